@@ -0,0 +1,103 @@
+"""
+Benchmark the NDBC buoy file parser.
+
+Builds a synthetic realtime2 ``.txt`` file and times the vectorized parser
+against a line-by-line split into ``NdbcObservation`` records.
+
+Examples:
+
+# Default: 45 days of 10-minute rows (one realtime2 file)
+uv run scripts/benchmarks/ndbc_parser.py
+
+# A year of rows (roughly one historical stdmet file)
+uv run scripts/benchmarks/ndbc_parser.py --days 365
+"""
+
+import argparse
+import statistics
+import time
+
+import numpy as np
+
+from ocean_report.endpoints.ndbc.parser import ndbc_observations, parse_ndbc_text
+from ocean_report.models.ndbc.observations import NdbcObservation
+
+HEADER = (
+    "#YY  MM DD hh mm WDIR WSPD GST  WVHT   DPD   APD MWD   PRES  ATMP  WTMP  "
+    "DEWP  VIS PTDY  TIDE\n"
+    "#yr  mo dy hr mn degT m/s  m/s     m   sec   sec degT   hPa  degC  degC  "
+    "degC  nmi  hPa    ft\n"
+)
+
+
+def _median_time(func, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def _synthetic_file(days: float) -> str:
+    count = int(days * 24 * 6)
+    stamps = np.datetime64("2025-07-04T00:00") - np.arange(count) * np.timedelta64(
+        10, "m"
+    )
+    rng = np.random.default_rng(0)
+    rows = [HEADER]
+    for stamp, speed, temp in zip(
+        stamps.astype(str), rng.uniform(0, 15, count), rng.uniform(15, 25, count)
+    ):
+        date, clock = stamp.split("T")
+        year, month, day = date.split("-")
+        hour, minute = clock.split(":")
+        water = "  MM" if speed > 14 else f"{temp:.1f}"
+        rows.append(
+            f"{year} {month} {day} {hour} {minute}  200 {speed:4.1f}  6.0    MM"
+            f"    MM    MM  MM 1015.0  22.3  {water}  18.1   MM   MM    MM\n"
+        )
+    return "".join(rows)
+
+
+def _parse_lines(text: str) -> list[NdbcObservation]:
+    observations = []
+    for line in text.splitlines()[2:]:
+        fields = line.split()
+        speed, water = fields[6], fields[14]
+        observations.append(
+            NdbcObservation(
+                station_id="44091",
+                timestamp=f"{fields[0]}-{fields[1]}-{fields[2]} {fields[3]}:{fields[4]}",
+                wind_speed_knots=None if speed == "MM" else float(speed) * 1.94384,
+                water_temperature_c=None if water == "MM" else float(water),
+            )
+        )
+    return observations
+
+
+def main():
+    """
+    Run the NDBC parser benchmark
+    """
+    parser = argparse.ArgumentParser(description="Benchmark NDBC parsing")
+    parser.add_argument("--days", type=float, default=45.0)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    text = _synthetic_file(args.days)
+    print(f"{text.count(chr(10)) - 2:,} rows ({args.days:g} days at 10 minutes)")
+
+    for name, func in (
+        ("frame (vectorized)", lambda: parse_ndbc_text(text)),
+        (
+            "records (vectorized)",
+            lambda: ndbc_observations(parse_ndbc_text(text), station_id="44091"),
+        ),
+        ("records (line split)", lambda: _parse_lines(text)),
+    ):
+        print(f"{name:24s} {_median_time(func, args.repeat) * 1000:9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
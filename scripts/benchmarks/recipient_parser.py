@@ -0,0 +1,62 @@
+"""
+Benchmark the streaming recipient parser.
+
+Generates a synthetic Gist-style recipient list (one address per line, with
+mixed case, padding, duplicates and a few invalid entries) and times
+``parse_recipient_lines`` over it.
+
+Examples:
+
+# Default: 1M lines
+uv run scripts/benchmarks/recipient_parser.py
+
+# Smaller list, more repeats
+uv run scripts/benchmarks/recipient_parser.py --lines 100000 --repeat 10
+"""
+
+import argparse
+import statistics
+import time
+
+from ocean_report.emailer.address_fetcher import parse_recipient_lines
+
+
+def _lines(count: int) -> list[str]:
+    lines = []
+    for i in range(count):
+        if i % 10_000 == 0:
+            lines.append("not-an-email")
+        elif i % 20 == 0:
+            lines.append(f"subscriber{i - 1}@example.com")
+        else:
+            lines.append(f"  Subscriber{i}@Example.com ")
+    return lines
+
+
+def main():
+    """
+    Run the recipient parser benchmark
+    """
+    parser = argparse.ArgumentParser(description="Benchmark recipient parsing")
+    parser.add_argument("--lines", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    lines = _lines(args.lines)
+    timings = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        recipients = parse_recipient_lines(lines)
+        timings.append(time.perf_counter() - start)
+
+    median = statistics.median(timings)
+    print(repr(recipients))
+    print(
+        f"{args.lines} lines: median {median * 1000:.1f} ms, "
+        f"min {min(timings) * 1000:.1f} ms, "
+        f"{args.lines / median / 1e6:.2f}M lines/s"
+    )
+
+
+if __name__ == "__main__":
+    main()
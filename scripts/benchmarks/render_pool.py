@@ -0,0 +1,114 @@
+"""
+Benchmark process-pool formatting and rendering of multi-location batches.
+
+Builds a batch of synthetic raw reports and times ``RenderPool.render`` at
+each worker count. Pools are started and warmed (config loaded, template
+compiled in every worker) before timing, so the numbers are steady-state
+batch throughput, the case a long-running process sees. Speedup is relative
+to 1 worker, which renders in-process.
+
+Speedup is bounded by the CPU cores available: worker counts above
+``os.cpu_count()`` only add scheduling overhead.
+
+Examples:
+
+# Default: 512 locations at 1, 4 and 16 workers
+uv run scripts/benchmarks/render_pool.py
+
+# Larger batch, more repeats
+uv run scripts/benchmarks/render_pool.py --locations 4096 --repeat 5
+"""
+
+import argparse
+import logging
+import os
+import statistics
+import time
+from datetime import datetime, timedelta
+
+from ocean_report.logger import configure_logger
+from ocean_report.models.noaa.tides import NoaaTidePredictionRecord
+from ocean_report.workflows.models import RawReportData
+from ocean_report.workflows.render_pool import RenderJob, RenderPool
+
+
+def _raw_report(index: int) -> RawReportData:
+    start = datetime(2025, 7, 4, 2, 17) + timedelta(minutes=index % 60)
+    return RawReportData(
+        tides=[
+            NoaaTidePredictionRecord(
+                t=(start + timedelta(minutes=372 * i)).strftime("%Y-%m-%d %H:%M"),
+                v=4.1 if i % 2 else -0.3,
+                type="H" if i % 2 else "L",
+            )
+            for i in range(4)
+        ],
+        tide_timestamp=datetime(2025, 7, 4, 6, 0),
+        water_temp=60.0 + index % 20,
+        water_temp_timestamp=datetime(2025, 7, 4, 6, 0),
+        water_temp_data_time="2025-07-04 05:54",
+        wind_forecast=[
+            {
+                "time": f"{hour % 12 or 12} {'AM' if hour < 12 else 'PM'}",
+                "speed_mph": 4.8 + hour / 3,
+                "direction": "ESE",
+                "wind_type": "Cross/Onshore",
+                "direction_deg": 108.0 + hour,
+            }
+            for hour in (8, 12, 15, 18)
+        ],
+        wind_timestamp=datetime(2025, 7, 4, 6, 0),
+    )
+
+
+def _jobs(count: int) -> list[RenderJob]:
+    return [
+        RenderJob(
+            location=f"location-{index}",
+            raw_data=_raw_report(index),
+            report_date=datetime(2025, 7, 4),
+        )
+        for index in range(count)
+    ]
+
+
+def _bench(workers: int, jobs: list[RenderJob], repeat: int) -> float:
+    with RenderPool(workers=workers) as pool:
+        pool.render(jobs[: workers * 4])  # start and warm every worker
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            pool.render(jobs)
+            timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main():
+    """
+    Run the render pool benchmark
+    """
+    parser = argparse.ArgumentParser(description="Benchmark RenderPool")
+    parser.add_argument("--locations", type=int, default=512)
+    parser.add_argument(
+        "--workers", type=int, nargs="+", default=[1, 4, 16], help="Worker counts"
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    configure_logger(level=logging.WARNING)
+    jobs = _jobs(args.locations)
+    print(f"{args.locations} locations, {os.cpu_count()} CPU(s)")
+
+    baseline = None
+    for workers in args.workers:
+        elapsed = _bench(workers, jobs, args.repeat)
+        baseline = baseline or elapsed
+        print(
+            f"{workers:>3} worker(s)  {elapsed * 1000:>9.1f} ms  "
+            f"{args.locations / elapsed:>9.1f} reports/s  "
+            f"{baseline / elapsed:>5.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Benchmark SMTP delivery throughput against the local SMTP sink.
+
+Drives ``emailer.sender.send_email`` (one message, every recipient in BCC)
+and ``workflows.email.sender.send_or_preview_email`` (configured delivery
+mode) against an in-process STARTTLS + AUTH server, so pooling and chunking
+changes can be measured without a real mail provider.
+
+Examples:
+
+# Default run: 1, 100 and 10k recipients, no simulated latency
+uv run scripts/benchmarks/smtp_throughput.py
+
+# Simulate a 20 ms provider round trip per SMTP command
+uv run scripts/benchmarks/smtp_throughput.py --latency-ms 20
+
+# Compare chunk sizes and connection counts
+uv run scripts/benchmarks/smtp_throughput.py --chunk-size 100 --connections 8
+"""
+
+import argparse
+import time
+from unittest.mock import Mock
+
+from ocean_report.application.context import ApplicationContext
+from ocean_report.config.schemas import AppConfig, DeliveryConfig, EmailConfig
+from ocean_report.emailer.sender import EmailRecipients, send_email
+from ocean_report.testing import SmtpSink
+from ocean_report.workflows.email import send_or_preview_email
+
+SENDER = "bench@example.com"
+PASSWORD = "bench-password"
+
+
+def _recipients(count: int) -> list[str]:
+    return [f"subscriber{i}@example.com" for i in range(count)]
+
+
+def _bench_send_email(sink: SmtpSink, recipients: list[str]) -> float:
+    start = time.perf_counter()
+    send_email(
+        subject="Benchmark",
+        body="Benchmark body",
+        sender_email=SENDER,
+        email_password=PASSWORD,
+        recipients=EmailRecipients(to_email=SENDER, bcc_list=recipients),
+        smtp_server=sink.host,
+        smtp_port=sink.port,
+    )
+    return time.perf_counter() - start
+
+
+def _bench_workflow(
+    sink: SmtpSink, recipients: list[str], delivery: DeliveryConfig
+) -> float:
+    config = AppConfig(
+        email=EmailConfig(
+            smtp_server=sink.host,
+            smtp_port=sink.port,
+            sender=SENDER,
+            password=PASSWORD,
+            delivery=delivery,
+        )
+    )
+    context = ApplicationContext(config=config, client=Mock())
+    start = time.perf_counter()
+    send_or_preview_email(
+        context=context,
+        run_email=True,
+        subject="Benchmark",
+        body="Benchmark body",
+        bcc_recipients=recipients,
+    )
+    return time.perf_counter() - start
+
+
+def _report(label: str, count: int, sink: SmtpSink, elapsed: float) -> None:
+    stats = sink.stats
+    print(
+        f"{label:<28} {count:>7} rcpt  {elapsed * 1000:>9.1f} ms  "
+        f"{stats.messages:>4} msgs  {stats.connections:>3} conns  "
+        f"{stats.messages / elapsed:>9.1f} msgs/s  "
+        f"{stats.recipients / elapsed:>11.1f} rcpt/s"
+    )
+
+
+def main():
+    """
+    Run the SMTP throughput benchmark
+    """
+    parser = argparse.ArgumentParser(description="Benchmark SMTP delivery")
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[1, 100, 10_000],
+        help="Recipient counts to benchmark",
+    )
+    parser.add_argument(
+        "--latency-ms",
+        type=float,
+        default=0.0,
+        help="Simulated delay per SMTP command in milliseconds",
+    )
+    parser.add_argument("--chunk-size", type=int, default=50)
+    parser.add_argument("--connections", type=int, default=4)
+    args = parser.parse_args()
+
+    modes = {
+        "send_email": None,
+        "workflow (single)": DeliveryConfig(mode="single"),
+        "workflow (chunked)": DeliveryConfig(
+            mode="chunked",
+            chunk_size=args.chunk_size,
+            max_connections=args.connections,
+        ),
+    }
+
+    with SmtpSink(
+        username=SENDER,
+        password=PASSWORD,
+        command_latency_seconds=args.latency_ms / 1000,
+        keep_messages=False,
+    ) as sink:
+        for count in args.sizes:
+            recipients = _recipients(count)
+            for label, delivery in modes.items():
+                sink.reset()
+                if delivery is None:
+                    elapsed = _bench_send_email(sink, recipients)
+                else:
+                    elapsed = _bench_workflow(sink, recipients, delivery)
+                _report(label, count, sink, elapsed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+"""
+Micro-benchmark suite for the report's hot paths, with baseline comparison.
+
+Each benchmark is warmed up, calibrated to a loop count that makes one
+sample last at least 10 ms, then sampled repeatedly. Results report the
+median and interquartile range per call. ``compare`` re-runs the suite (or
+reads a results file) and flags benchmarks whose median slowed down by more
+than the threshold with a significant one-sided Mann-Whitney U test against
+the stored baseline samples. It exits with status 1 if any did.
+
+Baselines are machine-specific: refresh ``baseline.json`` on the machine
+that runs ``compare``.
+
+Examples:
+
+# Run everything and print a table
+uv run scripts/benchmarks/suite.py run
+
+# Save results / refresh the committed baseline
+uv run scripts/benchmarks/suite.py run --output scripts/benchmarks/baseline.json
+
+# Check the working tree against the baseline
+uv run scripts/benchmarks/suite.py compare
+
+# Only tide benchmarks, more samples
+uv run scripts/benchmarks/suite.py compare -k tide --samples 40
+"""
+
+import argparse
+import logging
+import sys
+from contextlib import ExitStack
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+from ocean_report.application.context import ApplicationContext
+from ocean_report.config.loader import load_app_config
+from ocean_report.config.schemas import AppConfig
+from ocean_report.emailer.template_helpers import format_tide_info, format_wind_info
+from ocean_report.emailer.template_renderer import render_email_template
+from ocean_report.logger import configure_logger
+from ocean_report.models.email import EmailTemplateData
+from ocean_report.models.noaa.tides import NoaaTidePredictionRecord, NoaaTideResponse
+from ocean_report.models.openmeteo.forecast import (
+    OpenMeteoForecastResponse,
+    OpenMeteoHourlyForecast,
+)
+from ocean_report.services.tide_service import filter_daytime_tides
+from ocean_report.testing.benchmark import (
+    DEFAULT_ALPHA,
+    DEFAULT_SAMPLES,
+    DEFAULT_THRESHOLD,
+    compare,
+    load_results,
+    measure,
+    save_results,
+)
+from ocean_report.use_cases.wind import get_daily_wind_forecast
+
+BASELINE = Path(__file__).with_name("baseline.json")
+
+
+def _tide_records(days: int = 7) -> list[NoaaTidePredictionRecord]:
+    start = datetime(2025, 7, 1, 2, 17)
+    return [
+        NoaaTidePredictionRecord(
+            t=(start + timedelta(minutes=372 * i)).strftime("%Y-%m-%d %H:%M"),
+            v=4.1 if i % 2 else -0.3,
+            type="H" if i % 2 else "L",
+        )
+        for i in range(days * 4)
+    ]
+
+
+def _wind_entries() -> list[dict]:
+    return [
+        {
+            "time": f"{hour % 12 or 12} {'AM' if hour < 12 else 'PM'}",
+            "speed_mph": 4.8 + hour / 3,
+            "direction": "ESE",
+            "wind_type": "Cross/Onshore",
+            "direction_deg": 108.0 + hour,
+        }
+        for hour in range(6, 21)
+    ]
+
+
+def _wind_forecast() -> OpenMeteoForecastResponse:
+    start = datetime.combine(datetime.now().date(), datetime.min.time())
+    hours = range(16 * 24)  # Open-Meteo's maximum 16-day horizon
+    times = [start + timedelta(hours=h) for h in hours]
+    return OpenMeteoForecastResponse(
+        hourly=OpenMeteoHourlyForecast(
+            time=[stamp.isoformat(timespec="minutes") for stamp in times],
+            wind_speed_10m=[8.0 + h % 17 for h in hours],
+            wind_direction_10m=[(37.0 * h) % 360 for h in hours],
+        )
+    )
+
+
+def _prediction_payload() -> dict:
+    return {
+        "predictions": [
+            {"t": f"2025-07-04 {i // 10:02d}:{i % 10 * 6:02d}", "v": "3.142"}
+            for i in range(240)
+        ]
+    }
+
+
+def _template_data() -> EmailTemplateData:
+    return EmailTemplateData(
+        long_date="Friday, July 4, 2025",
+        water_temp="73.5 °F",
+        tide_info=format_tide_info(_tide_records(1)),
+        wind_info=format_wind_info(_wind_entries()[:4]),
+        station_name="Atlantic City (8534720)",
+        station_city="Atlantic City",
+        date_retrieved="Jul 4 at 6:00 AM",
+        water_temp_measured_at_date="14:00",
+    )
+
+
+def _benchmarks(stack: ExitStack) -> dict:
+    """Benchmark name -> zero-argument callable."""
+    tides = _tide_records()
+    wind = _wind_entries()
+    payload = _prediction_payload()
+    template_data = _template_data()
+
+    stack.enter_context(
+        patch(
+            "ocean_report.use_cases.wind.fetch_wind_forecast",
+            return_value=_wind_forecast(),
+        )
+    )
+    context = ApplicationContext(config=AppConfig(), client=Mock())
+
+    return {
+        "tides.filter_daytime_tides": lambda: filter_daytime_tides(tides),
+        "email.format_tide_info": lambda: format_tide_info(tides),
+        "email.format_wind_info": lambda: format_wind_info(wind),
+        "wind.get_daily_wind_forecast": lambda: get_daily_wind_forecast(
+            context=context
+        ),
+        "models.tide_response_validate": lambda: NoaaTideResponse.model_validate(
+            payload
+        ),
+        "config.load_app_config": load_app_config,
+        "email.render_template": lambda: render_email_template(template_data),
+    }
+
+
+def _run(names_filter: str | None, samples: int) -> list:
+    results = []
+    with ExitStack() as stack:
+        for name, func in _benchmarks(stack).items():
+            if names_filter and names_filter not in name:
+                continue
+            result = measure(name, func, samples=samples)
+            print(
+                f"{name:34s} median {result.median * 1e6:10.1f} µs"
+                f"   IQR {result.iqr * 1e6:8.1f} µs   ({result.loops} loops)"
+            )
+            results.append(result)
+    return results
+
+
+def main():
+    """
+    Run the benchmark suite or compare it against the baseline
+    """
+    parser = argparse.ArgumentParser(description="Benchmark suite")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Run and print benchmarks")
+    run_parser.add_argument("--output", type=Path, help="Write results JSON here")
+
+    compare_parser = subparsers.add_parser(
+        "compare", help="Flag significant slowdowns against a baseline"
+    )
+    compare_parser.add_argument("--baseline", type=Path, default=BASELINE)
+    compare_parser.add_argument(
+        "--current", type=Path, help="Results JSON to compare (default: run now)"
+    )
+    compare_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    compare_parser.add_argument("--alpha", type=float, default=DEFAULT_ALPHA)
+
+    for sub in (run_parser, compare_parser):
+        sub.add_argument("-k", dest="names_filter", help="Only names containing this")
+        sub.add_argument("--samples", type=int, default=DEFAULT_SAMPLES)
+    args = parser.parse_args()
+    # Time the code, not console output of per-call INFO logs.
+    configure_logger(level=logging.WARNING)
+
+    if args.command == "run":
+        results = _run(args.names_filter, args.samples)
+        if args.output:
+            save_results(args.output, results)
+            print(f"wrote {args.output}")
+        return
+
+    baseline = load_results(args.baseline)
+    if args.current:
+        current = list(load_results(args.current).values())
+    else:
+        current = _run(args.names_filter, args.samples)
+
+    print()
+    regressions = 0
+    for result in current:
+        if result.name not in baseline:
+            print(f"{result.name:34s} (no baseline)")
+            continue
+        comparison = compare(
+            baseline[result.name], result, threshold=args.threshold, alpha=args.alpha
+        )
+        verdict = "SLOWER" if comparison.regressed else "ok"
+        regressions += comparison.regressed
+        print(
+            f"{comparison.name:34s} {comparison.ratio:6.2f}x"
+            f"   p={comparison.p_value:.4f}   {verdict}"
+        )
+    if regressions:
+        print(f"\n{regressions} significant slowdown(s)")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Benchmark suppression filtering against large suppression lists.
+
+Compares the bloom filter + sorted-array confirm in
+``emailer.suppression`` with a plain ``set`` and, on a small sample, with
+the naive ``address in list`` scan it replaces.
+
+Examples:
+
+# Default: 1M suppressed addresses, 100k recipients
+uv run scripts/benchmarks/suppression.py
+
+# Larger send
+uv run scripts/benchmarks/suppression.py --recipients 1000000
+"""
+
+import argparse
+import statistics
+import sys
+import time
+
+from ocean_report.emailer.address_fetcher import RecipientSet
+from ocean_report.emailer.suppression import SuppressionFilter
+
+
+def _median_time(func, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main():
+    """
+    Run the suppression benchmark
+    """
+    parser = argparse.ArgumentParser(description="Benchmark suppression filtering")
+    parser.add_argument("--suppressed", type=int, default=1_000_000)
+    parser.add_argument("--recipients", type=int, default=100_000)
+    parser.add_argument("--false-positive-rate", type=float, default=0.01)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    suppressed = sorted(f"gone{i}@example.com" for i in range(args.suppressed))
+    # 1% of recipients are suppressed
+    recipients = RecipientSet(
+        f"gone{i}@example.com" if i % 100 == 0 else f"user{i}@example.com"
+        for i in range(args.recipients)
+    )
+
+    start = time.perf_counter()
+    suppression_filter = SuppressionFilter(
+        suppressed, false_positive_rate=args.false_positive_rate
+    )
+    build = time.perf_counter() - start
+    print(
+        f"bloom build:   {build * 1000:9.1f} ms, "
+        f"{suppression_filter.size_bytes / 2**20:.1f} MiB (bits + confirm array), "
+        f"k={suppression_filter.num_hashes}"
+    )
+
+    bloom = _median_time(lambda: suppression_filter.filter(recipients), args.repeat)
+    print(f"bloom filter:  {bloom * 1000:9.1f} ms for {len(recipients)} recipients")
+
+    suppressed_set = set(suppressed)
+    set_bytes = sys.getsizeof(suppressed_set) + sum(map(sys.getsizeof, suppressed))
+    print(f"python set:    {set_bytes / 2**20:9.1f} MiB")
+    exact = _median_time(
+        lambda: [a for a in recipients if a not in suppressed_set], args.repeat
+    )
+    print(f"set lookups:   {exact * 1000:9.1f} ms")
+
+    sample = list(recipients[:20])
+    start = time.perf_counter()
+    _ = [a for a in sample if a not in suppressed]
+    naive = (time.perf_counter() - start) / len(sample) * len(recipients)
+    print(f"list scan:     {naive * 1000:9.1f} ms (extrapolated from 20 lookups)")
+
+
+if __name__ == "__main__":
+    main()
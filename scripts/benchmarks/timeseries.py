@@ -0,0 +1,102 @@
+"""
+Benchmark the memory-mapped time-series store against the SQLite history.
+
+Builds years of 6-minute water temperature samples in both stores, then
+times a 24-hour window read and a one-year aggregate from each.
+
+Examples:
+
+# Default: 10 years of 6-minute samples
+uv run scripts/benchmarks/timeseries.py
+
+# Smaller run
+uv run scripts/benchmarks/timeseries.py --years 2
+"""
+
+import argparse
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+
+from ocean_report.models.noaa.water_temperature import NoaaWaterTemperatureRecord
+from ocean_report.storage.timeseries import TimeSeriesStore
+from ocean_report.storage.water_temp_history import WaterTempHistory
+
+STATION = "8534720"
+
+
+def _median_time(func, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main():
+    """
+    Run the time-series benchmark
+    """
+    parser = argparse.ArgumentParser(description="Benchmark time-series storage")
+    parser.add_argument("--years", type=float, default=10.0)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    start = np.datetime64("2015-01-01T00:00")
+    count = int(args.years * 365 * 24 * 10)
+    stamps = start + np.arange(count) * np.timedelta64(6, "m")
+    values = 60 + 15 * np.sin(np.arange(count) / (24 * 10 * 365) * 2 * np.pi)
+    end = stamps[-1].astype(datetime)
+    print(f"{count:,} samples ({args.years:g} years at 6-minute intervals)")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = TimeSeriesStore(Path(tmp) / "ts")
+        build = time.perf_counter()
+        store.append(STATION, "water_temperature", stamps, values)
+        print(f"columnar build: {time.perf_counter() - build:.2f}s")
+
+        history = WaterTempHistory(Path(tmp) / "history.sqlite3")
+        build = time.perf_counter()
+        history.append(
+            STATION,
+            (
+                NoaaWaterTemperatureRecord(
+                    timestamp=str(stamp).replace("T", " "), temperature=value
+                )
+                for stamp, value in zip(stamps.astype(str), values.tolist())
+            ),
+        )
+        print(f"sqlite build:   {time.perf_counter() - build:.2f}s")
+
+        day_start = end - timedelta(hours=24)
+        year_start = end - timedelta(days=365)
+
+        def columnar_day():
+            return store.open(STATION, "water_temperature").slice(day_start, end)
+
+        def columnar_year():
+            series = store.open(STATION, "water_temperature")
+            return series.slice(year_start, end).stats()
+
+        def sqlite_day():
+            return history.window(STATION, start=day_start, end=end)
+
+        def sqlite_year():
+            return history.summarize(STATION, start=year_start, end=end)
+
+        for name, func in (
+            ("24h window (columnar)", columnar_day),
+            ("24h window (sqlite)", sqlite_day),
+            ("1y stats (columnar)", columnar_year),
+            ("1y stats (sqlite)", sqlite_year),
+        ):
+            print(f"{name:24s} {_median_time(func, args.repeat) * 1000:9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
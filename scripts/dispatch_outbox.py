@@ -0,0 +1,41 @@
+"""
+Script to deliver messages waiting in the email outbox.
+
+Re-sends previously rendered reports without calling any data APIs.
+
+Examples:
+
+# Drain the outbox with the configured number of workers
+uv run scripts/dispatch_outbox.py
+
+# Drain with 4 parallel workers
+uv run scripts/dispatch_outbox.py --workers 4
+"""
+
+import argparse
+
+import ocean_report
+
+
+def main():
+    """
+    Dispatch queued Ocean report emails
+    """
+    parser = argparse.ArgumentParser(description="Deliver queued report emails")
+    parser.add_argument("--config", help="Path to config file")
+    parser.add_argument(
+        "--workers", type=int, default=None, help="Parallel dispatch workers"
+    )
+    args = parser.parse_args()
+
+    summary = ocean_report.dispatch_pending_emails(
+        cfg_path=args.config, workers=args.workers
+    )
+    print(
+        f"Sent: {summary.sent} | Retrying: {summary.retrying} | Dead: {summary.dead}"
+        f" | Lost lease: {summary.lost}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Script to find the NOAA stations nearest to a location.
+
+Uses the cached station catalog (fetched on first use).
+
+Examples:
+
+# Nearest tide prediction station to the configured location
+uv run scripts/find_station.py
+
+# Three nearest water temperature stations to a point
+uv run scripts/find_station.py --lat 39.36 --lon -74.42 --product water_temperature -k 3
+
+# Force a catalog refresh first
+uv run scripts/find_station.py --refresh
+"""
+
+import argparse
+
+from ocean_report.application.factory import create_application_context
+from ocean_report.use_cases.stations import (
+    PRODUCT_STATION_TYPES,
+    find_nearest_stations,
+    get_station_index,
+)
+
+
+def main():
+    """
+    Print the stations nearest to a location
+    """
+    parser = argparse.ArgumentParser(description="Find nearest NOAA stations")
+    parser.add_argument("--config", help="Path to config file")
+    parser.add_argument("--lat", type=float, help="Latitude (defaults to config)")
+    parser.add_argument("--lon", type=float, help="Longitude (defaults to config)")
+    parser.add_argument(
+        "--product", choices=sorted(PRODUCT_STATION_TYPES), default="tide_predictions"
+    )
+    parser.add_argument("-k", type=int, default=1, help="Number of stations")
+    parser.add_argument("--max-km", type=float, help="Maximum distance in km")
+    parser.add_argument(
+        "--refresh", action="store_true", help="Re-fetch the station catalog"
+    )
+    args = parser.parse_args()
+
+    context = create_application_context(config_path=args.config)
+    if args.refresh:
+        get_station_index(context=context, product=args.product, refresh=True)
+
+    matches = find_nearest_stations(
+        context=context,
+        latitude=args.lat,
+        longitude=args.lon,
+        product=args.product,
+        k=args.k,
+        max_distance_km=args.max_km,
+    )
+    if not matches:
+        print("No stations found")
+    for match in matches:
+        print(f"{match.station_id}  {match.name:30s} {match.distance_km:8.1f} km")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Script to load recipient lists into the local subscriber store.
+
+Imports the configured Gist lists (main -> summer, offseason -> offseason,
+test -> test segment) or a local file in the same format.
+
+Examples:
+
+# Mirror all configured recipient URLs into the store
+uv run scripts/import_subscribers.py
+
+# Import a local list as the summer segment for a location
+uv run scripts/import_subscribers.py --file summer.txt --season summer --location lbi
+"""
+
+import argparse
+from pathlib import Path
+
+from ocean_report.application.factory import create_application_context
+from ocean_report.emailer.subscribers import SEASONS, SubscriberStore
+from ocean_report.use_cases.email import import_subscribers_from_recipient_urls
+
+
+def main():
+    """
+    Import subscribers into the local store
+    """
+    parser = argparse.ArgumentParser(description="Import report subscribers")
+    parser.add_argument("--config", help="Path to config file")
+    parser.add_argument("--location", help="Location key (defaults to config)")
+    parser.add_argument("--file", type=Path, help="Local recipient list to import")
+    parser.add_argument("--season", choices=sorted(SEASONS), default="all")
+    parser.add_argument("--test", action="store_true", help="Import as test segment")
+    parser.add_argument(
+        "--append",
+        action="store_true",
+        help="Add to the segment instead of replacing it",
+    )
+    args = parser.parse_args()
+
+    context = create_application_context(config_path=args.config)
+    store_config = context.config.email.subscriber_store
+
+    if args.file is None:
+        counts = import_subscribers_from_recipient_urls(
+            context=context, location=args.location
+        )
+        for name, count in counts.items():
+            print(f"{name}: {count} subscribers")
+        return
+
+    store = SubscriberStore(Path(store_config.path).expanduser())
+    count = store.import_text(
+        args.file.read_text(encoding="utf-8"),
+        location=args.location or store_config.location,
+        season=args.season,
+        is_test=args.test,
+        replace=not args.append,
+    )
+    print(f"{args.file}: {count} subscribers")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Script to backfill NDBC historical buoy data into the time-series store.
+
+Streams yearly stdmet archives (gzip'd text) and appends each variable as a
+``stdmet_<column>`` series under ``timeseries.directory``. Finished years
+are recorded, so re-running after an interruption resumes where it stopped.
+
+Examples:
+
+# Last ten years for the configured buoy
+uv run scripts/ingest_ndbc_history.py --start-year 2015
+
+# A specific buoy and range
+uv run scripts/ingest_ndbc_history.py --buoy 44009 --start-year 2000 --end-year 2010
+"""
+
+import argparse
+from datetime import date
+
+from ocean_report.application.factory import create_application_context
+from ocean_report.use_cases.buoy import ingest_buoy_history
+
+
+def main():
+    """
+    Ingest NDBC stdmet archives
+    """
+    parser = argparse.ArgumentParser(description="Backfill NDBC buoy history")
+    parser.add_argument("--config", help="Path to config file")
+    parser.add_argument("--buoy", help="NDBC buoy ID (defaults to config)")
+    parser.add_argument("--start-year", type=int, required=True)
+    parser.add_argument(
+        "--end-year",
+        type=int,
+        default=date.today().year - 1,
+        help="Last archive year (defaults to last year)",
+    )
+    args = parser.parse_args()
+
+    context = create_application_context(config_path=args.config)
+    ingested = ingest_buoy_history(
+        context=context,
+        years=range(args.start_year, args.end_year + 1),
+        buoy_id=args.buoy,
+    )
+    for year, rows in ingested.items():
+        print(f"{year}: {rows:,} rows appended")
+    if not ingested:
+        print("Nothing new to ingest")
+
+
+if __name__ == "__main__":
+    main()
@@ -20,6 +20,9 @@ uv run scripts/run_report_no_email.py --test
 
 # Combine everything
 uv run scripts/run_report_no_email.py --html --text --test
+
+# Re-render an archived day from the run archive (no network)
+uv run scripts/run_report_no_email.py --replay 20250704 --html
 """
 
 import argparse
@@ -73,6 +76,11 @@ def main():
         help="Display text email preview in terminal after generating report",
     )
     parser.add_argument("--test", action="store_true", help="Run in test mode")
+    parser.add_argument(
+        "--replay",
+        metavar="YYYYMMDD",
+        help="Re-render an archived run for this date instead of fetching data",
+    )
 
     args = parser.parse_args()
 
@@ -80,7 +88,9 @@ def main():
     ocean_report.hello()
 
     # Run Report
-    ocean_report.run_report(run_email=RUN_EMAIL, test=args.test)
+    ocean_report.run_report(
+        run_email=RUN_EMAIL, test=args.test, replay=args.replay
+    )
 
     # Auto-preview if requested
     if args.html:
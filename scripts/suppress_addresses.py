@@ -0,0 +1,54 @@
+"""
+Script to manage the email suppression list.
+
+Suppressed (unsubscribed or bounced) addresses are removed from every send.
+
+Examples:
+
+# Suppress addresses listed in a file (one per line or comma-separated)
+uv run scripts/suppress_addresses.py --file bounces.txt
+
+# Suppress or re-allow individual addresses
+uv run scripts/suppress_addresses.py someone@example.com
+uv run scripts/suppress_addresses.py --remove someone@example.com
+"""
+
+import argparse
+from pathlib import Path
+
+from ocean_report.config import load_app_config
+from ocean_report.emailer.suppression import SuppressionList
+
+
+def main():
+    """
+    Add or remove suppressed email addresses
+    """
+    parser = argparse.ArgumentParser(description="Manage the suppression list")
+    parser.add_argument("addresses", nargs="*", help="Addresses to (un)suppress")
+    parser.add_argument("--config", help="Path to config file")
+    parser.add_argument("--file", type=Path, help="File of addresses")
+    parser.add_argument(
+        "--remove", action="store_true", help="Remove instead of add"
+    )
+    args = parser.parse_args()
+
+    settings = load_app_config(args.config)
+    suppression_list = SuppressionList(
+        Path(settings.email.suppression.path).expanduser()
+    )
+
+    addresses = list(args.addresses)
+    if args.file is not None:
+        addresses.extend(args.file.read_text(encoding="utf-8").splitlines())
+
+    if args.remove:
+        count = suppression_list.remove(addresses)
+        print(f"Removed {count} addresses from {suppression_list.path}")
+    else:
+        count = suppression_list.add(addresses)
+        print(f"Added {count} addresses to {suppression_list.path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Script to check hi/lo tide interpolation against NOAA 6-minute predictions.
+
+Fetches both the hi/lo events and the 6-minute series for a station and
+date range, then prints the interpolation error.
+
+Examples:
+
+# Configured station, one month
+uv run scripts/validate_tide_interpolation.py --begin 20250701 --end 20250731
+
+# Another station
+uv run scripts/validate_tide_interpolation.py --station 8518750 --begin 20250101 --end 20250131
+"""
+
+import argparse
+
+import numpy as np
+
+from ocean_report.application.factory import create_application_context
+from ocean_report.models.noaa.tides import NoaaTideParams
+from ocean_report.services.tide_service import fetch_tide_data
+from ocean_report.tides.interpolation import TideEvents, interpolation_error
+
+
+def main():
+    """
+    Print interpolation error against NOAA's 6-minute predictions
+    """
+    parser = argparse.ArgumentParser(description="Validate tide interpolation")
+    parser.add_argument("--config", help="Path to config file")
+    parser.add_argument("--station", help="NOAA station ID (defaults to config)")
+    parser.add_argument("--begin", required=True, help="First date (YYYYMMDD)")
+    parser.add_argument("--end", required=True, help="Last date (YYYYMMDD)")
+    args = parser.parse_args()
+
+    context = create_application_context(config_path=args.config)
+    station = args.station or context.config.noaa.station_id
+
+    def fetch(interval):
+        params = NoaaTideParams(
+            begin_date=args.begin,
+            end_date=args.end,
+            station=station,
+            interval=interval,
+        )
+        return fetch_tide_data(context=context, params=params)
+
+    events = TideEvents.from_records(fetch("hilo"))
+    series = fetch("6")
+    times = np.array([record.timestamp for record in series], dtype="datetime64[m]")
+    heights = np.array([record.height_feet for record in series])
+
+    error = interpolation_error(events, times, heights)
+    print(f"station {station}: {len(events)} hi/lo events, {len(series)} samples")
+    print(f"compared {error['count']} samples")
+    print(f"rms error:  {error['rms']:.3f} ft")
+    print(f"max error:  {error['max_abs']:.3f} ft")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Script to check local harmonic tide predictions against NOAA's own.
+
+Loads the station's constituents (fetching them if not cached), predicts
+hi/lo events and 6-minute heights locally, and compares both with NOAA
+predictions for the same range.
+
+Examples:
+
+# Configured station, one month
+uv run scripts/validate_tide_prediction.py --begin 20250701 --end 20250731
+
+# Another station
+uv run scripts/validate_tide_prediction.py --station 8518750 --begin 20250101 --end 20250131
+"""
+
+import argparse
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from ocean_report.application.factory import create_application_context
+from ocean_report.models.noaa.tides import NoaaTideParams
+from ocean_report.services.tide_service import fetch_tide_data
+from ocean_report.tides.harmonic import predict_heights, predict_hilo
+from ocean_report.use_cases.tides import load_harmonic_model
+
+
+def main():
+    """
+    Print local prediction error against NOAA's predictions
+    """
+    parser = argparse.ArgumentParser(description="Validate harmonic tide prediction")
+    parser.add_argument("--config", help="Path to config file")
+    parser.add_argument("--station", help="NOAA station ID (defaults to config)")
+    parser.add_argument("--begin", required=True, help="First date (YYYYMMDD)")
+    parser.add_argument("--end", required=True, help="Last date (YYYYMMDD)")
+    parser.add_argument(
+        "--time-zone",
+        help="Station time zone (defaults to noaa.tide_prediction.time_zone)",
+    )
+    args = parser.parse_args()
+
+    context = create_application_context(config_path=args.config)
+    station = args.station or context.config.noaa.station_id
+    time_zone = args.time_zone or context.config.noaa.tide_prediction.time_zone
+    model = load_harmonic_model(context=context, station_id=station)
+    start = datetime.strptime(args.begin, "%Y%m%d")
+    end = datetime.strptime(args.end, "%Y%m%d") + timedelta(days=1)
+
+    def fetch(interval):
+        params = NoaaTideParams(
+            begin_date=args.begin,
+            end_date=args.end,
+            station=station,
+            interval=interval,
+        )
+        return fetch_tide_data(context=context, params=params)
+
+    noaa_events = fetch("hilo")
+    local_events = predict_hilo(model, start=start, end=end, time_zone=time_zone)
+    print(f"station {station}: {len(model.names)} constituents")
+    print(f"hi/lo events: {len(local_events)} local, {len(noaa_events)} NOAA")
+    if len(local_events) == len(noaa_events):
+        noaa_times = np.array(
+            [record.timestamp for record in noaa_events], dtype="datetime64[m]"
+        )
+        local_times = np.array(
+            [record.timestamp for record in local_events], dtype="datetime64[m]"
+        )
+        minutes = np.abs((local_times - noaa_times).astype(int))
+        height_error = np.abs(
+            np.array([record.height_feet for record in local_events])
+            - np.array([record.height_feet for record in noaa_events])
+        )
+        print(f"event time error:   max {minutes.max()} min")
+        print(f"event height error: max {height_error.max():.3f} ft")
+
+    series = fetch("6")
+    times, heights = predict_heights(model, start=start, end=end, time_zone=time_zone)
+    reference = {record.timestamp: record.height_feet for record in series}
+    stamps = np.char.replace(np.datetime_as_string(times), "T", " ").tolist()
+    paired = [
+        (height, reference[stamp])
+        for stamp, height in zip(stamps, heights.tolist())
+        if stamp in reference
+    ]
+    error = np.array([local - noaa for local, noaa in paired])
+    print(f"compared {len(error)} 6-minute samples")
+    if len(error):
+        print(f"rms error:  {np.sqrt(np.mean(error**2)):.3f} ft")
+        print(f"max error:  {np.abs(error).max():.3f} ft")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,15 @@
 """Ocean Report package initialization."""
 
 from . import config
-from .logger import configure_logger, logger, LogOutput
+from .cli import main
+from .logger import configure_logger, flush_logger, logger, LogOutput
 from .services import tide_service
 from .services import water_temp_service
-from .workflows.report_runner import run_report
+from .workflows.report_runner import (
+    dispatch_pending_emails,
+    replay_report,
+    run_report,
+)
 
 
 def hello() -> None:
@@ -14,10 +19,14 @@ def hello() -> None:
 
 __all__ = [
     "hello",
+    "main",
     "run_report",
+    "replay_report",
+    "dispatch_pending_emails",
     "config",
     "logger",
     "configure_logger",
+    "flush_logger",
     "LogOutput",
     "tide_service",
     "water_temp_service",
@@ -5,24 +5,62 @@ from __future__ import annotations
 from collections.abc import Mapping
 from types import TracebackType
 from typing import Any
+from urllib.parse import urlsplit
 
 import certifi
 import requests
-from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
 from ..logger import logger
+from ..metrics import registry
 from .exceptions import (
     ApiClientError,
     ApiConnectionError,
     ApiResponseError,
     ApiSslError,
 )
+from .timing import RequestTiming, TimedHTTPAdapter, measure_request
 
 
 RequestTimeout = float | tuple[float, float]
 VerifyOption = bool | str
 
+HTTP_REQUESTS = registry.counter(
+    "ocean_report_http_requests_total",
+    "Outbound HTTP GET requests by host and outcome.",
+    labelnames=("host", "outcome"),
+)
+HTTP_REQUEST_DURATION = registry.histogram(
+    "ocean_report_http_request_duration_seconds",
+    "Total time of outbound GET requests, retries and redirects included.",
+    labelnames=("host",),
+)
+HTTP_RETRIES = registry.counter(
+    "ocean_report_http_retries_total",
+    "Transport-level retries of outbound GET requests.",
+    labelnames=("host",),
+)
+HTTP_RESPONSE_BYTES = registry.counter(
+    "ocean_report_http_response_bytes_total",
+    "Decoded response body bytes downloaded (streamed bodies excluded).",
+    labelnames=("host",),
+)
+HTTP_WIRE_BYTES = registry.counter(
+    "ocean_report_http_wire_bytes_total",
+    "Response body bytes received on the wire, before decompression.",
+    labelnames=("host",),
+)
+HTTP_PHASE_DURATION = registry.histogram(
+    "ocean_report_http_phase_duration_seconds",
+    "Outbound GET time by phase (dns, connect, tls, send, wait, download).",
+    labelnames=("host", "phase"),
+)
+HTTP_CONNECTIONS_OPENED = registry.counter(
+    "ocean_report_http_connections_opened_total",
+    "New connections opened; requests minus these reused a pooled one.",
+    labelnames=("host",),
+)
+
 
 class ApiClient:
     """Reusable HTTP transport client with retries, SSL controls, and typed accessors.
@@ -61,7 +99,7 @@ class ApiClient:
             allowed_methods=frozenset({"GET"}),
             raise_on_status=False,
         )
-        adapter = HTTPAdapter(max_retries=retry)
+        adapter = TimedHTTPAdapter(max_retries=retry)
 
         session = requests.Session()
         session.mount("https://", adapter)
@@ -71,18 +109,18 @@ class ApiClient:
     def _resolve_verify(self) -> str | bool:
         return certifi.where() if self.verify_ssl else False
 
-    def _log_retry_history(self, response: requests.Response, url: str) -> None:
-        """Log retry metadata captured by urllib3 for observability."""
+    def _log_retry_history(self, response: requests.Response, url: str) -> int:
+        """Log retry metadata captured by urllib3 and return the retry count."""
 
         retries = getattr(getattr(response, "raw", None), "retries", None)
         history = getattr(retries, "history", None)
         if not history:
-            return
+            return 0
 
         try:
             retry_count = len(history)
         except TypeError:
-            return
+            return 0
 
         if retry_count > 0:
             logger.info(
@@ -91,6 +129,7 @@ class ApiClient:
                 retry_count,
                 response.status_code,
             )
+        return retry_count
 
     def _send_get(  # pylint: disable=too-many-arguments
         self,
@@ -101,33 +140,97 @@ class ApiClient:
         timeout: RequestTimeout,
         verify: VerifyOption,
         allow_redirects: bool,
+        stream: bool = False,
     ) -> requests.Response:
-        """Send a GET request and normalize request/response errors."""
+        """Send a GET request and normalize request/response errors.
+
+        The response carries a :class:`RequestTiming` as ``response.timing``.
+        """
 
+        host = urlsplit(url).hostname or ""
         try:
-            response = self.session.get(
-                url,
-                params=params,
-                headers=headers,
-                timeout=timeout,
-                verify=verify,
-                allow_redirects=allow_redirects,
-            )
+            with measure_request(host) as timing:
+                response = self.session.get(
+                    url,
+                    params=params,
+                    headers=headers,
+                    timeout=timeout,
+                    verify=verify,
+                    allow_redirects=allow_redirects,
+                    stream=stream,
+                )
         except requests.exceptions.SSLError as exc:
+            HTTP_REQUESTS.inc(host=host, outcome="ssl_error")
             raise ApiSslError(f"SSL request failed for GET {url}") from exc
         except requests.exceptions.RequestException as exc:
+            HTTP_REQUESTS.inc(host=host, outcome="connection_error")
             raise ApiConnectionError(f"Connection failed for GET {url}") from exc
 
-        self._log_retry_history(response, url)
+        retry_count = self._log_retry_history(response, url)
+        timing.attempts += retry_count
+        self._finish_timing(timing, response, url=url, stream=stream)
+        response.timing = timing
+        if retry_count:
+            HTTP_RETRIES.inc(retry_count, host=host)
 
         try:
             response.raise_for_status()
         except requests.exceptions.HTTPError as exc:
+            HTTP_REQUESTS.inc(host=host, outcome="http_error")
+            response.close()
             raise ApiResponseError(
                 f"HTTP {response.status_code} returned for GET {url}"
             ) from exc
+
+        HTTP_REQUESTS.inc(host=host, outcome="ok")
         return response
 
+    @staticmethod
+    def _finish_timing(
+        timing: RequestTiming, response: requests.Response, *, url: str, stream: bool
+    ) -> None:
+        """Fill in byte counts, then log and record the timing."""
+
+        if not stream:
+            content = response.content
+            if isinstance(content, (bytes, bytearray)):
+                timing.decoded_bytes = len(content)
+        wire_bytes = getattr(getattr(response, "raw", None), "tell", None)
+        if callable(wire_bytes):
+            value = wire_bytes()
+            timing.wire_bytes = value if isinstance(value, int) else None
+
+        logger.debug(
+            "api.request_timing method=GET url=%s dns=%.4f connect=%.4f tls=%.4f "
+            "send=%.4f wait=%.4f download=%.4f total=%.4f wire_bytes=%s "
+            "decoded_bytes=%s reused=%s attempts=%d",
+            url,
+            timing.dns,
+            timing.connect,
+            timing.tls,
+            timing.send,
+            timing.wait,
+            timing.download,
+            timing.total,
+            timing.wire_bytes,
+            timing.decoded_bytes,
+            timing.connection_reused,
+            timing.attempts,
+        )
+
+        if not registry.enabled:
+            return
+        host = timing.host
+        HTTP_REQUEST_DURATION.observe(timing.total, host=host)
+        for phase, seconds in timing.phases().items():
+            HTTP_PHASE_DURATION.observe(seconds, host=host, phase=phase)
+        if timing.connections_opened:
+            HTTP_CONNECTIONS_OPENED.inc(timing.connections_opened, host=host)
+        if timing.decoded_bytes is not None:
+            HTTP_RESPONSE_BYTES.inc(timing.decoded_bytes, host=host)
+        if timing.wire_bytes is not None:
+            HTTP_WIRE_BYTES.inc(timing.wire_bytes, host=host)
+
     def get(  # pylint: disable=too-many-arguments
         self,
         url: str,
@@ -137,11 +240,14 @@ class ApiClient:
         timeout: RequestTimeout | None = None,
         verify: VerifyOption | None = None,
         allow_redirects: bool = True,
+        stream: bool = False,
     ) -> requests.Response:
         """Perform a GET request using configured transport defaults.
 
         This method automatically raises :class:`ApiResponseError` when the
-        response status code is not successful.
+        response status code is not successful. With ``stream=True`` the body
+        is not downloaded up front; read it with ``iter_lines``/``iter_content``
+        and close the response when done.
         """
 
         resolved_timeout = timeout if timeout is not None else self.timeout
@@ -155,6 +261,7 @@ class ApiClient:
                 timeout=resolved_timeout,
                 verify=resolved_verify,
                 allow_redirects=allow_redirects,
+                stream=stream,
             )
         except ApiSslError:
             if not self.retry_insecure_on_ssl_error or verify is False:
@@ -177,6 +284,7 @@ class ApiClient:
                     timeout=resolved_timeout,
                     verify=False,
                     allow_redirects=allow_redirects,
+                    stream=stream,
                 )
             except ApiClientError as retry_exc:
                 logger.error(
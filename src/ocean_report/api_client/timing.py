@@ -0,0 +1,213 @@
+"""Per-request HTTP phase timing for the shared ApiClient transport.
+
+``requests`` only reports how long a request took in total. To see where
+the time went, the client's session mounts ``TimedHTTPAdapter``. Its
+urllib3 connection classes time each phase into the ``RequestTiming`` of
+the request in progress, which ``ApiClient`` opens around every GET:
+
+- ``dns``: resolving the host name (``getaddrinfo``);
+- ``connect``: the TCP handshake;
+- ``tls``: the TLS handshake and certificate check;
+- ``send``: writing the request line, headers and body;
+- ``wait``: from the request being sent until the response headers arrive
+  (server think-time plus one round trip);
+- ``download``: reading and decoding the body after the last response's
+  headers. It is close to zero for ``stream=True``, where the caller reads
+  the body later.
+
+Phases are summed over urllib3 retries and redirects. A request that opens
+no connection reused a pooled one. Sessions that do not mount the adapter
+still get ``total``, byte counts and retry attempts.
+"""
+
+from __future__ import annotations
+
+import socket
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import (
+    ConnectTimeoutError,
+    NameResolutionError,
+    NewConnectionError,
+)
+from urllib3.util.connection import allowed_gai_family
+
+PHASES = ("dns", "connect", "tls", "send", "wait", "download")
+
+_active_timing: ContextVar[Optional["RequestTiming"]] = ContextVar(
+    "ocean_report_request_timing", default=None
+)
+
+
+@dataclass
+class RequestTiming:  # pylint: disable=too-many-instance-attributes
+    """Where the time and bytes of one ``ApiClient`` GET went (seconds)."""
+
+    host: str
+    dns: float = 0.0
+    connect: float = 0.0
+    tls: float = 0.0
+    send: float = 0.0
+    wait: float = 0.0
+    download: float = 0.0
+    total: float = 0.0
+    wire_bytes: Optional[int] = None
+    decoded_bytes: Optional[int] = None
+    connections_opened: int = 0
+    attempts: int = 1
+    headers_received_at: Optional[float] = None
+
+    @property
+    def connection_reused(self) -> bool:
+        """True if the request was served over an already open connection."""
+        return self.connections_opened == 0
+
+    def phases(self) -> dict[str, float]:
+        """Phase name -> seconds, in request order."""
+        return {phase: getattr(self, phase) for phase in PHASES}
+
+
+@contextmanager
+def measure_request(host: str) -> Iterator[RequestTiming]:
+    """
+    Collect phase timings for requests made inside the block.
+
+    Args:
+        host: Host name the request is for.
+
+    Yields:
+        The RequestTiming being filled; ``total`` and ``download`` are set
+        when the block exits.
+    """
+    timing = RequestTiming(host=host)
+    token = _active_timing.set(timing)
+    start = time.perf_counter()
+    try:
+        yield timing
+    finally:
+        _active_timing.reset(token)
+        end = time.perf_counter()
+        timing.total = end - start
+        if timing.headers_received_at is not None:
+            timing.download = end - timing.headers_received_at
+
+
+def _add(phase: str, start: float) -> float:
+    """Add the time since ``start`` to the active timing's ``phase``."""
+    timing = _active_timing.get()
+    now = time.perf_counter()
+    if timing is not None:
+        setattr(timing, phase, getattr(timing, phase) + now - start)
+    return now
+
+
+class _TimedConnectionMixin:
+    """Times DNS, connect, send and wait on a urllib3 connection."""
+
+    def _new_conn(self) -> socket.socket:
+        timing = _active_timing.get()
+        if timing is None:
+            return super()._new_conn()
+
+        start = time.perf_counter()
+        dns_host = self._dns_host
+        try:
+            addresses = socket.getaddrinfo(
+                dns_host.strip("[]"),
+                self.port,
+                allowed_gai_family(),
+                socket.SOCK_STREAM,
+            )
+        except socket.gaierror as exc:
+            raise NameResolutionError(self.host, self, exc) from exc
+        connect_start = _add("dns", start)
+        timing.connections_opened += 1
+
+        # Connect to the resolved addresses in order, as urllib3 would.
+        try:
+            for position, address in enumerate(addresses):
+                self._dns_host = address[4][0]
+                try:
+                    return super()._new_conn()
+                except (NewConnectionError, ConnectTimeoutError):
+                    if position == len(addresses) - 1:
+                        raise
+            raise NewConnectionError(self, "getaddrinfo returned no addresses")
+        finally:
+            self._dns_host = dns_host
+            _add("connect", connect_start)
+
+    def request(self, *args: Any, **kwargs: Any) -> None:
+        start = time.perf_counter()
+        try:
+            super().request(*args, **kwargs)
+        finally:
+            _add("send", start)
+
+    def getresponse(self, *args: Any, **kwargs: Any) -> Any:
+        start = time.perf_counter()
+        try:
+            return super().getresponse(*args, **kwargs)
+        finally:
+            now = _add("wait", start)
+            timing = _active_timing.get()
+            if timing is not None:
+                timing.headers_received_at = now
+
+
+class TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    """Plain HTTP connection with phase timing."""
+
+
+class TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    """HTTPS connection with phase timing, including the TLS handshake."""
+
+    def connect(self) -> None:
+        timing = _active_timing.get()
+        if timing is None:
+            super().connect()
+            return
+        socket_time = timing.dns + timing.connect
+        start = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            # Everything in connect() except DNS and TCP is the TLS handshake.
+            elapsed = time.perf_counter() - start
+            socket_time = timing.dns + timing.connect - socket_time
+            timing.tls += max(0.0, elapsed - socket_time)
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+class TimedHTTPAdapter(HTTPAdapter):
+    """``HTTPAdapter`` whose pooled connections record phase timings."""
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _TimedHTTPConnectionPool,
+            "https": _TimedHTTPSConnectionPool,
+        }
+
+
+__all__ = [
+    "PHASES",
+    "RequestTiming",
+    "TimedHTTPAdapter",
+    "measure_request",
+]
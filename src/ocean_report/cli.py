@@ -0,0 +1,74 @@
+"""Command-line interface: the ``ocean-report`` console script."""
+
+from __future__ import annotations
+
+import argparse
+from collections.abc import Sequence
+
+from .workflows.daemon import serve
+from .workflows.http_service import serve_http
+from .workflows.report_runner import run_report
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="ocean-report", description="Daily coastal conditions email report."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Run one report and exit.")
+    run.add_argument("--config", help="Config file (default: OCEAN_REPORT_CONFIG)")
+    run.add_argument(
+        "--send-email",
+        action="store_true",
+        help="Send the email instead of printing it.",
+    )
+    run.add_argument("--test", action="store_true", help="Use test recipients.")
+    run.add_argument(
+        "--replay",
+        metavar="YYYYMMDD",
+        help="Re-render an archived run instead of fetching live data.",
+    )
+
+    serve_parser = commands.add_parser(
+        "serve",
+        help="Run reports on the serve.schedules cron schedules until stopped.",
+    )
+    serve_parser.add_argument(
+        "--config", help="Config file to load and watch for changes."
+    )
+
+    http = commands.add_parser(
+        "http", help="Serve report data and rendered bodies over local HTTP."
+    )
+    http.add_argument("--config", help="Config file (default: OCEAN_REPORT_CONFIG)")
+    http.add_argument("--host", help="Listen address (default: http_service.host)")
+    http.add_argument(
+        "--port", type=int, help="Listen port (default: http_service.port)"
+    )
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """
+    Entry point for the ``ocean-report`` command.
+
+    Returns:
+        Process exit status.
+    """
+    args = _build_parser().parse_args(argv)
+    if args.command == "serve":
+        serve(cfg_path=args.config)
+    elif args.command == "http":
+        serve_http(cfg_path=args.config, host=args.host, port=args.port)
+    else:
+        run_report(
+            cfg_path=args.config,
+            run_email=args.send_email,
+            test=args.test,
+            replay=args.replay,
+        )
+    return 0
+
+
+__all__ = ["main"]
@@ -4,9 +4,12 @@ from __future__ import annotations
 
 import re
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, ValidationInfo, field_validator
+
+from ..utils.cron import CronSchedule
 
 _ENV_PLACEHOLDER_PATTERN = re.compile(r"^\$\{[^}]+\}$")
 
@@ -27,11 +30,211 @@ class StrictModel(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
 
+class WaterTempHistoryConfig(StrictModel):
+    """Local water temperature history, refreshed with delta fetches."""
+
+    enabled: bool = False
+    path: str = "data/water-temperature.sqlite3"
+    backfill_hours: float = 168.0
+    retention_days: float = 30.0
+    time_zone: str = "America/New_York"
+
+    @field_validator("enabled", mode="before")
+    @classmethod
+    def normalize_enabled(cls, value: Any) -> bool:
+        """
+        If the value is None or an unresolved env placeholder, return the default.
+        This allows users to set env vars to empty or leave them unset to use defaults.
+        """
+        if value is None or _is_unresolved_env_placeholder(value):
+            return _field_default(cls, "enabled")
+        if isinstance(value, bool):
+            return value
+        if isinstance(value, str):
+            normalized = value.strip().lower()
+            if normalized in {"true", "1", "yes", "on"}:
+                return True
+            if normalized in {"false", "0", "no", "off"}:
+                return False
+        return bool(value)
+
+    @field_validator("path", mode="before")
+    @classmethod
+    def normalize_path(cls, value: Any) -> str:
+        """Normalize history database path."""
+        if value is None or _is_unresolved_env_placeholder(value):
+            return _field_default(cls, "path")
+        return str(value)
+
+    @field_validator("backfill_hours", mode="before")
+    @classmethod
+    def normalize_backfill_hours(cls, value: Any) -> float:
+        """
+        If the value is None or an unresolved env placeholder, return the default.
+        NOAA serves at most 31 days of 6-minute data per request.
+        """
+        if value is None or _is_unresolved_env_placeholder(value):
+            return _field_default(cls, "backfill_hours")
+        hours = float(value)
+        if not 0 < hours <= 720:
+            raise ValueError(
+                "noaa.water_temp_history.backfill_hours must be between 0 and 720"
+            )
+        return hours
+
+    @field_validator("retention_days", mode="before")
+    @classmethod
+    def normalize_retention_days(cls, value: Any) -> float:
+        """
+        If the value is None or an unresolved env placeholder, return the default.
+        Otherwise require a positive number of days.
+        """
+        if value is None or _is_unresolved_env_placeholder(value):
+            return _field_default(cls, "retention_days")
+        days = float(value)
+        if days <= 0:
+            raise ValueError(
+                "noaa.water_temp_history.retention_days must be greater than zero"
+            )
+        return days
+
+    @field_validator("time_zone", mode="before")
+    @classmethod
+    def validate_time_zone(cls, value: Any) -> str:
+        """Require the IANA zone of the station's local (``lst_ldt``) times."""
+        if value is None or _is_unresolved_env_placeholder(value):
+            return _field_default(cls, "time_zone")
+        name = str(value).strip()
+        try:
+            ZoneInfo(name)
+        except (ZoneInfoNotFoundError, ValueError) as exc:
+            raise ValueError(f"Unknown time zone: {name}") from exc
+        return name
+
+
+class StationCatalogConfig(StrictModel):
+    """Locally cached NOAA station catalog for nearest-station lookups."""
+
+    directory: str = "data/stations"
+    max_age_hours: float = 168.0
+
+    @field_validator("directory", mode="before")
+    @classmethod
+    def normalize_directory(cls, value: Any) -> str:
+        """Normalize catalog cache directory."""
+        if value is None or _is_unresolved_env_placeholder(value):
+            return _field_default(cls, "directory")
+        return str(value)
+
+    @field_validator("max_age_hours", mode="before")
+    @classmethod
+    def normalize_max_age_hours(cls, value: Any) -> float:
+        """
+        If the value is None or an unresolved env placeholder, return the default.
+        Otherwise require a positive number of hours.
+        """
+        if value is None or _is_unresolved_env_placeholder(value):
+            return _field_default(cls, "max_age_hours")
+        hours = float(value)
+        if hours <= 0:
+            raise ValueError(
+                "noaa.station_catalog.max_age_hours must be greater than zero"
+            )
+        return hours
+
+
+class TidePredictionConfig(StrictModel):
+    """Local harmonic tide prediction from cached NOAA constituents."""
+
+    enabled: bool = False
+    directory: str = "data/tide-constituents"
+    time_zone: str = "America/New_York"
+    max_age_days: float = 365.0
+
+    @field_validator("enabled", mode="before")
+    @classmethod
+    def normalize_enabled(cls, value: Any) -> bool:
+        """
+        If the value is None or an unresolved env placeholder, return the default.
+        This allows users to set env vars to empty or leave them unset to use defaults.
+        """
+        if value is None or _is_unresolved_env_placeholder(value):
+            return _field_default(cls, "enabled")
+        if isinstance(value, bool):
+            return value
+        if isinstance(value, str):
+            normalized = value.strip().lower()
+            if normalized in {"true", "1", "yes", "on"}:
+                return True
+            if normalized in {"false", "0", "no", "off"}:
+                return False
+        return bool(value)
+
+    @field_validator("directory", "time_zone", mode="before")
+    @classmethod
+    def normalize_text(cls, value: Any, info: Any) -> str:
+        """Normalize constituent cache directory and prediction time zone."""
+        if value is None or _is_unresolved_env_placeholder(value):
+            return _field_default(cls, info.field_name)
+        return str(value)
+
+    @field_validator("max_age_days", mode="before")
+    @classmethod
+    def normalize_max_age_days(cls, value: Any) -> float:
+        """
+        If the value is None or an unresolved env placeholder, return the default.
+        Otherwise require a positive number of days.
+        """
+        if value is None or _is_unresolved_env_placeholder(value):
+            return _field_default(cls, "max_age_days")
+        days = float(value)
+        if days <= 0:
+            raise ValueError(
+                "noaa.tide_prediction.max_age_days must be greater than zero"
+            )
+        return days
+
+
+class SubordinateStationConfig(StrictModel):
+    """Hi/lo offsets that derive a subordinate station from a reference station.
+
+    Leave ``reference_station_id`` empty to use the offsets NOAA publishes
+    for the station.
+    """
+
+    reference_station_id: str = ""
+    time_offset_high_minutes: float = 0.0
+    time_offset_low_minutes: float = 0.0
+    height_offset_high: float = 1.0
+    height_offset_low: float = 1.0
+    height_adjustment: Literal["ratio", "add"] = "ratio"
+
+    @field_validator("reference_station_id", mode="before")
+    @classmethod
+    def normalize_reference_station_id(cls, value: Any) -> str:
+        """Normalize the reference station ID (YAML may parse it as a number)."""
+        if value is None or _is_unresolved_env_placeholder(value):
+            return _field_default(cls, "reference_station_id")
+        return str(value)
+
+
 class NoaaConfig(StrictModel):
     """NOAA station configuration."""
 
     station_id: str = "8534720"
     buoy_id: str = "44091"
+    water_temp_history: WaterTempHistoryConfig = Field(
+        default_factory=WaterTempHistoryConfig
+    )
+    station_catalog: StationCatalogConfig = Field(
+        default_factory=StationCatalogConfig
+    )
+    tide_prediction: TidePredictionConfig = Field(
+        default_factory=TidePredictionConfig
+    )
+    subordinate_stations: dict[str, SubordinateStationConfig] = Field(
+        default_factory=dict
+    )
 
     @field_validator("station_id", "buoy_id", mode="before")
     @classmethod
@@ -44,6 +247,33 @@ class NoaaConfig(StrictModel):
             return _field_default(cls, info.field_name)
         return str(value)
 
+    @field_validator("subordinate_stations", mode="before")
+    @classmethod
+    def normalize_subordinate_stations(cls, value: Any) -> dict[str, Any]:
+        """
+        Key subordinate stations by string ID and allow empty entries.
+        An empty entry uses the offsets NOAA publishes for the station.
+        """
+        if value is None or _is_unresolved_env_placeholder(value):
+            return {}
+        if not isinstance(value, dict):
+            raise ValueError("noaa.subordinate_stations must be a mapping")
+        return {str(key): entry or {} for key, entry in value.items()}
+
+    @field_validator("subordinate_stations")
+    @classmethod
+    def validate_subordinate_references(
+        cls, value: dict[str, SubordinateStationConfig]
+    ) -> dict[str, SubordinateStationConfig]:
+        """Require reference stations that are not themselves subordinate."""
+        for station_id, entry in value.items():
+            if entry.reference_station_id in value:
+                raise ValueError(
+                    f"noaa.subordinate_stations.{station_id} references "
+                    f"subordinate station {entry.reference_station_id}"
+                )
+        return value
+
 
 class RecipientUrlsConfig(StrictModel):
     """Remote recipient list sources."""
@@ -64,6 +294,283 @@ class RecipientUrlsConfig(StrictModel):
         return str(value)
 
 
+class DeliveryConfig(StrictModel):
+    """SMTP delivery strategy for BCC recipients."""
+
+    mode: str = "single"  # Options: single, chunked
+    chunk_size: int = 50
+    max_connections: int = 4
+    max_retries: int = 2
+    backoff_seconds: float = 1.0
+
+    @field_validator("mode", mode="before")
+    @classmethod
+    def normalize_mode(cls, value: Any) -> str:
+        """Normalize delivery mode option."""
+        if value is None or _is_unresolved_env_placeholder(value):
+            return _field_default(cls, "mode")
+        mode = str(value).strip().lower()
+        if mode not in {"single", "chunked"}:
+            raise ValueError(
+                f"email.delivery.mode must be 'single' or 'chunked', got: {mode}"
+            )
+        return mode
+
+    @field_validator("chunk_size", "max_connections", mode="before")
+    @classmethod
+    def normalize_positive_ints(cls, value: Any, info: Any) -> int:
+        """
+        If the value is None or an unresolved env placeholder, return the default.
+        Otherwise require a positive integer.
+        """
+        if value is None or _is_unresolved_env_placeholder(value):
+            return _field_default(cls, info.field_name)
+        number = int(value)
+        if number < 1:
+            raise ValueError(f"email.delivery.{info.field_name} must be at least 1")
+        return number
+
+    @field_validator("max_retries", mode="before")
+    @classmethod
+    def normalize_max_retries(cls, value: Any) -> int:
+        """
+        If the value is None or an unresolved env placeholder, return the default.
+        This allows users to set env vars to empty or leave them unset to use defaults.
+        """
+        if value is None or _is_unresolved_env_placeholder(value):
+            return _field_default(cls, "max_retries")
+        retries = int(value)
+        if retries < 0:
+            raise ValueError(
+                "email.delivery.max_retries must be greater than or equal to zero"
+            )
+        return retries
+
+    @field_validator("backoff_seconds", mode="before")
+    @classmethod
+    def normalize_backoff_seconds(cls, value: Any) -> float:
+        """
+        If the value is None or an unresolved env placeholder, return the default.
+        This allows users to set env vars to empty or leave them unset to use defaults.
+        """
+        if value is None or _is_unresolved_env_placeholder(value):
+            return _field_default(cls, "backoff_seconds")
+        backoff = float(value)
+        if backoff < 0:
+            raise ValueError(
+                "email.delivery.backoff_seconds must be greater than or equal to zero"
+            )
+        return backoff
+
+
+class OutboxConfig(StrictModel):
+    """Durable outbox spool for rendered messages."""
+
+    enabled: bool = False
+    path: str = "data/outbox.sqlite3"
+    max_attempts: int = 5
+    retry_delay_seconds: float = 60.0
+    lease_seconds: float = 300.0
+    workers: int = 1
+
+    @field_validator("enabled", mode="before")
+    @classmethod
+    def normalize_enabled(cls, value: Any) -> bool:
+        """
+        If the value is None or an unresolved env placeholder, return the default.
+        This allows users to set env vars to empty or leave them unset to use defaults.
+        """
+        if value is None or _is_unresolved_env_placeholder(value):
+            return _field_default(cls, "enabled")
+        if isinstance(value, bool):
+            return value
+        if isinstance(value, str):
+            normalized = value.strip().lower()
+            if normalized in {"true", "1", "yes", "on"}:
+                return True
+            if normalized in {"false", "0", "no", "off"}:
+                return False
+        return bool(value)
+
+    @field_validator("path", mode="before")
+    @classmethod
+    def normalize_path(cls, value: Any) -> str:
+        """Normalize outbox database path."""
+        if value is None or _is_unresolved_env_placeholder(value):
+            return _field_default(cls, "path")
+        return str(value)
+
+    @field_validator("max_attempts", "workers", mode="before")
+    @classmethod
+    def normalize_positive_ints(cls, value: Any, info: Any) -> int:
+        """
+        If the value is None or an unresolved env placeholder, return the default.
+        Otherwise require a positive integer.
+        """
+        if value is None or _is_unresolved_env_placeholder(value):
+            return _field_default(cls, info.field_name)
+        number = int(value)
+        if number < 1:
+            raise ValueError(f"email.outbox.{info.field_name} must be at least 1")
+        return number
+
+    @field_validator("retry_delay_seconds", "lease_seconds", mode="before")
+    @classmethod
+    def normalize_seconds(cls, value: Any, info: Any) -> float:
+        """
+        If the value is None or an unresolved env placeholder, return the default.
+        Otherwise require a non-negative number of seconds.
+        """
+        if value is None or _is_unresolved_env_placeholder(value):
+            return _field_default(cls, info.field_name)
+        seconds = float(value)
+        if seconds < 0:
+            raise ValueError(
+                f"email.outbox.{info.field_name} must be greater than or equal to zero"
+            )
+        return seconds
+
+
+class RecipientCacheConfig(StrictModel):
+    """Local snapshots of recipient lists, refreshed with conditional GETs."""
+
+    enabled: bool = True
+    directory: str = "data/recipient-cache"
+    stale_after_hours: float = 72.0
+
+    @field_validator("enabled", mode="before")
+    @classmethod
+    def normalize_enabled(cls, value: Any) -> bool:
+        """
+        If the value is None or an unresolved env placeholder, return the default.
+        This allows users to set env vars to empty or leave them unset to use defaults.
+        """
+        if value is None or _is_unresolved_env_placeholder(value):
+            return _field_default(cls, "enabled")
+        if isinstance(value, bool):
+            return value
+        if isinstance(value, str):
+            normalized = value.strip().lower()
+            if normalized in {"true", "1", "yes", "on"}:
+                return True
+            if normalized in {"false", "0", "no", "off"}:
+                return False
+        return bool(value)
+
+    @field_validator("directory", mode="before")
+    @classmethod
+    def normalize_directory(cls, value: Any) -> str:
+        """Normalize snapshot directory path."""
+        if value is None or _is_unresolved_env_placeholder(value):
+            return _field_default(cls, "directory")
+        return str(value)
+
+    @field_validator("stale_after_hours", mode="before")
+    @classmethod
+    def normalize_stale_after_hours(cls, value: Any) -> float:
+        """
+        If the value is None or an unresolved env placeholder, return the default.
+        Otherwise require a non-negative number of hours.
+        """
+        if value is None or _is_unresolved_env_placeholder(value):
+            return _field_default(cls, "stale_after_hours")
+        hours = float(value)
+        if hours < 0:
+            raise ValueError(
+                "email.recipient_cache.stale_after_hours must be greater than or "
+                "equal to zero"
+            )
+        return hours
+
+
+class SubscriberStoreConfig(StrictModel):
+    """Local SQLite subscriber store used instead of the recipient URLs."""
+
+    enabled: bool = False
+    path: str = "data/subscribers.sqlite3"
+    location: str = "default"
+
+    @field_validator("enabled", mode="before")
+    @classmethod
+    def normalize_enabled(cls, value: Any) -> bool:
+        """
+        If the value is None or an unresolved env placeholder, return the default.
+        This allows users to set env vars to empty or leave them unset to use defaults.
+        """
+        if value is None or _is_unresolved_env_placeholder(value):
+            return _field_default(cls, "enabled")
+        if isinstance(value, bool):
+            return value
+        if isinstance(value, str):
+            normalized = value.strip().lower()
+            if normalized in {"true", "1", "yes", "on"}:
+                return True
+            if normalized in {"false", "0", "no", "off"}:
+                return False
+        return bool(value)
+
+    @field_validator("path", "location", mode="before")
+    @classmethod
+    def normalize_strings(cls, value: Any, info: Any) -> str:
+        """
+        If the value is None or an unresolved env placeholder, return the default.
+        """
+        if value is None or _is_unresolved_env_placeholder(value):
+            return _field_default(cls, info.field_name)
+        return str(value)
+
+
+class SuppressionConfig(StrictModel):
+    """Unsubscribed/bounced addresses removed before every send."""
+
+    enabled: bool = True
+    path: str = "data/suppression.txt"
+    false_positive_rate: float = 0.01
+
+    @field_validator("enabled", mode="before")
+    @classmethod
+    def normalize_enabled(cls, value: Any) -> bool:
+        """
+        If the value is None or an unresolved env placeholder, return the default.
+        This allows users to set env vars to empty or leave them unset to use defaults.
+        """
+        if value is None or _is_unresolved_env_placeholder(value):
+            return _field_default(cls, "enabled")
+        if isinstance(value, bool):
+            return value
+        if isinstance(value, str):
+            normalized = value.strip().lower()
+            if normalized in {"true", "1", "yes", "on"}:
+                return True
+            if normalized in {"false", "0", "no", "off"}:
+                return False
+        return bool(value)
+
+    @field_validator("path", mode="before")
+    @classmethod
+    def normalize_path(cls, value: Any) -> str:
+        """Normalize suppression list path."""
+        if value is None or _is_unresolved_env_placeholder(value):
+            return _field_default(cls, "path")
+        return str(value)
+
+    @field_validator("false_positive_rate", mode="before")
+    @classmethod
+    def normalize_false_positive_rate(cls, value: Any) -> float:
+        """
+        If the value is None or an unresolved env placeholder, return the default.
+        Otherwise require a rate strictly between 0 and 1.
+        """
+        if value is None or _is_unresolved_env_placeholder(value):
+            return _field_default(cls, "false_positive_rate")
+        rate = float(value)
+        if not 0 < rate < 1:
+            raise ValueError(
+                "email.suppression.false_positive_rate must be between 0 and 1"
+            )
+        return rate
+
+
 class EmailConfig(StrictModel):
     """SMTP and recipient configuration."""
 
@@ -75,6 +582,15 @@ class EmailConfig(StrictModel):
     test_recipients: str | None = None
     recipient_urls: RecipientUrlsConfig = Field(default_factory=RecipientUrlsConfig)
     use_recipient_url: bool = True
+    recipient_cache: RecipientCacheConfig = Field(
+        default_factory=RecipientCacheConfig
+    )
+    subscriber_store: SubscriberStoreConfig = Field(
+        default_factory=SubscriberStoreConfig
+    )
+    suppression: SuppressionConfig = Field(default_factory=SuppressionConfig)
+    delivery: DeliveryConfig = Field(default_factory=DeliveryConfig)
+    outbox: OutboxConfig = Field(default_factory=OutboxConfig)
 
     @field_validator("smtp_server", mode="before")
     @classmethod
@@ -181,6 +697,10 @@ class LoggingConfig(StrictModel):
     file_path: str = "logs/ocean_report.log"
     level: str = "INFO"  # Options: DEBUG, INFO, WARNING, ERROR, CRITICAL
     format: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    queued: bool = False  # Write records on a background thread
+    json_output: bool = False  # One JSON object per line instead of `format`
+    max_bytes: int = 0  # Rotate the log file at this size; 0 disables rotation
+    backup_count: int = 5  # Rotated log files to keep
 
     @field_validator("output", mode="before")
     @classmethod
@@ -225,6 +745,38 @@ class LoggingConfig(StrictModel):
             return _field_default(cls, "format")
         return str(value)
 
+    @field_validator("queued", "json_output", mode="before")
+    @classmethod
+    def normalize_bool_defaults(cls, value: Any, info: Any) -> bool:
+        """
+        If the value is None or an unresolved env placeholder, return the default.
+        This allows users to set env vars to empty or leave them unset to use defaults.
+        """
+        if value is None or _is_unresolved_env_placeholder(value):
+            return _field_default(cls, info.field_name)
+        if isinstance(value, bool):
+            return value
+        if isinstance(value, str):
+            normalized = value.strip().lower()
+            if normalized in {"true", "1", "yes", "on"}:
+                return True
+            if normalized in {"false", "0", "no", "off"}:
+                return False
+        return bool(value)
+
+    @field_validator("max_bytes", "backup_count", mode="before")
+    @classmethod
+    def normalize_rotation(cls, value: Any, info: Any) -> int:
+        """Normalize log rotation settings (non-negative integers)."""
+        if value is None or _is_unresolved_env_placeholder(value):
+            return _field_default(cls, info.field_name)
+        number = int(value)
+        if number < 0:
+            raise ValueError(
+                f"logging.{info.field_name} must be greater than or equal to zero"
+            )
+        return number
+
 
 class ApiConfig(StrictModel):
     """HTTP client behavior configuration."""
@@ -342,6 +894,360 @@ class ReportingConfig(StrictModel):
         return (project_root / path).resolve()
 
 
+class ArchiveConfig(StrictModel):
+    """Local archive of each run's raw API inputs, used for replay."""
+
+    enabled: bool = False
+    path: str = "data/runs.sqlite3"
+
+    @field_validator("enabled", mode="before")
+    @classmethod
+    def normalize_enabled(cls, value: Any) -> bool:
+        """
+        If the value is None or an unresolved env placeholder, return the default.
+        This allows users to set env vars to empty or leave them unset to use defaults.
+        """
+        if value is None or _is_unresolved_env_placeholder(value):
+            return _field_default(cls, "enabled")
+        if isinstance(value, bool):
+            return value
+        if isinstance(value, str):
+            normalized = value.strip().lower()
+            if normalized in {"true", "1", "yes", "on"}:
+                return True
+            if normalized in {"false", "0", "no", "off"}:
+                return False
+        return bool(value)
+
+    @field_validator("path", mode="before")
+    @classmethod
+    def normalize_path(cls, value: Any) -> str:
+        """Normalize run archive database path."""
+        if value is None or _is_unresolved_env_placeholder(value):
+            return _field_default(cls, "path")
+        return str(value)
+
+
+class TimeSeriesConfig(StrictModel):
+    """Memory-mapped columnar store for station observations."""
+
+    enabled: bool = False
+    directory: str = "data/timeseries"
+
+    @field_validator("enabled", mode="before")
+    @classmethod
+    def normalize_enabled(cls, value: Any) -> bool:
+        """
+        If the value is None or an unresolved env placeholder, return the default.
+        This allows users to set env vars to empty or leave them unset to use defaults.
+        """
+        if value is None or _is_unresolved_env_placeholder(value):
+            return _field_default(cls, "enabled")
+        if isinstance(value, bool):
+            return value
+        if isinstance(value, str):
+            normalized = value.strip().lower()
+            if normalized in {"true", "1", "yes", "on"}:
+                return True
+            if normalized in {"false", "0", "no", "off"}:
+                return False
+        return bool(value)
+
+    @field_validator("directory", mode="before")
+    @classmethod
+    def normalize_directory(cls, value: Any) -> str:
+        """Normalize time-series root directory."""
+        if value is None or _is_unresolved_env_placeholder(value):
+            return _field_default(cls, "directory")
+        return str(value)
+
+
+class TracingConfig(StrictModel):
+    """Chrome trace export of each report run's spans."""
+
+    enabled: bool = False
+    directory: str = "logs/traces"
+
+    @field_validator("enabled", mode="before")
+    @classmethod
+    def normalize_enabled(cls, value: Any) -> bool:
+        """
+        If the value is None or an unresolved env placeholder, return the default.
+        This allows users to set env vars to empty or leave them unset to use defaults.
+        """
+        if value is None or _is_unresolved_env_placeholder(value):
+            return _field_default(cls, "enabled")
+        if isinstance(value, bool):
+            return value
+        if isinstance(value, str):
+            normalized = value.strip().lower()
+            if normalized in {"true", "1", "yes", "on"}:
+                return True
+            if normalized in {"false", "0", "no", "off"}:
+                return False
+        return bool(value)
+
+    @field_validator("directory", mode="before")
+    @classmethod
+    def normalize_directory(cls, value: Any) -> str:
+        """Normalize trace output directory."""
+        if value is None or _is_unresolved_env_placeholder(value):
+            return _field_default(cls, "directory")
+        return str(value)
+
+
+class MetricsConfig(StrictModel):
+    """OpenMetrics textfile written at the end of each report run."""
+
+    enabled: bool = False
+    textfile_path: str = "logs/metrics/ocean_report.prom"
+
+    @field_validator("enabled", mode="before")
+    @classmethod
+    def normalize_enabled(cls, value: Any) -> bool:
+        """
+        If the value is None or an unresolved env placeholder, return the default.
+        This allows users to set env vars to empty or leave them unset to use defaults.
+        """
+        if value is None or _is_unresolved_env_placeholder(value):
+            return _field_default(cls, "enabled")
+        if isinstance(value, bool):
+            return value
+        if isinstance(value, str):
+            normalized = value.strip().lower()
+            if normalized in {"true", "1", "yes", "on"}:
+                return True
+            if normalized in {"false", "0", "no", "off"}:
+                return False
+        return bool(value)
+
+    @field_validator("textfile_path", mode="before")
+    @classmethod
+    def normalize_textfile_path(cls, value: Any) -> str:
+        """Normalize metrics textfile path."""
+        if value is None or _is_unresolved_env_placeholder(value):
+            return _field_default(cls, "textfile_path")
+        return str(value)
+
+
+class ScheduleConfig(StrictModel):
+    """One cron schedule of the ``ocean-report serve`` daemon."""
+
+    name: str
+    cron: str = "0 6 * * *"
+    timezone: str = "America/New_York"
+    send_email: bool = True
+    test: bool = False
+    # Per-location overrides; unset values come from noaa/location
+    station_id: str | None = None
+    latitude: float | None = None
+    longitude: float | None = None
+    beach_orientation_degrees: float | None = None
+
+    @field_validator("cron", mode="before")
+    @classmethod
+    def validate_cron(cls, value: Any) -> str:
+        """Reject cron expressions the scheduler cannot evaluate."""
+        if value is None or _is_unresolved_env_placeholder(value):
+            return _field_default(cls, "cron")
+        return CronSchedule.parse(str(value)).expression
+
+    @field_validator("timezone", mode="before")
+    @classmethod
+    def validate_timezone(cls, value: Any) -> str:
+        """Require an IANA time zone name such as ``America/New_York``."""
+        if value is None or _is_unresolved_env_placeholder(value):
+            return _field_default(cls, "timezone")
+        name = str(value).strip()
+        try:
+            ZoneInfo(name)
+        except (ZoneInfoNotFoundError, ValueError) as exc:
+            raise ValueError(f"Unknown time zone: {name}") from exc
+        return name
+
+    @field_validator("send_email", "test", mode="before")
+    @classmethod
+    def normalize_flags(cls, value: Any, info: Any) -> bool:
+        """
+        If the value is None or an unresolved env placeholder, return the default.
+        This allows users to set env vars to empty or leave them unset to use defaults.
+        """
+        if value is None or _is_unresolved_env_placeholder(value):
+            return _field_default(cls, info.field_name)
+        if isinstance(value, bool):
+            return value
+        if isinstance(value, str):
+            normalized = value.strip().lower()
+            if normalized in {"true", "1", "yes", "on"}:
+                return True
+            if normalized in {"false", "0", "no", "off"}:
+                return False
+        return bool(value)
+
+    @field_validator(
+        "station_id",
+        "latitude",
+        "longitude",
+        "beach_orientation_degrees",
+        mode="before",
+    )
+    @classmethod
+    def normalize_overrides(cls, value: Any) -> Any:
+        """Treat empty values and unresolved env placeholders as no override."""
+        if value == "" or _is_unresolved_env_placeholder(value):
+            return None
+        return value
+
+
+class ServeConfig(StrictModel):
+    """Schedules and reload settings of the long-running report daemon."""
+
+    schedules: list[ScheduleConfig] = Field(default_factory=list)
+    config_poll_seconds: float = 30.0
+    # Above 1, schedules due together run concurrently and format and render
+    # in a pool of this many worker processes
+    render_workers: int = 1
+
+    @field_validator("schedules", mode="before")
+    @classmethod
+    def normalize_schedules(cls, value: Any) -> list[Any]:
+        """Treat a missing schedule list as empty."""
+        if value is None or _is_unresolved_env_placeholder(value):
+            return []
+        return value
+
+    @field_validator("schedules")
+    @classmethod
+    def validate_unique_names(
+        cls, value: list[ScheduleConfig]
+    ) -> list[ScheduleConfig]:
+        """Schedule names identify jobs in logs and must be unique."""
+        names = [schedule.name for schedule in value]
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        if duplicates:
+            raise ValueError(f"Duplicate schedule names: {', '.join(duplicates)}")
+        return value
+
+    @field_validator("config_poll_seconds", mode="before")
+    @classmethod
+    def normalize_config_poll_seconds(cls, value: Any) -> float:
+        """Normalize how often the config file is checked for changes."""
+        if value is None or _is_unresolved_env_placeholder(value):
+            return _field_default(cls, "config_poll_seconds")
+        seconds = float(value)
+        if seconds <= 0:
+            raise ValueError(
+                f"serve.config_poll_seconds must be positive, got: {seconds}"
+            )
+        return seconds
+
+    @field_validator("render_workers", mode="before")
+    @classmethod
+    def normalize_render_workers(cls, value: Any) -> int:
+        """Normalize the number of render worker processes."""
+        if value is None or _is_unresolved_env_placeholder(value):
+            return _field_default(cls, "render_workers")
+        workers = int(value)
+        if workers < 1:
+            raise ValueError(
+                f"serve.render_workers must be at least 1, got: {workers}"
+            )
+        return workers
+
+
+class HttpServiceConfig(StrictModel):
+    """Local HTTP service exposing report data (``ocean-report http``)."""
+
+    host: str = "127.0.0.1"
+    port: int = 8765
+    cache_ttl_seconds: float = 300.0
+
+    @field_validator("host", mode="before")
+    @classmethod
+    def normalize_host(cls, value: Any) -> str:
+        """Normalize the listen address."""
+        if value is None or _is_unresolved_env_placeholder(value):
+            return _field_default(cls, "host")
+        return str(value).strip()
+
+    @field_validator("port", mode="before")
+    @classmethod
+    def normalize_port(cls, value: Any) -> int:
+        """Normalize the listen port (0 picks a free port)."""
+        if value is None or _is_unresolved_env_placeholder(value):
+            return _field_default(cls, "port")
+        port = int(value)
+        if not 0 <= port <= 65535:
+            raise ValueError(f"http_service.port must be 0-65535, got: {port}")
+        return port
+
+    @field_validator("cache_ttl_seconds", mode="before")
+    @classmethod
+    def normalize_cache_ttl_seconds(cls, value: Any) -> float:
+        """Normalize how long a location's report is served from memory."""
+        if value is None or _is_unresolved_env_placeholder(value):
+            return _field_default(cls, "cache_ttl_seconds")
+        seconds = float(value)
+        if seconds < 0:
+            raise ValueError(
+                f"http_service.cache_ttl_seconds must not be negative, got: {seconds}"
+            )
+        return seconds
+
+
+class StaleWhileRevalidateConfig(StrictModel):
+    """Stale-while-revalidate serving of the report data use cases."""
+
+    enabled: bool = False
+    fresh_seconds: float = 60.0
+    max_stale_seconds: float = 3600.0
+
+    @field_validator("enabled", mode="before")
+    @classmethod
+    def normalize_enabled(cls, value: Any) -> bool:
+        """
+        If the value is None or an unresolved env placeholder, return the default.
+        This allows users to set env vars to empty or leave them unset to use defaults.
+        """
+        if value is None or _is_unresolved_env_placeholder(value):
+            return _field_default(cls, "enabled")
+        if isinstance(value, bool):
+            return value
+        if isinstance(value, str):
+            normalized = value.strip().lower()
+            if normalized in {"true", "1", "yes", "on"}:
+                return True
+            if normalized in {"false", "0", "no", "off"}:
+                return False
+        return bool(value)
+
+    @field_validator("fresh_seconds", "max_stale_seconds", mode="before")
+    @classmethod
+    def normalize_seconds(cls, value: Any, info: ValidationInfo) -> float:
+        """Normalize the freshness and staleness bounds."""
+        if value is None or _is_unresolved_env_placeholder(value):
+            return _field_default(cls, info.field_name)
+        seconds = float(value)
+        if seconds < 0:
+            raise ValueError(
+                f"stale_while_revalidate.{info.field_name} must not be negative, "
+                f"got: {seconds}"
+            )
+        return seconds
+
+    @field_validator("max_stale_seconds")
+    @classmethod
+    def validate_max_stale_seconds(cls, value: float, info: ValidationInfo) -> float:
+        """A value may not be served stale for less time than it is fresh."""
+        fresh_seconds = info.data.get("fresh_seconds")
+        if fresh_seconds is not None and value < fresh_seconds:
+            raise ValueError(
+                "stale_while_revalidate.max_stale_seconds must be at least "
+                f"fresh_seconds ({fresh_seconds}), got: {value}"
+            )
+        return value
+
+
 class AppConfig(StrictModel):
     """Validated config root model."""
 
@@ -352,3 +1258,12 @@ class AppConfig(StrictModel):
     api: ApiConfig = Field(default_factory=ApiConfig)
     logging: LoggingConfig = Field(default_factory=LoggingConfig)
     reporting: ReportingConfig = Field(default_factory=ReportingConfig)
+    archive: ArchiveConfig = Field(default_factory=ArchiveConfig)
+    timeseries: TimeSeriesConfig = Field(default_factory=TimeSeriesConfig)
+    tracing: TracingConfig = Field(default_factory=TracingConfig)
+    metrics: MetricsConfig = Field(default_factory=MetricsConfig)
+    serve: ServeConfig = Field(default_factory=ServeConfig)
+    http_service: HttpServiceConfig = Field(default_factory=HttpServiceConfig)
+    stale_while_revalidate: StaleWhileRevalidateConfig = Field(
+        default_factory=StaleWhileRevalidateConfig
+    )
@@ -1,10 +1,219 @@
 """Address fetcher module for ocean report."""
 
+from __future__ import annotations
+
+import itertools
 import json
+import re
 import time
+from collections.abc import Iterable, Iterator, Sequence
+from typing import overload
+
 from ..api_client.client import ApiClient
 from ..logger import logger
 
+# Practical address check applied to lowercased, stripped entries: a dot-atom
+# local part and a dotted domain of alphanumeric labels with inner hyphens.
+# Possessive quantifiers keep matching linear with no backtracking.
+EMAIL_PATTERN = re.compile(
+    r"[a-z0-9.!#$%&'*+/=?^_`{|}~-]++"
+    r"@[a-z0-9]++(?:-++[a-z0-9]++)*+(?:\.[a-z0-9]++(?:-++[a-z0-9]++)*+)++"
+)
+
+# Matches a run of valid newline-terminated entries. Scanning a joined batch
+# with it costs one regex call per invalid entry instead of one per address.
+_VALID_RUN_PATTERN = re.compile(rf"(?>(?:{EMAIL_PATTERN.pattern})\n)*")
+
+# Lines joined per batch; large enough that per-batch overhead is negligible.
+PARSE_BATCH_LINES = 65_536
+
+# Response chunk size used when streaming a recipient list.
+STREAM_CHUNK_BYTES = 64 * 1024
+
+# Invalid entries kept on a RecipientSet for log output.
+MAX_INVALID_SAMPLES = 20
+
+
+class RecipientSet(Sequence[str]):
+    """Immutable, de-duplicated, validated recipient addresses.
+
+    Addresses are stored once, lowercased, in first-seen order, so the set can
+    be handed straight to the sender (it is a ``Sequence[str]``). Membership
+    checks build a hash index on first use.
+    """
+
+    __slots__ = ("_addresses", "_index", "duplicates", "invalid", "invalid_count")
+
+    def __init__(
+        self,
+        addresses: Iterable[str] = (),
+        *,
+        duplicates: int = 0,
+        invalid_count: int = 0,
+        invalid: Sequence[str] = (),
+    ) -> None:
+        self._addresses: tuple[str, ...] = tuple(addresses)
+        self._index: frozenset[str] | None = None
+        self.duplicates = duplicates
+        self.invalid_count = invalid_count
+        self.invalid: tuple[str, ...] = tuple(invalid)
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> tuple[str, ...]: ...
+
+    def __getitem__(self, index: int | slice) -> str | tuple[str, ...]:
+        return self._addresses[index]
+
+    def __len__(self) -> int:
+        return len(self._addresses)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._addresses)
+
+    def __contains__(self, address: object) -> bool:
+        if not isinstance(address, str):
+            return False
+        if self._index is None:
+            self._index = frozenset(self._addresses)
+        return address.strip().lower() in self._index
+
+    def __repr__(self) -> str:
+        return (
+            f"RecipientSet({len(self)} addresses, {self.duplicates} duplicates, "
+            f"{self.invalid_count} invalid)"
+        )
+
+    def to_csv(self) -> str:
+        """Return the addresses as a comma-separated string."""
+        return ",".join(self._addresses)
+
+
+def parse_recipient_lines(
+    lines: Iterable[str | bytes], *, batch_lines: int = PARSE_BATCH_LINES
+) -> RecipientSet:
+    """
+    Normalize, de-duplicate, and validate recipients from an iterable of lines.
+
+    Lines may hold one address or several separated by commas. Input is
+    consumed in batches, so a streamed response never has to be held in
+    memory as one string. Each batch is lowercased and split in one pass,
+    de-duplicated with a dict, and validated against :data:`EMAIL_PATTERN`
+    by scanning the joined batch, so no Python code runs per valid address.
+
+    Args:
+        lines: Raw lines, e.g. ``response.iter_lines()`` or ``str.splitlines()``.
+            Bytes are decoded as UTF-8.
+        batch_lines: Number of lines processed per batch.
+
+    Returns:
+        RecipientSet: Valid addresses in first-seen order.
+    """
+    seen: dict[str, None] = {}
+    rejected: dict[str, None] = {}
+    entries = 0
+    iterator = iter(lines)
+
+    while True:
+        batch = list(itertools.islice(iterator, batch_lines))
+        if not batch:
+            break
+        if isinstance(batch[0], bytes):
+            text = b"\n".join(batch).decode("utf-8", errors="replace").lower()
+        else:
+            text = "\n".join(batch).lower()
+        if "," in text:
+            text = text.replace(",", "\n")
+
+        stripped = list(map(str.strip, text.splitlines()))
+        entries += len(stripped) - stripped.count("")
+        candidates = dict.fromkeys(stripped)
+        candidates.pop("", None)
+        for address in _find_invalid(candidates):
+            del candidates[address]
+            rejected[address] = None
+        seen.update(candidates)
+
+    invalid = list(itertools.islice(rejected, MAX_INVALID_SAMPLES))
+    return RecipientSet(
+        seen,
+        duplicates=entries - len(seen) - len(rejected),
+        invalid_count=len(rejected),
+        invalid=invalid,
+    )
+
+
+def _find_invalid(candidates: Iterable[str]) -> list[str]:
+    """Return the entries in ``candidates`` that fail :data:`EMAIL_PATTERN`."""
+    text = "\n".join(candidates) + "\n"
+    invalid: list[str] = []
+    position = 0
+    end = len(text) if text != "\n" else 0
+    while True:
+        run = _VALID_RUN_PATTERN.match(text, position)
+        position = run.end() if run else position
+        if position >= end:
+            return invalid
+        line_end = text.index("\n", position)
+        invalid.append(text[position:line_end])
+        position = line_end + 1
+
+
+def stream_recipients_from_gist(
+    *,
+    client: ApiClient,
+    url: str,
+) -> RecipientSet:
+    """
+    Stream a recipient list from a Gist URL and parse it line by line.
+
+    Args:
+        client: HTTP client for making the request.
+        url: URL to the Gist raw text file.
+
+    Returns:
+        RecipientSet: Normalized, de-duplicated, valid addresses.
+
+    Raises:
+        ValueError: If the URL is empty.
+        ApiClientError: If the request fails (connection, SSL, or HTTP error).
+    """
+    if not url:
+        raise ValueError("Gist URL is not set.")
+
+    logger.debug("    → Streaming recipients from Gist: %s", url)
+    fetch_start = time.time()
+    response = client.get(url, stream=True)
+    try:
+        response.encoding = response.encoding or "utf-8"
+        recipients = parse_recipient_lines(
+            response.iter_lines(chunk_size=STREAM_CHUNK_BYTES, decode_unicode=True)
+        )
+    finally:
+        response.close()
+
+    logger.debug(
+        "    ✓ %d recipients streamed from Gist in %.2f seconds",
+        len(recipients),
+        time.time() - fetch_start,
+    )
+    log_recipient_issues(recipients)
+    return recipients
+
+
+def log_recipient_issues(recipients: RecipientSet) -> None:
+    """Log duplicate and invalid entries dropped while parsing."""
+    if recipients.duplicates:
+        logger.debug("    → Dropped %d duplicate recipients", recipients.duplicates)
+    if recipients.invalid_count:
+        logger.warning(
+            "    ⚠ Skipped %d invalid recipient entries (e.g. %s)",
+            recipients.invalid_count,
+            ", ".join(recipients.invalid[:3]),
+        )
+
 
 def fetch_recipients_from_gist(
     *,
@@ -59,3 +268,14 @@ def parse_recipients(text: str, verbose: bool = False) -> str:
         print(json.dumps(cleaned, indent=2))
 
     return ",".join(cleaned)
+
+
+__all__ = [
+    "EMAIL_PATTERN",
+    "RecipientSet",
+    "fetch_recipients_from_gist",
+    "log_recipient_issues",
+    "parse_recipient_lines",
+    "parse_recipients",
+    "stream_recipients_from_gist",
+]
@@ -0,0 +1,365 @@
+"""Durable on-disk outbox for rendered email messages.
+
+Rendered messages are spooled to a SQLite database before delivery so that a
+failed SMTP send can be retried later without re-fetching data or re-rendering
+the template. Messages are claimed with a lease, which lets several dispatcher
+workers (threads or processes) drain the same outbox safely. A worker records
+an outcome only while it still holds the lease; once the lease has expired
+and another worker re-claimed the message, the stale worker's updates are
+rejected with ``OutboxLeaseLostError``.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, Optional, Sequence
+
+from ..logger import logger
+
+STATUS_PENDING = "pending"
+STATUS_SENDING = "sending"
+STATUS_SENT = "sent"
+STATUS_DEAD = "dead"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    message_id TEXT NOT NULL UNIQUE,
+    subject TEXT NOT NULL,
+    body TEXT NOT NULL,
+    sender_email TEXT NOT NULL,
+    to_email TEXT NOT NULL DEFAULT '',
+    bcc_json TEXT NOT NULL DEFAULT '[]',
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT,
+    created_at REAL NOT NULL,
+    next_attempt_at REAL NOT NULL,
+    lease_owner TEXT,
+    lease_expires_at REAL,
+    last_attempt_at REAL,
+    sent_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_outbox_ready ON outbox (status, next_attempt_at);
+"""
+
+
+class OutboxLeaseLostError(Exception):
+    """Raised when a worker updates a message it no longer holds a lease on."""
+
+
+@dataclass(frozen=True)
+class OutboxMessage:
+    """A fully rendered message stored in the outbox."""
+
+    id: int
+    message_id: str
+    subject: str
+    body: str
+    sender_email: str
+    to_email: str
+    bcc_list: tuple[str, ...]
+    status: str
+    attempts: int
+    last_error: Optional[str] = None
+    lease_owner: Optional[str] = None
+
+
+class Outbox:
+    """SQLite-backed spool of rendered messages awaiting delivery.
+
+    Each operation opens a short-lived connection, so one ``Outbox`` instance
+    can be shared between threads and several processes can point at the same
+    file.
+    """
+
+    def __init__(self, path: str | Path, *, lease_seconds: float = 300.0) -> None:
+        self.path = Path(path)
+        self.lease_seconds = lease_seconds
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection in autocommit mode with WAL journaling."""
+        conn = sqlite3.connect(self.path, timeout=30.0, isolation_level=None)
+        try:
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            yield conn
+        finally:
+            conn.close()
+
+    def enqueue(
+        self,
+        *,
+        subject: str,
+        body: str,
+        sender_email: str,
+        to_email: str = "",
+        bcc_list: Sequence[str] = (),
+    ) -> OutboxMessage:
+        """Store a rendered message for delivery and return it."""
+        now = time.time()
+        message_id = uuid.uuid4().hex
+        bcc = list(bcc_list)
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "INSERT INTO outbox (message_id, subject, body, sender_email, "
+                "to_email, bcc_json, created_at, next_attempt_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    message_id,
+                    subject,
+                    body,
+                    sender_email,
+                    to_email,
+                    json.dumps(bcc),
+                    now,
+                    now,
+                ),
+            )
+            row_id = cursor.lastrowid
+
+        logger.info(
+            "  ✓ Message %s queued in outbox (%d BCC recipients)",
+            message_id,
+            len(bcc),
+        )
+        return OutboxMessage(
+            id=row_id,
+            message_id=message_id,
+            subject=subject,
+            body=body,
+            sender_email=sender_email,
+            to_email=to_email,
+            bcc_list=tuple(bcc),
+            status=STATUS_PENDING,
+            attempts=0,
+        )
+
+    def claim(
+        self,
+        *,
+        worker_id: str,
+        limit: int = 1,
+        not_attempted_since: Optional[float] = None,
+    ) -> list[OutboxMessage]:
+        """Lease up to ``limit`` ready messages to ``worker_id``.
+
+        Ready messages are pending messages whose retry time has passed, or
+        messages whose previous lease expired (e.g. a crashed worker).
+
+        Args:
+            worker_id: Identifier recorded as the lease owner.
+            limit: Maximum number of messages to claim.
+            not_attempted_since: If set, ignore retry schedules and instead
+                claim pending messages not attempted since this timestamp.
+                Used by manual dispatch runs so each message is tried once.
+        """
+        now = time.time()
+        if not_attempted_since is None:
+            pending_clause = "(status = ? AND next_attempt_at <= ?)"
+            pending_args: tuple = (STATUS_PENDING, now)
+        else:
+            pending_clause = (
+                "(status = ? AND (last_attempt_at IS NULL OR last_attempt_at < ?))"
+            )
+            pending_args = (STATUS_PENDING, not_attempted_since)
+
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                rows = conn.execute(
+                    f"SELECT * FROM outbox WHERE {pending_clause} "
+                    "OR (status = ? AND lease_expires_at < ?) "
+                    "ORDER BY id LIMIT ?",
+                    (*pending_args, STATUS_SENDING, now, limit),
+                ).fetchall()
+                conn.executemany(
+                    "UPDATE outbox SET status = ?, lease_owner = ?, "
+                    "lease_expires_at = ?, last_attempt_at = ?, "
+                    "attempts = attempts + 1 WHERE id = ?",
+                    [
+                        (
+                            STATUS_SENDING,
+                            worker_id,
+                            now + self.lease_seconds,
+                            now,
+                            row["id"],
+                        )
+                        for row in rows
+                    ],
+                )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+        return [
+            _row_to_message(
+                row,
+                status=STATUS_SENDING,
+                attempts=row["attempts"] + 1,
+                lease_owner=worker_id,
+            )
+            for row in rows
+        ]
+
+    def renew_lease(self, message: OutboxMessage) -> None:
+        """Extend the lease on a claimed message by ``lease_seconds``.
+
+        Long deliveries call this as they progress, so the message is not
+        re-claimed by another worker while it is still being sent.
+
+        Raises:
+            OutboxLeaseLostError: If another worker has claimed the message.
+        """
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE outbox SET lease_expires_at = ? "
+                f"WHERE {_LEASE_HELD_CLAUSE}",
+                (time.time() + self.lease_seconds, *_lease_args(message)),
+            )
+        _check_lease(cursor, message)
+
+    def mark_sent(self, message: OutboxMessage) -> None:
+        """Record a successful delivery.
+
+        Raises:
+            OutboxLeaseLostError: If another worker has claimed the message.
+        """
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE outbox SET status = ?, sent_at = ?, last_error = NULL, "
+                "lease_owner = NULL, lease_expires_at = NULL "
+                f"WHERE {_LEASE_HELD_CLAUSE}",
+                (STATUS_SENT, time.time(), *_lease_args(message)),
+            )
+        _check_lease(cursor, message)
+
+    def mark_failed(
+        self,
+        message: OutboxMessage,
+        *,
+        error: str,
+        max_attempts: int,
+        retry_delay_seconds: float,
+        retry_recipients: Optional[Sequence[str]] = None,
+    ) -> str:
+        """Record a failed delivery and schedule a retry or give up.
+
+        Args:
+            message: The claimed message that failed.
+            error: Error description stored for operators.
+            max_attempts: Attempts after which the message is marked dead.
+            retry_delay_seconds: Base delay, doubled for each attempt.
+            retry_recipients: If given, only these BCC recipients are retried
+                (used after a partial chunked delivery).
+
+        Returns:
+            The new status (``pending`` or ``dead``).
+
+        Raises:
+            OutboxLeaseLostError: If another worker has claimed the message.
+        """
+        status = STATUS_DEAD if message.attempts >= max_attempts else STATUS_PENDING
+        next_attempt_at = time.time() + retry_delay_seconds * (
+            2 ** max(message.attempts - 1, 0)
+        )
+        bcc = list(message.bcc_list if retry_recipients is None else retry_recipients)
+        to_email = message.to_email if retry_recipients is None else ""
+        if message.to_email and message.to_email in bcc:
+            bcc.remove(message.to_email)
+            to_email = message.to_email
+
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE outbox SET status = ?, last_error = ?, next_attempt_at = ?, "
+                "to_email = ?, bcc_json = ?, lease_owner = NULL, "
+                f"lease_expires_at = NULL WHERE {_LEASE_HELD_CLAUSE}",
+                (
+                    status,
+                    error,
+                    next_attempt_at,
+                    to_email,
+                    json.dumps(bcc),
+                    *_lease_args(message),
+                ),
+            )
+        _check_lease(cursor, message)
+        return status
+
+    def get(self, message_id: str) -> Optional[OutboxMessage]:
+        """Look up a message by its public message id."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT * FROM outbox WHERE message_id = ?", (message_id,)
+            ).fetchone()
+        return None if row is None else _row_to_message(row)
+
+    def counts(self) -> dict[str, int]:
+        """Return the number of messages per status."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT status, COUNT(*) AS total FROM outbox GROUP BY status"
+            ).fetchall()
+        return {row["status"]: row["total"] for row in rows}
+
+
+_LEASE_HELD_CLAUSE = "id = ? AND lease_owner = ? AND status = ?"
+
+
+def _lease_args(message: OutboxMessage) -> tuple:
+    """Parameters for ``_LEASE_HELD_CLAUSE``."""
+    return (message.id, message.lease_owner, STATUS_SENDING)
+
+
+def _check_lease(cursor: sqlite3.Cursor, message: OutboxMessage) -> None:
+    """Raise if a lease-guarded update matched no row."""
+    if cursor.rowcount == 0:
+        raise OutboxLeaseLostError(
+            f"Lease on outbox message {message.message_id} held by "
+            f"{message.lease_owner!r} was lost to another worker"
+        )
+
+
+def _row_to_message(
+    row: sqlite3.Row,
+    *,
+    status: Optional[str] = None,
+    attempts: Optional[int] = None,
+    lease_owner: Optional[str] = None,
+) -> OutboxMessage:
+    """Build an OutboxMessage from a database row."""
+    return OutboxMessage(
+        id=row["id"],
+        message_id=row["message_id"],
+        subject=row["subject"],
+        body=row["body"],
+        sender_email=row["sender_email"],
+        to_email=row["to_email"],
+        bcc_list=tuple(json.loads(row["bcc_json"])),
+        status=status or row["status"],
+        attempts=row["attempts"] if attempts is None else attempts,
+        last_error=row["last_error"],
+        lease_owner=lease_owner or row["lease_owner"],
+    )
+
+
+__all__ = [
+    "Outbox",
+    "OutboxLeaseLostError",
+    "OutboxMessage",
+    "STATUS_DEAD",
+    "STATUS_PENDING",
+    "STATUS_SENDING",
+    "STATUS_SENT",
+]
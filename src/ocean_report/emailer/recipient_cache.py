@@ -0,0 +1,284 @@
+"""Local snapshots of remote recipient lists.
+
+Each recipient URL is mirrored to a snapshot on disk together with the
+``ETag`` and ``Last-Modified`` validators from the last download. Refreshes
+send ``If-None-Match``/``If-Modified-Since``, so an unchanged list costs one
+small ``304 Not Modified`` round trip, and the snapshot is served whenever the
+upstream is unreachable.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Optional
+
+import requests
+
+from ..api_client.client import ApiClient
+from ..api_client.exceptions import ApiClientError, ApiConnectionError
+from ..logger import logger
+from .address_fetcher import (
+    STREAM_CHUNK_BYTES,
+    RecipientSet,
+    log_recipient_issues,
+    parse_recipient_lines,
+)
+
+HTTP_NOT_MODIFIED = 304
+
+
+@dataclass(frozen=True)
+class RecipientSnapshot:
+    """Metadata for one cached recipient list."""
+
+    url: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    downloaded_at: float
+    validated_at: float
+    count: int
+
+    def age_seconds(self, now: Optional[float] = None) -> float:
+        """Seconds since the snapshot was last confirmed current upstream."""
+        current = time.time() if now is None else now
+        return max(current - self.validated_at, 0.0)
+
+
+class RecipientSnapshotStore:
+    """Directory of recipient snapshots keyed by URL."""
+
+    def __init__(self, directory: str | Path) -> None:
+        self.directory = Path(directory)
+
+    def _paths(self, url: str) -> tuple[Path, Path]:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()[:16]
+        return (
+            self.directory / f"{key}.txt",
+            self.directory / f"{key}.json",
+        )
+
+    def load(self, url: str) -> Optional[tuple[RecipientSnapshot, RecipientSet]]:
+        """Return the snapshot and its recipients, or None if not cached."""
+        list_path, meta_path = self._paths(url)
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            text = list_path.read_text(encoding="utf-8")
+        except (OSError, ValueError):
+            return None
+
+        snapshot = RecipientSnapshot(
+            url=meta["url"],
+            etag=meta.get("etag"),
+            last_modified=meta.get("last_modified"),
+            downloaded_at=float(meta["downloaded_at"]),
+            validated_at=float(meta["validated_at"]),
+            count=int(meta["count"]),
+        )
+        # Snapshots hold already-normalized addresses, one per line.
+        return snapshot, RecipientSet(text.split("\n") if text else ())
+
+    def save(self, snapshot: RecipientSnapshot, recipients: RecipientSet) -> None:
+        """Write a snapshot atomically (list first, then metadata)."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        list_path, _ = self._paths(snapshot.url)
+        _atomic_write(list_path, "\n".join(recipients))
+        self.save_metadata(snapshot)
+
+    def save_metadata(self, snapshot: RecipientSnapshot) -> None:
+        """Rewrite only the metadata file (e.g. after a 304)."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        _, meta_path = self._paths(snapshot.url)
+        _atomic_write(
+            meta_path,
+            json.dumps(
+                {
+                    "url": snapshot.url,
+                    "etag": snapshot.etag,
+                    "last_modified": snapshot.last_modified,
+                    "downloaded_at": snapshot.downloaded_at,
+                    "validated_at": snapshot.validated_at,
+                    "count": snapshot.count,
+                },
+                indent=2,
+            ),
+        )
+
+
+def sync_recipients(
+    *,
+    client: ApiClient,
+    url: str,
+    store: RecipientSnapshotStore,
+    stale_after_hours: float = 72.0,
+) -> RecipientSet:
+    """
+    Return the recipient list for ``url``, refreshing the local snapshot.
+
+    Sends a conditional GET when a snapshot exists. On ``304 Not Modified``
+    the snapshot is served; on ``200`` the body is streamed, parsed and
+    stored. If the request or the body download fails, the snapshot is
+    served if there is one. A body with no valid addresses never replaces a
+    non-empty snapshot; the snapshot is served and a warning logged.
+
+    Args:
+        client: HTTP client for making the request.
+        url: URL to the Gist raw text file.
+        store: Snapshot store for this URL.
+        stale_after_hours: Age after which a served snapshot is reported as
+            stale in the logs.
+
+    Returns:
+        RecipientSet: Normalized, de-duplicated, valid addresses.
+
+    Raises:
+        ValueError: If the URL is empty.
+        ApiClientError: If the request or download fails and no snapshot
+            exists.
+    """
+    if not url:
+        raise ValueError("Gist URL is not set.")
+
+    cached = store.load(url)
+    headers: dict[str, str] = {}
+    if cached is not None:
+        snapshot, _ = cached
+        if snapshot.etag:
+            headers["If-None-Match"] = snapshot.etag
+        if snapshot.last_modified:
+            headers["If-Modified-Since"] = snapshot.last_modified
+
+    logger.debug(
+        "    → Syncing recipients from %s (conditional=%s)", url, bool(headers)
+    )
+    fetch_start = time.time()
+    try:
+        response = client.get(url, headers=headers or None, stream=True)
+        try:
+            if response.status_code == HTTP_NOT_MODIFIED and cached is not None:
+                snapshot, recipients = cached
+                now = time.time()
+                store.save_metadata(replace(snapshot, validated_at=now))
+                _log_snapshot_age(snapshot, now, stale_after_hours)
+                logger.debug(
+                    "    ✓ Recipient list unchanged (304) in %.2f seconds",
+                    time.time() - fetch_start,
+                )
+                return recipients
+
+            response.encoding = response.encoding or "utf-8"
+            recipients = parse_recipient_lines(
+                response.iter_lines(chunk_size=STREAM_CHUNK_BYTES, decode_unicode=True)
+            )
+            headers_in = response.headers
+        except requests.exceptions.RequestException as exc:
+            raise ApiConnectionError(f"Download interrupted for GET {url}") from exc
+        finally:
+            response.close()
+    except ApiClientError as exc:
+        if cached is None:
+            raise
+        return _serve_snapshot(
+            cached, exc, url=url, stale_after_hours=stale_after_hours
+        )
+
+    if not recipients and cached is not None and cached[1]:
+        logger.warning(
+            "    ⚠ Recipient list at %s has no valid addresses; keeping the "
+            "local snapshot with %d recipients",
+            url,
+            len(cached[1]),
+        )
+        return cached[1]
+
+    now = time.time()
+    store.save(
+        RecipientSnapshot(
+            url=url,
+            etag=headers_in.get("ETag"),
+            last_modified=headers_in.get("Last-Modified"),
+            downloaded_at=now,
+            validated_at=now,
+            count=len(recipients),
+        ),
+        recipients,
+    )
+    logger.debug(
+        "    ✓ %d recipients downloaded and cached in %.2f seconds",
+        len(recipients),
+        time.time() - fetch_start,
+    )
+    log_recipient_issues(recipients)
+    return recipients
+
+
+def _serve_snapshot(
+    cached: tuple[RecipientSnapshot, RecipientSet],
+    error: Exception,
+    *,
+    url: str,
+    stale_after_hours: float,
+) -> RecipientSet:
+    """Serve the snapshot after a failed refresh, logging its age."""
+    snapshot, recipients = cached
+    age = snapshot.age_seconds()
+    logger.warning(
+        "    ⚠ Recipient list fetch failed (%s); using local snapshot "
+        "with %d recipients, last confirmed current %s ago",
+        error,
+        len(recipients),
+        _format_age(age),
+    )
+    if age > stale_after_hours * 3600:
+        logger.warning(
+            "    ⚠ Recipient snapshot for %s is older than %.0f hours",
+            url,
+            stale_after_hours,
+        )
+    return recipients
+
+
+def _log_snapshot_age(
+    snapshot: RecipientSnapshot, now: float, stale_after_hours: float
+) -> None:
+    """Log how long ago the cached list last changed upstream."""
+    changed_age = max(now - snapshot.downloaded_at, 0.0)
+    if changed_age > stale_after_hours * 3600:
+        logger.info(
+            "    → Recipient list unchanged upstream for %s (%d recipients)",
+            _format_age(changed_age),
+            snapshot.count,
+        )
+    else:
+        logger.debug(
+            "    → Recipient snapshot last changed %s ago", _format_age(changed_age)
+        )
+
+
+def _format_age(seconds: float) -> str:
+    """Format an age in seconds as a short human-readable string."""
+    if seconds < 120:
+        return f"{seconds:.0f}s"
+    if seconds < 7200:
+        return f"{seconds / 60:.0f}m"
+    if seconds < 172800:
+        return f"{seconds / 3600:.1f}h"
+    return f"{seconds / 86400:.1f}d"
+
+
+def _atomic_write(path: Path, text: str) -> None:
+    """Write ``text`` to ``path`` via a temporary file and rename."""
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(text, encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+__all__ = [
+    "RecipientSnapshot",
+    "RecipientSnapshotStore",
+    "sync_recipients",
+]
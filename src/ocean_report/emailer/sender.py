@@ -2,14 +2,30 @@
 
 import smtplib
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
 from dataclasses import dataclass, field
 from email.mime.text import MIMEText
-from typing import List, Optional
+from typing import Callable, List, Optional, Sequence
 
 from ..logger import logger
-# from ..application.context import ApplicationContext
+from ..metrics import registry
+from ..tracing import span
 
-# from .config import get_settings
+EMAIL_SEND_DURATION = registry.histogram(
+    "ocean_report_email_send_duration_seconds",
+    "SMTP delivery time of one report email, by send mode.",
+    labelnames=("mode",),
+)
+EMAIL_RECIPIENTS = registry.counter(
+    "ocean_report_email_recipients_total",
+    "Report recipients by delivery outcome.",
+    labelnames=("outcome",),
+)
+SMTP_RETRIES = registry.counter(
+    "ocean_report_smtp_retries_total",
+    "Chunk delivery attempts beyond the first.",
+)
 
 
 @dataclass(frozen=True)
@@ -20,6 +36,73 @@ class EmailRecipients:
     bcc_list: List[str] = field(default_factory=list)
 
 
+class EmailDeliveryError(Exception):
+    """Raised when a chunked delivery could not reach any recipient."""
+
+
+@dataclass(frozen=True)
+class ChunkResult:
+    """Outcome of delivering one envelope chunk."""
+
+    index: int
+    recipients: int
+    delivered: int
+    failed_recipients: tuple[str, ...] = ()
+    attempts: int = 1
+    error: Optional[str] = None
+
+    @property
+    def failed(self) -> int:
+        """Number of recipients in this chunk that were not delivered."""
+        return len(self.failed_recipients)
+
+
+@dataclass(frozen=True)
+class DeliveryReport:
+    """Aggregated outcome of a chunked delivery."""
+
+    chunks: tuple[ChunkResult, ...] = ()
+    duration_seconds: float = 0.0
+
+    @property
+    def delivered(self) -> int:
+        """Total recipients accepted by the SMTP server."""
+        return sum(chunk.delivered for chunk in self.chunks)
+
+    @property
+    def failed(self) -> int:
+        """Total recipients that could not be delivered."""
+        return sum(chunk.failed for chunk in self.chunks)
+
+    @property
+    def failed_recipients(self) -> list[str]:
+        """Every recipient address that could not be delivered."""
+        return [
+            address for chunk in self.chunks for address in chunk.failed_recipients
+        ]
+
+
+def chunk_recipients(recipients: Sequence[str], chunk_size: int) -> list[list[str]]:
+    """
+    Split recipients into envelope chunks of at most ``chunk_size`` addresses.
+
+    Args:
+        recipients: Recipient addresses in delivery order.
+        chunk_size: Maximum number of envelope recipients per message.
+
+    Returns:
+        List of recipient chunks. Empty addresses are dropped.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1.")
+
+    addresses = [address for address in recipients if address]
+    return [
+        addresses[start : start + chunk_size]
+        for start in range(0, len(addresses), chunk_size)
+    ]
+
+
 def send_email(  # pylint: disable=too-many-arguments,too-many-locals,too-many-statements
     *,
     subject: str = "🌊 Daily Water Report",
@@ -47,6 +130,7 @@ def send_email(  # pylint: disable=too-many-arguments,too-many-locals,too-many-s
 
     if not bcc_list:
         bcc_list = [""]
+    recipient_count = len({address for address in [to_email, *bcc_list] if address})
 
     logger.debug("    → Preparing email message...")
     logger.debug("    → From: %s", sender_email)
@@ -67,55 +151,316 @@ def send_email(  # pylint: disable=too-many-arguments,too-many-locals,too-many-s
 
     # Connect to the SMTP server and send the email
     logger.info("    → Connecting to SMTP server: %s:%s", smtp_server, smtp_port)
-    smtp_start = time.time()
 
-    try:
-        with smtplib.SMTP(smtp_server, smtp_port) as server:
-            connect_time = time.time() - smtp_start
+    with span(
+        "smtp.send_email", server=smtp_server, recipients=len(bcc_list)
+    ) as smtp_span:
+        try:
+            with span("smtp.connect") as step:
+                connection = smtplib.SMTP(smtp_server, smtp_port)
             logger.debug(
-                "    ✓ SMTP connection established in %.2f seconds", connect_time
+                "    ✓ SMTP connection established in %.2f seconds", step.duration
             )
+            with connection as server:
+                logger.debug("    → Starting TLS upgrade...")
+                with span("smtp.starttls") as step:
+                    server.starttls()  # Upgrade the connection to secure
+                logger.debug(
+                    "    ✓ TLS upgrade completed in %.2f seconds", step.duration
+                )
 
-            logger.debug("    → Starting TLS upgrade...")
-            tls_start = time.time()
-            server.starttls()  # Upgrade the connection to secure
-            logger.debug(
-                "    ✓ TLS upgrade completed in %.2f seconds", time.time() - tls_start
-            )
+                logger.debug("    → Authenticating with SMTP server...")
+                with span("smtp.login") as step:
+                    server.login(sender_email, email_password)
+                logger.debug(
+                    "    ✓ SMTP authentication succeeded in %.2f seconds",
+                    step.duration,
+                )
 
-            logger.debug("    → Authenticating with SMTP server...")
-            auth_start = time.time()
-            server.login(sender_email, email_password)
-            logger.debug(
-                "    ✓ SMTP authentication succeeded in %.2f seconds",
-                time.time() - auth_start,
+                logger.debug("    → Sending email message...")
+                with span("smtp.send_message") as step:
+                    server.send_message(msg)  # Send the message
+                logger.debug(
+                    "    ✓ Email message sent in %.2f seconds", step.duration
+                )
+
+        except smtplib.SMTPException as e:
+            EMAIL_RECIPIENTS.inc(recipient_count, outcome="failed")
+            logger.error(
+                "    ✗ SMTP error after %.2f seconds: %s", smtp_span.duration, e
+            )
+            raise
+        except Exception as e:
+            EMAIL_RECIPIENTS.inc(recipient_count, outcome="failed")
+            logger.error(
+                "    ✗ Unexpected error during email send after %.2f seconds: %s",
+                smtp_span.duration,
+                e,
             )
+            raise
 
-            logger.debug("    → Sending email message...")
-            send_start = time.time()
-            server.send_message(msg)  # Send the message
-            logger.debug(
-                "    ✓ Email message sent in %.2f seconds", time.time() - send_start
+    EMAIL_SEND_DURATION.observe(smtp_span.duration, mode="single")
+    EMAIL_RECIPIENTS.inc(recipient_count, outcome="delivered")
+    logger.info("    ✓ Email sent successfully!")
+    logger.info("    ✓ SMTP operations took %.2f seconds total", smtp_span.duration)
+    logger.info(
+        "    ✓ Complete email operation took %.2f seconds",
+        time.time() - operation_start,
+    )
+
+
+def send_email_chunked(  # pylint: disable=too-many-arguments,too-many-locals
+    *,
+    subject: str = "🌊 Daily Water Report",
+    body: str = "Here is the daily water report.",
+    sender_email: str = "from-person@example.com",
+    email_password: Optional[str] = None,
+    recipients: Optional[EmailRecipients] = None,
+    smtp_server: Optional[str] = None,
+    smtp_port: Optional[int] = None,
+    chunk_size: int = 50,
+    max_connections: int = 4,
+    max_retries: int = 2,
+    backoff_seconds: float = 1.0,
+    before_chunk: Optional[Callable[[int], None]] = None,
+) -> DeliveryReport:
+    """Send email in envelope chunks over parallel SMTP connections.
+
+    BCC recipients never appear in a header; each chunk carries its addresses
+    only in the SMTP envelope (RCPT TO). Chunks are spread across up to
+    ``max_connections`` connections, and each chunk is retried on its own so a
+    failing chunk does not affect the others.
+
+    Args:
+        before_chunk: Called with each chunk's index before it is sent, from
+            the connection's worker thread. An exception stops that worker's
+            remaining chunks and is re-raised here (the outbox dispatcher
+            renews its lease this way).
+
+    Returns:
+        DeliveryReport with delivered and failed counts per chunk.
+
+    Raises:
+        ValueError: If the password is missing or chunk settings are invalid.
+        EmailDeliveryError: If there were recipients but none were delivered.
+    """
+    operation_start = time.time()
+
+    if email_password is None:
+        raise ValueError("Email password must be provided.")
+    if max_connections < 1:
+        raise ValueError("max_connections must be at least 1.")
+
+    to_email = "" if recipients is None else recipients.to_email
+    bcc_list = [] if recipients is None else recipients.bcc_list
+
+    if to_email == "example-recipient@gmail.com" or to_email is None:
+        to_email = ""
+
+    envelope = ([to_email] if to_email else []) + [
+        address for address in bcc_list if address and address != to_email
+    ]
+    chunks = chunk_recipients(envelope, chunk_size)
+
+    msg = MIMEText(body)
+    msg["Subject"] = subject
+    msg["From"] = sender_email
+    # An empty To header is malformed; name the BCC-only audience instead.
+    msg["To"] = to_email or "undisclosed-recipients:;"
+
+    if not chunks:
+        logger.warning("    ⚠ No recipients to deliver to, skipping send")
+        return DeliveryReport(duration_seconds=time.time() - operation_start)
+
+    workers = min(max_connections, len(chunks))
+    logger.info(
+        "    → Delivering to %d recipients in %d chunks over %d connections",
+        len(envelope),
+        len(chunks),
+        workers,
+    )
+
+    assignments = [
+        [(index, chunks[index]) for index in range(worker, len(chunks), workers)]
+        for worker in range(workers)
+    ]
+    settings = _SmtpSettings(
+        server=smtp_server,
+        port=smtp_port,
+        sender_email=sender_email,
+        email_password=email_password,
+        max_retries=max_retries,
+        backoff_seconds=backoff_seconds,
+    )
+
+    # Each worker runs in a copy of this context so its spans nest under the
+    # caller's and reach its tracer.collect() block.
+    with ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="smtp-chunk"
+    ) as executor:
+        futures = [
+            executor.submit(
+                copy_context().run,
+                _deliver_assigned_chunks,
+                msg,
+                assigned,
+                settings,
+                before_chunk,
             )
+            for assigned in assignments
+        ]
+        batches = [future.result() for future in futures]
 
-        total_smtp_time = time.time() - smtp_start
-        total_operation_time = time.time() - operation_start
+    report = DeliveryReport(
+        chunks=tuple(
+            sorted(
+                (result for batch in batches for result in batch),
+                key=lambda result: result.index,
+            )
+        ),
+        duration_seconds=time.time() - operation_start,
+    )
 
-        logger.info("    ✓ Email sent successfully!")
-        logger.info("    ✓ SMTP operations took %.2f seconds total", total_smtp_time)
-        logger.info(
-            "    ✓ Complete email operation took %.2f seconds", total_operation_time
+    EMAIL_SEND_DURATION.observe(report.duration_seconds, mode="chunked")
+    EMAIL_RECIPIENTS.inc(report.delivered, outcome="delivered")
+    EMAIL_RECIPIENTS.inc(report.failed, outcome="failed")
+    SMTP_RETRIES.inc(sum(chunk.attempts - 1 for chunk in report.chunks))
+    logger.info(
+        "    ✓ Chunked delivery finished in %.2f seconds (%d delivered, %d failed)",
+        report.duration_seconds,
+        report.delivered,
+        report.failed,
+    )
+    if report.delivered == 0:
+        raise EmailDeliveryError(
+            f"Chunked delivery failed for all {report.failed} recipients."
         )
+    return report
 
-    except smtplib.SMTPException as e:
-        logger.error(
-            "    ✗ SMTP error after %.2f seconds: %s", time.time() - smtp_start, e
-        )
-        raise
-    except Exception as e:
-        logger.error(
-            "    ✗ Unexpected error during email send after %.2f seconds: %s",
-            time.time() - smtp_start,
-            e,
-        )
-        raise
+
+@dataclass(frozen=True)
+class _SmtpSettings:
+    """Connection and retry settings shared by chunk workers."""
+
+    server: Optional[str]
+    port: Optional[int]
+    sender_email: str
+    email_password: str
+    max_retries: int
+    backoff_seconds: float
+
+
+def _open_smtp_connection(settings: _SmtpSettings) -> smtplib.SMTP:
+    """Connect, upgrade to TLS, and authenticate a new SMTP session."""
+    with span("smtp.connect", server=settings.server):
+        server = smtplib.SMTP(settings.server, settings.port)
+        try:
+            server.starttls()
+            server.login(settings.sender_email, settings.email_password)
+        except Exception:
+            _close_smtp_connection(server)
+            raise
+    return server
+
+
+def _close_smtp_connection(server: Optional[smtplib.SMTP]) -> None:
+    """Close an SMTP session, ignoring errors from an already broken link."""
+    if server is None:
+        return
+    try:
+        server.quit()
+    except (smtplib.SMTPException, OSError):
+        server.close()
+
+
+def _deliver_assigned_chunks(
+    msg: MIMEText,
+    assigned: list[tuple[int, list[str]]],
+    settings: _SmtpSettings,
+    before_chunk: Optional[Callable[[int], None]] = None,
+) -> list[ChunkResult]:
+    """Deliver a worker's chunks over one reused SMTP connection."""
+    results = []
+    server: Optional[smtplib.SMTP] = None
+
+    try:
+        for index, chunk in assigned:
+            if before_chunk is not None:
+                before_chunk(index)
+            server, result = _deliver_chunk(server, msg, index, chunk, settings)
+            results.append(result)
+    finally:
+        _close_smtp_connection(server)
+
+    return results
+
+
+def _deliver_chunk(
+    server: Optional[smtplib.SMTP],
+    msg: MIMEText,
+    index: int,
+    chunk: list[str],
+    settings: _SmtpSettings,
+) -> tuple[Optional[smtplib.SMTP], ChunkResult]:
+    """Deliver one chunk, reconnecting and retrying on transient failures."""
+    attempts = 0
+    last_error: Optional[Exception] = None
+
+    while attempts <= settings.max_retries:
+        attempts += 1
+        try:
+            if server is None:
+                server = _open_smtp_connection(settings)
+            with span("smtp.chunk", index=index, recipients=len(chunk)):
+                refused = server.send_message(
+                    msg, from_addr=settings.sender_email, to_addrs=chunk
+                )
+            failed = tuple(address for address in chunk if address in refused)
+            logger.debug(
+                "    ✓ Chunk %d delivered (%d/%d accepted, attempt %d)",
+                index,
+                len(chunk) - len(failed),
+                len(chunk),
+                attempts,
+            )
+            return server, ChunkResult(
+                index=index,
+                recipients=len(chunk),
+                delivered=len(chunk) - len(failed),
+                failed_recipients=failed,
+                attempts=attempts,
+            )
+        except smtplib.SMTPRecipientsRefused as exc:
+            # Every address was rejected; retrying cannot change that.
+            logger.warning("    ⚠ Chunk %d: all recipients refused", index)
+            return server, ChunkResult(
+                index=index,
+                recipients=len(chunk),
+                delivered=0,
+                failed_recipients=tuple(chunk),
+                attempts=attempts,
+                error=str(exc),
+            )
+        except (smtplib.SMTPException, OSError) as exc:
+            last_error = exc
+            _close_smtp_connection(server)
+            server = None
+            logger.warning(
+                "    ⚠ Chunk %d attempt %d/%d failed: %s",
+                index,
+                attempts,
+                settings.max_retries + 1,
+                exc,
+            )
+            if attempts <= settings.max_retries:
+                time.sleep(settings.backoff_seconds * (2 ** (attempts - 1)))
+
+    logger.error("    ✗ Chunk %d failed after %d attempts", index, attempts)
+    return server, ChunkResult(
+        index=index,
+        recipients=len(chunk),
+        delivered=0,
+        failed_recipients=tuple(chunk),
+        attempts=attempts,
+        error=str(last_error),
+    )
@@ -0,0 +1,212 @@
+"""Local SQLite subscriber store with indexed segment queries.
+
+Subscriptions are keyed by ``(location, season, is_test, email)`` in a
+``WITHOUT ROWID`` table, so every segment is a contiguous range of the
+primary key and a segment query is a single index range scan with no
+network round trip.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import time
+from collections.abc import Iterable
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+from ..logger import logger
+from .address_fetcher import RecipientSet, parse_recipient_lines
+
+SEASON_SUMMER = "summer"
+SEASON_OFFSEASON = "offseason"
+SEASON_ALL = "all"
+SEASONS = frozenset({SEASON_SUMMER, SEASON_OFFSEASON, SEASON_ALL})
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS subscriptions (
+    location TEXT NOT NULL,
+    season TEXT NOT NULL,
+    is_test INTEGER NOT NULL DEFAULT 0,
+    email TEXT NOT NULL,
+    added_at REAL NOT NULL,
+    PRIMARY KEY (location, season, is_test, email)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_subscriptions_email ON subscriptions (email);
+"""
+
+
+class SubscriberStore:
+    """SQLite-backed subscriber segments.
+
+    Like the outbox, each operation opens a short-lived connection, so one
+    instance can be shared between threads.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection in autocommit mode with WAL journaling."""
+        conn = sqlite3.connect(self.path, timeout=30.0, isolation_level=None)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            yield conn
+        finally:
+            conn.close()
+
+    def import_segment(
+        self,
+        addresses: Iterable[str],
+        *,
+        location: str,
+        season: str,
+        is_test: bool = False,
+        replace: bool = True,
+    ) -> int:
+        """
+        Store ``addresses`` as the members of one segment.
+
+        Args:
+            addresses: Normalized addresses (e.g. a RecipientSet).
+            location: Location key of the segment.
+            season: ``summer``, ``offseason`` or ``all``.
+            is_test: Whether this is a test segment.
+            replace: If True, members not in ``addresses`` are removed so the
+                segment mirrors its source list exactly.
+
+        Returns:
+            Number of members in the segment after the import.
+
+        Raises:
+            ValueError: If ``season`` is not a known season.
+        """
+        _check_season(season)
+        now = time.time()
+        key = (location, season, int(is_test))
+
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                if replace:
+                    conn.execute(
+                        "DELETE FROM subscriptions "
+                        "WHERE location = ? AND season = ? AND is_test = ?",
+                        key,
+                    )
+                conn.executemany(
+                    "INSERT OR IGNORE INTO subscriptions "
+                    "(location, season, is_test, email, added_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    ((*key, address, now) for address in addresses),
+                )
+                (count,) = conn.execute(
+                    "SELECT COUNT(*) FROM subscriptions "
+                    "WHERE location = ? AND season = ? AND is_test = ?",
+                    key,
+                ).fetchone()
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+        logger.info(
+            "  ✓ Imported %d subscribers into segment %s/%s%s",
+            count,
+            location,
+            season,
+            " (test)" if is_test else "",
+        )
+        return count
+
+    def import_text(
+        self,
+        text: str,
+        *,
+        location: str,
+        season: str,
+        is_test: bool = False,
+        replace: bool = True,
+    ) -> int:
+        """Import a recipient list in the Gist format (lines and/or commas)."""
+        recipients = parse_recipient_lines(text.splitlines())
+        return self.import_segment(
+            recipients,
+            location=location,
+            season=season,
+            is_test=is_test,
+            replace=replace,
+        )
+
+    def segment(
+        self,
+        *,
+        location: str,
+        season: str,
+        is_test: bool = False,
+    ) -> RecipientSet:
+        """
+        Return the subscribers of one segment.
+
+        Members subscribed for ``all`` seasons are included in every season.
+
+        Args:
+            location: Location key of the segment.
+            season: ``summer`` or ``offseason`` (or ``all`` for year-round only).
+            is_test: Whether to read the test segment.
+
+        Returns:
+            RecipientSet: Segment members in primary-key order (address order
+            within each season).
+        """
+        _check_season(season)
+        seasons = (season,) if season == SEASON_ALL else (season, SEASON_ALL)
+        placeholders = ", ".join("?" for _ in seasons)
+
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT email FROM subscriptions "
+                f"WHERE location = ? AND season IN ({placeholders}) AND is_test = ?",
+                (location, *seasons, int(is_test)),
+            ).fetchall()
+
+        return RecipientSet(dict.fromkeys(row[0] for row in rows))
+
+    def remove(self, email: str) -> int:
+        """Remove an address from every segment; return rows deleted."""
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "DELETE FROM subscriptions WHERE email = ?",
+                (email.strip().lower(),),
+            )
+        return cursor.rowcount
+
+    def counts(self) -> dict[tuple[str, str, bool], int]:
+        """Return the member count of every segment."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT location, season, is_test, COUNT(*) FROM subscriptions "
+                "GROUP BY location, season, is_test"
+            ).fetchall()
+        return {(loc, season, bool(test)): total for loc, season, test, total in rows}
+
+
+def _check_season(season: str) -> None:
+    """Reject unknown season names."""
+    if season not in SEASONS:
+        raise ValueError(
+            f"Unknown season {season!r}; expected one of {sorted(SEASONS)}"
+        )
+
+
+__all__ = [
+    "SEASON_ALL",
+    "SEASON_OFFSEASON",
+    "SEASON_SUMMER",
+    "SEASONS",
+    "SubscriberStore",
+]
@@ -0,0 +1,224 @@
+"""Suppression list: addresses that must never be emailed again.
+
+Unsubscribed and bounced addresses are kept on disk as a sorted text file
+(one normalized address per line). For filtering, the list is loaded into a
+:class:`SuppressionFilter`: a compact bloom filter that rejects almost every
+non-suppressed recipient with a few vectorized bit lookups, backed by the
+exact sorted array for confirming the rare positives with a binary search.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import time
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from ..logger import logger
+from .address_fetcher import RecipientSet, parse_recipient_lines
+
+_SPLITMIX_GAMMA = np.uint64(0x9E3779B97F4A7C15)
+_SPLITMIX_MUL1 = np.uint64(0xBF58476D1CE4E5B9)
+_SPLITMIX_MUL2 = np.uint64(0x94D049BB133111EB)
+
+
+@dataclass(frozen=True)
+class SuppressionResult:
+    """Recipients left after suppression, and those removed."""
+
+    recipients: RecipientSet
+    suppressed: tuple[str, ...]
+
+
+class SuppressionFilter:
+    """Bloom filter over a suppression list with exact confirmation.
+
+    Hashes use Python's built-in ``hash`` (computed in C for every address at
+    once) expanded into ``k`` bit positions by double hashing in numpy, so
+    neither building nor querying runs Python code per address. Bloom
+    positives are confirmed with :func:`numpy.searchsorted` against the
+    sorted list held as one fixed-width bytes array, so results are exact
+    and the list costs roughly its raw size in memory.
+    """
+
+    def __init__(
+        self, sorted_addresses: Sequence[str], *, false_positive_rate: float = 0.01
+    ) -> None:
+        if not 0 < false_positive_rate < 1:
+            raise ValueError("false_positive_rate must be between 0 and 1.")
+        count = max(len(sorted_addresses), 1)
+        bits = math.ceil(-count * math.log(false_positive_rate) / math.log(2) ** 2)
+        self.num_bits = max(bits, 64)
+        self.num_hashes = max(round(self.num_bits / count * math.log(2)), 1)
+
+        flags = np.zeros(self.num_bits, dtype=bool)
+        if sorted_addresses:
+            flags[self._positions(sorted_addresses).ravel()] = True
+        self._bits = np.packbits(flags, bitorder="little")
+        # UTF-8 preserves code point order, so the encoded list stays sorted.
+        self._sorted = np.array(
+            "\n".join(sorted_addresses).encode("utf-8").split(b"\n")
+            if sorted_addresses
+            else [],
+            dtype=bytes,
+        )
+
+    @property
+    def size_bytes(self) -> int:
+        """Memory used by the bloom bit array and the confirm array."""
+        return int(self._bits.nbytes + self._sorted.nbytes)
+
+    def __len__(self) -> int:
+        return len(self._sorted)
+
+    def _positions(self, addresses: Sequence[str]) -> np.ndarray:
+        """Return a (len(addresses), k) array of bit positions."""
+        h1 = np.fromiter(map(hash, addresses), dtype=np.int64, count=len(addresses))
+        h1 = h1.view(np.uint64)
+        h2 = _splitmix64(h1) | np.uint64(1)
+        steps = np.arange(self.num_hashes, dtype=np.uint64)
+        with np.errstate(over="ignore"):
+            combined = h1[:, None] + steps[None, :] * h2[:, None]
+        return (combined % np.uint64(self.num_bits)).astype(np.int64)
+
+    def might_contain_many(self, addresses: Sequence[str]) -> np.ndarray:
+        """Bloom check for many addresses; False means definitely absent."""
+        if not addresses:
+            return np.zeros(0, dtype=bool)
+        positions = self._positions(addresses)
+        hits = (self._bits[positions >> 3] >> (positions & 7).astype(np.uint8)) & 1
+        return hits.all(axis=1)
+
+    def contains_many(self, addresses: Sequence[str]) -> np.ndarray:
+        """Exact membership for many addresses."""
+        result = self.might_contain_many(addresses)
+        candidates = np.flatnonzero(result)
+        if candidates.size:
+            result[candidates] = self._confirm([addresses[i] for i in candidates])
+        return result
+
+    def __contains__(self, address: object) -> bool:
+        if not isinstance(address, str):
+            return False
+        return bool(self.contains_many([address])[0])
+
+    def _confirm(self, addresses: Sequence[str]) -> np.ndarray:
+        """Exact membership via binary search of the sorted bytes array."""
+        if not len(self._sorted):
+            return np.zeros(len(addresses), dtype=bool)
+        encoded = [address.encode("utf-8") for address in addresses]
+        width = self._sorted.dtype.itemsize
+        fits = np.fromiter(map(len, encoded), dtype=np.int64) <= width
+        queries = np.array(encoded, dtype=self._sorted.dtype)
+        index = np.searchsorted(self._sorted, queries)
+        found = index < len(self._sorted)
+        found[found] = self._sorted[index[found]] == queries[found]
+        return found & fits
+
+    def filter(self, recipients: Sequence[str]) -> SuppressionResult:
+        """
+        Remove suppressed addresses from ``recipients``.
+
+        Args:
+            recipients: Normalized addresses (e.g. a RecipientSet).
+
+        Returns:
+            SuppressionResult with the kept RecipientSet and removed addresses.
+        """
+        candidates = list(recipients)
+        matches = self.contains_many(candidates)
+        suppressed = {candidates[index] for index in np.flatnonzero(matches)}
+        if not suppressed:
+            if isinstance(recipients, RecipientSet):
+                return SuppressionResult(recipients=recipients, suppressed=())
+            return SuppressionResult(
+                recipients=RecipientSet(candidates), suppressed=()
+            )
+        return SuppressionResult(
+            recipients=RecipientSet(a for a in candidates if a not in suppressed),
+            suppressed=tuple(a for a in candidates if a in suppressed),
+        )
+
+
+class SuppressionList:
+    """Sorted on-disk suppression list."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+
+    def read(self) -> list[str]:
+        """Return the sorted suppressed addresses (empty if no file)."""
+        try:
+            text = self.path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return []
+        addresses = text.split("\n") if text else []
+        if any(a > b for a, b in zip(addresses, addresses[1:])):
+            addresses.sort()
+        return addresses
+
+    def add(self, addresses: Iterable[str]) -> int:
+        """
+        Add addresses to the list and return how many were new.
+
+        Entries are normalized and validated like recipient lists.
+        """
+        incoming = parse_recipient_lines(addresses)
+        current = self.read()
+        merged = sorted(set(current).union(incoming))
+        added = len(merged) - len(current)
+        if added:
+            self._write(merged)
+        return added
+
+    def remove(self, addresses: Iterable[str]) -> int:
+        """Remove addresses (e.g. re-subscribed); return how many were removed."""
+        removing = set(parse_recipient_lines(addresses))
+        current = self.read()
+        kept = [address for address in current if address not in removing]
+        removed = len(current) - len(kept)
+        if removed:
+            self._write(kept)
+        return removed
+
+    def load_filter(self, *, false_positive_rate: float = 0.01) -> SuppressionFilter:
+        """Load the list and build a :class:`SuppressionFilter` over it."""
+        load_start = time.time()
+        suppression_filter = SuppressionFilter(
+            self.read(), false_positive_rate=false_positive_rate
+        )
+        logger.debug(
+            "  ✓ Loaded %d suppressed addresses (%.1f KiB bloom filter) "
+            "in %.2f seconds",
+            len(suppression_filter),
+            suppression_filter.size_bytes / 1024,
+            time.time() - load_start,
+        )
+        return suppression_filter
+
+    def _write(self, sorted_addresses: Sequence[str]) -> None:
+        """Atomically replace the list file."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text("\n".join(sorted_addresses), encoding="utf-8")
+        os.replace(tmp_path, self.path)
+
+
+def _splitmix64(values: np.ndarray) -> np.ndarray:
+    """SplitMix64 finalizer: derive a well-mixed second hash from the first."""
+    with np.errstate(over="ignore"):
+        z = values + _SPLITMIX_GAMMA
+        z = (z ^ (z >> np.uint64(30))) * _SPLITMIX_MUL1
+        z = (z ^ (z >> np.uint64(27))) * _SPLITMIX_MUL2
+        return z ^ (z >> np.uint64(31))
+
+
+__all__ = [
+    "SuppressionFilter",
+    "SuppressionList",
+    "SuppressionResult",
+]
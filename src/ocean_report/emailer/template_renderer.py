@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
-from jinja2 import Environment, FileSystemLoader, TemplateError
+from jinja2 import Environment, FileSystemLoader, Template, TemplateError
 
 from ..config import get_settings, get_template_path
 from ..logger import logger
@@ -48,16 +49,7 @@ def render_email_template(
     logger.info("Rendering email template: %s", template_path.name)
 
     try:
-        # Set up Jinja2 environment
-        env = Environment(
-            loader=FileSystemLoader(template_path.parent),
-            trim_blocks=True,
-            lstrip_blocks=True,
-            autoescape=False,  # Email is plain text, not HTML
-        )
-
-        # Load template
-        template = env.get_template(template_path.name)
+        template = get_compiled_template(template_path)
 
         # Get config for defaults (used in template filters/fallbacks)
         config = get_settings()
@@ -78,6 +70,36 @@ def render_email_template(
         raise
 
 
+def get_compiled_template(template_path: str | Path) -> Template:
+    """
+    Return the compiled template, parsing it only on first use or after edits.
+
+    Calling this ahead of time (e.g. in a worker initializer) moves the
+    parse out of the first render.
+    """
+    template_path = Path(template_path)
+    env = _get_environment(str(template_path.parent.resolve()))
+    return env.get_template(template_path.name)
+
+
+@lru_cache(maxsize=16)
+def _get_environment(directory: str) -> Environment:
+    """
+    Return the shared Jinja2 environment for a template directory.
+
+    The environment caches compiled templates and, with ``auto_reload``,
+    checks the file's modification time on each lookup, so repeated renders
+    in one process (the ``serve`` daemon, worker pools) skip re-parsing.
+    """
+    return Environment(
+        loader=FileSystemLoader(directory),
+        trim_blocks=True,
+        lstrip_blocks=True,
+        autoescape=False,  # Email is plain text, not HTML
+        auto_reload=True,
+    )
+
+
 def load_template_content(template_path: Optional[str | Path] = None) -> str:
     """
     Load raw template content without rendering.
@@ -103,4 +125,9 @@ def load_template_content(template_path: Optional[str | Path] = None) -> str:
     return template_path.read_text(encoding="utf-8")
 
 
-__all__ = ["EmailTemplateData", "render_email_template", "load_template_content"]
+__all__ = [
+    "EmailTemplateData",
+    "get_compiled_template",
+    "render_email_template",
+    "load_template_content",
+]
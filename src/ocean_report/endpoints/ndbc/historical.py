@@ -0,0 +1,93 @@
+"""NDBC historical standard meteorological (stdmet) archive endpoint."""
+
+from __future__ import annotations
+
+import gzip
+import io
+from collections.abc import Iterator
+
+import pandas as pd
+import requests
+
+from ...api_client.exceptions import ApiConnectionError, ApiResponseError
+from .base import NdbcEndpoint
+from .parser import iter_ndbc_frames
+
+DOWNLOAD_CHUNK_BYTES = 64 * 1024
+PARSE_CHUNK_ROWS = 20_000
+
+
+class NdbcHistoricalEndpoint(NdbcEndpoint):
+    """NDBC endpoint for yearly gzip'd stdmet archives.
+
+    Files live at ``data/historical/stdmet/<buoy>h<year>.txt.gz``. They are
+    streamed: the response body is read in ``chunk_bytes`` pieces,
+    decompressed incrementally and parsed ``chunk_rows`` at a time, so memory
+    stays bounded regardless of file size.
+    """
+
+    PATH = "data/historical/stdmet"
+
+    @staticmethod
+    def filename(station_id: str, year: int) -> str:
+        """Archive file name, e.g. ``44091h2024.txt.gz``."""
+
+        return f"{station_id.lower()}h{year}.txt.gz"
+
+    def iter_frames(
+        self,
+        station_id: str,
+        year: int,
+        *,
+        chunk_rows: int = PARSE_CHUNK_ROWS,
+        chunk_bytes: int = DOWNLOAD_CHUNK_BYTES,
+    ) -> Iterator[pd.DataFrame]:
+        """Stream one yearly archive as parsed frames in file (time) order."""
+
+        response = self.client.get(
+            self.build_url(f"{self.PATH}/{self.filename(station_id, year)}"),
+            stream=True,
+        )
+        try:
+            raw = _ChunkReader(response.iter_content(chunk_size=chunk_bytes))
+            with gzip.GzipFile(fileobj=raw) as decompressed:
+                text = io.TextIOWrapper(decompressed, encoding="ascii", errors="replace")
+                yield from iter_ndbc_frames(text, chunk_rows=chunk_rows)
+        except (requests.exceptions.RequestException, EOFError) as exc:
+            raise ApiConnectionError(
+                f"Download interrupted for GET {response.url}"
+            ) from exc
+        except gzip.BadGzipFile as exc:
+            raise ApiResponseError(f"Invalid gzip body for GET {response.url}") from exc
+        finally:
+            response.close()
+
+
+class _ChunkReader(io.RawIOBase):
+    """Read-only binary stream over an iterator of byte chunks."""
+
+    def __init__(self, chunks: Iterator[bytes]) -> None:
+        super().__init__()
+        self._chunks = iter(chunks)
+        self._pending = memoryview(b"")
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._pending:
+            try:
+                self._pending = memoryview(next(self._chunks))
+            except StopIteration:
+                return 0
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+
+__all__ = [
+    "DOWNLOAD_CHUNK_BYTES",
+    "PARSE_CHUNK_ROWS",
+    "NdbcHistoricalEndpoint",
+]
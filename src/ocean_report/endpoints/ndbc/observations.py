@@ -2,24 +2,39 @@
 
 from __future__ import annotations
 
+import pandas as pd
+
 from ...models.ndbc.observations import (
     NdbcObservation,
     NdbcObservationsParams,
     NdbcObservationsResponse,
 )
 from .base import NdbcEndpoint
+from .parser import ndbc_observations, parse_ndbc_text
 
 
 class NdbcObservationsEndpoint(NdbcEndpoint):
-    """NDBC endpoint wrapper for observation data retrieval."""
+    """NDBC endpoint wrapper for realtime observation files.
+
+    NDBC serves the last 45 days per buoy as whitespace-delimited text at
+    ``data/realtime2/<station>.<txt|spec|ocean>``; there is no JSON API.
+    """
 
     PATH = "data/realtime2"
 
+    def fetch_frame(self, params: NdbcObservationsParams) -> pd.DataFrame:
+        """Retrieve a realtime file and parse it into a time-indexed frame."""
+
+        response = self.get_response(f"{self.PATH}/{params.filename}")
+        return parse_ndbc_text(response.text)
+
     def fetch(self, params: NdbcObservationsParams) -> NdbcObservationsResponse:
-        """Retrieve and validate NDBC observation data."""
+        """Retrieve standard meteorological data as observation records."""
 
-        payload = self.get_json(self.PATH, params=params.to_query_params())
-        return self.parse_model(NdbcObservationsResponse, payload)
+        frame = self.fetch_frame(params)
+        return NdbcObservationsResponse(
+            observations=ndbc_observations(frame, station_id=params.station_id)
+        )
 
     get = fetch
 
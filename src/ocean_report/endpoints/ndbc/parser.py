@@ -0,0 +1,260 @@
+"""Parser for NDBC whitespace-delimited buoy data files.
+
+NDBC serves realtime (``data/realtime2/<station>.txt``, ``.spec``,
+``.ocean``) and historical (``stdmet``) observations as text tables::
+
+    #YY  MM DD hh mm WDIR WSPD GST  WVHT ...  WTMP ...
+    #yr  mo dy hr mn degT m/s  m/s     m ...  degC ...
+    2025 07 04 12 50  200  5.0  6.0   0.8 ...  21.3 ...
+
+The first line names the columns and the optional second line gives units.
+Missing values are written as ``MM``. Older historical files have a single
+header line without ``#``, a ``YYYY`` or two-digit ``YY`` year, may not have
+a minute column, use ``WD``/``BAR`` for ``WDIR``/``PRES``, and mark missing
+values with 99/999/9999 sentinels; all of these are normalized here.
+
+Parsing is handed to pandas' C reader, so a 45-day realtime file or a full
+year of historical data is parsed without per-row Python work.
+"""
+
+from __future__ import annotations
+
+import io
+import math
+from collections.abc import Iterator
+from typing import IO, Optional
+
+import numpy as np
+import pandas as pd
+
+from ...models.ndbc.observations import NdbcObservation
+
+MISSING_MARKERS = ["MM"]
+MS_TO_KNOTS = 1.9438444924406046
+
+_YEAR_COLUMNS = ("YY", "YYYY")
+_COLUMN_ALIASES = {"WD": "WDIR", "BAR": "PRES"}
+# Missing-value sentinels in older stdmet files (impossible as real readings).
+_SENTINELS = {
+    "WDIR": [999],
+    "WSPD": [99],
+    "GST": [99],
+    "WVHT": [99],
+    "DPD": [99],
+    "APD": [99],
+    "MWD": [999],
+    "PRES": [9999],
+    "ATMP": [99, 999],
+    "WTMP": [99, 999],
+    "DEWP": [99, 999],
+    "VIS": [99],
+    "TIDE": [99],
+}
+_TIME_COLUMNS = ("MM", "DD", "hh", "mm")
+
+
+def parse_ndbc_text(source: str | bytes | IO[str]) -> pd.DataFrame:
+    """
+    Parse an NDBC buoy data file into a frame.
+
+    Args:
+        source: File contents, or an open text stream positioned at the header.
+
+    Returns:
+        DataFrame indexed by UTC ``timestamp`` (ascending) with one column per
+        measurement (``WDIR``, ``WSPD``, ``WTMP`` ...). Missing values are NaN.
+        Units from the second header line are in ``frame.attrs["units"]``.
+
+    Raises:
+        ValueError: If the header has no date/time columns.
+    """
+    return _frame(next(iter_ndbc_frames(source)))
+
+
+def iter_ndbc_frames(
+    source: str | bytes | IO[str], *, chunk_rows: Optional[int] = None
+) -> Iterator[pd.DataFrame]:
+    """
+    Parse an NDBC buoy data file, optionally in chunks of ``chunk_rows``.
+
+    Chunked parsing keeps memory bounded for large (e.g. decompressed
+    historical) streams. Rows are yielded in file order, so chunks are not
+    sorted against each other.
+
+    Args:
+        source: File contents, or an open text stream positioned at the header.
+        chunk_rows: Rows per frame. If None, yields a single frame.
+
+    Yields:
+        DataFrames shaped like :func:`parse_ndbc_text` results, unsorted.
+
+    Raises:
+        ValueError: If the header has no date/time columns.
+    """
+    stream = _text_stream(source)
+    columns = _header_columns(stream.readline())
+    if not any(column in columns for column in _YEAR_COLUMNS):
+        raise ValueError(f"NDBC header has no year column: {columns}")
+
+    units: dict[str, str] = {}
+    units_line = stream.readline()
+    if units_line.startswith("#"):
+        units = dict(zip(columns, units_line.lstrip("#").split()))
+        data: IO[str] = stream
+    else:
+        data = _Prepended(units_line, stream)
+
+    reader = pd.read_csv(
+        data,
+        sep=r"\s+",
+        header=None,
+        names=columns,
+        na_values={
+            column: MISSING_MARKERS + _SENTINELS.get(column, [])
+            for column in columns
+        },
+        keep_default_na=False,
+        comment="#",
+        chunksize=chunk_rows,
+    )
+    if chunk_rows is None:
+        reader = iter([reader])
+    empty = True
+    for chunk in reader:
+        empty = False
+        frame = _index_by_time(chunk)
+        frame.attrs["units"] = units
+        yield frame
+    if empty:
+        frame = _index_by_time(pd.DataFrame(columns=columns))
+        frame.attrs["units"] = units
+        yield frame
+
+
+def ndbc_observations(
+    frame: pd.DataFrame, *, station_id: str
+) -> list[NdbcObservation]:
+    """
+    Convert a parsed standard meteorological frame to observation records.
+
+    Args:
+        frame: Result of :func:`parse_ndbc_text` for a ``.txt``/stdmet file.
+        station_id: Buoy ID to stamp on each record.
+
+    Returns:
+        One NdbcObservation per row, oldest first. Wind speeds are converted
+        from m/s to knots.
+    """
+    minutes = frame.index.tz_convert(None).values.astype("datetime64[m]")
+    stamps = [stamp.replace("T", " ") for stamp in np.datetime_as_string(minutes)]
+    columns = {
+        "wind_speed_knots": _column(frame, "WSPD", scale=MS_TO_KNOTS),
+        "wind_gust_knots": _column(frame, "GST", scale=MS_TO_KNOTS),
+        "wind_direction_deg": _column(frame, "WDIR"),
+        "water_temperature_c": _column(frame, "WTMP"),
+    }
+    return [
+        NdbcObservation(
+            station_id=station_id,
+            timestamp=stamp,
+            **{name: values[row] for name, values in columns.items()},
+        )
+        for row, stamp in enumerate(stamps)
+    ]
+
+
+def _frame(frame: pd.DataFrame) -> pd.DataFrame:
+    """Sort a parsed frame by time (realtime files are newest first)."""
+    if frame.index.is_monotonic_increasing:
+        return frame
+    units = frame.attrs.get("units", {})
+    frame = frame.sort_index(kind="stable")
+    frame.attrs["units"] = units
+    return frame
+
+
+def _text_stream(source: str | bytes | IO[str]) -> IO[str]:
+    if isinstance(source, bytes):
+        return io.StringIO(source.decode("ascii", errors="replace"))
+    if isinstance(source, str):
+        return io.StringIO(source)
+    return source
+
+
+def _header_columns(line: str) -> list[str]:
+    return [_COLUMN_ALIASES.get(name, name) for name in line.lstrip("#").split()]
+
+
+def _index_by_time(frame: pd.DataFrame) -> pd.DataFrame:
+    """Replace the date/time part columns with a UTC ``timestamp`` index."""
+    year_column = next(column for column in _YEAR_COLUMNS if column in frame)
+    year = frame[year_column].to_numpy(dtype=np.int64)
+    year = np.where(year < 100, year + 1900, year)
+
+    def part(column: str) -> np.ndarray | int:
+        return frame[column].to_numpy(dtype=np.int64) if column in frame else 0
+
+    # Calendar arithmetic on datetime64 units avoids per-row date parsing.
+    months = (year - 1970) * 12 + part("MM") - 1
+    minutes = (part("DD") - 1) * 1440 + part("hh") * 60 + part("mm")
+    stamps = months.astype("datetime64[M]").astype("datetime64[m]") + np.asarray(
+        minutes, dtype="timedelta64[m]"
+    )
+    index = pd.DatetimeIndex(stamps, name="timestamp").tz_localize("UTC")
+    values = frame.drop(columns=[year_column, *_TIME_COLUMNS], errors="ignore")
+    values.index = index
+    return values
+
+
+def _column(
+    frame: pd.DataFrame, name: str, *, scale: float = 1.0
+) -> list[Optional[float]]:
+    """Return a numeric column as a list with None for missing values."""
+    if name not in frame:
+        return [None] * len(frame)
+    values = pd.to_numeric(frame[name], errors="coerce") * scale
+    return [None if math.isnan(value) else value for value in values.tolist()]
+
+
+class _Prepended(io.TextIOBase):
+    """Text stream that yields one already-read line before the rest."""
+
+    def __init__(self, first: str, rest: IO[str]) -> None:
+        super().__init__()
+        self._first = first
+        self._rest = rest
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: Optional[int] = -1) -> str:
+        head, self._first = self._first, ""
+        if size is None or size < 0:
+            return head + self._rest.read()
+        if head:
+            return head
+        return self._rest.read(size)
+
+    def readline(self, size: Optional[int] = -1) -> str:
+        if self._first:
+            head, self._first = self._first, ""
+            return head
+        return self._rest.readline(size)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> str:
+        line = self.readline()
+        if not line:
+            raise StopIteration
+        return line
+
+
+__all__ = [
+    "MISSING_MARKERS",
+    "MS_TO_KNOTS",
+    "iter_ndbc_frames",
+    "ndbc_observations",
+    "parse_ndbc_text",
+]
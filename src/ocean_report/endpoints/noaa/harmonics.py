@@ -0,0 +1,50 @@
+"""NOAA station metadata endpoint for tide prediction inputs."""
+
+from __future__ import annotations
+
+from ...models.noaa.harmonics import (
+    NoaaDatumsResponse,
+    NoaaHarmonicConstituentsResponse,
+    NoaaTidePredictionOffsets,
+)
+from ..base import BaseEndpoint
+
+
+class NoaaHarmonicsEndpoint(BaseEndpoint):
+    """NOAA metadata API (mdapi) wrapper for tide prediction inputs."""
+
+    BASE_URL = "https://api.tidesandcurrents.noaa.gov/mdapi/prod/webapi"
+
+    def fetch_constituents(
+        self, station_id: str, *, units: str = "english"
+    ) -> NoaaHarmonicConstituentsResponse:
+        """Retrieve a station's harmonic constituents (phases in GMT)."""
+
+        payload = self.get_json(
+            f"stations/{station_id}/harcon.json", params={"units": units}
+        )
+        return self.parse_model(NoaaHarmonicConstituentsResponse, payload)
+
+    def fetch_datums(
+        self, station_id: str, *, units: str = "english"
+    ) -> NoaaDatumsResponse:
+        """Retrieve a station's tidal datums."""
+
+        payload = self.get_json(
+            f"stations/{station_id}/datums.json", params={"units": units}
+        )
+        return self.parse_model(NoaaDatumsResponse, payload)
+
+    def fetch_prediction_offsets(self, station_id: str) -> NoaaTidePredictionOffsets:
+        """Retrieve a subordinate station's offsets from its reference station."""
+
+        payload = self.get_json(f"stations/{station_id}/tidepredoffsets.json")
+        return self.parse_model(NoaaTidePredictionOffsets, payload)
+
+
+__all__ = [
+    "NoaaDatumsResponse",
+    "NoaaHarmonicConstituentsResponse",
+    "NoaaHarmonicsEndpoint",
+    "NoaaTidePredictionOffsets",
+]
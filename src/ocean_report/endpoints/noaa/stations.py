@@ -7,13 +7,14 @@ from ...models.noaa.stations import (
     NoaaStationsParams,
     NoaaStationsResponse,
 )
-from .base import NoaaEndpoint
+from ..base import BaseEndpoint
 
 
-class NoaaStationsEndpoint(NoaaEndpoint):
-    """NOAA endpoint wrapper for station metadata retrieval."""
+class NoaaStationsEndpoint(BaseEndpoint):
+    """NOAA metadata API (mdapi) wrapper for the station catalog."""
 
-    PATH = "stations"
+    BASE_URL = "https://api.tidesandcurrents.noaa.gov/mdapi/prod/webapi"
+    PATH = "stations.json"
 
     def fetch(self, params: NoaaStationsParams | None = None) -> NoaaStationsResponse:
         """Retrieve and validate station metadata."""
@@ -1,6 +1,12 @@
 """Logging configuration for ocean report."""
 
+import atexit
+import json
 import logging
+import logging.handlers
+import queue
+import threading
+from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
 from typing import Optional
@@ -17,12 +23,75 @@ class LogOutput(Enum):
 # Create the base logger
 logger = logging.getLogger("ocean_report")
 
+# Handlers created by configure_logger, and in queued mode the running
+# listener thread that owns the real ones.
+_handlers: list[logging.Handler] = []
+_listener: Optional[logging.handlers.QueueListener] = None
+_listener_lock = threading.Lock()
 
-def configure_logger(
+# Attributes every LogRecord has; anything else came from ``extra=``.
+_RECORD_ATTRIBUTES = frozenset(
+    logging.LogRecord("", 0, "", 0, "", None, None).__dict__
+) | {"message", "asctime", "taskName"}
+
+
+class JsonFormatter(logging.Formatter):
+    """Format records as one JSON object per line.
+
+    Fields passed with ``extra=`` are included alongside the standard ones.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(
+                timespec="milliseconds"
+            ),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "thread": record.threadName,
+        }
+        payload.update(
+            (key, value)
+            for key, value in record.__dict__.items()
+            if key not in _RECORD_ATTRIBUTES
+        )
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            payload["exception"] = record.exc_text
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that defers all formatting to the listener thread.
+
+    The stock ``prepare`` formats the whole record on the calling thread.
+    This one only merges the message arguments (they may be mutated after
+    the call returns) and renders any traceback, which cannot be pickled or
+    outlive the ``except`` block.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        message = record.getMessage()
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record.msg = message
+        record.args = None
+        record.exc_info = None
+        return record
+
+
+def configure_logger(  # pylint: disable=too-many-arguments,too-many-positional-arguments
     output: LogOutput = LogOutput.CONSOLE,
     log_file: Optional[str | Path] = None,
     level: int = logging.INFO,
     log_format: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    *,
+    queued: bool = False,
+    json_output: bool = False,
+    max_bytes: int = 0,
+    backup_count: int = 5,
 ) -> logging.Logger:
     """Configure logger with flexible output options.
 
@@ -31,6 +100,14 @@ def configure_logger(
         log_file: Path to log file (required if output is FILE or BOTH)
         level: Logging level (default: logging.INFO)
         log_format: Log message format string
+        queued: If True, log calls only enqueue the record; a background
+            listener thread formats and writes it. Call ``flush_logger`` to
+            wait for queued records to be written.
+        json_output: If True, write one JSON object per record instead of
+            ``log_format`` text.
+        max_bytes: Rotate the log file when it would exceed this size;
+            0 disables rotation.
+        backup_count: Rotated files to keep when ``max_bytes`` is set.
 
     Returns:
         Configured logger instance
@@ -51,23 +128,23 @@ def configure_logger(
         >>> # With custom level
         >>> configure_logger(LogOutput.BOTH, log_file="debug.log", level=logging.DEBUG)
     """
+    global _listener  # pylint: disable=global-statement
+
     # Validate file path if needed
     if output in (LogOutput.FILE, LogOutput.BOTH) and not log_file:
         raise ValueError(f"log_file must be provided when output is {output.value}")
 
-    # Clear existing handlers to avoid duplicates
-    logger.handlers.clear()
+    # Drain and close the previous configuration to avoid duplicates
+    _remove_handlers()
     logger.setLevel(level)
 
     # Create formatter
-    formatter = logging.Formatter(log_format)
+    formatter = JsonFormatter() if json_output else logging.Formatter(log_format)
+    handlers: list[logging.Handler] = []
 
     # Add console handler
     if output in (LogOutput.CONSOLE, LogOutput.BOTH):
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(level)
-        console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
+        handlers.append(logging.StreamHandler())
 
     # Add file handler
     if output in (LogOutput.FILE, LogOutput.BOTH):
@@ -75,10 +152,35 @@ def configure_logger(
         # Create parent directories if they don't exist
         log_path.parent.mkdir(parents=True, exist_ok=True)
 
-        file_handler = logging.FileHandler(log_path, mode="a", encoding="utf-8")
-        file_handler.setLevel(level)
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        if max_bytes > 0:
+            handlers.append(
+                logging.handlers.RotatingFileHandler(
+                    log_path,
+                    mode="a",
+                    maxBytes=max_bytes,
+                    backupCount=backup_count,
+                    encoding="utf-8",
+                )
+            )
+        else:
+            handlers.append(logging.FileHandler(log_path, mode="a", encoding="utf-8"))
+
+    for handler in handlers:
+        handler.setLevel(level)
+        handler.setFormatter(formatter)
+    _handlers.extend(handlers)
+
+    if queued:
+        record_queue: queue.SimpleQueue = queue.SimpleQueue()
+        with _listener_lock:
+            _listener = logging.handlers.QueueListener(
+                record_queue, *handlers, respect_handler_level=True
+            )
+            _listener.start()
+        handlers = [_QueueHandler(record_queue)]
+
+    for handler in handlers:
+        logger.addHandler(handler)
 
     # Prevent propagation to avoid duplicate logs
     logger.propagate = False
@@ -86,6 +188,37 @@ def configure_logger(
     return logger
 
 
+def flush_logger() -> None:
+    """
+    Write out every record logged so far.
+
+    In queued mode this waits for the listener to drain the queue, then
+    restarts it, so logging can continue afterwards.
+    """
+    with _listener_lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener.start()
+    for handler in list(_handlers):
+        handler.flush()
+
+
+def _remove_handlers() -> None:
+    """Stop the listener (draining its queue) and close our handlers."""
+    global _listener  # pylint: disable=global-statement
+    with _listener_lock:
+        listener, _listener = _listener, None
+    if listener is not None:
+        listener.stop()
+    logger.handlers.clear()
+    while _handlers:
+        _handlers.pop().close()
+
+
+# Queued records must reach their handlers before the interpreter exits.
+atexit.register(_remove_handlers)
+
+
 # Initialize with default console logging for backward compatibility
 if not logger.handlers:
     configure_logger()
@@ -0,0 +1,343 @@
+"""In-process metrics registry with OpenMetrics textfile export.
+
+Counters, gauges and fixed-bucket histograms are declared once at module
+level and updated from the hot paths::
+
+    from ocean_report.metrics import registry
+
+    HTTP_REQUESTS = registry.counter(
+        "ocean_report_http_requests_total",
+        "Outbound HTTP requests.",
+        labelnames=("host", "outcome"),
+    )
+
+    HTTP_REQUESTS.inc(host="api.tidesandcurrents.noaa.gov", outcome="ok")
+
+The registry is disabled by default; every update then returns after one
+attribute check, so instrumented code costs next to nothing when metrics
+are off. ``run_report`` enables it from ``metrics.enabled`` and writes the
+values with ``write_textfile`` at the end of the run, for node-exporter's
+textfile collector.
+
+The exposition keeps the ``_total`` suffix on counter family names, which
+the Prometheus text parser used by node-exporter expects, and ends with the
+OpenMetrics ``# EOF`` marker.
+"""
+
+from __future__ import annotations
+
+import abc
+import bisect
+import math
+import os
+import threading
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from typing import Union
+
+# Latency buckets in seconds, from fast cache hits to slow upstream calls.
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+
+LabelValues = tuple[str, ...]
+
+
+class _Metric(abc.ABC):
+    """Shared name, help text, labels and lock of one metric family."""
+
+    metric_type = ""
+
+    def __init__(
+        self,
+        registry: MetricsRegistry,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str],
+    ) -> None:
+        self._registry = registry
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _label_values(self, labels: dict[str, object]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}"
+            )
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    @abc.abstractmethod
+    def _reset(self) -> None:
+        """Drop every recorded value."""
+
+    @abc.abstractmethod
+    def _samples(self) -> Iterable[tuple[str, LabelValues, dict[str, str], float]]:
+        """(sample name, label values, extra labels, value) tuples."""
+
+
+class Counter(_Metric):
+    """Monotonically increasing count, per label set."""
+
+    metric_type = "counter"
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._values: dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: object) -> None:
+        """Add ``amount`` (must not be negative)."""
+        if not self._registry.enabled:
+            return
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        key = self._label_values(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: object) -> float:
+        """Current count for a label set (0 if never incremented)."""
+        return self._values.get(self._label_values(labels), 0.0)
+
+    def _reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+    def _samples(self):
+        with self._lock:
+            items = list(self._values.items())
+        for key, value in items:
+            yield self.name, key, {}, value
+
+
+class Gauge(_Metric):
+    """Value that can go up and down, per label set."""
+
+    metric_type = "gauge"
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._values: dict[LabelValues, float] = {}
+
+    def set(self, value: float, **labels: object) -> None:
+        """Replace the current value."""
+        if not self._registry.enabled:
+            return
+        key = self._label_values(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def inc(self, amount: float = 1.0, **labels: object) -> None:
+        """Add ``amount`` (negative to decrease)."""
+        if not self._registry.enabled:
+            return
+        key = self._label_values(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: object) -> float:
+        """Current value for a label set (0 if never set)."""
+        return self._values.get(self._label_values(labels), 0.0)
+
+    def _reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+    def _samples(self):
+        with self._lock:
+            items = list(self._values.items())
+        for key, value in items:
+            yield self.name, key, {}, value
+
+
+class Histogram(_Metric):
+    """Distribution of observations over fixed upper-bound buckets."""
+
+    metric_type = "histogram"
+
+    def __init__(
+        self, *args, buckets: Sequence[float] = DEFAULT_BUCKETS, **kwargs
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        bounds = sorted(float(bound) for bound in buckets)
+        if not bounds or bounds[-1] != math.inf:
+            bounds.append(math.inf)
+        self.buckets = tuple(bounds)
+        # Per label set: [per-bucket counts..., sum]
+        self._values: dict[LabelValues, list[float]] = {}
+
+    def observe(self, value: float, **labels: object) -> None:
+        """Record one observation."""
+        if not self._registry.enabled:
+            return
+        key = self._label_values(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [0.0] * (len(self.buckets) + 1)
+            state[index] += 1
+            state[-1] += value
+
+    def count(self, **labels: object) -> int:
+        """Number of observations for a label set."""
+        state = self._values.get(self._label_values(labels))
+        return 0 if state is None else int(sum(state[:-1]))
+
+    def _reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+    def _samples(self):
+        with self._lock:
+            items = [(key, list(state)) for key, state in self._values.items()]
+        for key, state in items:
+            cumulative = 0.0
+            for bound, count in zip(self.buckets, state):
+                cumulative += count
+                yield (
+                    f"{self.name}_bucket",
+                    key,
+                    {"le": "+Inf" if math.isinf(bound) else repr(bound)},
+                    cumulative,
+                )
+            yield f"{self.name}_count", key, {}, cumulative
+            yield f"{self.name}_sum", key, {}, state[-1]
+
+
+MetricType = Union[Counter, Gauge, Histogram]
+
+
+class MetricsRegistry:
+    """Holds metric families and renders them as OpenMetrics text."""
+
+    def __init__(self, *, enabled: bool = False) -> None:
+        self.enabled = enabled
+        self._metrics: dict[str, MetricType] = {}
+        self._lock = threading.Lock()
+
+    def counter(
+        self, name: str, documentation: str, *, labelnames: Sequence[str] = ()
+    ) -> Counter:
+        """Declare (or return the existing) counter ``name``."""
+        return self._register(Counter, name, documentation, labelnames)
+
+    def gauge(
+        self, name: str, documentation: str, *, labelnames: Sequence[str] = ()
+    ) -> Gauge:
+        """Declare (or return the existing) gauge ``name``."""
+        return self._register(Gauge, name, documentation, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        *,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Declare (or return the existing) histogram ``name``."""
+        return self._register(
+            Histogram, name, documentation, labelnames, buckets=buckets
+        )
+
+    def reset(self) -> None:
+        """Drop every recorded value; declared metrics stay registered."""
+        for metric in list(self._metrics.values()):
+            metric._reset()  # pylint: disable=protected-access
+
+    def to_openmetrics(self) -> str:
+        """Render all metrics that have values as exposition text."""
+        lines: list[str] = []
+        for name in sorted(self._metrics):
+            metric = self._metrics[name]
+            samples = list(metric._samples())  # pylint: disable=protected-access
+            if not samples:
+                continue
+            lines.append(f"# HELP {name} {_escape_help(metric.documentation)}")
+            lines.append(f"# TYPE {name} {metric.metric_type}")
+            for sample_name, key, extra, value in samples:
+                labels = dict(zip(metric.labelnames, key), **extra)
+                lines.append(
+                    f"{sample_name}{_format_labels(labels)} {_format_value(value)}"
+                )
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, path: str | Path) -> Path:
+        """
+        Atomically write the exposition text to ``path``.
+
+        The text is written to a temporary file in the same directory and
+        renamed over ``path``, so a collector never reads a partial file.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        temporary.write_text(self.to_openmetrics(), encoding="utf-8")
+        os.replace(temporary, path)
+        return path
+
+    def _register(self, cls, name, documentation, labelnames, **kwargs):
+        with self._lock:
+            existing = self._metrics.get(name)
+            if existing is not None:
+                if not isinstance(existing, cls) or existing.labelnames != tuple(
+                    labelnames
+                ):
+                    raise ValueError(f"Metric {name} is already registered")
+                return existing
+            metric = cls(self, name, documentation, labelnames, **kwargs)
+            self._metrics[name] = metric
+            return metric
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    if float(value).is_integer() and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    body = ",".join(f'{key}="{_escape_label(value)}"' for key, value in labels.items())
+    return "{" + body + "}"
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _escape_help(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+# Process-wide registry updated by the API client, services and sender.
+registry = MetricsRegistry()
+
+
+__all__ = [
+    "Counter",
+    "DEFAULT_BUCKETS",
+    "Gauge",
+    "Histogram",
+    "MetricsRegistry",
+    "registry",
+]
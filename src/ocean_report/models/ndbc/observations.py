@@ -2,34 +2,38 @@
 
 from __future__ import annotations
 
+from typing import Literal
+
 from pydantic import Field
 
 from ..common.base import ApiSchema
 
 
 class NdbcObservationsParams(ApiSchema):
-    """Query parameters for NDBC observations requests."""
+    """Parameters for NDBC realtime observation file requests."""
 
     station_id: str = Field(min_length=4, max_length=5)
-    format: str = "json"
+    file_type: Literal["txt", "spec", "ocean"] = "txt"
 
-    def to_query_params(self) -> dict[str, str]:
-        """Serialize params to NDBC query string shape."""
+    @property
+    def filename(self) -> str:
+        """Realtime file name, e.g. ``44091.txt``."""
 
-        payload = self.model_dump(by_alias=True, exclude_none=True)
-        return {key: str(value) for key, value in payload.items()}
+        return f"{self.station_id.upper()}.{self.file_type}"
 
 
 class NdbcObservation(ApiSchema):
-    """One normalized NDBC observation record."""
+    """One normalized NDBC observation record (timestamps in UTC)."""
 
     station_id: str = Field(alias="station")
     timestamp: str
     wind_speed_knots: float | None = Field(default=None, alias="wind_spd")
+    wind_gust_knots: float | None = Field(default=None, alias="gust")
+    wind_direction_deg: float | None = Field(default=None, alias="wind_dir")
     water_temperature_c: float | None = Field(default=None, alias="water_temp")
 
 
 class NdbcObservationsResponse(ApiSchema):
-    """Top-level NDBC observations response body."""
+    """Observations parsed from one NDBC file."""
 
     observations: list[NdbcObservation] = Field(default_factory=list)
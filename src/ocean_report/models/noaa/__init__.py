@@ -1,5 +1,12 @@
 """NOAA model exports."""
 
+from .harmonics import (
+    NoaaDatum,
+    NoaaDatumsResponse,
+    NoaaHarmonicConstituent,
+    NoaaHarmonicConstituentsResponse,
+    NoaaTidePredictionOffsets,
+)
 from .stations import NoaaStation, NoaaStationsParams, NoaaStationsResponse
 from .tides import NoaaTideParams, NoaaTidePredictionRecord, NoaaTideResponse
 from .water_temperature import (
@@ -12,10 +19,15 @@ from .water_temperature import (
 
 # pylint: disable=duplicate-code  # Standard re-export pattern for package organization
 __all__ = [
+    "NoaaDatum",
+    "NoaaDatumsResponse",
+    "NoaaHarmonicConstituent",
+    "NoaaHarmonicConstituentsResponse",
     "NoaaStation",
     "NoaaStationsParams",
     "NoaaStationsResponse",
     "NoaaTideParams",
+    "NoaaTidePredictionOffsets",
     "NoaaTidePredictionRecord",
     "NoaaTideResponse",
     "NoaaWaterTempParams",
@@ -0,0 +1,79 @@
+"""Typed NOAA station metadata schemas for local tide prediction."""
+
+from __future__ import annotations
+
+from pydantic import ConfigDict, Field
+
+from ..common.base import ApiSchema
+
+
+class NoaaHarmonicConstituent(ApiSchema):
+    """One harmonic constituent (amplitude, Greenwich phase, speed)."""
+
+    number: int | None = None
+    name: str
+    description: str | None = None
+    amplitude: float
+    phase_gmt: float = Field(alias="phase_GMT")
+    phase_local: float | None = None
+    speed: float
+    comments: str | None = None
+
+
+class NoaaHarmonicConstituentsResponse(ApiSchema):
+    """Top-level ``harcon.json`` response body."""
+
+    units: str | None = None
+    constituents: list[NoaaHarmonicConstituent] = Field(
+        default_factory=list, alias="HarmonicConstituents"
+    )
+    self_url: str | None = Field(default=None, alias="self")
+
+
+class NoaaDatum(ApiSchema):
+    """One tidal datum height relative to station datum."""
+
+    name: str
+    description: str | None = None
+    value: float | None = None
+
+
+class NoaaDatumsResponse(ApiSchema):
+    """Top-level ``datums.json`` response body.
+
+    The response also carries epoch, extremes and links that are not needed
+    here, so unknown fields are ignored instead of rejected.
+    """
+
+    model_config = ConfigDict(frozen=True, extra="ignore", populate_by_name=True)
+
+    units: str | None = None
+    datums: list[NoaaDatum] = Field(default_factory=list)
+
+    def value(self, name: str) -> float | None:
+        """Height of a named datum (e.g. ``MSL``), or None if not published."""
+
+        for datum in self.datums:
+            if datum.name == name:
+                return datum.value
+        return None
+
+
+class NoaaTidePredictionOffsets(ApiSchema):
+    """Top-level ``tidepredoffsets.json`` response body.
+
+    Subordinate stations (``type`` ``S``) predict hi/lo tides by correcting
+    the reference station's events. ``height_adjusted_type`` is ``R`` when
+    the height offsets are ratios and ``A`` when they are added in feet.
+    Time offsets are in minutes.
+    """
+
+    model_config = ConfigDict(frozen=True, extra="ignore", populate_by_name=True)
+
+    reference_station_id: str | None = Field(default=None, alias="refStationId")
+    station_type: str | None = Field(default=None, alias="type")
+    height_offset_high_tide: float = Field(default=1.0, alias="heightOffsetHighTide")
+    height_offset_low_tide: float = Field(default=1.0, alias="heightOffsetLowTide")
+    time_offset_high_tide: float = Field(default=0.0, alias="timeOffsetHighTide")
+    time_offset_low_tide: float = Field(default=0.0, alias="timeOffsetLowTide")
+    height_adjusted_type: str = Field(default="R", alias="heightAdjustedType")
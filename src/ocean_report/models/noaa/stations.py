@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from pydantic import Field
+from pydantic import ConfigDict, Field
 
 from ..common.base import ApiSchema
 
@@ -11,6 +11,7 @@ class NoaaStationsParams(ApiSchema):
     """Query parameters for NOAA stations requests."""
 
     format: str = "json"
+    station_type: str | None = Field(default=None, alias="type")
 
     def to_query_params(self) -> dict[str, str]:
         """Serialize params to NOAA query string shape."""
@@ -20,17 +21,27 @@ class NoaaStationsParams(ApiSchema):
 
 
 class NoaaStation(ApiSchema):
-    """NOAA station metadata."""
+    """NOAA station metadata from ``stations.json``.
+
+    Each station also carries state, time zone, flags and links to its
+    detail resources, none of which are needed here, so unknown fields are
+    ignored instead of rejected.
+    """
+
+    model_config = ConfigDict(frozen=True, extra="ignore", populate_by_name=True)
 
     station_id: str = Field(alias="id")
     name: str
-    latitude: float | None = None
-    longitude: float | None = None
+    latitude: float | None = Field(default=None, alias="lat")
+    longitude: float | None = Field(default=None, alias="lng")
 
 
 class NoaaStationsResponse(ApiSchema):
-    """Top-level NOAA stations response body."""
+    """Top-level ``stations.json`` response body (``units`` and ``self`` ignored)."""
+
+    model_config = ConfigDict(frozen=True, extra="ignore", populate_by_name=True)
 
+    count: int | None = None
     stations: list[NoaaStation] = Field(default_factory=list)
 
 
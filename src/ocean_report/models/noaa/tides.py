@@ -20,7 +20,7 @@ class NoaaTideParams(ApiSchema):
     datum: str = "MLLW"
     time_zone: Literal["lst_ldt", "gmt"] = "lst_ldt"
     units: Literal["english", "metric"] = "english"
-    interval: Literal["hilo", "h"] = "hilo"
+    interval: Literal["hilo", "h", "6"] = "hilo"
     format: Literal["json"] = "json"
 
     def to_query_params(self) -> dict[str, str]:
@@ -30,11 +30,15 @@ class NoaaTideParams(ApiSchema):
 
 
 class NoaaTidePredictionRecord(ApiSchema):
-    """One NOAA tide prediction data point."""
+    """One NOAA tide prediction data point.
+
+    ``event_type`` is ``"H"``/``"L"`` for ``interval=hilo`` and absent for
+    evenly spaced (``h``/``6``) series.
+    """
 
     timestamp: str = Field(alias="t")
     height_feet: float = Field(alias="v")
-    event_type: str = Field(alias="type")
+    event_type: str | None = Field(default=None, alias="type")
 
 
 class NoaaTideResponse(ApiSchema):
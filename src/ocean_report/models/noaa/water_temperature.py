@@ -2,24 +2,54 @@
 
 from __future__ import annotations
 
-from typing import Literal
+from typing import Any, Literal
 
-from pydantic import Field
+from pydantic import Field, model_validator
 
 from ..common.base import ApiSchema
 
 
+NOAA_RANGE_FORMAT = "%Y%m%d %H:%M"
+
+
 class NoaaWaterTemperatureParams(ApiSchema):
-    """Query parameters for NOAA water temperature requests."""
+    """Query parameters for NOAA water temperature requests.
+
+    Either ``date`` (e.g. ``"latest"``) or a ``begin_date``/``end_date`` range
+    in ``yyyyMMdd HH:mm`` format is sent; giving a range clears ``date``.
+    """
 
     station: str = Field(min_length=7, max_length=7)
     product: Literal["water_temperature"] = "water_temperature"
     application: str = "ocean-report"
-    date: str = "latest"
+    date: str | None = "latest"
+    begin_date: str | None = Field(default=None, min_length=8, max_length=14)
+    end_date: str | None = Field(default=None, min_length=8, max_length=14)
     units: Literal["english", "metric"] = "english"
     time_zone: Literal["lst_ldt", "gmt"] = "lst_ldt"
     format: Literal["json"] = "json"
 
+    @model_validator(mode="before")
+    @classmethod
+    def range_replaces_date(cls, data: Any) -> Any:
+        """Drop the default ``date`` when a begin/end range is given."""
+        if isinstance(data, dict) and (
+            data.get("begin_date") is not None or data.get("end_date") is not None
+        ):
+            data = {**data}
+            data.setdefault("date", None)
+        return data
+
+    @model_validator(mode="after")
+    def check_date_or_range(self) -> "NoaaWaterTemperatureParams":
+        """Require exactly one of ``date`` or a complete range."""
+        has_range = self.begin_date is not None or self.end_date is not None
+        if has_range and (self.begin_date is None or self.end_date is None):
+            raise ValueError("begin_date and end_date must be given together")
+        if has_range == (self.date is not None):
+            raise ValueError("Give either date or begin_date/end_date")
+        return self
+
     def to_query_params(self) -> dict[str, str]:
         """Serialize this request into NOAA query params."""
 
@@ -40,6 +70,7 @@ class NoaaWaterTemperatureResponse(ApiSchema):
 
     data: list[NoaaWaterTemperatureRecord] = Field(default_factory=list)
     metadata: dict | None = None  # Station metadata returned by NOAA API
+    error: dict | None = None  # e.g. "No data was found" for an empty range
 
 
 # Backward-compatible aliases for earlier naming.
@@ -0,0 +1,95 @@
+"""NDBC buoy data fetching module for ocean report."""
+
+from collections.abc import Iterator
+
+import pandas as pd
+
+from ..api_client.exceptions import ApiClientError
+from ..application.factory import ApplicationContext
+from ..endpoints.ndbc.historical import PARSE_CHUNK_ROWS, NdbcHistoricalEndpoint
+from ..endpoints.ndbc.observations import NdbcObservationsEndpoint
+from ..logger import logger
+from .instrumentation import upstream_call
+from ..models.ndbc.observations import NdbcObservationsParams
+
+
+def fetch_buoy_frame(
+    *,
+    context: ApplicationContext,
+    params: NdbcObservationsParams,
+) -> pd.DataFrame:
+    """
+    Fetch an NDBC realtime buoy file (last 45 days) as a parsed frame.
+
+    This is a thin service layer function that only handles API calls.
+
+    Args:
+        context (ApplicationContext): The application context containing the API client.
+        params (NdbcObservationsParams): Buoy ID and realtime file type.
+
+    Returns:
+        pd.DataFrame: Observations indexed by UTC timestamp, oldest first.
+
+    Raises:
+        ApiClientError: If the NDBC request fails.
+    """
+    endpoint = NdbcObservationsEndpoint(context.client)
+
+    try:
+        logger.debug(
+            "    → Making NDBC request for %s (buoy: %s)",
+            params.filename,
+            params.station_id,
+        )
+        with upstream_call(
+            "ndbc.realtime", station=params.station_id, file=params.filename
+        ) as api_span:
+            frame = endpoint.fetch_frame(params)
+            api_span.set_attribute("rows", len(frame))
+        logger.info(
+            "    ✓ NDBC %s responded and parsed in %.2f seconds. Found %d rows.",
+            params.filename,
+            api_span.duration,
+            len(frame),
+        )
+        return frame
+
+    except ApiClientError as e:
+        logger.error("Failed to fetch NDBC buoy data: %s", e)
+        raise
+
+
+def stream_buoy_history(
+    *,
+    context: ApplicationContext,
+    station_id: str,
+    year: int,
+    chunk_rows: int = PARSE_CHUNK_ROWS,
+) -> Iterator[pd.DataFrame]:
+    """
+    Stream one yearly NDBC stdmet archive as parsed frames.
+
+    The gzip'd file is downloaded, decompressed and parsed incrementally, so
+    at most ``chunk_rows`` rows are held at a time.
+
+    Args:
+        context (ApplicationContext): The application context containing the API client.
+        station_id (str): NDBC buoy ID.
+        year (int): Archive year.
+        chunk_rows (int): Rows per yielded frame.
+
+    Yields:
+        pd.DataFrame: Observations indexed by UTC timestamp, in file order.
+
+    Raises:
+        ApiClientError: If the NDBC request fails (e.g. the year is not archived).
+    """
+    endpoint = NdbcHistoricalEndpoint(context.client)
+    logger.debug(
+        "    → Streaming NDBC archive %s", endpoint.filename(station_id, year)
+    )
+    try:
+        yield from endpoint.iter_frames(station_id, year, chunk_rows=chunk_rows)
+    except ApiClientError as e:
+        logger.error("Failed to fetch NDBC archive for %s %d: %s", station_id, year, e)
+        raise
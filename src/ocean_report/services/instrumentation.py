@@ -0,0 +1,45 @@
+"""Span and metrics wrapper shared by the upstream API services."""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from ..api_client.exceptions import ApiClientError
+from ..metrics import registry
+from ..tracing import Span, span
+
+UPSTREAM_REQUEST_DURATION = registry.histogram(
+    "ocean_report_upstream_request_duration_seconds",
+    "Service-level upstream call time, including response validation.",
+    labelnames=("source",),
+)
+UPSTREAM_ERRORS = registry.counter(
+    "ocean_report_upstream_errors_total",
+    "Upstream calls that raised ApiClientError.",
+    labelnames=("source",),
+)
+
+
+@contextmanager
+def upstream_call(source: str, **attributes: Any) -> Iterator[Span]:
+    """
+    Run an upstream API call in a span and record its latency and failures.
+
+    Args:
+        source: Span name and ``source`` metric label, e.g. ``noaa.tides``.
+        **attributes: Initial span attributes.
+
+    Yields:
+        The open Span.
+    """
+    with span(source, **attributes) as api_span:
+        try:
+            yield api_span
+        except ApiClientError:
+            UPSTREAM_ERRORS.inc(source=source)
+            raise
+        finally:
+            UPSTREAM_REQUEST_DURATION.observe(api_span.duration, source=source)
+
+
+__all__ = ["upstream_call"]
@@ -0,0 +1,52 @@
+"""NOAA station catalog fetching module for ocean report."""
+
+
+from ..api_client.exceptions import ApiClientError
+from ..application.factory import ApplicationContext
+from ..endpoints.noaa.stations import NoaaStationsEndpoint
+from ..logger import logger
+from .instrumentation import upstream_call
+from ..models.noaa.stations import NoaaStation, NoaaStationsParams
+
+
+def fetch_stations(
+    *,
+    context: ApplicationContext,
+    params: NoaaStationsParams,
+) -> list[NoaaStation]:
+    """
+    Fetch the NOAA station catalog.
+
+    This is a thin service layer function that only handles API calls.
+
+    Args:
+        context (ApplicationContext): The application context containing the API client.
+        params (NoaaStationsParams): Query parameters (e.g. station type).
+
+    Returns:
+        list[NoaaStation]: Station metadata records.
+
+    Raises:
+        ApiClientError: If the NOAA API request fails.
+    """
+    endpoint = NoaaStationsEndpoint(context.client)
+
+    try:
+        logger.debug(
+            "    → Making NOAA API request for station catalog (type: %s)",
+            params.station_type,
+        )
+        with upstream_call(
+            "noaa.stations", station_type=params.station_type
+        ) as api_span:
+            response = endpoint.fetch(params)
+        logger.info(
+            "    ✓ NOAA Stations API responded in %.2f seconds. Found %d stations.",
+            api_span.duration,
+            len(response.stations),
+        )
+        return list(response.stations)
+
+    except ApiClientError as e:
+        logger.error("Failed to fetch station catalog from NOAA API: %s", e)
+        raise
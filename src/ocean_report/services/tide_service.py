@@ -1,13 +1,19 @@
 """Tide data fetching module for ocean report."""
 
-import time
 from datetime import datetime, time as time_obj
 from typing import List
 
 from ..api_client.exceptions import ApiClientError
 from ..application.factory import ApplicationContext
+from ..endpoints.noaa.harmonics import NoaaHarmonicsEndpoint
 from ..endpoints.noaa.tides import NoaaTidesEndpoint
 from ..logger import logger
+from .instrumentation import upstream_call
+from ..models.noaa.harmonics import (
+    NoaaDatumsResponse,
+    NoaaHarmonicConstituentsResponse,
+    NoaaTidePredictionOffsets,
+)
 from ..models.noaa.tides import NoaaTideParams, NoaaTidePredictionRecord
 
 
@@ -41,13 +47,18 @@ def fetch_tide_data(
             params.station,
             params.begin_date,
         )
-        api_start = time.time()
-        response = endpoint.fetch(params)
-        api_duration = time.time() - api_start
+        with upstream_call(
+            "noaa.tides",
+            station=params.station,
+            begin_date=params.begin_date,
+            interval=params.interval,
+        ) as api_span:
+            response = endpoint.fetch(params)
+            api_span.set_attribute("records", len(response.predictions))
 
         logger.info(
             "    ✓ NOAA Tides API responded in %.2f seconds. Found %d predictions.",
-            api_duration,
+            api_span.duration,
             len(response.predictions),
         )
         return response.predictions
@@ -57,6 +68,90 @@ def fetch_tide_data(
         raise
 
 
+def fetch_station_harmonics(
+    *,
+    context: ApplicationContext,
+    station_id: str,
+) -> tuple[NoaaHarmonicConstituentsResponse, NoaaDatumsResponse]:
+    """
+    Fetch a station's harmonic constituents and tidal datums from NOAA.
+
+    This is a thin service layer function that only handles API calls.
+
+    Args:
+        context (ApplicationContext): The application context containing the API client.
+        station_id (str): NOAA station ID.
+
+    Returns:
+        Tuple of the constituents and datums responses (English units).
+
+    Raises:
+        ApiClientError: If a NOAA metadata request fails.
+    """
+    endpoint = NoaaHarmonicsEndpoint(context.client)
+
+    try:
+        logger.debug(
+            "    → Making NOAA metadata requests for harmonics (station: %s)",
+            station_id,
+        )
+        with upstream_call("noaa.harmonics", station=station_id) as api_span:
+            constituents = endpoint.fetch_constituents(station_id)
+            datums = endpoint.fetch_datums(station_id)
+        logger.info(
+            "    ✓ NOAA harmonic constituents responded in %.2f seconds. "
+            "Found %d constituents.",
+            api_span.duration,
+            len(constituents.constituents),
+        )
+        return constituents, datums
+
+    except ApiClientError as e:
+        logger.error("Failed to fetch harmonic constituents from NOAA API: %s", e)
+        raise
+
+
+def fetch_subordinate_offsets(
+    *,
+    context: ApplicationContext,
+    station_id: str,
+) -> NoaaTidePredictionOffsets:
+    """
+    Fetch a subordinate station's tide prediction offsets from NOAA.
+
+    This is a thin service layer function that only handles API calls.
+
+    Args:
+        context (ApplicationContext): The application context containing the API client.
+        station_id (str): NOAA subordinate station ID.
+
+    Returns:
+        NoaaTidePredictionOffsets: Reference station and hi/lo offsets.
+
+    Raises:
+        ApiClientError: If the NOAA metadata request fails.
+    """
+    endpoint = NoaaHarmonicsEndpoint(context.client)
+
+    try:
+        logger.debug(
+            "    → Making NOAA metadata request for tide offsets (station: %s)",
+            station_id,
+        )
+        with upstream_call("noaa.tide_offsets", station=station_id):
+            offsets = endpoint.fetch_prediction_offsets(station_id)
+        logger.info(
+            "    ✓ Station %s predicts from reference station %s",
+            station_id,
+            offsets.reference_station_id,
+        )
+        return offsets
+
+    except ApiClientError as e:
+        logger.error("Failed to fetch tide prediction offsets from NOAA API: %s", e)
+        raise
+
+
 def filter_daytime_tides(
     tides: List[NoaaTidePredictionRecord],
     start_time: time_obj = time_obj(6, 0),
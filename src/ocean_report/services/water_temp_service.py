@@ -1,12 +1,12 @@
 """Water temperature data fetching module for ocean report."""
 
-import time
 from typing import Optional
 
 from ..api_client.exceptions import ApiClientError
 from ..application.factory import ApplicationContext
 from ..endpoints.noaa.water_temperature import WaterTemperatureEndpoint
 from ..logger import logger
+from .instrumentation import upstream_call
 from ..models.noaa.water_temperature import (
     NoaaWaterTempParams,
     NoaaWaterTemperatureRecord,
@@ -42,13 +42,15 @@ def fetch_water_temp(
             "    → Making NOAA API request for water temperature (station: %s)",
             params.station,
         )
-        api_start = time.time()
-        response = endpoint.fetch(params)
-        api_duration = time.time() - api_start
+        with upstream_call(
+            "noaa.water_temperature", station=params.station
+        ) as api_span:
+            response = endpoint.fetch(params)
+            api_span.set_attribute("records", len(response.data))
 
         logger.info(
             "    ✓ NOAA Water Temperature API responded in %.2f seconds. Found %d records.",
-            api_duration,
+            api_span.duration,
             len(response.data),
         )
 
@@ -65,6 +67,63 @@ def fetch_water_temp(
         raise
 
 
+def fetch_water_temp_series(
+    *,
+    context: ApplicationContext,
+    params: NoaaWaterTempParams,
+) -> list[NoaaWaterTemperatureRecord]:
+    """
+    Fetch every water temperature record in a NOAA date range.
+
+    Like ``fetch_water_temp`` this only handles the API call. A range with no
+    observations (NOAA answers with an ``error`` body) returns an empty list.
+
+    Args:
+        context (ApplicationContext): The application context containing the API client.
+        params (NoaaWaterTempParams): Query parameters with ``begin_date``/``end_date``.
+
+    Returns:
+        list[NoaaWaterTemperatureRecord]: Records in ascending time order.
+
+    Raises:
+        ApiClientError: If the NOAA API request fails.
+    """
+    endpoint = WaterTemperatureEndpoint(context.client)
+
+    try:
+        logger.debug(
+            "    → Making NOAA API request for water temperature %s to %s "
+            "(station: %s)",
+            params.begin_date,
+            params.end_date,
+            params.station,
+        )
+        with upstream_call(
+            "noaa.water_temperature",
+            station=params.station,
+            begin_date=params.begin_date,
+            end_date=params.end_date,
+        ) as api_span:
+            response = endpoint.fetch(params)
+            api_span.set_attribute("records", len(response.data))
+        logger.info(
+            "    ✓ NOAA Water Temperature API responded in %.2f seconds. "
+            "Found %d records.",
+            api_span.duration,
+            len(response.data),
+        )
+        if response.error:
+            logger.debug(
+                "    → NOAA returned no water temperature data: %s",
+                response.error.get("message", response.error),
+            )
+        return list(response.data)
+
+    except ApiClientError as e:
+        logger.error("Failed to fetch water temperature from NOAA API: %s", e)
+        raise
+
+
 def add_unit_of_measure(temp: float) -> str:
     """
     Format the water temperature value as a string with the Fahrenheit symbol.
@@ -1,10 +1,10 @@
 """Wind forecast data fetching module for ocean report."""
 
-import time
 from ..api_client.exceptions import ApiClientError
 from ..application.factory import ApplicationContext
 from ..endpoints.openmeteo.forecast import OpenMeteoForecastEndpoint
 from ..logger import logger
+from .instrumentation import upstream_call
 from ..models.openmeteo.forecast import (
     OpenMeteoForecastParams,
     OpenMeteoForecastResponse,
@@ -40,14 +40,18 @@ def fetch_wind_forecast(
             params.latitude,
             params.longitude,
         )
-        api_start = time.time()
-        response = endpoint.fetch(params)
-        api_duration = time.time() - api_start
+        with upstream_call(
+            "openmeteo.forecast",
+            latitude=params.latitude,
+            longitude=params.longitude,
+        ) as api_span:
+            response = endpoint.fetch(params)
+            api_span.set_attribute("records", len(response.hourly.time))
 
         logger.info(
             "    ✓ Open-Meteo Wind Forecast API responded in %.2f seconds. "
             "Found %d hourly records.",
-            api_duration,
+            api_span.duration,
             len(response.hourly.time),
         )
         return response
@@ -0,0 +1,19 @@
+"""Local on-disk stores for observation data."""
+
+from .station_catalog import StationCatalogCache, StationIndex, StationMatch
+from .tide_constituents import StationHarmonics, TideConstituentStore
+from .timeseries import TimeSeries, TimeSeriesStore
+from .water_temp_history import WaterTempHistory, WaterTempSample, WaterTempSummary
+
+__all__ = [
+    "StationCatalogCache",
+    "StationHarmonics",
+    "StationIndex",
+    "StationMatch",
+    "TideConstituentStore",
+    "TimeSeries",
+    "TimeSeriesStore",
+    "WaterTempHistory",
+    "WaterTempSample",
+    "WaterTempSummary",
+]
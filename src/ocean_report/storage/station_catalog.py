@@ -0,0 +1,240 @@
+"""Cached NOAA station catalog with a nearest-station spatial index.
+
+Stations are placed on the unit sphere as 3-D vectors, where straight-line
+(chord) distance orders points exactly like great-circle distance. A uniform
+grid over those vectors lets single lookups inspect only the few cells
+around the query. Bulk lookups use a chunked matrix product over every
+station instead, which is exact and fully vectorized.
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import math
+import os
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from ..models.noaa.stations import NoaaStation
+
+EARTH_RADIUS_KM = 6371.0088
+DEFAULT_CELL_KM = 100.0
+BULK_CHUNK_ROWS = 4096
+GRID_RINGS = 3
+
+
+@dataclass(frozen=True)
+class StationMatch:
+    """A station returned by a nearest-station lookup."""
+
+    station_id: str
+    name: str
+    latitude: float
+    longitude: float
+    distance_km: float
+
+
+class StationIndex:
+    """Nearest-neighbour index over station coordinates.
+
+    Stations without coordinates are skipped.
+    """
+
+    def __init__(
+        self, stations: Sequence[NoaaStation], *, cell_km: float = DEFAULT_CELL_KM
+    ) -> None:
+        located = [
+            s for s in stations if s.latitude is not None and s.longitude is not None
+        ]
+        self.station_ids = [s.station_id for s in located]
+        self.names = [s.name for s in located]
+        self.latitudes = np.array([s.latitude for s in located], dtype=np.float64)
+        self.longitudes = np.array([s.longitude for s in located], dtype=np.float64)
+        self.vectors = _unit_vectors(self.latitudes, self.longitudes)
+        self._points = [tuple(row) for row in self.vectors.tolist()]
+
+        # Cell edge in chord units; a point in a cell r rings away is at
+        # least (r - 1) cells from the query along some axis.
+        self._cell = 2 * math.sin(cell_km / EARTH_RADIUS_KM / 2)
+        self._cells: dict[tuple[int, int, int], list[int]] = {}
+        keys = np.floor(self.vectors / self._cell).astype(np.int64)
+        for index, key in enumerate(map(tuple, keys.tolist())):
+            self._cells.setdefault(key, []).append(index)
+
+    def __len__(self) -> int:
+        return len(self.station_ids)
+
+    def nearest(
+        self,
+        latitude: float,
+        longitude: float,
+        *,
+        k: int = 1,
+        max_distance_km: Optional[float] = None,
+    ) -> list[StationMatch]:
+        """
+        Return the ``k`` stations closest to a point, nearest first.
+
+        Args:
+            latitude: Query latitude in degrees.
+            longitude: Query longitude in degrees.
+            k: Number of stations to return.
+            max_distance_km: Ignore stations farther away than this.
+
+        Returns:
+            Up to ``k`` StationMatch objects.
+        """
+        if not len(self) or k < 1:
+            return []
+        lat, lon = math.radians(latitude), math.radians(longitude)
+        qx, qy, qz = (
+            math.cos(lat) * math.cos(lon),
+            math.cos(lat) * math.sin(lon),
+            math.sin(lat),
+        )
+        cx, cy, cz = (math.floor(value / self._cell) for value in (qx, qy, qz))
+        limit = (
+            math.inf
+            if max_distance_km is None
+            else 2 * math.sin(min(max_distance_km / EARTH_RADIUS_KM, math.pi) / 2)
+        )
+
+        best: list[tuple[float, int]] = []
+        for ring in itertools.count():
+            bound = (ring - 1) * self._cell
+            if bound > limit or (len(best) >= k and bound > best[-1][0]):
+                break
+            if ring >= len(_RING_OFFSETS):
+                # Nothing close by: scanning every station beats more rings.
+                best = self._scan(np.array([qx, qy, qz]), k=k, limit=limit)
+                break
+            for dx, dy, dz in _RING_OFFSETS[ring]:
+                for index in self._cells.get((cx + dx, cy + dy, cz + dz), ()):
+                    x, y, z = self._points[index]
+                    chord = math.sqrt((x - qx) ** 2 + (y - qy) ** 2 + (z - qz) ** 2)
+                    if chord <= limit:
+                        best.append((chord, index))
+            best.sort()
+            del best[k:]
+        return [self._match(index, chord) for chord, index in best]
+
+    def _scan(
+        self, query: np.ndarray, *, k: int, limit: float
+    ) -> list[tuple[float, int]]:
+        """Exact k-nearest search over every station."""
+        chords = np.sqrt(np.maximum(2.0 - 2.0 * (self.vectors @ query), 0.0))
+        count = min(k, len(chords))
+        candidates = np.argpartition(chords, count - 1)[:count]
+        return sorted(
+            (float(chords[index]), int(index))
+            for index in candidates
+            if chords[index] <= limit
+        )
+
+    def nearest_many(
+        self, latitudes: Sequence[float], longitudes: Sequence[float]
+    ) -> tuple[list[str], np.ndarray]:
+        """
+        Find the nearest station for many points at once.
+
+        Args:
+            latitudes: Query latitudes in degrees.
+            longitudes: Query longitudes in degrees.
+
+        Returns:
+            Tuple of nearest station IDs and distances in kilometres.
+        """
+        queries = _unit_vectors(
+            np.asarray(latitudes, dtype=np.float64),
+            np.asarray(longitudes, dtype=np.float64),
+        )
+        if not len(self):
+            return [""] * len(queries), np.full(len(queries), np.inf)
+        nearest = np.empty(len(queries), dtype=np.int64)
+        cosines = np.empty(len(queries), dtype=np.float64)
+        for start in range(0, len(queries), BULK_CHUNK_ROWS):
+            # Largest dot product == smallest angle between unit vectors.
+            dots = queries[start : start + BULK_CHUNK_ROWS] @ self.vectors.T
+            nearest[start : start + BULK_CHUNK_ROWS] = dots.argmax(axis=1)
+            cosines[start : start + BULK_CHUNK_ROWS] = dots.max(axis=1)
+        distances = np.arccos(np.clip(cosines, -1.0, 1.0)) * EARTH_RADIUS_KM
+        return [self.station_ids[index] for index in nearest.tolist()], distances
+
+    def _match(self, index: int, chord: float) -> StationMatch:
+        return StationMatch(
+            station_id=self.station_ids[index],
+            name=self.names[index],
+            latitude=float(self.latitudes[index]),
+            longitude=float(self.longitudes[index]),
+            distance_km=2 * math.asin(min(chord / 2, 1.0)) * EARTH_RADIUS_KM,
+        )
+
+
+class StationCatalogCache:
+    """Station lists on disk, one JSON file per station type."""
+
+    def __init__(self, directory: str | Path) -> None:
+        self.directory = Path(directory)
+
+    def path(self, station_type: str) -> Path:
+        """Cache file for a station type."""
+        return self.directory / f"{station_type}.json"
+
+    def load(self, station_type: str) -> Optional[tuple[float, list[NoaaStation]]]:
+        """Return ``(fetched_at, stations)``, or None if not cached."""
+        try:
+            payload = json.loads(self.path(station_type).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        stations = [NoaaStation.model_validate(item) for item in payload["stations"]]
+        return float(payload["fetched_at"]), stations
+
+    def save(self, station_type: str, stations: Sequence[NoaaStation]) -> None:
+        """Write a station list atomically."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.path(station_type)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(
+            json.dumps(
+                {
+                    "fetched_at": time.time(),
+                    "stations": [station.model_dump() for station in stations],
+                }
+            ),
+            encoding="utf-8",
+        )
+        os.replace(tmp_path, path)
+
+
+def _unit_vectors(latitudes: np.ndarray, longitudes: np.ndarray) -> np.ndarray:
+    """Convert degrees to an (n, 3) array of unit vectors."""
+    lat = np.radians(latitudes)
+    lon = np.radians(longitudes)
+    cos_lat = np.cos(lat)
+    return np.column_stack((cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat)))
+
+
+def _ring_offsets(ring: int) -> list[tuple[int, int, int]]:
+    """Return the cell offsets at Chebyshev distance ``ring``."""
+    span = range(-ring, ring + 1)
+    return [
+        offset
+        for offset in itertools.product(span, span, span)
+        if max(map(abs, offset)) == ring
+    ]
+
+
+_RING_OFFSETS = [_ring_offsets(ring) for ring in range(GRID_RINGS + 1)]
+
+
+__all__ = [
+    "StationCatalogCache",
+    "StationIndex",
+    "StationMatch",
+]
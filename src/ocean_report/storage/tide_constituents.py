@@ -0,0 +1,99 @@
+"""On-disk cache of NOAA harmonic constituents and tidal datums."""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import time
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from ..models.noaa.harmonics import NoaaHarmonicConstituent
+
+_SAFE_STATION = re.compile(r"^[A-Za-z0-9_-]+$")
+
+
+@dataclass(frozen=True)
+class StationHarmonics:
+    """Cached prediction inputs for one station."""
+
+    station_id: str
+    fetched_at: float
+    units: str
+    constituents: list[NoaaHarmonicConstituent]
+    datums: dict[str, float]
+
+
+class TideConstituentStore:
+    """Harmonic constituents and datums per station, one JSON file each.
+
+    Constituents only change when NOAA re-analyses a station, so the cache
+    is refreshed rarely (``noaa.tide_prediction.max_age_days``).
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        self.directory = Path(directory)
+
+    def path(self, station_id: str) -> Path:
+        """Cache file for a station."""
+        if not _SAFE_STATION.match(station_id):
+            raise ValueError(f"Invalid station ID {station_id!r}")
+        return self.directory / f"{station_id}.json"
+
+    def load(self, station_id: str) -> Optional[StationHarmonics]:
+        """Return the cached harmonics, or None if not cached."""
+        try:
+            payload = json.loads(self.path(station_id).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        return StationHarmonics(
+            station_id=station_id,
+            fetched_at=float(payload["fetched_at"]),
+            units=payload["units"],
+            constituents=[
+                NoaaHarmonicConstituent.model_validate(item)
+                for item in payload["constituents"]
+            ],
+            datums={name: float(value) for name, value in payload["datums"].items()},
+        )
+
+    def save(
+        self,
+        station_id: str,
+        *,
+        constituents: Sequence[NoaaHarmonicConstituent],
+        datums: Mapping[str, float],
+        units: str = "feet",
+    ) -> StationHarmonics:
+        """Write a station's harmonics atomically and return them."""
+        harmonics = StationHarmonics(
+            station_id=station_id,
+            fetched_at=time.time(),
+            units=units,
+            constituents=list(constituents),
+            datums=dict(datums),
+        )
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.path(station_id)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(
+            json.dumps(
+                {
+                    "fetched_at": harmonics.fetched_at,
+                    "units": units,
+                    "constituents": [
+                        c.model_dump(by_alias=True) for c in harmonics.constituents
+                    ],
+                    "datums": harmonics.datums,
+                }
+            ),
+            encoding="utf-8",
+        )
+        os.replace(tmp_path, path)
+        return harmonics
+
+
+__all__ = ["StationHarmonics", "TideConstituentStore"]
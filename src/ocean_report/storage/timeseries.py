@@ -0,0 +1,296 @@
+"""Memory-mapped columnar time-series store.
+
+Each station/product series is a directory of append-only column files::
+
+    <root>/<station_id>/<product>/
+        timestamps.i8   int64 seconds since the epoch (station-local, naive)
+        values.f4       float32 measurement, NaN when missing
+        flags.u1        uint8 quality-flag bits
+        meta.json       committed row count
+
+Columns are opened with :class:`numpy.memmap`, so slicing a time range is a
+binary search on the timestamp column plus array views: no rows are parsed
+and no pydantic records are built. ``meta.json`` is replaced atomically
+after the column bytes are written, so readers only ever see fully written
+rows. One writer per series at a time is assumed.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Optional
+
+import numpy as np
+
+FORMAT_VERSION = 1
+TIMESTAMP_DTYPE = np.dtype("<i8")
+VALUE_DTYPE = np.dtype("<f4")
+FLAG_DTYPE = np.dtype("u1")
+
+PRODUCT_WATER_TEMPERATURE = "water_temperature"
+
+_COLUMNS = {
+    "timestamps": ("timestamps.i8", TIMESTAMP_DTYPE),
+    "values": ("values.f4", VALUE_DTYPE),
+    "flags": ("flags.u1", FLAG_DTYPE),
+}
+_SAFE_NAME = re.compile(r"^[A-Za-z0-9_.-]+$")
+
+TimeLike = datetime | np.datetime64 | str
+
+
+@dataclass(frozen=True)
+class TimeSeries:
+    """Read-only view of one series (or a time slice of it)."""
+
+    timestamps: np.ndarray
+    values: np.ndarray
+    flags: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    @property
+    def times(self) -> np.ndarray:
+        """Timestamps as ``datetime64[s]`` (a view, no copy)."""
+        return self.timestamps.view("datetime64[s]")
+
+    def slice(
+        self, start: Optional[TimeLike] = None, end: Optional[TimeLike] = None
+    ) -> "TimeSeries":
+        """Return rows with ``start <= timestamp < end`` as views."""
+        lo, hi = 0, len(self.timestamps)
+        if start is not None:
+            lo = int(np.searchsorted(self.timestamps, _seconds(start)))
+        if end is not None:
+            hi = int(np.searchsorted(self.timestamps, _seconds(end)))
+        return TimeSeries(
+            timestamps=self.timestamps[lo:hi],
+            values=self.values[lo:hi],
+            flags=self.flags[lo:hi],
+        )
+
+    def latest(self) -> Optional[tuple[datetime, float]]:
+        """Return the newest ``(timestamp, value)``, or None if empty."""
+        if not len(self):
+            return None
+        return (
+            self.times[-1].astype(datetime),
+            float(self.values[-1]),
+        )
+
+    def stats(self) -> dict[str, Any]:
+        """Count, min, max and mean of the non-missing values."""
+        present = self.values[~np.isnan(self.values)]
+        if not present.size:
+            return {"count": 0, "min": None, "max": None, "mean": None}
+        return {
+            "count": int(present.size),
+            "min": float(present.min()),
+            "max": float(present.max()),
+            "mean": float(present.mean(dtype=np.float64)),
+        }
+
+
+class TimeSeriesStore:
+    """Directory of append-only columnar series keyed by station and product."""
+
+    def __init__(self, root: str | Path) -> None:
+        self.root = Path(root)
+
+    def _series_dir(self, station_id: str, product: str) -> Path:
+        for name in (station_id, product):
+            if not _SAFE_NAME.match(name):
+                raise ValueError(f"Invalid series name {name!r}")
+        return self.root / station_id / product
+
+    def count(self, station_id: str, product: str) -> int:
+        """Number of committed rows in a series (0 if it does not exist)."""
+        meta_path = self._series_dir(station_id, product) / "meta.json"
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return 0
+        if meta.get("format_version") != FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported time-series format {meta.get('format_version')}"
+            )
+        return int(meta["count"])
+
+    def series(self) -> list[tuple[str, str]]:
+        """List every ``(station_id, product)`` in the store."""
+        return sorted(
+            (meta.parent.parent.name, meta.parent.name)
+            for meta in self.root.glob("*/*/meta.json")
+        )
+
+    def open(self, station_id: str, product: str) -> TimeSeries:
+        """Memory-map a series read-only."""
+        directory = self._series_dir(station_id, product)
+        count = self.count(station_id, product)
+        columns = {}
+        for column, (filename, dtype) in _COLUMNS.items():
+            if count:
+                columns[column] = np.memmap(
+                    directory / filename, dtype=dtype, mode="r", shape=(count,)
+                )
+            else:
+                columns[column] = np.empty(0, dtype=dtype)
+        return TimeSeries(**columns)
+
+    def missing(
+        self, station_id: str, product: str, timestamps: np.ndarray
+    ) -> np.ndarray:
+        """
+        Flag timestamps that are not stored in a series.
+
+        Args:
+            station_id: Station key.
+            product: Product key.
+            timestamps: ``datetime64`` or int64 epoch-second array.
+
+        Returns:
+            Boolean array, True where the timestamp has no stored row.
+        """
+        stamps = _to_seconds(timestamps)
+        stored = self.open(station_id, product).timestamps
+        if not len(stored):
+            return np.ones(len(stamps), dtype=bool)
+        positions = np.searchsorted(stored, stamps)
+        found = positions < len(stored)
+        found[found] = stored[positions[found]] == stamps[found]
+        return ~found
+
+    def append(
+        self,
+        station_id: str,
+        product: str,
+        timestamps: np.ndarray,
+        values: np.ndarray,
+        flags: Optional[np.ndarray] = None,
+    ) -> int:
+        """
+        Append rows newer than the series' last timestamp.
+
+        Rows are sorted by time and de-duplicated first; rows at or before the
+        newest stored timestamp are skipped, so re-appending an overlapping
+        batch is harmless.
+
+        Args:
+            station_id: Station key.
+            product: Product key (e.g. ``water_temperature``).
+            timestamps: ``datetime64`` or int64 epoch-second array.
+            values: Measurements (NaN for missing).
+            flags: Optional quality-flag bits per row.
+
+        Returns:
+            Number of rows appended.
+
+        Raises:
+            ValueError: If column lengths differ or a name is invalid.
+        """
+        stamps = _to_seconds(timestamps)
+        vals = np.asarray(values, dtype=VALUE_DTYPE)
+        bits = (
+            np.zeros(len(stamps), dtype=FLAG_DTYPE)
+            if flags is None
+            else np.asarray(flags, dtype=FLAG_DTYPE)
+        )
+        if not len(stamps) == len(vals) == len(bits):
+            raise ValueError("timestamps, values and flags must be the same length")
+
+        order = np.argsort(stamps, kind="stable")
+        stamps, vals, bits = stamps[order], vals[order], bits[order]
+        if len(stamps):
+            # Keep the last row of any duplicate timestamp.
+            keep = np.append(stamps[1:] != stamps[:-1], True)
+            stamps, vals, bits = stamps[keep], vals[keep], bits[keep]
+
+        directory = self._series_dir(station_id, product)
+        count = self.count(station_id, product)
+        if count:
+            last = self.open(station_id, product).timestamps[-1]
+            newer = stamps > last
+            stamps, vals, bits = stamps[newer], vals[newer], bits[newer]
+        if not len(stamps):
+            return 0
+
+        directory.mkdir(parents=True, exist_ok=True)
+        columns = {"timestamps": stamps, "values": vals, "flags": bits}
+        for column, data in columns.items():
+            filename, dtype = _COLUMNS[column]
+            with open(directory / filename, "ab") as handle:
+                # Drop bytes from an append that never committed.
+                handle.truncate(count * dtype.itemsize)
+                handle.write(data.tobytes())
+                handle.flush()
+                os.fsync(handle.fileno())
+
+        meta_path = directory / "meta.json"
+        tmp_path = directory / f"meta.json.{os.getpid()}.tmp"
+        meta = {"format_version": FORMAT_VERSION, "count": count + len(stamps)}
+        tmp_path.write_text(json.dumps(meta), encoding="utf-8")
+        os.replace(tmp_path, meta_path)
+        return len(stamps)
+
+
+def noaa_columns(
+    records: Sequence[Any], *, value_field: str
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Convert NOAA records to ``(timestamps, values, flags)`` columns.
+
+    Args:
+        records: Records with a ``timestamp`` (``YYYY-MM-DD HH:MM``) attribute.
+        value_field: Attribute holding the measurement (e.g. ``temperature``).
+
+    Returns:
+        Tuple of int64 epoch seconds, float32 values and uint8 flag bits.
+    """
+    stamps = np.array(
+        [record.timestamp for record in records], dtype="datetime64[m]"
+    ).astype("datetime64[s]")
+    vals = np.array(
+        [getattr(record, value_field) for record in records], dtype=VALUE_DTYPE
+    )
+    bits = np.fromiter(
+        (_flag_bits(getattr(record, "f", None)) for record in records),
+        dtype=FLAG_DTYPE,
+        count=len(records),
+    )
+    return stamps.view(TIMESTAMP_DTYPE), vals, bits
+
+
+def _flag_bits(flags: Optional[str]) -> int:
+    """Pack NOAA's ``"0,1,0,0"`` quality flags into bits (first flag = bit 0)."""
+    if not flags:
+        return 0
+    parts = flags.split(",")[:8]
+    return sum(1 << index for index, flag in enumerate(parts) if flag.strip() == "1")
+
+
+def _to_seconds(timestamps: np.ndarray | Iterable) -> np.ndarray:
+    """Normalize datetime64 or integer timestamps to int64 epoch seconds."""
+    array = np.asarray(timestamps)
+    if np.issubdtype(array.dtype, np.datetime64):
+        return array.astype("datetime64[s]").view(TIMESTAMP_DTYPE)
+    return array.astype(TIMESTAMP_DTYPE)
+
+
+def _seconds(value: TimeLike) -> np.int64:
+    """Convert one time bound to int64 epoch seconds."""
+    return np.datetime64(value, "s").astype(TIMESTAMP_DTYPE)
+
+
+__all__ = [
+    "PRODUCT_WATER_TEMPERATURE",
+    "TimeSeries",
+    "TimeSeriesStore",
+    "noaa_columns",
+]
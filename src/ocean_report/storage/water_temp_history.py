@@ -0,0 +1,208 @@
+"""Per-station water temperature history in SQLite.
+
+Samples are keyed by ``(station_id, observed_at)`` in a ``WITHOUT ROWID``
+table. ``observed_at`` keeps NOAA's ``YYYY-MM-DD HH:MM`` station-local
+timestamp, which sorts lexically, so "newest sample" and "last 24 hours" are
+primary-key range scans.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import Iterable
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator, Optional
+
+from ..models.noaa.water_temperature import NoaaWaterTemperatureRecord
+
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS water_temperature (
+    station_id TEXT NOT NULL,
+    observed_at TEXT NOT NULL,
+    temperature REAL NOT NULL,
+    flags TEXT,
+    PRIMARY KEY (station_id, observed_at)
+) WITHOUT ROWID;
+"""
+
+
+@dataclass(frozen=True)
+class WaterTempSample:
+    """One stored water temperature observation."""
+
+    timestamp: str
+    temperature: float
+    flags: Optional[str] = None
+
+    @property
+    def observed_at(self) -> datetime:
+        """Observation time (station local, naive)."""
+        return datetime.strptime(self.timestamp, TIMESTAMP_FORMAT)
+
+
+@dataclass(frozen=True)
+class WaterTempSummary:
+    """Aggregate of the samples in a time window."""
+
+    count: int
+    minimum: Optional[float]
+    maximum: Optional[float]
+    mean: Optional[float]
+    first: Optional[WaterTempSample]
+    last: Optional[WaterTempSample]
+
+    @property
+    def change(self) -> Optional[float]:
+        """Temperature change from the first to the last sample."""
+        if self.first is None or self.last is None:
+            return None
+        return self.last.temperature - self.first.temperature
+
+
+class WaterTempHistory:
+    """SQLite-backed water temperature samples for any number of stations.
+
+    Like the outbox, each operation opens a short-lived connection, so one
+    instance can be shared between threads.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection in autocommit mode with WAL journaling."""
+        conn = sqlite3.connect(self.path, timeout=30.0, isolation_level=None)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            yield conn
+        finally:
+            conn.close()
+
+    def latest(self, station_id: str) -> Optional[WaterTempSample]:
+        """Return the newest stored sample for a station, if any."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT observed_at, temperature, flags FROM water_temperature "
+                "WHERE station_id = ? ORDER BY observed_at DESC LIMIT 1",
+                (station_id,),
+            ).fetchone()
+        return WaterTempSample(*row) if row else None
+
+    def append(
+        self, station_id: str, records: Iterable[NoaaWaterTemperatureRecord]
+    ) -> int:
+        """
+        Store NOAA records for a station, ignoring ones already stored.
+
+        Args:
+            station_id: NOAA station the records belong to.
+            records: Records from a NOAA water temperature response.
+
+        Returns:
+            Number of new samples stored.
+        """
+        rows = [
+            (station_id, record.timestamp, record.temperature, record.f)
+            for record in records
+        ]
+        if not rows:
+            return 0
+        with self._connect() as conn:
+            before = conn.total_changes
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.executemany(
+                    "INSERT OR IGNORE INTO water_temperature "
+                    "(station_id, observed_at, temperature, flags) "
+                    "VALUES (?, ?, ?, ?)",
+                    rows,
+                )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            return conn.total_changes - before
+
+    def window(
+        self,
+        station_id: str,
+        *,
+        start: datetime,
+        end: Optional[datetime] = None,
+    ) -> list[WaterTempSample]:
+        """Return samples with ``start <= observed_at <= end`` in time order."""
+        upper = "9999" if end is None else end.strftime(TIMESTAMP_FORMAT)
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT observed_at, temperature, flags FROM water_temperature "
+                "WHERE station_id = ? AND observed_at BETWEEN ? AND ? "
+                "ORDER BY observed_at",
+                (station_id, start.strftime(TIMESTAMP_FORMAT), upper),
+            ).fetchall()
+        return [WaterTempSample(*row) for row in rows]
+
+    def summarize(
+        self,
+        station_id: str,
+        *,
+        start: datetime,
+        end: Optional[datetime] = None,
+    ) -> WaterTempSummary:
+        """Aggregate the samples in a window without loading them all."""
+        bounds = (
+            station_id,
+            start.strftime(TIMESTAMP_FORMAT),
+            "9999" if end is None else end.strftime(TIMESTAMP_FORMAT),
+        )
+        where = "WHERE station_id = ? AND observed_at BETWEEN ? AND ?"
+        with self._connect() as conn:
+            count, minimum, maximum, mean = conn.execute(
+                "SELECT COUNT(*), MIN(temperature), MAX(temperature), "
+                f"AVG(temperature) FROM water_temperature {where}",
+                bounds,
+            ).fetchone()
+            first = conn.execute(
+                "SELECT observed_at, temperature, flags FROM water_temperature "
+                f"{where} ORDER BY observed_at LIMIT 1",
+                bounds,
+            ).fetchone()
+            last = conn.execute(
+                "SELECT observed_at, temperature, flags FROM water_temperature "
+                f"{where} ORDER BY observed_at DESC LIMIT 1",
+                bounds,
+            ).fetchone()
+        return WaterTempSummary(
+            count=count,
+            minimum=minimum,
+            maximum=maximum,
+            mean=mean,
+            first=WaterTempSample(*first) if first else None,
+            last=WaterTempSample(*last) if last else None,
+        )
+
+    def prune(self, station_id: str, *, before: datetime) -> int:
+        """Delete a station's samples older than ``before``; return rows deleted."""
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "DELETE FROM water_temperature "
+                "WHERE station_id = ? AND observed_at < ?",
+                (station_id, before.strftime(TIMESTAMP_FORMAT)),
+            )
+        return cursor.rowcount
+
+
+__all__ = [
+    "TIMESTAMP_FORMAT",
+    "WaterTempHistory",
+    "WaterTempSample",
+    "WaterTempSummary",
+]
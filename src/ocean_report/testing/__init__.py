@@ -0,0 +1,15 @@
+"""Test and benchmark helpers that run entirely in-process."""
+
+from .benchmark import BenchmarkResult, compare, load_results, measure, save_results
+from .smtp_sink import SinkMessage, SinkStats, SmtpSink
+
+__all__ = [
+    "BenchmarkResult",
+    "SinkMessage",
+    "SinkStats",
+    "SmtpSink",
+    "compare",
+    "load_results",
+    "measure",
+    "save_results",
+]
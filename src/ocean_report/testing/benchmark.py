@@ -0,0 +1,242 @@
+"""Micro-benchmark harness with baseline comparison.
+
+A single wall-clock measurement mostly measures scheduler noise. The harness
+instead:
+
+- warms up the code under test (imports, caches, template compilation);
+- calibrates a loop count so each sample lasts at least ``min_sample_time``;
+- takes repeated samples of the mean per-call time;
+- reports the median and interquartile range, which ignore outliers.
+
+Baselines are stored as JSON, samples included. A benchmark counts as a
+regression only if its median slowed down by more than a threshold *and* a
+one-sided Mann-Whitney U test says the slowdown is significant. The test
+assumes neither normality nor equal variances.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import platform
+import statistics
+import time
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+DEFAULT_SAMPLES = 20
+DEFAULT_WARMUP = 3
+DEFAULT_MIN_SAMPLE_TIME = 0.01  # seconds
+DEFAULT_THRESHOLD = 0.10  # relative median slowdown that matters
+DEFAULT_ALPHA = 0.01
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """Per-call timings for one benchmark, in seconds."""
+
+    name: str
+    samples: tuple[float, ...]
+    loops: int = 1
+
+    @property
+    def median(self) -> float:
+        """Median per-call time."""
+        return statistics.median(self.samples)
+
+    @property
+    def iqr(self) -> float:
+        """Interquartile range of the per-call times."""
+        if len(self.samples) < 2:
+            return 0.0
+        q1, _, q3 = statistics.quantiles(self.samples, n=4, method="inclusive")
+        return q3 - q1
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-serializable summary including the raw samples."""
+        return {
+            "median": self.median,
+            "iqr": self.iqr,
+            "loops": self.loops,
+            "samples": list(self.samples),
+        }
+
+
+@dataclass(frozen=True)
+class Comparison:
+    """Current timings of one benchmark against its baseline."""
+
+    name: str
+    baseline_median: float
+    current_median: float
+    p_value: float
+    regressed: bool
+
+    @property
+    def ratio(self) -> float:
+        """Current median over baseline median (>1 means slower)."""
+        return self.current_median / self.baseline_median
+
+
+def measure(
+    name: str,
+    func: Callable[[], Any],
+    *,
+    samples: int = DEFAULT_SAMPLES,
+    warmup: int = DEFAULT_WARMUP,
+    min_sample_time: float = DEFAULT_MIN_SAMPLE_TIME,
+) -> BenchmarkResult:
+    """
+    Time ``func`` with warmup, loop calibration and repeated samples.
+
+    Args:
+        name: Benchmark name.
+        func: Zero-argument callable to time.
+        samples: Number of samples to record.
+        warmup: Calls made before calibration and timing.
+        min_sample_time: Minimum duration of one sample; fast functions are
+            called in a loop and the mean per-call time is recorded.
+
+    Returns:
+        BenchmarkResult with ``samples`` per-call timings.
+    """
+    for _ in range(warmup):
+        func()
+    loops = _calibrate(func, min_sample_time)
+    timings = []
+    for _ in range(samples):
+        timings.append(_time_loops(func, loops) / loops)
+    return BenchmarkResult(name=name, samples=tuple(timings), loops=loops)
+
+
+def compare(
+    baseline: BenchmarkResult,
+    current: BenchmarkResult,
+    *,
+    threshold: float = DEFAULT_THRESHOLD,
+    alpha: float = DEFAULT_ALPHA,
+) -> Comparison:
+    """
+    Decide whether ``current`` is a significant slowdown from ``baseline``.
+
+    Args:
+        baseline: Stored baseline timings.
+        current: Fresh timings of the same benchmark.
+        threshold: Minimum relative slowdown of the median to report.
+        alpha: Significance level of the one-sided Mann-Whitney U test.
+
+    Returns:
+        Comparison with the test's p-value and the verdict.
+    """
+    p_value = mann_whitney_greater(current.samples, baseline.samples)
+    slower = current.median > baseline.median * (1 + threshold)
+    return Comparison(
+        name=current.name,
+        baseline_median=baseline.median,
+        current_median=current.median,
+        p_value=p_value,
+        regressed=slower and p_value < alpha,
+    )
+
+
+def mann_whitney_greater(sample: Sequence[float], reference: Sequence[float]) -> float:
+    """
+    One-sided p-value that ``sample`` tends to be larger than ``reference``.
+
+    Uses the normal approximation with tie and continuity corrections, which
+    is accurate for the 10+ samples per side the harness records.
+    """
+    n1, n2 = len(sample), len(reference)
+    if not n1 or not n2:
+        return 1.0
+    ranks = _average_ranks([*sample, *reference])
+    u_statistic = sum(ranks[:n1]) - n1 * (n1 + 1) / 2
+
+    total = n1 + n2
+    ties = sum(count**3 - count for count in _tie_counts([*sample, *reference]))
+    variance = n1 * n2 / 12 * ((total + 1) - ties / (total * (total - 1)))
+    if variance <= 0:
+        return 1.0
+    z_score = (u_statistic - n1 * n2 / 2 - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z_score / math.sqrt(2))
+
+
+def save_results(path: str | Path, results: Iterable[BenchmarkResult]) -> None:
+    """Write results and environment details to a JSON file."""
+    payload = {
+        "metadata": {
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+        },
+        "benchmarks": {result.name: result.to_dict() for result in results},
+    }
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+
+
+def load_results(path: str | Path) -> dict[str, BenchmarkResult]:
+    """Read results written by ``save_results``, keyed by benchmark name."""
+    payload = json.loads(Path(path).read_text(encoding="utf-8"))
+    return {
+        name: BenchmarkResult(
+            name=name, samples=tuple(entry["samples"]), loops=entry.get("loops", 1)
+        )
+        for name, entry in payload["benchmarks"].items()
+    }
+
+
+def _calibrate(func: Callable[[], Any], min_sample_time: float) -> int:
+    """Smallest loop count from 1, 2, 5, 10, 20, ... lasting ``min_sample_time``."""
+    scale = 1
+    while True:
+        for multiplier in (1, 2, 5):
+            loops = scale * multiplier
+            if _time_loops(func, loops) >= min_sample_time:
+                return loops
+        scale *= 10
+
+
+def _time_loops(func: Callable[[], Any], loops: int) -> float:
+    start = time.perf_counter()
+    for _ in range(loops):
+        func()
+    return time.perf_counter() - start
+
+
+def _average_ranks(values: Sequence[float]) -> list[float]:
+    """1-based ranks, with tied values sharing their average rank."""
+    order = sorted(range(len(values)), key=values.__getitem__)
+    ranks = [0.0] * len(values)
+    start = 0
+    while start < len(order):
+        end = start
+        while end + 1 < len(order) and values[order[end + 1]] == values[order[start]]:
+            end += 1
+        for position in range(start, end + 1):
+            ranks[order[position]] = (start + end) / 2 + 1
+        start = end + 1
+    return ranks
+
+
+def _tie_counts(values: Sequence[float]) -> list[int]:
+    counts: dict[float, int] = {}
+    for value in values:
+        counts[value] = counts.get(value, 0) + 1
+    return [count for count in counts.values() if count > 1]
+
+
+__all__ = [
+    "BenchmarkResult",
+    "Comparison",
+    "compare",
+    "load_results",
+    "mann_whitney_greater",
+    "measure",
+    "save_results",
+]
@@ -0,0 +1,389 @@
+"""In-process SMTP sink for tests and benchmarks.
+
+The sink speaks enough ESMTP for ``smtplib`` clients: EHLO/HELO, STARTTLS
+(with the bundled self-signed ``localhost`` certificate), AUTH PLAIN/LOGIN,
+MAIL/RCPT/DATA, RSET, NOOP and QUIT. Accepted messages are kept in memory so
+tests can inspect envelopes and payloads, and an optional per-command delay
+simulates a remote provider's round-trip latency.
+
+The bundled key pair is for local testing only and must never be used to
+protect real traffic.
+"""
+
+from __future__ import annotations
+
+import base64
+import socketserver
+import ssl
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import TracebackType
+from typing import Optional
+
+CERT_DIR = Path(__file__).parent / "certs"
+DEFAULT_CERTFILE = CERT_DIR / "localhost-cert.pem"
+DEFAULT_KEYFILE = CERT_DIR / "localhost-key.pem"
+
+
+@dataclass(frozen=True)
+class SinkMessage:
+    """One message accepted by the sink."""
+
+    mail_from: str
+    rcpt_tos: tuple[str, ...]
+    data: bytes
+    authenticated_as: Optional[str] = None
+    tls: bool = False
+
+
+@dataclass
+class SinkStats:
+    """Counters collected by the sink across all sessions."""
+
+    connections: int = 0
+    tls_upgrades: int = 0
+    logins: int = 0
+    messages: int = 0
+    recipients: int = 0
+    rejected_recipients: int = 0
+
+
+@dataclass
+class SmtpSinkConfig:  # pylint: disable=too-many-instance-attributes
+    """Behaviour switches for an SmtpSink."""
+
+    username: Optional[str] = None
+    password: Optional[str] = None
+    command_latency_seconds: float = 0.0
+    rejected_recipients: frozenset[str] = frozenset()
+    max_recipients: Optional[int] = None
+    require_tls_for_auth: bool = True
+    keep_messages: bool = True
+    certfile: Path = DEFAULT_CERTFILE
+    keyfile: Path = DEFAULT_KEYFILE
+    extra_latency: dict[str, float] = field(default_factory=dict)
+
+
+class SmtpSink:
+    """Threaded local SMTP server that records what it receives.
+
+    Example:
+        >>> with SmtpSink(username="user", password="secret") as sink:
+        ...     send_email(..., smtp_server=sink.host, smtp_port=sink.port)
+        ...     assert sink.messages[0].rcpt_tos == ("a@example.com",)
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        *,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        command_latency_seconds: float = 0.0,
+        rejected_recipients: Optional[set[str]] = None,
+        max_recipients: Optional[int] = None,
+        keep_messages: bool = True,
+    ) -> None:
+        self.config = SmtpSinkConfig(
+            username=username,
+            password=password,
+            command_latency_seconds=command_latency_seconds,
+            rejected_recipients=frozenset(
+                address.lower() for address in (rejected_recipients or set())
+            ),
+            max_recipients=max_recipients,
+            keep_messages=keep_messages,
+        )
+        self.messages: list[SinkMessage] = []
+        self.stats = SinkStats()
+        self._lock = threading.Lock()
+        self._ssl_context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+        self._ssl_context.load_cert_chain(self.config.certfile, self.config.keyfile)
+        self._server = _ThreadingSmtpServer((host, port), _SmtpHandler, sink=self)
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def host(self) -> str:
+        """Address the sink is listening on."""
+        return self._server.server_address[0]
+
+    @property
+    def port(self) -> int:
+        """Port the sink is listening on."""
+        return self._server.server_address[1]
+
+    def start(self) -> "SmtpSink":
+        """Start serving in a background thread."""
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            name="smtp-sink",
+            daemon=True,
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and close the listening socket."""
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def reset(self) -> None:
+        """Forget recorded messages and counters."""
+        with self._lock:
+            self.messages.clear()
+            self.stats = SinkStats()
+
+    def _record(self, message: SinkMessage) -> None:
+        with self._lock:
+            self.stats.messages += 1
+            self.stats.recipients += len(message.rcpt_tos)
+            if self.config.keep_messages:
+                self.messages.append(message)
+
+    def _count(self, counter: str, amount: int = 1) -> None:
+        with self._lock:
+            setattr(self.stats, counter, getattr(self.stats, counter) + amount)
+
+    def __enter__(self) -> "SmtpSink":
+        return self.start()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.stop()
+
+
+class _ThreadingSmtpServer(socketserver.ThreadingTCPServer):
+    """TCP server that carries a reference to its owning sink."""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, server_address, handler_class, *, sink: SmtpSink) -> None:
+        self.sink = sink
+        super().__init__(server_address, handler_class)
+
+
+class _SmtpHandler(socketserver.BaseRequestHandler):
+    """One SMTP session."""
+
+    server: _ThreadingSmtpServer
+
+    def setup(self) -> None:
+        self.sink = self.server.sink
+        self.tls = False
+        self.user: Optional[str] = None
+        self._reset_transaction()
+        self._open_files()
+
+    def _open_files(self) -> None:
+        self.rfile = self.request.makefile("rb")
+        self.wfile = self.request.makefile("wb", buffering=0)
+
+    def _reset_transaction(self) -> None:
+        self.mail_from: Optional[str] = None
+        self.rcpt_tos: list[str] = []
+
+    def _reply(self, line: str, command: str = "") -> None:
+        delay = self.sink.config.extra_latency.get(
+            command, self.sink.config.command_latency_seconds
+        )
+        if delay:
+            time.sleep(delay)
+        self.wfile.write(line.encode("ascii") + b"\r\n")
+
+    def _readline(self) -> Optional[str]:
+        raw = self.rfile.readline()
+        if not raw:
+            return None
+        return raw.decode("utf-8", errors="replace").rstrip("\r\n")
+
+    def handle(self) -> None:
+        self.sink._count("connections")  # pylint: disable=protected-access
+        self._reply("220 localhost ocean-report SMTP sink ready")
+
+        while True:
+            line = self._readline()
+            if line is None:
+                return
+            verb, _, argument = line.partition(" ")
+            verb = verb.upper()
+            handler = getattr(self, f"_cmd_{verb.lower()}", None)
+            if handler is None:
+                self._reply("502 Command not implemented", verb)
+                continue
+            if handler(argument) is False:
+                return
+
+    def _cmd_ehlo(self, _argument: str) -> None:
+        features = ["250-localhost", "250-8BITMIME", "250-PIPELINING"]
+        if not self.tls:
+            features.append("250-STARTTLS")
+        if self.tls or not self.sink.config.require_tls_for_auth:
+            features.append("250-AUTH PLAIN LOGIN")
+        features[-1] = features[-1].replace("250-", "250 ", 1)
+        for index, feature in enumerate(features):
+            if index < len(features) - 1:
+                self.wfile.write(feature.encode("ascii") + b"\r\n")
+            else:
+                self._reply(feature, "EHLO")
+
+    def _cmd_helo(self, _argument: str) -> None:
+        self._reply("250 localhost", "HELO")
+
+    def _cmd_starttls(self, _argument: str) -> Optional[bool]:
+        if self.tls:
+            self._reply("503 Already using TLS", "STARTTLS")
+            return None
+        self._reply("220 Ready to start TLS", "STARTTLS")
+        try:
+            # pylint: disable=protected-access
+            self.request = self.sink._ssl_context.wrap_socket(
+                self.request, server_side=True
+            )
+        except (ssl.SSLError, OSError):
+            return False
+        self.tls = True
+        self.sink._count("tls_upgrades")  # pylint: disable=protected-access
+        self._open_files()
+        self._reset_transaction()
+        return None
+
+    def _cmd_auth(self, argument: str) -> Optional[bool]:
+        if self.sink.config.require_tls_for_auth and not self.tls:
+            self._reply("530 Must issue a STARTTLS command first", "AUTH")
+            return None
+
+        mechanism, _, initial = argument.partition(" ")
+        mechanism = mechanism.upper()
+        if mechanism == "PLAIN":
+            if not initial:
+                self._reply("334 ", "AUTH")
+                initial = self._readline() or ""
+            try:
+                _, username, password = (
+                    base64.b64decode(initial).decode("utf-8").split("\0")
+                )
+            except ValueError:
+                self._reply("501 Malformed AUTH PLAIN response", "AUTH")
+                return None
+        elif mechanism == "LOGIN":
+            try:
+                if initial:
+                    username = base64.b64decode(initial).decode("utf-8")
+                else:
+                    self._reply("334 VXNlcm5hbWU6", "AUTH")
+                    username = base64.b64decode(self._readline() or "").decode()
+                self._reply("334 UGFzc3dvcmQ6", "AUTH")
+                password = base64.b64decode(self._readline() or "").decode("utf-8")
+            except ValueError:
+                self._reply("501 Malformed AUTH LOGIN response", "AUTH")
+                return None
+        else:
+            self._reply("504 Unrecognized authentication type", "AUTH")
+            return None
+
+        config = self.sink.config
+        if config.username is not None and (
+            username != config.username or password != config.password
+        ):
+            self._reply("535 Authentication credentials invalid", "AUTH")
+            return None
+
+        self.user = username
+        self.sink._count("logins")  # pylint: disable=protected-access
+        self._reply("235 Authentication successful", "AUTH")
+        return None
+
+    def _cmd_mail(self, argument: str) -> None:
+        if self.sink.config.username is not None and self.user is None:
+            self._reply("530 Authentication required", "MAIL")
+            return
+        self._reset_transaction()
+        self.mail_from = _extract_address(argument)
+        self._reply("250 OK", "MAIL")
+
+    def _cmd_rcpt(self, argument: str) -> None:
+        if self.mail_from is None:
+            self._reply("503 Need MAIL command", "RCPT")
+            return
+        address = _extract_address(argument)
+        if not address:
+            self._reply("501 Syntax: RCPT TO:<address>", "RCPT")
+            return
+        config = self.sink.config
+        if address.lower() in config.rejected_recipients:
+            self.sink._count("rejected_recipients")  # pylint: disable=protected-access
+            self._reply("550 No such user here", "RCPT")
+            return
+        if config.max_recipients is not None and (
+            len(self.rcpt_tos) >= config.max_recipients
+        ):
+            self._reply("452 Too many recipients", "RCPT")
+            return
+        self.rcpt_tos.append(address)
+        self._reply("250 OK", "RCPT")
+
+    def _cmd_data(self, _argument: str) -> Optional[bool]:
+        if not self.rcpt_tos:
+            self._reply("503 Need RCPT command", "DATA")
+            return None
+        self._reply("354 End data with <CR><LF>.<CR><LF>", "DATA")
+
+        lines = []
+        while True:
+            raw = self.rfile.readline()
+            if not raw:
+                return False
+            if raw in (b".\r\n", b".\n"):
+                break
+            if raw.startswith(b".."):
+                raw = raw[1:]
+            lines.append(raw)
+
+        # pylint: disable=protected-access
+        self.sink._record(
+            SinkMessage(
+                mail_from=self.mail_from or "",
+                rcpt_tos=tuple(self.rcpt_tos),
+                data=b"".join(lines),
+                authenticated_as=self.user,
+                tls=self.tls,
+            )
+        )
+        self._reset_transaction()
+        self._reply("250 OK: queued", "DATA")
+        return None
+
+    def _cmd_rset(self, _argument: str) -> None:
+        self._reset_transaction()
+        self._reply("250 OK", "RSET")
+
+    def _cmd_noop(self, _argument: str) -> None:
+        self._reply("250 OK", "NOOP")
+
+    def _cmd_quit(self, _argument: str) -> bool:
+        self._reply("221 Bye", "QUIT")
+        return False
+
+
+def _extract_address(argument: str) -> str:
+    """Pull the address out of ``FROM:<a@b>`` / ``TO:<a@b> PARAMS``."""
+    _, _, value = argument.partition(":")
+    value = value.strip()
+    if value.startswith("<"):
+        value = value[1 : value.find(">")]
+    else:
+        value = value.split(" ", 1)[0]
+    return value
+
+
+__all__ = ["SinkMessage", "SinkStats", "SmtpSink"]
@@ -0,0 +1,22 @@
+"""Local tide computations on top of NOAA predictions."""
+
+from .harmonic import HarmonicModel, predict_heights, predict_hilo
+from .interpolation import (
+    TideEvents,
+    interpolate_heights,
+    interpolation_error,
+    tide_curve,
+)
+from .subordinate import SubordinateOffsets, apply_offsets
+
+__all__ = [
+    "HarmonicModel",
+    "SubordinateOffsets",
+    "TideEvents",
+    "apply_offsets",
+    "interpolate_heights",
+    "interpolation_error",
+    "predict_heights",
+    "predict_hilo",
+    "tide_curve",
+]
@@ -0,0 +1,424 @@
+"""Harmonic tide prediction from NOAA constituents.
+
+NOAA predicts tides as a sum of cosine constituents::
+
+    h(t) = Z0 + sum_i f_i(t) * A_i * cos(V_i(t) + u_i(t) - kappa_i)
+
+where ``A``/``kappa`` are a station's published amplitude and Greenwich
+phase, ``V`` is the equilibrium argument from the positions of the mean
+sun and moon, and ``f``/``u`` are the node factor and nodal correction for
+the 18.6-year lunar node cycle. ``Z0`` is mean sea level above the
+prediction datum (MLLW).
+
+This module follows Schureman (1958), *Manual of Harmonic Analysis and
+Prediction of Tides*, for the 37 constituents NOAA publishes. Like NOAA,
+node factors are evaluated at the middle of each calendar year. Everything
+is vectorized: heights for a year of 6-minute times are one matrix product.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from ..models.noaa.harmonics import NoaaHarmonicConstituent
+from ..models.noaa.tides import NoaaTidePredictionRecord
+
+TIME_UNIT = "datetime64[m]"
+_EPOCH = np.datetime64("2000-01-01T12:00", "m")  # J2000.0
+_OBLIQUITY = 23.452  # Schureman's constants; the node factor
+_MOON_INCLINATION = 5.145  # normalizations below assume them.
+# Times per synthesis block, bounding the (constituents x times) matrix.
+BLOCK_SIZE = 50_000
+
+# Schureman's equilibrium argument V as multiples of (T, s, h, p, p1, 90
+# degrees), where T = 180 + 15t is the mean solar hour angle, s/h/p the mean
+# longitudes of moon, sun and lunar perigee, and p1 the solar perigee. The
+# second item names the node factor formula.
+CONSTITUENTS: dict[str, tuple[tuple[int, int, int, int, int, int], str]] = {
+    "M2": ((2, -2, 2, 0, 0, 0), "M2"),
+    "S2": ((2, 0, 0, 0, 0, 0), "solar"),
+    "N2": ((2, -3, 2, 1, 0, 0), "M2"),
+    "K1": ((1, 0, 1, 0, 0, -1), "K1"),
+    "M4": ((4, -4, 4, 0, 0, 0), "M2^2"),
+    "O1": ((1, -2, 1, 0, 0, 1), "O1"),
+    "M6": ((6, -6, 6, 0, 0, 0), "M2^3"),
+    "MK3": ((3, -2, 3, 0, 0, -1), "M2*K1"),
+    "S4": ((4, 0, 0, 0, 0, 0), "solar"),
+    "MN4": ((4, -5, 4, 1, 0, 0), "M2^2"),
+    "NU2": ((2, -3, 4, -1, 0, 0), "M2"),
+    "S6": ((6, 0, 0, 0, 0, 0), "solar"),
+    "MU2": ((2, -4, 4, 0, 0, 0), "M2"),
+    "2N2": ((2, -4, 2, 2, 0, 0), "M2"),
+    "OO1": ((1, 2, 1, 0, 0, -1), "OO1"),
+    "LAM2": ((2, -1, 0, 1, 0, 2), "M2"),
+    "S1": ((1, 0, 0, 0, 0, 0), "solar"),
+    "M1": ((1, -1, 1, 1, 0, 1), "M1"),
+    "J1": ((1, 1, 1, -1, 0, -1), "J1"),
+    "MM": ((0, 1, 0, -1, 0, 0), "Mm"),
+    "SSA": ((0, 0, 2, 0, 0, 0), "solar"),
+    "SA": ((0, 0, 1, 0, 0, 0), "solar"),
+    "MSF": ((0, 2, -2, 0, 0, 0), "S-M2"),
+    "MF": ((0, 2, 0, 0, 0, 0), "Mf"),
+    "RHO": ((1, -3, 3, -1, 0, 1), "O1"),
+    "Q1": ((1, -3, 1, 1, 0, 1), "O1"),
+    "T2": ((2, 0, -1, 0, 1, 0), "solar"),
+    "R2": ((2, 0, 1, 0, -1, 2), "solar"),
+    "2Q1": ((1, -4, 1, 2, 0, 1), "O1"),
+    "P1": ((1, 0, -1, 0, 0, 1), "solar"),
+    "2SM2": ((2, 2, -2, 0, 0, 0), "S-M2"),
+    "M3": ((3, -3, 3, 0, 0, 0), "M3"),
+    "L2": ((2, -1, 2, -1, 0, 2), "L2"),
+    "2MK3": ((3, -4, 3, 0, 0, 1), "M2^2/K1"),
+    "K2": ((2, 0, 2, 0, 0, 0), "K2"),
+    "M8": ((8, -8, 8, 0, 0, 0), "M2^4"),
+    "MS4": ((4, -2, 2, 0, 0, 0), "M2"),
+}
+
+_COMPOUNDS = {"M2^2", "M2^3", "M2^4", "S-M2", "M2*K1", "M2^2/K1"}
+
+# Rates of (T, s, h, p, p1) in degrees per hour, for constituent speeds.
+_RATES = np.array([15.0, 0.5490165, 0.0410686, 0.0046418, 0.0000020])
+
+
+@dataclass(frozen=True)
+class HarmonicModel:
+    """A station's constituents, ready for synthesis."""
+
+    station_id: str
+    names: tuple[str, ...]
+    amplitudes: np.ndarray
+    phases: np.ndarray
+    datum_offset: float = 0.0
+
+    @classmethod
+    def from_constituents(
+        cls,
+        station_id: str,
+        constituents: Sequence[NoaaHarmonicConstituent],
+        *,
+        datum_offset: float = 0.0,
+    ) -> "HarmonicModel":
+        """
+        Build a model from NOAA ``harcon`` constituents.
+
+        Args:
+            station_id: NOAA station ID.
+            constituents: Constituents with amplitude and ``phase_GMT``.
+                Zero-amplitude and unknown constituents are skipped.
+            datum_offset: Mean sea level above the prediction datum (MSL - MLLW).
+
+        Returns:
+            HarmonicModel for the station.
+        """
+        used = [c for c in constituents if c.amplitude and c.name in CONSTITUENTS]
+        return cls(
+            station_id=station_id,
+            names=tuple(c.name for c in used),
+            amplitudes=np.array([c.amplitude for c in used], dtype=float),
+            phases=np.array([c.phase_gmt for c in used], dtype=float),
+            datum_offset=datum_offset,
+        )
+
+    @property
+    def speeds(self) -> np.ndarray:
+        """Constituent speeds in degrees per hour."""
+        coefficients = np.array([CONSTITUENTS[name][0][:5] for name in self.names])
+        return coefficients.reshape(-1, 5) @ _RATES
+
+    def heights(self, times_utc: Any) -> np.ndarray:
+        """
+        Predicted heights at UTC times.
+
+        Args:
+            times_utc: ``datetime64`` UTC times (any shape convertible to 1-D).
+
+        Returns:
+            Heights above the prediction datum, in the constituents' units.
+        """
+        times = np.atleast_1d(np.asarray(times_utc, dtype=TIME_UNIT))
+        heights = np.empty(times.shape, dtype=float)
+        for start in range(0, len(times), BLOCK_SIZE):
+            block = times[start : start + BLOCK_SIZE]
+            argument, factor = _arguments(self.names, block)
+            argument -= self.phases[:, None]
+            heights[start : start + BLOCK_SIZE] = self.datum_offset + np.einsum(
+                "c,ct->t", self.amplitudes, factor * np.cos(np.radians(argument))
+            )
+        return heights
+
+    def extrema(
+        self, start_utc: Any, end_utc: Any, *, step_minutes: int = 6
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        High and low waters with ``start_utc <= t < end_utc``.
+
+        Heights are sampled every ``step_minutes``, turning points are located
+        from slope sign changes and refined to the minute with a parabola
+        through the neighbouring samples.
+
+        Returns:
+            Tuple of ``datetime64[m]`` UTC times, heights, and a boolean array
+            that is True for high waters.
+        """
+        start = np.datetime64(start_utc, "m")
+        end = np.datetime64(end_utc, "m")
+        step = np.timedelta64(step_minutes, "m")
+        grid = np.arange(start - 2 * step, end + 2 * step, step)
+        heights = self.heights(grid)
+
+        slope = np.sign(np.diff(heights))
+        turning = np.flatnonzero(slope[1:] * slope[:-1] < 0) + 1
+        before, at, after = heights[turning - 1], heights[turning], heights[turning + 1]
+        curvature = before - 2 * at + after
+        offset = np.where(curvature != 0, 0.5 * (before - after) / curvature, 0.0)
+        minutes = np.rint(offset * step_minutes).astype(np.int64)
+        times = grid[turning] + minutes.astype("timedelta64[m]")
+
+        inside = (times >= start) & (times < end)
+        times, curvature = times[inside], curvature[inside]
+        return times, self.heights(times), curvature < 0
+
+
+def predict_hilo(
+    model: HarmonicModel, *, start: Any, end: Any, time_zone: str
+) -> list[NoaaTidePredictionRecord]:
+    """
+    High/low predictions shaped like NOAA ``interval=hilo`` records.
+
+    Args:
+        model: Station model.
+        start: First local (wall-clock) time, inclusive.
+        end: Last local time, exclusive.
+        time_zone: IANA zone of the wall-clock times (NOAA ``lst_ldt``).
+
+    Returns:
+        Records with local ``YYYY-MM-DD HH:MM`` timestamps, heights rounded
+        to NOAA's 3 decimals and ``H``/``L`` types.
+    """
+    times, heights, is_high = model.extrema(
+        _to_utc(start, time_zone), _to_utc(end, time_zone)
+    )
+    return [
+        NoaaTidePredictionRecord(t=stamp, v=round(height, 3), type="H" if high else "L")
+        for stamp, height, high in zip(
+            _local_strings(times, time_zone), heights.tolist(), is_high.tolist()
+        )
+    ]
+
+
+def predict_heights(
+    model: HarmonicModel,
+    *,
+    start: Any,
+    end: Any,
+    time_zone: str,
+    step_minutes: int = 6,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Evenly spaced predicted heights over a local time range.
+
+    The grid is laid out in UTC, so days with a DST change have 23 or 25
+    hours of samples, like NOAA's ``lst_ldt`` series.
+
+    Returns:
+        Tuple of local ``datetime64[m]`` wall-clock times and heights.
+    """
+    times = np.arange(
+        _to_utc(start, time_zone),
+        _to_utc(end, time_zone),
+        np.timedelta64(step_minutes, "m"),
+    )
+    local = pd.DatetimeIndex(times).tz_localize("UTC").tz_convert(time_zone)
+    return local.tz_localize(None).values.astype(TIME_UNIT), model.heights(times)
+
+
+def _to_utc(local: Any, time_zone: str) -> np.datetime64:
+    """Convert a naive local wall-clock time to naive UTC ``datetime64[m]``."""
+    stamp = pd.Timestamp(np.datetime64(local, "m")).tz_localize(
+        time_zone, ambiguous=True, nonexistent="shift_forward"
+    )
+    return np.datetime64(stamp.tz_convert(None), "m")
+
+
+def _local_strings(times_utc: np.ndarray, time_zone: str) -> list[str]:
+    """Format UTC times as local ``YYYY-MM-DD HH:MM`` strings."""
+    local = pd.DatetimeIndex(times_utc).tz_localize("UTC").tz_convert(time_zone)
+    return local.strftime("%Y-%m-%d %H:%M").tolist()
+
+
+def astronomical_arguments(times_utc: np.ndarray) -> dict[str, np.ndarray]:
+    """
+    Mean astronomical longitudes (degrees) at UTC times.
+
+    Returns:
+        Dict with ``T`` (mean solar hour angle), ``s``, ``h``, ``p``, ``N``
+        (lunar node) and ``p1``.
+    """
+    minutes = (np.asarray(times_utc, dtype=TIME_UNIT) - _EPOCH).astype(np.float64)
+    centuries = minutes / (36525.0 * 1440.0)
+    hours = minutes / 60.0
+    c2, c3 = centuries**2, centuries**3
+    return {
+        "T": (180.0 + 15.0 * (hours + 12.0)) % 360.0,
+        "s": (218.3164477 + 481267.88123421 * centuries - 0.0015786 * c2) % 360.0,
+        "h": (280.46646 + 36000.76983 * centuries + 0.0003032 * c2) % 360.0,
+        "p": (83.3532465 + 4069.0137287 * centuries - 0.01032 * c2 - c3 / 80053)
+        % 360.0,
+        "N": (125.0445479 - 1934.1362891 * centuries + 0.0020754 * c2) % 360.0,
+        "p1": (282.93735 + 1.71946 * centuries + 0.00046 * c2) % 360.0,
+    }
+
+
+def node_factors(
+    names: Sequence[str], node: np.ndarray, perigee: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Node factors ``f`` and nodal corrections ``u`` (degrees).
+
+    Args:
+        names: Constituent names.
+        node: Longitude of the moon's ascending node N (degrees).
+        perigee: Longitude of the lunar perigee p (degrees).
+
+    Returns:
+        Arrays of shape ``(len(names), len(node))``.
+    """
+    lunar = _lunar_node_terms(np.asarray(node, float), np.asarray(perigee, float))
+    f = np.empty((len(names), len(lunar["I"])))
+    u = np.empty_like(f)
+    for row, name in enumerate(names):
+        f[row], u[row] = _node_factor(CONSTITUENTS[name][1], lunar)
+    return f, u
+
+
+def _arguments(
+    names: Sequence[str], times: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return ``V + u`` (degrees) and ``f`` for each constituent and time."""
+    astro = astronomical_arguments(times)
+    coefficients = np.array([CONSTITUENTS[name][0] for name in names], dtype=float)
+    basis = np.vstack(
+        [astro["T"], astro["s"], astro["h"], astro["p"], astro["p1"]]
+        + [np.full(len(times), 90.0)]
+    )
+    argument = coefficients.reshape(-1, 6) @ basis
+
+    # Node factors are held constant over each calendar year (mid-year value).
+    years = times.astype("datetime64[Y]")
+    unique_years, year_index = np.unique(years, return_inverse=True)
+    mid_year = unique_years.astype(TIME_UNIT) + np.timedelta64(182 * 1440 + 720, "m")
+    mid_astro = astronomical_arguments(mid_year)
+    f, u = node_factors(names, mid_astro["N"], mid_astro["p"])
+    return argument + u[:, year_index], f[:, year_index]
+
+
+def _lunar_node_terms(node: np.ndarray, perigee: np.ndarray) -> dict[str, np.ndarray]:
+    """Schureman's I, nu, xi, nu', 2nu'' and P for given N and p (degrees)."""
+    n = np.radians(node)
+    omega, inc = np.radians(_OBLIQUITY), np.radians(_MOON_INCLINATION)
+    cos_i = np.cos(inc) * np.cos(omega) - np.sin(inc) * np.sin(omega) * np.cos(n)
+    big_i = np.arccos(cos_i)
+
+    # Napier's analogies give (N - xi + nu)/2 and (N - xi - nu)/2; taking
+    # them relative to N/2 keeps nu and xi continuous through N = 180.
+    half = np.tan(n / 2)
+    a = np.arctan(np.cos((omega - inc) / 2) / np.cos((omega + inc) / 2) * half)
+    b = np.arctan(np.sin((omega - inc) / 2) / np.sin((omega + inc) / 2) * half)
+    a = _wrap(np.degrees(a) - node / 2, 180.0)
+    b = _wrap(np.degrees(b) - node / 2, 180.0)
+    nu, xi = a - b, -(a + b)
+
+    nu_r, sin_i = np.radians(nu), np.sin(big_i)
+    nu_prime = np.degrees(
+        np.arctan2(
+            np.sin(2 * big_i) * np.sin(nu_r), np.sin(2 * big_i) * np.cos(nu_r) + 0.3347
+        )
+    )
+    two_nu_second = np.degrees(
+        np.arctan2(
+            sin_i**2 * np.sin(2 * nu_r), sin_i**2 * np.cos(2 * nu_r) + 0.0727
+        )
+    )
+    return {
+        "I": big_i,
+        "nu": nu,
+        "xi": xi,
+        "nu_prime": nu_prime,
+        "two_nu_second": two_nu_second,
+        "P": np.radians(perigee - xi),
+    }
+
+
+def _node_factor(kind: str, lunar: dict[str, np.ndarray]) -> tuple[np.ndarray, Any]:
+    """Node factor and nodal correction for one formula kind."""
+    big_i, nu, xi = lunar["I"], lunar["nu"], lunar["xi"]
+    if kind == "solar":
+        return np.ones_like(big_i), 0.0
+    if kind == "M2":
+        return np.cos(big_i / 2) ** 4 / 0.9154, 2 * xi - 2 * nu
+    if kind == "O1":
+        return np.sin(big_i) * np.cos(big_i / 2) ** 2 / 0.3800, 2 * xi - nu
+    if kind == "K1":
+        sin_2i, nu_r = np.sin(2 * big_i), np.radians(nu)
+        f = np.sqrt(0.8965 * sin_2i**2 + 0.6001 * sin_2i * np.cos(nu_r) + 0.1006)
+        return f, -lunar["nu_prime"]
+    if kind == "K2":
+        sin_i, nu_r = np.sin(big_i), np.radians(nu)
+        f = np.sqrt(19.0444 * sin_i**4 + 2.7702 * sin_i**2 * np.cos(2 * nu_r) + 0.0981)
+        return f, -lunar["two_nu_second"]
+    if kind == "J1":
+        return np.sin(2 * big_i) / 0.7214, -nu
+    if kind == "OO1":
+        return np.sin(big_i) * np.sin(big_i / 2) ** 2 / 0.0164, -2 * xi - nu
+    if kind == "Mm":
+        return (2 / 3 - np.sin(big_i) ** 2) / 0.5021, 0.0
+    if kind == "Mf":
+        return np.sin(big_i) ** 2 / 0.1578, -2 * xi
+    if kind == "M1":
+        f_o1, u_o1 = _node_factor("O1", lunar)
+        p = lunar["P"]
+        q = np.degrees(np.arctan2(0.483 * np.sin(p), np.cos(p)))
+        return f_o1 * np.sqrt(2.310 + 1.435 * np.cos(2 * p)), u_o1 - xi + q
+    if kind == "L2":
+        f_m2, u_m2 = _node_factor("M2", lunar)
+        p, tan2 = lunar["P"], np.tan(big_i / 2) ** 2
+        r = np.degrees(np.arctan2(np.sin(2 * p), 1 / (6 * tan2) - np.cos(2 * p)))
+        inverse_ra = np.sqrt(1 - 12 * tan2 * np.cos(2 * p) + 36 * tan2**2)
+        return f_m2 * inverse_ra, u_m2 - r
+    if kind == "M3":
+        f_m2, u_m2 = _node_factor("M2", lunar)
+        return f_m2**1.5, 1.5 * u_m2
+    if kind in _COMPOUNDS:
+        # Compound tides combine the factors of their M2/K1 components.
+        f_m2, u_m2 = _node_factor("M2", lunar)
+        f_k1, u_k1 = _node_factor("K1", lunar)
+        compounds = {
+            "M2^2": (f_m2**2, 2 * u_m2),
+            "M2^3": (f_m2**3, 3 * u_m2),
+            "M2^4": (f_m2**4, 4 * u_m2),
+            "S-M2": (f_m2, -u_m2),
+            "M2*K1": (f_m2 * f_k1, u_m2 + u_k1),
+            "M2^2/K1": (f_m2**2 * f_k1, 2 * u_m2 - u_k1),
+        }
+        return compounds[kind]
+    raise ValueError(f"Unknown node factor formula {kind!r}")
+
+
+def _wrap(degrees: np.ndarray, period: float) -> np.ndarray:
+    """Wrap angles to ``[-period/2, period/2)``."""
+    return (degrees + period / 2) % period - period / 2
+
+
+__all__ = [
+    "CONSTITUENTS",
+    "HarmonicModel",
+    "astronomical_arguments",
+    "node_factors",
+    "predict_heights",
+    "predict_hilo",
+]
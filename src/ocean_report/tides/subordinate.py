@@ -0,0 +1,108 @@
+"""Subordinate-station tide predictions derived from a reference station.
+
+NOAA publishes hi/lo predictions for subordinate stations as corrections
+to a nearby reference (harmonic) station. Each high tide of the reference
+is shifted by the high-tide time offset and its height adjusted by the
+high-tide height offset; low tides use the low-tide offsets. Heights are
+either multiplied by the offset (``R``, ratio) or have it added (``A``).
+
+Offsets for any number of subordinate stations sharing a reference are
+applied to the reference events in one broadcast pass, so a stretch of
+coastline costs one reference-station request.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Literal
+
+import numpy as np
+
+from .interpolation import TideEvents
+
+
+@dataclass(frozen=True)
+class SubordinateOffsets:
+    """Time and height corrections from a reference station's hi/lo events.
+
+    Time offsets are in minutes (positive means later). Height offsets are
+    ratios when ``height_adjustment`` is ``"ratio"`` and feet when it is
+    ``"add"``.
+    """
+
+    station_id: str
+    reference_station_id: str
+    time_offset_high_minutes: float = 0.0
+    time_offset_low_minutes: float = 0.0
+    height_offset_high: float = 1.0
+    height_offset_low: float = 1.0
+    height_adjustment: Literal["ratio", "add"] = "ratio"
+
+
+def apply_offsets(
+    events: TideEvents, offsets: Sequence[SubordinateOffsets]
+) -> list[TideEvents]:
+    """
+    Derive subordinate-station events from reference-station events.
+
+    Args:
+        events: Reference station hi/lo events with ``is_high`` set.
+        offsets: Corrections for each subordinate station.
+
+    Returns:
+        One ``TideEvents`` per entry of ``offsets``, in the same order.
+
+    Raises:
+        ValueError: If ``events`` has no high/low types.
+    """
+    if events.is_high is None:
+        raise ValueError("Reference tide events have no high/low types")
+    if not offsets:
+        return []
+
+    high_minutes = np.array([o.time_offset_high_minutes for o in offsets])
+    low_minutes = np.array([o.time_offset_low_minutes for o in offsets])
+    high_heights = np.array([o.height_offset_high for o in offsets])
+    low_heights = np.array([o.height_offset_low for o in offsets])
+    ratio = np.array([o.height_adjustment == "ratio" for o in offsets])
+
+    # (stations, events) matrices: one row per subordinate station.
+    is_high = events.is_high[np.newaxis, :]
+    shift = np.where(is_high, high_minutes[:, None], low_minutes[:, None])
+    factor = np.where(is_high, high_heights[:, None], low_heights[:, None])
+    heights = np.where(
+        ratio[:, None],
+        events.heights[np.newaxis, :] * factor,
+        events.heights[np.newaxis, :] + factor,
+    )
+    times = events.times[np.newaxis, :] + np.rint(shift).astype("timedelta64[m]")
+
+    # Unequal high/low time offsets can reorder events that are close together.
+    order = np.argsort(times, axis=1, kind="stable")
+    times = np.take_along_axis(times, order, axis=1)
+    heights = np.take_along_axis(heights, order, axis=1)
+    kinds = np.take_along_axis(np.broadcast_to(is_high, order.shape), order, axis=1)
+    return [
+        TideEvents(times=times[row], heights=heights[row], is_high=kinds[row])
+        for row in range(len(offsets))
+    ]
+
+
+def clip_events(
+    events: TideEvents, start: np.datetime64, end: np.datetime64
+) -> TideEvents:
+    """Events with ``start <= time < end``."""
+    inside = (events.times >= start) & (events.times < end)
+    return TideEvents(
+        times=events.times[inside],
+        heights=events.heights[inside],
+        is_high=None if events.is_high is None else events.is_high[inside],
+    )
+
+
+__all__ = [
+    "SubordinateOffsets",
+    "apply_offsets",
+    "clip_events",
+]
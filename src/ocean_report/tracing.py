@@ -0,0 +1,274 @@
+"""Span-based tracing for ocean report workflows.
+
+A span times one unit of work. Spans nest through a context variable, so
+each thread and each asyncio task keeps its own current span::
+
+    from ocean_report.tracing import span, traced
+
+    with span("noaa.tides", station=station_id) as current:
+        response = endpoint.fetch(params)
+        current.set_attribute("predictions", len(response.predictions))
+    logger.info("Tides fetched in %.2f seconds", current.duration)
+
+    @traced("report.render")
+    def render(...): ...
+
+Spans are always timed, so callers can log their durations. Finished spans
+are kept only by an active ``tracer.collect()`` block in the same context,
+so untraced runs do not accumulate them and concurrent runs (threads or
+tasks) each collect only their own. Collected spans export to Chrome
+trace-event JSON. Open it in Perfetto (https://ui.perfetto.dev) or
+``chrome://tracing`` to see overlap and the critical path. Each thread and
+each asyncio task gets its own track.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import itertools
+import json
+import os
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Finished spans kept per collection; older ones are dropped first.
+DEFAULT_MAX_SPANS = 100_000
+
+_span_ids = itertools.count(1)
+_current_span: ContextVar[Optional["Span"]] = ContextVar(
+    "ocean_report_current_span", default=None
+)
+
+
+@dataclass
+class Span:
+    """One timed unit of work."""
+
+    name: str
+    attributes: dict[str, Any] = field(default_factory=dict)
+    span_id: int = field(default_factory=lambda: next(_span_ids))
+    parent_id: Optional[int] = None
+    start_ns: int = field(default_factory=time.perf_counter_ns)
+    end_ns: Optional[int] = None
+    thread_id: int = field(default_factory=threading.get_ident)
+    thread_name: str = field(default_factory=lambda: threading.current_thread().name)
+    task_name: Optional[str] = None
+    status: str = "ok"
+
+    @property
+    def duration(self) -> float:
+        """Elapsed seconds (so far, if the span is still open)."""
+        end = time.perf_counter_ns() if self.end_ns is None else self.end_ns
+        return (end - self.start_ns) / 1e9
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Attach a key/value to the span (exported as trace ``args``)."""
+        self.attributes[key] = value
+
+
+class Tracer:
+    """Creates spans and collects finished ones for export."""
+
+    def __init__(self, *, max_spans: int = DEFAULT_MAX_SPANS) -> None:
+        self.max_spans = max_spans
+        # Collectors travel with the context like the current span, so a
+        # span only reaches the collect() blocks of the run it belongs to.
+        self._collectors: ContextVar[tuple[deque[Span], ...]] = ContextVar(
+            f"ocean_report_span_collectors_{id(self)}", default=()
+        )
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[Span]:
+        """
+        Time a block as a child of the current span.
+
+        Exceptions are recorded on the span (``status="error"`` and an
+        ``error`` attribute) and re-raised.
+
+        Args:
+            name: Span name, conventionally ``area.operation``.
+            **attributes: Initial span attributes.
+
+        Yields:
+            The open Span.
+        """
+        parent = _current_span.get()
+        current = Span(
+            name=name,
+            attributes=attributes,
+            parent_id=parent.span_id if parent else None,
+            task_name=_task_name(),
+        )
+        token = _current_span.set(current)
+        try:
+            yield current
+        except BaseException as exc:
+            current.status = "error"
+            current.attributes["error"] = type(exc).__name__
+            raise
+        finally:
+            current.end_ns = time.perf_counter_ns()
+            _current_span.reset(token)
+            for collector in self._collectors.get():
+                collector.append(current)
+
+    def traced(self, name: Optional[str] = None) -> Callable[[F], F]:
+        """Decorator that runs each call of a function in a span."""
+
+        def decorator(func: F) -> F:
+            span_name = name or f"{func.__module__}.{func.__qualname__}"
+
+            @functools.wraps(func)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                with self.span(span_name):
+                    return func(*args, **kwargs)
+
+            return wrapper  # type: ignore[return-value]
+
+        return decorator
+
+    @contextmanager
+    def collect(self) -> Iterator[list[Span]]:
+        """
+        Keep spans that finish inside the block in this context.
+
+        Spans from asyncio tasks created in the block are included. Worker
+        threads are included only if they run in a copy of the caller's
+        context (``contextvars.copy_context().run``).
+
+        Yields:
+            A list that holds the collected spans once the block exits.
+        """
+        buffer: deque[Span] = deque(maxlen=self.max_spans)
+        token = self._collectors.set((*self._collectors.get(), buffer))
+        collected: list[Span] = []
+        try:
+            yield collected
+        finally:
+            self._collectors.reset(token)
+            collected.extend(buffer)
+
+    def current_span(self) -> Optional[Span]:
+        """The innermost open span in this thread or task."""
+        return _current_span.get()
+
+
+def to_chrome_trace(spans: list[Span]) -> dict[str, Any]:
+    """
+    Convert spans to Chrome trace-event JSON (complete ``X`` events).
+
+    Each (thread, asyncio task) pair gets its own ``tid`` so that spans
+    which overlap on one thread but belong to different tasks do not
+    collide. Timestamps are microseconds from the first span.
+    """
+    if not spans:
+        return {"traceEvents": [], "displayTimeUnit": "ms"}
+    origin = min(s.start_ns for s in spans)
+    pid = os.getpid()
+    lanes: dict[tuple[int, Optional[str]], int] = {}
+    events: list[dict[str, Any]] = []
+
+    for item in sorted(spans, key=lambda s: s.start_ns):
+        lane = (item.thread_id, item.task_name)
+        if lane not in lanes:
+            lanes[lane] = len(lanes) + 1
+            label = item.thread_name
+            if item.task_name:
+                label = f"{label} / {item.task_name}"
+            events.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": pid,
+                    "tid": lanes[lane],
+                    "args": {"name": label},
+                }
+            )
+        end_ns = item.end_ns if item.end_ns is not None else item.start_ns
+        events.append(
+            {
+                "name": item.name,
+                "cat": item.name.split(".", 1)[0],
+                "ph": "X",
+                "ts": (item.start_ns - origin) / 1000,
+                "dur": (end_ns - item.start_ns) / 1000,
+                "pid": pid,
+                "tid": lanes[lane],
+                "args": {
+                    **{key: _jsonable(value) for key, value in item.attributes.items()},
+                    "span_id": item.span_id,
+                    "parent_id": item.parent_id,
+                    "status": item.status,
+                },
+            }
+        )
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def write_chrome_trace(path: str | Path, spans: list[Span]) -> Path:
+    """Write spans as a Chrome trace JSON file and return its path."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(to_chrome_trace(spans)), encoding="utf-8")
+    return path
+
+
+def aggregate(spans: list[Span]) -> dict[str, dict[str, float]]:
+    """
+    Summarize spans by name.
+
+    Returns:
+        ``{name: {"count", "total_seconds", "max_seconds"}}``.
+    """
+    summary: dict[str, dict[str, float]] = {}
+    for item in spans:
+        entry = summary.setdefault(
+            item.name, {"count": 0, "total_seconds": 0.0, "max_seconds": 0.0}
+        )
+        entry["count"] += 1
+        entry["total_seconds"] += item.duration
+        entry["max_seconds"] = max(entry["max_seconds"], item.duration)
+    return summary
+
+
+def _task_name() -> Optional[str]:
+    """Name of the running asyncio task, if any."""
+    try:
+        task = asyncio.current_task()
+    except RuntimeError:
+        return None
+    return task.get_name() if task is not None else None
+
+
+def _jsonable(value: Any) -> Any:
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    return str(value)
+
+
+# Process-wide tracer used by the workflows and services.
+tracer = Tracer()
+span = tracer.span
+traced = tracer.traced
+
+
+__all__ = [
+    "Span",
+    "Tracer",
+    "aggregate",
+    "span",
+    "to_chrome_trace",
+    "traced",
+    "tracer",
+    "write_chrome_trace",
+]
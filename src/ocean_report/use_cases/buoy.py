@@ -0,0 +1,252 @@
+"""Buoy use cases - NDBC realtime observations for the configured buoy."""
+
+import json
+import os
+from collections.abc import Iterable
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Literal, Optional
+
+import numpy as np
+import pandas as pd
+
+from ..api_client.exceptions import ApiResponseError
+from ..application.factory import ApplicationContext
+from ..endpoints.ndbc.parser import ndbc_observations
+from ..logger import logger
+from ..models.ndbc.observations import NdbcObservation, NdbcObservationsParams
+from ..services.buoy_service import fetch_buoy_frame, stream_buoy_history
+from ..storage.timeseries import TimeSeriesStore
+from .water_temperature import open_timeseries_store
+
+OBSERVATION_COLUMNS = ("WSPD", "GST", "WDIR", "WTMP")
+STDMET_COLUMNS = (
+    "WDIR",
+    "WSPD",
+    "GST",
+    "WVHT",
+    "DPD",
+    "APD",
+    "MWD",
+    "PRES",
+    "ATMP",
+    "WTMP",
+    "DEWP",
+    "VIS",
+    "TIDE",
+)
+STDMET_MANIFEST = "stdmet_manifest.json"
+
+
+def get_buoy_observations(
+    *,
+    context: ApplicationContext,
+    buoy_id: str | None = None,
+    file_type: Literal["txt", "spec", "ocean"] = "txt",
+    hours: float | None = None,
+    now: datetime | None = None,
+) -> pd.DataFrame:
+    """
+    Get recent NDBC buoy observations as a time-indexed frame.
+
+    Args:
+        context (ApplicationContext): The application context containing
+            configuration and API client.
+        buoy_id (str | None): NDBC buoy ID. If None, uses ``noaa.buoy_id``.
+        file_type (str): ``txt`` (standard meteorological), ``spec`` or ``ocean``.
+        hours (float | None): Keep only the last N hours. If None, returns all
+            45 days NDBC publishes.
+        now (datetime | None): End of the ``hours`` window (UTC). Defaults to now.
+
+    Returns:
+        pd.DataFrame: Observations indexed by UTC timestamp, oldest first.
+
+    Raises:
+        ApiClientError: If the NDBC request fails.
+    """
+    if buoy_id is None:
+        buoy_id = context.config.noaa.buoy_id
+        logger.debug("Using buoy_id from config: %s", buoy_id)
+
+    frame = fetch_buoy_frame(
+        context=context,
+        params=NdbcObservationsParams(station_id=buoy_id, file_type=file_type),
+    )
+    if hours is not None:
+        end = pd.Timestamp(now or datetime.now(timezone.utc))
+        end = end.tz_localize("UTC") if end.tzinfo is None else end
+        frame = frame.loc[end - timedelta(hours=hours) : end]
+    return frame
+
+
+def get_latest_buoy_observation(
+    *,
+    context: ApplicationContext,
+    buoy_id: str | None = None,
+) -> Optional[NdbcObservation]:
+    """
+    Get the newest buoy reading that has wind or water temperature data.
+
+    Args:
+        context (ApplicationContext): The application context.
+        buoy_id (str | None): NDBC buoy ID. If None, uses ``noaa.buoy_id``.
+
+    Returns:
+        Optional[NdbcObservation]: Latest observation, or None if the file has
+            no wind or water temperature readings.
+
+    Raises:
+        ApiClientError: If the NDBC request fails.
+    """
+    if buoy_id is None:
+        buoy_id = context.config.noaa.buoy_id
+    frame = get_buoy_observations(context=context, buoy_id=buoy_id)
+    columns = [column for column in OBSERVATION_COLUMNS if column in frame]
+    reported = frame[frame[columns].notna().any(axis=1)] if columns else frame[:0]
+    if reported.empty:
+        logger.warning("No wind or water temperature readings for buoy %s", buoy_id)
+        return None
+    return ndbc_observations(reported.iloc[-1:], station_id=buoy_id)[0]
+
+
+def stdmet_product(column: str) -> str:
+    """Time-series product name for an NDBC stdmet column (e.g. ``stdmet_wtmp``)."""
+    return f"stdmet_{column.lower()}"
+
+
+def ingest_buoy_history(
+    *,
+    context: ApplicationContext,
+    years: Iterable[int],
+    buoy_id: str | None = None,
+    store: TimeSeriesStore | None = None,
+) -> dict[int, int]:
+    """
+    Backfill yearly NDBC stdmet archives into the columnar time-series store.
+
+    Each archive is streamed, decompressed and parsed in bounded chunks, and
+    every stdmet column is appended as its own ``stdmet_<column>`` series
+    (UTC timestamps, missing readings dropped). Completed years are recorded
+    in ``<store>/<buoy>/stdmet_manifest.json`` and skipped on later runs, so
+    an interrupted backfill resumes at the first unfinished year. Re-reading
+    a partly ingested year is harmless because the store skips rows it
+    already has.
+
+    Years are ingested oldest first. The store only appends rows newer than
+    each series' latest row, so readings older than data already stored
+    (a later year, or realtime observations) cannot be added. Such a year is
+    logged as an error and not recorded in the manifest; backfill older
+    years into an empty store, or one that ends before them.
+
+    Args:
+        context (ApplicationContext): The application context containing
+            configuration and API client.
+        years (Iterable[int]): Archive years to ingest.
+        buoy_id (str | None): NDBC buoy ID. If None, uses ``noaa.buoy_id``.
+        store (TimeSeriesStore | None): Target store. If None, opens the
+            store configured in ``timeseries``.
+
+    Returns:
+        dict[int, int]: Rows appended per year ingested in this call (rows
+            already stored are not counted). Years that were already complete
+            or have no archive are omitted.
+
+    Raises:
+        ApiClientError: If NDBC cannot be reached.
+    """
+    if buoy_id is None:
+        buoy_id = context.config.noaa.buoy_id
+        logger.debug("Using buoy_id from config: %s", buoy_id)
+    if store is None:
+        store = open_timeseries_store(context)
+
+    manifest_path = store.root / buoy_id.upper() / STDMET_MANIFEST
+    manifest = _load_manifest(manifest_path)
+    ingested: dict[int, int] = {}
+
+    for year in sorted(set(years)):
+        if str(year) in manifest:
+            logger.debug("  → NDBC %s %d already ingested", buoy_id, year)
+            continue
+        rows = refused = 0
+        try:
+            for frame in stream_buoy_history(
+                context=context, station_id=buoy_id, year=year
+            ):
+                appended, skipped = _append_stdmet(store, buoy_id.upper(), frame)
+                rows += appended
+                refused += skipped
+        except ApiResponseError as exc:
+            logger.warning("  ⚠ No NDBC archive for %s %d: %s", buoy_id, year, exc)
+            continue
+
+        ingested[year] = rows
+        if refused:
+            logger.error(
+                "  ⚠ NDBC %s %d not fully ingested: %d readings are older than "
+                "data already stored; the year is not recorded as complete",
+                buoy_id,
+                year,
+                refused,
+            )
+            continue
+        manifest[str(year)] = {
+            "rows": rows,
+            "ingested_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        }
+        _save_manifest(manifest_path, manifest)
+        logger.info("  ✓ Ingested NDBC %s %d (%d rows)", buoy_id, year, rows)
+
+    return ingested
+
+
+def _append_stdmet(
+    store: TimeSeriesStore, buoy_id: str, frame: pd.DataFrame
+) -> tuple[int, int]:
+    """
+    Append each stdmet column of a parsed chunk as its own series.
+
+    Returns:
+        ``(rows, refused)``: distinct timestamps newly stored in any column,
+        and readings still missing afterwards because the store only appends
+        after each series' newest row.
+    """
+    stamps = frame.index.tz_convert(None).values
+    stored = np.zeros(len(stamps), dtype=bool)
+    refused = 0
+    for column in STDMET_COLUMNS:
+        if column not in frame:
+            continue
+        values = pd.to_numeric(frame[column], errors="coerce").to_numpy(np.float32)
+        present = ~np.isnan(values)
+        if not present.any():
+            continue
+        product = stdmet_product(column)
+        new = store.missing(buoy_id, product, stamps[present])
+        store.append(buoy_id, product, stamps[present], values[present])
+        still_missing = store.missing(buoy_id, product, stamps[present])
+        stored[np.flatnonzero(present)[new & ~still_missing]] = True
+        refused += int(still_missing.sum())
+    return len(np.unique(stamps[stored])), refused
+
+
+def _load_manifest(path: Path) -> dict[str, Any]:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return {}
+
+
+def _save_manifest(path: Path, manifest: dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+__all__ = [
+    "get_buoy_observations",
+    "get_latest_buoy_observation",
+    "ingest_buoy_history",
+    "stdmet_product",
+]
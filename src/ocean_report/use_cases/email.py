@@ -1,9 +1,24 @@
 """Email use case for sending ocean reports."""
 
 import datetime as dt
+import time
+from pathlib import Path
+
 from ocean_report.emailer.address_fetcher import (
+    RecipientSet,
     fetch_recipients_from_gist,
     parse_recipients,
+    stream_recipients_from_gist,
+)
+from ocean_report.emailer.recipient_cache import (
+    RecipientSnapshotStore,
+    sync_recipients,
+)
+from ocean_report.emailer.subscribers import (
+    SEASON_ALL,
+    SEASON_OFFSEASON,
+    SEASON_SUMMER,
+    SubscriberStore,
 )
 from ..application.context import ApplicationContext
 from ..application.factory import create_application_context
@@ -27,14 +42,159 @@ def get_email_recipients(
         str: Cleaned, comma-separated string of email addresses.
     """
 
+    context = _resolve_context(context)
+    url = _select_recipient_url(context, test_recips=test_recips)
+    raw_text = fetch_recipients_from_gist(client=context.client, url=url)
+    return parse_recipients(raw_text, verbose=verbose)
+
+
+def get_email_recipient_set(
+    *,
+    context: ApplicationContext | None = None,
+    test_recips: bool = False,
+) -> RecipientSet:
+    """
+    Streams, de-duplicates, and validates recipients from the configured Gist.
+
+    With ``email.subscriber_store`` enabled the recipients come from the
+    local subscriber store instead (see :func:`get_subscriber_segment`).
+    Otherwise, with ``email.recipient_cache`` enabled the list is kept in a local
+    snapshot, refreshed with a conditional GET, and served from the snapshot
+    when the Gist is unchanged or unreachable.
+
+    Args:
+        context: Application context. Created from default settings if None.
+        test_recips: Whether to use the test recipients URL.
+
+    Returns:
+        RecipientSet: Normalized, unique, valid email addresses.
+    """
+    context = _resolve_context(context)
+    if context.config.email.subscriber_store.enabled:
+        return get_subscriber_segment(context=context, test_recips=test_recips)
+
+    url = _select_recipient_url(context, test_recips=test_recips)
+
+    cache_config = context.config.email.recipient_cache
+    if not cache_config.enabled:
+        return stream_recipients_from_gist(client=context.client, url=url)
+
+    return sync_recipients(
+        client=context.client,
+        url=url,
+        store=RecipientSnapshotStore(Path(cache_config.directory).expanduser()),
+        stale_after_hours=cache_config.stale_after_hours,
+    )
+
+
+def get_subscriber_segment(
+    *,
+    context: ApplicationContext | None = None,
+    test_recips: bool = False,
+) -> RecipientSet:
+    """
+    Reads today's recipient segment from the local subscriber store.
+
+    The segment is chosen by ``email.subscriber_store.location``, the current
+    season (summer or offseason), and the test flag.
+
+    Args:
+        context: Application context. Created from default settings if None.
+        test_recips: Whether to read the test segment.
+
+    Returns:
+        RecipientSet: Segment members.
+    """
+    context = _resolve_context(context)
+    store_config = context.config.email.subscriber_store
+    season = SEASON_SUMMER if _is_summer(context) else SEASON_OFFSEASON
+
+    query_start = time.time()
+    store = SubscriberStore(Path(store_config.path).expanduser())
+    recipients = store.segment(
+        location=store_config.location, season=season, is_test=test_recips
+    )
+    logger.info(
+        "Loaded %d subscribers for segment %s/%s%s in %.1f ms",
+        len(recipients),
+        store_config.location,
+        season,
+        " (test)" if test_recips else "",
+        (time.time() - query_start) * 1000,
+    )
+    return recipients
+
+
+def import_subscribers_from_recipient_urls(
+    *,
+    context: ApplicationContext | None = None,
+    location: str | None = None,
+) -> dict[str, int]:
+    """
+    Imports the configured Gist recipient lists into the subscriber store.
+
+    ``recipient_urls.main`` becomes the summer segment, ``offseason`` the
+    offseason segment and ``test`` the year-round test segment. Each segment
+    is replaced so it mirrors its source list. URLs that are not set are
+    skipped.
+
+    Args:
+        context: Application context. Created from default settings if None.
+        location: Location key for the segments. Defaults to
+            ``email.subscriber_store.location``.
+
+    Returns:
+        dict[str, int]: Member count per imported list (main/offseason/test).
+    """
+    context = _resolve_context(context)
+    store_config = context.config.email.subscriber_store
+    urls = context.config.email.recipient_urls
+    location = location or store_config.location
+    store = SubscriberStore(Path(store_config.path).expanduser())
+
+    sources = (
+        ("main", urls.main, SEASON_SUMMER, False),
+        ("offseason", urls.offseason, SEASON_OFFSEASON, False),
+        ("test", urls.test, SEASON_ALL, True),
+    )
+    counts: dict[str, int] = {}
+    for name, url, season, is_test in sources:
+        if not url:
+            logger.warning("Recipient URL %r is not set; skipping import.", name)
+            continue
+        recipients = stream_recipients_from_gist(client=context.client, url=url)
+        counts[name] = store.import_segment(
+            recipients, location=location, season=season, is_test=is_test
+        )
+    return counts
+
+
+def _resolve_context(context: ApplicationContext | None) -> ApplicationContext:
+    """Return the given context or build one from default settings."""
     if context is None:
         logger.warning("No application context provided, using default settings.")
-        # context = create_application_context() --- IGNORE ---
         context = create_application_context()
+    return context
 
+
+def _select_recipient_url(context: ApplicationContext, *, test_recips: bool) -> str:
+    """Choose the main, offseason, or test recipient URL for today."""
     settings = context.config
+    is_summer = _is_summer(context)
+
+    if test_recips:
+        logger.info("Using test recipients.")
+        return settings.email.recipient_urls.test
+    if is_summer:
+        logger.info("Using regular recipients URL.")
+        return settings.email.recipient_urls.main
+    logger.info("Using offseason recipients URL.")
+    return settings.email.recipient_urls.offseason
+
 
-    # settings = get_settings()
+def _is_summer(context: ApplicationContext) -> bool:
+    """Return whether today falls in the configured summer season."""
+    settings = context.config
     is_summer = determine_is_summer(
         today=dt.date.today(),
         memorial_day_offset=settings.summer.memorial_day_offset,
@@ -45,17 +205,4 @@ def get_email_recipients(
         logger.info("It's summer!")
     else:
         logger.info("It's winter!")
-
-    if test_recips:
-        logger.info("Using test recipients.")
-        url = settings.email.recipient_urls.test
-    else:
-        if is_summer:
-            logger.info("Using regular recipients URL.")
-            url = settings.email.recipient_urls.main
-        else:
-            logger.info("Using offseason recipients URL.")
-            url = settings.email.recipient_urls.offseason
-
-    raw_text = fetch_recipients_from_gist(client=context.client, url=url)
-    return parse_recipients(raw_text, verbose=verbose)
+    return is_summer
@@ -0,0 +1,331 @@
+"""Stale-while-revalidate serving of the report data use cases.
+
+For on-demand callers, latency matters more than freshness to the minute.
+With ``stale_while_revalidate.enabled``, the ``*_swr`` functions here wrap
+``get_latest_water_temp``, ``get_daily_wind_forecast`` and
+``get_daytime_tides_for_date``:
+
+- a value younger than ``fresh_seconds`` is returned as-is;
+- a value up to ``max_stale_seconds`` old is returned immediately while one
+  daemon thread per key fetches a replacement for later calls;
+- anything older, or missing, is fetched before returning.
+
+Every call returns a ``ServedValue`` carrying the use case's usual result
+plus its age, so callers can show how stale the data is. When disabled, the
+wrappers call straight through and report an age of zero.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Generic, List, Optional, Set, Tuple, TypeVar
+
+from ..application.factory import ApplicationContext
+from ..logger import logger
+from ..metrics import registry
+from ..models.noaa.tides import NoaaTidePredictionRecord
+from . import tides, water_temperature, wind
+
+V = TypeVar("V")
+
+# Minimum seconds between background refresh attempts of one key after a
+# failure, so an unreachable API is not retried on every lookup.
+REFRESH_RETRY_SECONDS = 60.0
+
+LOOKUPS = registry.counter(
+    "ocean_report_stale_while_revalidate_lookups_total",
+    "Stale-while-revalidate lookups of report data by result.",
+    labelnames=("result",),
+)
+
+
+@dataclass(frozen=True)
+class ServedValue(Generic[V]):
+    """A use case result and how old it was when served."""
+
+    value: V
+    age_seconds: float
+    stale: bool
+    refreshing: bool
+
+
+class StaleWhileRevalidateCache:
+    """
+    Thread-safe in-memory values that are served stale while refreshing.
+
+    Args:
+        clock: Monotonic clock; injectable for tests.
+    """
+
+    def __init__(self, *, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: dict[Hashable, tuple[Any, float]] = {}
+        self._refreshing: set[Hashable] = set()
+        self._retry_after: dict[Hashable, float] = {}
+        # Bumped by clear() so loads started before it are not stored.
+        self._generation = 0
+
+    def get(
+        self,
+        key: Hashable,
+        loader: Callable[[], V],
+        *,
+        fresh_seconds: float,
+        max_stale_seconds: float,
+    ) -> ServedValue[V]:
+        """
+        Return the value for ``key``, serving a stale one if it is recent enough.
+
+        Raises:
+            Exception: Whatever ``loader`` raises when no usable value is cached.
+        """
+        now = self._clock()
+        start_refresh = False
+        with self._lock:
+            generation = self._generation
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, fetched_at = entry
+                age = now - fetched_at
+                if age <= fresh_seconds:
+                    LOOKUPS.inc(result="fresh")
+                    return ServedValue(value, age, stale=False, refreshing=False)
+                if age <= max_stale_seconds:
+                    LOOKUPS.inc(result="stale")
+                    if (
+                        key not in self._refreshing
+                        and now >= self._retry_after.get(key, 0.0)
+                    ):
+                        self._refreshing.add(key)
+                        start_refresh = True
+                    refreshing = key in self._refreshing
+                    entry_is_stale = True
+                else:
+                    LOOKUPS.inc(result="expired")
+                    entry_is_stale = False
+            else:
+                LOOKUPS.inc(result="miss")
+                entry_is_stale = False
+
+        if entry_is_stale:
+            if start_refresh:
+                self._start_refresh(key, loader, max_stale_seconds, generation)
+            return ServedValue(value, age, stale=True, refreshing=refreshing)
+
+        value = loader()
+        self._store(key, value, max_stale_seconds, generation)
+        return ServedValue(value, 0.0, stale=False, refreshing=False)
+
+    def clear(self) -> None:
+        """Drop every cached value; loads still in flight are discarded."""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._refreshing.clear()
+            self._retry_after.clear()
+
+    def _store(
+        self, key: Hashable, value: Any, max_stale_seconds: float, generation: int
+    ) -> None:
+        now = self._clock()
+        with self._lock:
+            if generation != self._generation:
+                return
+            # Entries past the bound can never be served again.
+            expired = [
+                other
+                for other, (_, fetched_at) in self._entries.items()
+                if now - fetched_at > max_stale_seconds
+            ]
+            for other in expired:
+                del self._entries[other]
+            self._entries[key] = (value, now)
+            self._retry_after.pop(key, None)
+
+    def _start_refresh(
+        self,
+        key: Hashable,
+        loader: Callable[[], Any],
+        max_stale_seconds: float,
+        generation: int,
+    ) -> None:
+        def refresh() -> None:
+            try:
+                self._store(key, loader(), max_stale_seconds, generation)
+                logger.debug("  ✓ Refreshed stale value for %s", key)
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                with self._lock:
+                    if generation == self._generation:
+                        self._retry_after[key] = self._clock() + REFRESH_RETRY_SECONDS
+                logger.warning(
+                    "  ⚠ Background refresh of %s failed; serving stale value: %s",
+                    key,
+                    exc,
+                )
+            finally:
+                with self._lock:
+                    if generation == self._generation:
+                        self._refreshing.discard(key)
+
+        logger.debug("  → Value for %s is stale; refreshing", key)
+        threading.Thread(target=refresh, name="swr-refresh", daemon=True).start()
+
+
+_cache = StaleWhileRevalidateCache()
+
+
+def get_latest_water_temp_swr(
+    *,
+    context: ApplicationContext,
+    station_id: str | None = None,
+) -> ServedValue[Tuple[Optional[float], datetime, Optional[str]]]:
+    """
+    Stale-while-revalidate ``get_latest_water_temp``.
+
+    Args:
+        context (ApplicationContext): The application context containing
+            configuration and API client.
+        station_id (str | None): NOAA station ID. If None, uses station from config.
+
+    Returns:
+        ServedValue: The ``get_latest_water_temp`` tuple and its age.
+
+    Raises:
+        ApiClientError: If no usable value is cached and the NOAA request fails.
+    """
+    if station_id is None:
+        station_id = context.config.noaa.station_id
+    return _serve(
+        context,
+        ("water_temperature", station_id),
+        lambda: water_temperature.get_latest_water_temp(
+            context=context, station_id=station_id
+        ),
+    )
+
+
+def get_daily_wind_forecast_swr(
+    *,
+    context: ApplicationContext,
+    latitude: float | None = None,
+    longitude: float | None = None,
+    beach_facing_deg: float | None = None,
+    times_to_get: Set[str] | None = None,
+) -> ServedValue[Tuple[List[Dict[str, Any]], datetime]]:
+    """
+    Stale-while-revalidate ``get_daily_wind_forecast``.
+
+    Args:
+        context (ApplicationContext): The application context containing
+            configuration and API client.
+        latitude (float | None): Location latitude. If None, uses config value.
+        longitude (float | None): Location longitude. If None, uses config value.
+        beach_facing_deg (float | None): Beach orientation in degrees.
+            If None, uses config value.
+        times_to_get (Set[str] | None): Times in "HH:MM" format to keep.
+            If None, uses the use case's default times.
+
+    Returns:
+        ServedValue: The ``get_daily_wind_forecast`` tuple and its age.
+
+    Raises:
+        ApiClientError: If no usable value is cached and the Open-Meteo
+            request fails.
+    """
+    location = context.config.location
+    if latitude is None:
+        latitude = location.latitude
+    if longitude is None:
+        longitude = location.longitude
+    if beach_facing_deg is None:
+        beach_facing_deg = location.beach_orientation_degrees
+    # The forecast is filtered to today, so the date is part of the key.
+    key = (
+        "wind",
+        datetime.now().strftime("%Y%m%d"),
+        latitude,
+        longitude,
+        beach_facing_deg,
+        frozenset(times_to_get) if times_to_get is not None else None,
+    )
+    return _serve(
+        context,
+        key,
+        lambda: wind.get_daily_wind_forecast(
+            context=context,
+            latitude=latitude,
+            longitude=longitude,
+            beach_facing_deg=beach_facing_deg,
+            times_to_get=times_to_get,
+        ),
+    )
+
+
+def get_daytime_tides_for_date_swr(
+    *,
+    context: ApplicationContext,
+    station_id: str | None = None,
+    date: str | None = None,
+) -> ServedValue[Tuple[List[NoaaTidePredictionRecord], datetime]]:
+    """
+    Stale-while-revalidate ``get_daytime_tides_for_date``.
+
+    Args:
+        context (ApplicationContext): The application context containing
+            configuration and API client.
+        station_id (str | None): NOAA station ID. If None, uses station from config.
+        date (str | None): Date for predictions in YYYYMMDD format. If None, uses today.
+
+    Returns:
+        ServedValue: The ``get_daytime_tides_for_date`` tuple and its age.
+
+    Raises:
+        ApiClientError: If no usable value is cached and the NOAA request fails.
+    """
+    if station_id is None:
+        station_id = context.config.noaa.station_id
+    if date is None:
+        date = datetime.now().strftime("%Y%m%d")
+    return _serve(
+        context,
+        ("tides", station_id, date),
+        lambda: tides.get_daytime_tides_for_date(
+            context=context, station_id=station_id, date=date
+        ),
+    )
+
+
+def clear_stale_while_revalidate_cache() -> None:
+    """Drop every value held by the ``*_swr`` use cases."""
+    _cache.clear()
+
+
+def _serve(
+    context: ApplicationContext, key: Tuple[Any, ...], loader: Callable[[], V]
+) -> ServedValue[V]:
+    """Serve ``key`` per the config, or call ``loader`` if the mode is off."""
+    config = context.config.stale_while_revalidate
+    if not config.enabled:
+        return ServedValue(loader(), 0.0, stale=False, refreshing=False)
+    return _cache.get(
+        key,
+        loader,
+        fresh_seconds=config.fresh_seconds,
+        max_stale_seconds=config.max_stale_seconds,
+    )
+
+
+__all__ = [
+    "REFRESH_RETRY_SECONDS",
+    "ServedValue",
+    "StaleWhileRevalidateCache",
+    "clear_stale_while_revalidate_cache",
+    "get_daily_wind_forecast_swr",
+    "get_daytime_tides_for_date_swr",
+    "get_latest_water_temp_swr",
+]
@@ -0,0 +1,202 @@
+"""Station use cases - nearest NOAA station lookups over a cached catalog."""
+
+import threading
+import time
+from collections.abc import Sequence
+from pathlib import Path
+
+import numpy as np
+
+from ..application.factory import ApplicationContext
+from ..logger import logger
+from ..models.noaa.stations import NoaaStationsParams
+from ..services.station_service import fetch_stations
+from ..storage.station_catalog import StationCatalogCache, StationIndex, StationMatch
+
+PRODUCT_STATION_TYPES = {
+    "tide_predictions": "tidepredictions",
+    "water_temperature": "watertemp",
+}
+
+_index_lock = threading.Lock()
+_indexes: dict[tuple[Path, str], tuple[float, StationIndex]] = {}
+_refresh_started: dict[tuple[Path, str], float] = {}
+
+# Minimum seconds between background refresh attempts of one catalog, so an
+# unreachable API is not retried on every lookup.
+REFRESH_RETRY_SECONDS = 900.0
+
+
+def get_station_index(
+    *,
+    context: ApplicationContext,
+    product: str = "tide_predictions",
+    refresh: bool = False,
+) -> StationIndex:
+    """
+    Return the nearest-station index for stations that serve ``product``.
+
+    The catalog is read from the local cache (``noaa.station_catalog``) and the
+    built index is kept in memory. A missing catalog is fetched before
+    returning; a catalog older than ``max_age_hours`` is served as-is while a
+    background thread downloads a fresh copy for later lookups.
+
+    Args:
+        context (ApplicationContext): The application context containing
+            configuration and API client.
+        product (str): ``tide_predictions`` or ``water_temperature``.
+        refresh (bool): Fetch the catalog now even if the cache is fresh.
+
+    Returns:
+        StationIndex: Index over the catalog's station coordinates.
+
+    Raises:
+        ValueError: If ``product`` is unknown.
+        ApiClientError: If no catalog is cached and the fetch fails.
+    """
+    station_type = _station_type(product)
+    catalog_config = context.config.noaa.station_catalog
+    cache = StationCatalogCache(Path(catalog_config.directory).expanduser())
+    key = (cache.directory, station_type)
+
+    if refresh:
+        return _refresh_index(context=context, cache=cache, station_type=station_type)
+
+    with _index_lock:
+        memo = _indexes.get(key)
+    if memo is None:
+        cached = cache.load(station_type)
+        if cached is None:
+            return _refresh_index(
+                context=context, cache=cache, station_type=station_type
+            )
+        fetched_at, stations = cached
+        memo = (fetched_at, StationIndex(stations))
+        with _index_lock:
+            _indexes[key] = memo
+
+    fetched_at, index = memo
+    if time.time() - fetched_at > catalog_config.max_age_hours * 3600:
+        _start_background_refresh(
+            context=context, cache=cache, station_type=station_type
+        )
+    return index
+
+
+def find_nearest_stations(
+    *,
+    context: ApplicationContext,
+    latitude: float | None = None,
+    longitude: float | None = None,
+    product: str = "tide_predictions",
+    k: int = 1,
+    max_distance_km: float | None = None,
+) -> list[StationMatch]:
+    """
+    Find the stations nearest to a location.
+
+    Args:
+        context (ApplicationContext): The application context.
+        latitude (float | None): Query latitude. If None, uses location from config.
+        longitude (float | None): Query longitude. If None, uses location from config.
+        product (str): ``tide_predictions`` or ``water_temperature``.
+        k (int): Number of stations to return.
+        max_distance_km (float | None): Ignore stations farther than this.
+
+    Returns:
+        list[StationMatch]: Nearest stations, closest first.
+    """
+    if latitude is None:
+        latitude = context.config.location.latitude
+    if longitude is None:
+        longitude = context.config.location.longitude
+    index = get_station_index(context=context, product=product)
+    return index.nearest(latitude, longitude, k=k, max_distance_km=max_distance_km)
+
+
+def find_nearest_stations_bulk(
+    *,
+    context: ApplicationContext,
+    latitudes: Sequence[float],
+    longitudes: Sequence[float],
+    product: str = "tide_predictions",
+) -> tuple[list[str], np.ndarray]:
+    """
+    Find the nearest station for many locations in one vectorized pass.
+
+    Args:
+        context (ApplicationContext): The application context.
+        latitudes (Sequence[float]): Query latitudes.
+        longitudes (Sequence[float]): Query longitudes.
+        product (str): ``tide_predictions`` or ``water_temperature``.
+
+    Returns:
+        Tuple of station IDs and distances in kilometres, one per location.
+    """
+    index = get_station_index(context=context, product=product)
+    return index.nearest_many(latitudes, longitudes)
+
+
+def _station_type(product: str) -> str:
+    """Map a product name to NOAA's station ``type`` filter."""
+    try:
+        return PRODUCT_STATION_TYPES[product]
+    except KeyError:
+        raise ValueError(
+            f"Unknown product {product!r}; expected one of "
+            f"{sorted(PRODUCT_STATION_TYPES)}"
+        ) from None
+
+
+def _refresh_index(
+    *, context: ApplicationContext, cache: StationCatalogCache, station_type: str
+) -> StationIndex:
+    """Fetch the catalog, cache it, and swap in a new index."""
+    stations = fetch_stations(
+        context=context, params=NoaaStationsParams(station_type=station_type)
+    )
+    cache.save(station_type, stations)
+    index = StationIndex(stations)
+    with _index_lock:
+        _indexes[(cache.directory, station_type)] = (time.time(), index)
+    logger.info(
+        "  ✓ Station catalog '%s' refreshed (%d stations with coordinates)",
+        station_type,
+        len(index),
+    )
+    return index
+
+
+def _start_background_refresh(
+    *, context: ApplicationContext, cache: StationCatalogCache, station_type: str
+) -> None:
+    """Refresh a stale catalog in a daemon thread (at most one per catalog)."""
+    key = (cache.directory, station_type)
+    now = time.time()
+    with _index_lock:
+        if now - _refresh_started.get(key, 0.0) < REFRESH_RETRY_SECONDS:
+            return
+        _refresh_started[key] = now
+
+    def refresh() -> None:
+        try:
+            _refresh_index(context=context, cache=cache, station_type=station_type)
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            logger.warning(
+                "  ⚠ Background refresh of station catalog '%s' failed: %s",
+                station_type,
+                exc,
+            )
+
+    logger.debug("  → Station catalog '%s' is stale; refreshing", station_type)
+    threading.Thread(
+        target=refresh, name=f"station-catalog-{station_type}", daemon=True
+    ).start()
+
+
+__all__ = [
+    "PRODUCT_STATION_TYPES",
+    "find_nearest_stations",
+    "find_nearest_stations_bulk",
+    "get_station_index",
+]
@@ -1,12 +1,36 @@
 """Tide use cases - orchestration layer for tide-related workflows."""
 
-from datetime import datetime
+import threading
+import time
+from datetime import datetime, timedelta
+from collections.abc import Sequence
+from pathlib import Path
 from typing import List, Tuple
 
+import numpy as np
+
+from ..api_client.exceptions import ApiClientError
 from ..application.factory import ApplicationContext
 from ..logger import logger
 from ..models.noaa.tides import NoaaTideParams, NoaaTidePredictionRecord
-from ..services.tide_service import fetch_tide_data, filter_daytime_tides
+from ..services.tide_service import (
+    fetch_station_harmonics,
+    fetch_subordinate_offsets,
+    fetch_tide_data,
+    filter_daytime_tides,
+)
+from ..storage.tide_constituents import TideConstituentStore
+from ..tides.harmonic import HarmonicModel, predict_heights, predict_hilo
+from ..tides.interpolation import TideEvents, tide_curve
+from ..tides.subordinate import SubordinateOffsets, apply_offsets, clip_events
+
+# Hi/lo ranges kept in memory per process; each is a few dozen events.
+MAX_CACHED_EVENT_RANGES = 64
+
+_events_lock = threading.Lock()
+_events_cache: dict[tuple[str, str, str], TideEvents] = {}
+_offsets_lock = threading.Lock()
+_published_offsets: dict[str, SubordinateOffsets] = {}
 
 
 def get_daytime_tides_for_date(
@@ -59,7 +83,7 @@ def get_daytime_tides_for_date(
 
     # Fetch raw tide data (service layer - API only)
     logger.info("Fetching tide data for station: %s on date: %s", station_id, date)
-    raw_tides = fetch_tide_data(context=context, params=params)
+    raw_tides = _fetch_hilo(context=context, params=params)
 
     if not raw_tides:
         logger.warning(
@@ -76,4 +100,341 @@ def get_daytime_tides_for_date(
     return daytime_tides, retrieval_time
 
 
-__all__ = ["get_daytime_tides_for_date"]
+def get_tide_events(
+    *,
+    context: ApplicationContext,
+    begin_date: str,
+    end_date: str,
+    station_id: str | None = None,
+) -> TideEvents:
+    """
+    Get high/low tide events for a date range, cached in memory.
+
+    Args:
+        context (ApplicationContext): The application context containing
+            configuration and API client.
+        begin_date (str): First date in YYYYMMDD format.
+        end_date (str): Last date in YYYYMMDD format (inclusive).
+        station_id (str | None): NOAA station ID. If None, uses station from config.
+
+    Returns:
+        TideEvents: Events in time order.
+
+    Raises:
+        ApiClientError: If the NOAA API request fails.
+    """
+    if station_id is None:
+        station_id = context.config.noaa.station_id
+
+    key = (station_id, begin_date, end_date)
+    with _events_lock:
+        cached = _events_cache.get(key)
+    if cached is not None:
+        return cached
+
+    params = NoaaTideParams(
+        begin_date=begin_date, end_date=end_date, station=station_id
+    )
+    events = TideEvents.from_records(_fetch_hilo(context=context, params=params))
+    with _events_lock:
+        _events_cache[key] = events
+        while len(_events_cache) > MAX_CACHED_EVENT_RANGES:
+            _events_cache.pop(next(iter(_events_cache)))
+    return events
+
+
+def get_tide_heights(
+    *,
+    context: ApplicationContext,
+    station_id: str | None = None,
+    date: str | None = None,
+    step_minutes: int = 60,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Get a tide height curve for one day without a series request.
+
+    With ``noaa.tide_prediction`` enabled the curve is synthesized from the
+    station's harmonic constituents. Otherwise heights are interpolated from
+    the hi/lo predictions (see ``ocean_report.tides.interpolation``), so an
+    hourly or 6-minute curve costs no more API calls than the daily tide
+    table. Events from the day before and after are included so the curve is
+    defined at midnight.
+
+    Args:
+        context (ApplicationContext): The application context containing
+            configuration and API client.
+        station_id (str | None): NOAA station ID. If None, uses station from config.
+        date (str | None): Date in YYYYMMDD format. If None, uses today.
+        step_minutes (int): Spacing of the curve (60 = hourly, 6 = NOAA 6-minute).
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: ``datetime64[m]`` local times and
+            heights in feet (MLLW).
+
+    Raises:
+        ApiClientError: If the NOAA API request fails.
+    """
+    if date is None:
+        date = datetime.now().strftime("%Y%m%d")
+        logger.debug("Using today's date: %s", date)
+
+    day = datetime.strptime(date, "%Y%m%d")
+    prediction = context.config.noaa.tide_prediction
+    if prediction.enabled:
+        try:
+            model = load_harmonic_model(context=context, station_id=station_id)
+            return predict_heights(
+                model,
+                start=day,
+                end=day + timedelta(days=1),
+                time_zone=prediction.time_zone,
+                step_minutes=step_minutes,
+            )
+        except (ApiClientError, ValueError) as exc:
+            logger.warning("⚠ Local tide prediction unavailable: %s", exc)
+
+    events = get_tide_events(
+        context=context,
+        station_id=station_id,
+        begin_date=(day - timedelta(days=1)).strftime("%Y%m%d"),
+        end_date=(day + timedelta(days=1)).strftime("%Y%m%d"),
+    )
+    return tide_curve(
+        events,
+        start=day,
+        end=day + timedelta(days=1),
+        step_minutes=step_minutes,
+    )
+
+
+def load_harmonic_model(
+    *,
+    context: ApplicationContext,
+    station_id: str | None = None,
+    datum: str = "MLLW",
+    refresh: bool = False,
+) -> HarmonicModel:
+    """
+    Load a station's harmonic model from the constituent cache.
+
+    Constituents and datums are fetched from NOAA's metadata API when not
+    cached or older than ``noaa.tide_prediction.max_age_days``. If that
+    refresh fails, a stale cache is still used.
+
+    Args:
+        context (ApplicationContext): The application context containing
+            configuration and API client.
+        station_id (str | None): NOAA station ID. If None, uses station from config.
+        datum (str): Prediction datum; heights are relative to it.
+        refresh (bool): Fetch from NOAA even if the cache is fresh.
+
+    Returns:
+        HarmonicModel: Model with heights in feet above ``datum``.
+
+    Raises:
+        ApiClientError: If nothing is cached and the fetch fails.
+        ValueError: If the station has no constituents or lacks the datums.
+    """
+    if station_id is None:
+        station_id = context.config.noaa.station_id
+
+    prediction = context.config.noaa.tide_prediction
+    store = TideConstituentStore(Path(prediction.directory).expanduser())
+    harmonics = None if refresh else store.load(station_id)
+    max_age = prediction.max_age_days * 86400
+    if harmonics is None or time.time() - harmonics.fetched_at > max_age:
+        try:
+            constituents, datums = fetch_station_harmonics(
+                context=context, station_id=station_id
+            )
+            harmonics = store.save(
+                station_id,
+                constituents=constituents.constituents,
+                datums={
+                    item.name: item.value
+                    for item in datums.datums
+                    if item.value is not None
+                },
+                units=constituents.units or "feet",
+            )
+        except ApiClientError:
+            if harmonics is None:
+                raise
+            logger.warning(
+                "⚠ Using stale harmonic constituents for station %s", station_id
+            )
+
+    if not harmonics.constituents:
+        raise ValueError(f"Station {station_id} has no harmonic constituents")
+    if "MSL" not in harmonics.datums or datum not in harmonics.datums:
+        raise ValueError(f"Station {station_id} does not publish MSL and {datum}")
+    return HarmonicModel.from_constituents(
+        station_id,
+        harmonics.constituents,
+        datum_offset=harmonics.datums["MSL"] - harmonics.datums[datum],
+    )
+
+
+def get_subordinate_offsets(
+    *, context: ApplicationContext, station_id: str
+) -> SubordinateOffsets:
+    """
+    Get the offsets that derive a subordinate station from its reference.
+
+    Definitions in ``noaa.subordinate_stations`` take precedence. Stations
+    without one (or with an empty ``reference_station_id``) use the offsets
+    NOAA publishes, fetched once per process.
+
+    Args:
+        context (ApplicationContext): The application context containing
+            configuration and API client.
+        station_id (str): NOAA subordinate station ID.
+
+    Returns:
+        SubordinateOffsets: Reference station and hi/lo corrections.
+
+    Raises:
+        ApiClientError: If the NOAA metadata request fails.
+        ValueError: If NOAA does not define the station by a reference station.
+    """
+    entry = context.config.noaa.subordinate_stations.get(station_id)
+    if entry is not None and entry.reference_station_id:
+        return SubordinateOffsets(station_id=station_id, **entry.model_dump())
+
+    with _offsets_lock:
+        cached = _published_offsets.get(station_id)
+    if cached is not None:
+        return cached
+
+    published = fetch_subordinate_offsets(context=context, station_id=station_id)
+    reference = published.reference_station_id
+    if not reference or reference == station_id:
+        raise ValueError(f"Station {station_id} is not a subordinate tide station")
+    offsets = SubordinateOffsets(
+        station_id=station_id,
+        reference_station_id=reference,
+        time_offset_high_minutes=published.time_offset_high_tide,
+        time_offset_low_minutes=published.time_offset_low_tide,
+        height_offset_high=published.height_offset_high_tide,
+        height_offset_low=published.height_offset_low_tide,
+        height_adjustment="add" if published.height_adjusted_type == "A" else "ratio",
+    )
+    with _offsets_lock:
+        _published_offsets[station_id] = offsets
+    return offsets
+
+
+def get_subordinate_tide_events(
+    *,
+    context: ApplicationContext,
+    station_ids: Sequence[str],
+    begin_date: str,
+    end_date: str,
+) -> dict[str, TideEvents]:
+    """
+    Get hi/lo events for subordinate stations from their reference stations.
+
+    Stations are grouped by reference station. Each reference is fetched
+    once (through the ``get_tide_events`` cache, padded by a day so shifted
+    events near midnight are kept), and all its subordinates are corrected
+    in one vectorized pass.
+
+    Args:
+        context (ApplicationContext): The application context containing
+            configuration and API client.
+        station_ids (Sequence[str]): NOAA subordinate station IDs.
+        begin_date (str): First date in YYYYMMDD format.
+        end_date (str): Last date in YYYYMMDD format (inclusive).
+
+    Returns:
+        dict[str, TideEvents]: Events per station ID, in time order.
+
+    Raises:
+        ApiClientError: If a NOAA request fails.
+        ValueError: If a station is not a subordinate station.
+    """
+    groups: dict[str, list[SubordinateOffsets]] = {}
+    for station_id in dict.fromkeys(station_ids):
+        offsets = get_subordinate_offsets(context=context, station_id=station_id)
+        groups.setdefault(offsets.reference_station_id, []).append(offsets)
+
+    begin = datetime.strptime(begin_date, "%Y%m%d")
+    end = datetime.strptime(end_date, "%Y%m%d") + timedelta(days=1)
+    window = (np.datetime64(begin, "m"), np.datetime64(end, "m"))
+    derived: dict[str, TideEvents] = {}
+    for reference, group in groups.items():
+        events = get_tide_events(
+            context=context,
+            station_id=reference,
+            begin_date=(begin - timedelta(days=1)).strftime("%Y%m%d"),
+            end_date=end.strftime("%Y%m%d"),
+        )
+        for offsets, station_events in zip(group, apply_offsets(events, group)):
+            derived[offsets.station_id] = clip_events(station_events, *window)
+        logger.info(
+            "    ✓ Derived %d subordinate station(s) from reference station %s",
+            len(group),
+            reference,
+        )
+    return derived
+
+
+def _fetch_hilo(
+    *, context: ApplicationContext, params: NoaaTideParams
+) -> List[NoaaTidePredictionRecord]:
+    """
+    Get hi/lo predictions locally when possible, otherwise from NOAA.
+
+    Configured subordinate stations are derived from their reference
+    station, and with ``noaa.tide_prediction`` enabled other stations are
+    predicted from harmonic constituents. Both cover English-unit,
+    local-time MLLW requests. Any failure falls back to the datagetter API.
+    """
+    prediction = context.config.noaa.tide_prediction
+    local = params.units == "english" and params.time_zone == "lst_ldt"
+    subordinate = params.station in context.config.noaa.subordinate_stations
+    if subordinate and local and params.datum == "MLLW":
+        try:
+            events = get_subordinate_tide_events(
+                context=context,
+                station_ids=[params.station],
+                begin_date=params.begin_date,
+                end_date=params.end_date,
+            )
+            return events[params.station].to_records()
+        except (ApiClientError, ValueError) as exc:
+            logger.warning(
+                "⚠ Subordinate tide offsets unavailable, using NOAA API: %s", exc
+            )
+        return fetch_tide_data(context=context, params=params)
+    if prediction.enabled and local:
+        try:
+            model = load_harmonic_model(
+                context=context, station_id=params.station, datum=params.datum
+            )
+            begin = datetime.strptime(params.begin_date, "%Y%m%d")
+            end = datetime.strptime(params.end_date, "%Y%m%d") + timedelta(days=1)
+            records = predict_hilo(
+                model, start=begin, end=end, time_zone=prediction.time_zone
+            )
+            logger.info(
+                "    ✓ Predicted %d tides locally for station %s",
+                len(records),
+                params.station,
+            )
+            return records
+        except (ApiClientError, ValueError) as exc:
+            logger.warning(
+                "⚠ Local tide prediction unavailable, using NOAA API: %s", exc
+            )
+    return fetch_tide_data(context=context, params=params)
+
+
+__all__ = [
+    "get_daytime_tides_for_date",
+    "get_subordinate_offsets",
+    "get_subordinate_tide_events",
+    "get_tide_events",
+    "get_tide_heights",
+    "load_harmonic_model",
+]
@@ -1,12 +1,27 @@
 """Water temperature use cases - orchestration layer for water temperature workflows."""
 
-from datetime import datetime
+from datetime import datetime, timedelta
+from pathlib import Path
 from typing import Optional, Tuple
+from zoneinfo import ZoneInfo
 
+from ..api_client.exceptions import ApiClientError
 from ..application.factory import ApplicationContext
 from ..logger import logger
-from ..models.noaa.water_temperature import NoaaWaterTempParams
-from ..services.water_temp_service import fetch_water_temp
+from ..models.noaa.water_temperature import NOAA_RANGE_FORMAT, NoaaWaterTempParams
+from ..services.water_temp_service import fetch_water_temp, fetch_water_temp_series
+from ..storage.timeseries import (
+    PRODUCT_WATER_TEMPERATURE,
+    TimeSeries,
+    TimeSeriesStore,
+    noaa_columns,
+)
+from ..storage.water_temp_history import WaterTempHistory, WaterTempSummary
+
+# NOAA ranges use station-local time. The end of each range is extended so
+# that samples stamped just after ``now`` (clock skew, a DST change) are
+# never cut off.
+RANGE_END_SLACK = timedelta(hours=12)
 
 
 def get_latest_water_temp(
@@ -41,6 +56,9 @@ def get_latest_water_temp(
         station_id = context.config.noaa.station_id
         logger.debug("Using station_id from config: %s", station_id)
 
+    if context.config.noaa.water_temp_history.enabled:
+        return _get_latest_from_history(context=context, station_id=station_id)
+
     # Build request parameters
     params = NoaaWaterTempParams(
         station=station_id,
@@ -67,6 +85,191 @@ def get_latest_water_temp(
     return temperature, retrieval_time, data_timestamp
 
 
+def open_water_temp_history(context: ApplicationContext) -> WaterTempHistory:
+    """Open the history store configured in ``noaa.water_temp_history``."""
+    return WaterTempHistory(
+        Path(context.config.noaa.water_temp_history.path).expanduser()
+    )
+
+
+def sync_water_temp_history(
+    *,
+    context: ApplicationContext,
+    history: WaterTempHistory,
+    station_id: str | None = None,
+    now: datetime | None = None,
+) -> int:
+    """
+    Fetch only the water temperature samples newer than the stored history.
+
+    The request range starts one minute after the newest stored sample (or
+    ``backfill_hours`` ago for an empty or very old history), so a routine
+    run downloads just the few 6-minute samples recorded since the last one.
+    Samples older than ``retention_days`` are pruned afterwards. With
+    ``timeseries.enabled`` the new samples are also appended to the columnar
+    time-series store, which keeps them beyond the retention window.
+
+    Args:
+        context (ApplicationContext): The application context containing
+            configuration and API client.
+        history (WaterTempHistory): Store to update.
+        station_id (str | None): NOAA station ID. If None, uses station from config.
+        now (datetime | None): Current station-local time. Defaults to now in
+            ``noaa.water_temp_history.time_zone``.
+
+    Returns:
+        int: Number of new samples stored.
+
+    Raises:
+        ApiClientError: If the NOAA API request fails.
+    """
+    if station_id is None:
+        station_id = context.config.noaa.station_id
+    history_config = context.config.noaa.water_temp_history
+    now = now or station_now(context)
+
+    earliest = now - timedelta(hours=history_config.backfill_hours)
+    newest = history.latest(station_id)
+    begin = earliest
+    if newest is not None:
+        begin = max(newest.observed_at + timedelta(minutes=1), earliest)
+
+    params = NoaaWaterTempParams(
+        station=station_id,
+        begin_date=begin.strftime(NOAA_RANGE_FORMAT),
+        end_date=(now + RANGE_END_SLACK).strftime(NOAA_RANGE_FORMAT),
+    )
+    logger.info(
+        "Fetching water temperature for station %s since %s",
+        station_id,
+        params.begin_date,
+    )
+    records = fetch_water_temp_series(context=context, params=params)
+    added = history.append(station_id, records)
+    if records and context.config.timeseries.enabled:
+        open_timeseries_store(context).append(
+            station_id,
+            PRODUCT_WATER_TEMPERATURE,
+            *noaa_columns(records, value_field="temperature"),
+        )
+    pruned = history.prune(
+        station_id, before=now - timedelta(days=history_config.retention_days)
+    )
+    logger.debug(
+        "  ✓ Water temperature history: %d new samples, %d pruned", added, pruned
+    )
+    return added
+
+
+def summarize_water_temp_history(
+    *,
+    context: ApplicationContext,
+    station_id: str | None = None,
+    hours: float = 24.0,
+    now: datetime | None = None,
+) -> WaterTempSummary:
+    """
+    Summarize the locally stored water temperature for a recent window.
+
+    No network request is made; call ``sync_water_temp_history`` (or
+    ``get_latest_water_temp`` with history enabled) to refresh first.
+
+    Args:
+        context (ApplicationContext): The application context containing configuration.
+        station_id (str | None): NOAA station ID. If None, uses station from config.
+        hours (float): Window length, e.g. 24 or 168 (7 days).
+        now (datetime | None): End of the window (station-local). Defaults to
+            now in ``noaa.water_temp_history.time_zone``.
+
+    Returns:
+        WaterTempSummary: Count, min, max, mean and change over the window.
+    """
+    if station_id is None:
+        station_id = context.config.noaa.station_id
+    now = now or station_now(context)
+    return open_water_temp_history(context).summarize(
+        station_id, start=now - timedelta(hours=hours)
+    )
+
+
+def open_timeseries_store(context: ApplicationContext) -> TimeSeriesStore:
+    """Open the columnar store configured in ``timeseries``."""
+    return TimeSeriesStore(Path(context.config.timeseries.directory).expanduser())
+
+
+def get_water_temp_series(
+    *,
+    context: ApplicationContext,
+    station_id: str | None = None,
+    hours: float = 24.0,
+    now: datetime | None = None,
+) -> TimeSeries:
+    """
+    Return recent water temperature samples as memory-mapped arrays.
+
+    Reads the columnar time-series store without building any records, for
+    analytics and formatters that work on arrays.
+
+    Args:
+        context (ApplicationContext): The application context containing configuration.
+        station_id (str | None): NOAA station ID. If None, uses station from config.
+        hours (float): Window length ending at ``now``.
+        now (datetime | None): End of the window (station-local). Defaults to
+            now in ``noaa.water_temp_history.time_zone``.
+
+    Returns:
+        TimeSeries: Views of the timestamp, value and flag columns.
+    """
+    if station_id is None:
+        station_id = context.config.noaa.station_id
+    now = now or station_now(context)
+    series = open_timeseries_store(context).open(station_id, PRODUCT_WATER_TEMPERATURE)
+    return series.slice(now - timedelta(hours=hours), now + timedelta(seconds=1))
+
+
+def station_now(context: ApplicationContext) -> datetime:
+    """
+    Current naive wall-clock time at the station.
+
+    NOAA ``lst_ldt`` timestamps, and so the stored history, are station-local;
+    ranges and cutoffs must be computed in that zone, not the host's.
+    """
+    zone = ZoneInfo(context.config.noaa.water_temp_history.time_zone)
+    return datetime.now(zone).replace(tzinfo=None)
+
+
+def _get_latest_from_history(
+    *, context: ApplicationContext, station_id: str
+) -> Tuple[Optional[float], datetime, Optional[str]]:
+    """Refresh the history with a delta fetch and return its newest sample.
+
+    If NOAA cannot be reached, the newest stored sample is served instead.
+    """
+    history = open_water_temp_history(context)
+    retrieval_time = datetime.now()
+    try:
+        sync_water_temp_history(context=context, history=history, station_id=station_id)
+    except ApiClientError as exc:
+        logger.warning(
+            "  ⚠ Water temperature history not refreshed for station %s; "
+            "serving stored samples: %s",
+            station_id,
+            exc,
+        )
+
+    newest = history.latest(station_id)
+    if newest is None:
+        logger.warning("No water temperature data returned for station %s", station_id)
+        return None, retrieval_time, None
+
+    logger.info(
+        "Latest water temperature: %.1f°F (measured at %s)",
+        newest.temperature,
+        newest.timestamp,
+    )
+    return newest.temperature, retrieval_time, newest.timestamp
+
+
 def format_water_temp_with_unit(temp: float) -> str:
     """
     Format the water temperature value as a string with the Fahrenheit symbol.
@@ -80,4 +283,13 @@ def format_water_temp_with_unit(temp: float) -> str:
     return f"{temp:.1f} °F"
 
 
-__all__ = ["get_latest_water_temp", "format_water_temp_with_unit"]
+__all__ = [
+    "get_latest_water_temp",
+    "format_water_temp_with_unit",
+    "get_water_temp_series",
+    "open_timeseries_store",
+    "open_water_temp_history",
+    "station_now",
+    "summarize_water_temp_history",
+    "sync_water_temp_history",
+]
@@ -0,0 +1,178 @@
+"""Cron expressions evaluated in a time zone, for scheduled report runs."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+MACROS = {
+    "@yearly": "0 0 1 1 *",
+    "@annually": "0 0 1 1 *",
+    "@monthly": "0 0 1 * *",
+    "@weekly": "0 0 * * 0",
+    "@daily": "0 0 * * *",
+    "@midnight": "0 0 * * *",
+    "@hourly": "0 * * * *",
+}
+
+_MONTH_NAMES = {
+    name: number
+    for number, name in enumerate(
+        ("jan", "feb", "mar", "apr", "may", "jun")
+        + ("jul", "aug", "sep", "oct", "nov", "dec"),
+        start=1,
+    )
+}
+_DAY_NAMES = {
+    name: number
+    for number, name in enumerate(("sun", "mon", "tue", "wed", "thu", "fri", "sat"))
+}
+
+# Give up looking for a run time after this long (e.g. "0 0 30 2 *").
+_SEARCH_LIMIT = timedelta(days=366 * 5)
+
+
+@dataclass(frozen=True)
+class CronSchedule:  # pylint: disable=too-many-instance-attributes
+    """
+    A five-field cron expression: minute, hour, day of month, month, weekday.
+
+    Fields accept ``*``, numbers, ranges (``1-5``), steps (``*/15``,
+    ``8-18/2``), comma-separated lists, and month or weekday names. Weekday 0
+    and 7 are both Sunday. As in cron, when both day of month and weekday
+    are restricted, a day matching either one runs.
+    """
+
+    expression: str
+    minutes: frozenset[int]
+    hours: frozenset[int]
+    days: frozenset[int]
+    months: frozenset[int]
+    weekdays: frozenset[int]
+    day_restricted: bool
+    weekday_restricted: bool
+
+    @classmethod
+    def parse(cls, expression: str) -> CronSchedule:
+        """
+        Parse a cron expression or macro such as ``@daily``.
+
+        Raises:
+            ValueError: If the expression is malformed or out of range.
+        """
+        text = " ".join(str(expression).split())
+        fields = MACROS.get(text.lower(), text).split(" ")
+        if len(fields) != 5:
+            raise ValueError(
+                f"Cron expression needs 5 fields "
+                f"(minute hour day month weekday), got: {expression!r}"
+            )
+        minute, hour, day, month, weekday = fields
+        weekdays = _parse_field(weekday, 0, 7, _DAY_NAMES, "weekday")
+        return cls(
+            expression=text,
+            minutes=_parse_field(minute, 0, 59, {}, "minute"),
+            hours=_parse_field(hour, 0, 23, {}, "hour"),
+            days=_parse_field(day, 1, 31, {}, "day of month"),
+            months=_parse_field(month, 1, 12, _MONTH_NAMES, "month"),
+            weekdays=frozenset(value % 7 for value in weekdays),
+            day_restricted=not day.startswith("*"),
+            weekday_restricted=not weekday.startswith("*"),
+        )
+
+    def next_after(self, moment: datetime, zone: ZoneInfo) -> datetime:
+        """
+        Return the first run time strictly after ``moment``.
+
+        The expression is matched against wall-clock time in ``zone``. A run
+        time that a daylight-saving jump skips does not run that day, and
+        one the fall-back hour repeats runs once, at its first occurrence.
+
+        Args:
+            moment: Aware datetime to search from.
+            zone: Time zone the expression is written in.
+
+        Returns:
+            Aware datetime in ``zone``.
+
+        Raises:
+            ValueError: If no run time exists within five years.
+        """
+        if moment.tzinfo is None:
+            raise ValueError("next_after() needs an aware datetime")
+        # Compare instants in UTC: aware datetimes sharing a tzinfo compare
+        # by wall clock, which ignores ``fold`` in the repeated hour.
+        after = moment.astimezone(timezone.utc)
+        local = moment.astimezone(zone).replace(tzinfo=None, second=0, microsecond=0)
+        local += timedelta(minutes=1)
+        limit = local + _SEARCH_LIMIT
+        while local < limit:
+            if local.month not in self.months:
+                local = _first_of_next_month(local)
+            elif not self._day_matches(local):
+                local = (local + timedelta(days=1)).replace(hour=0, minute=0)
+            elif local.hour not in self.hours:
+                local = (local + timedelta(hours=1)).replace(minute=0)
+            elif local.minute not in self.minutes:
+                local += timedelta(minutes=1)
+            else:
+                candidate = local.replace(tzinfo=zone)
+                if _exists(candidate) and candidate.astimezone(timezone.utc) > after:
+                    return candidate
+                local += timedelta(minutes=1)
+        raise ValueError(f"Cron expression never runs: {self.expression!r}")
+
+    def _day_matches(self, moment: datetime) -> bool:
+        in_days = moment.day in self.days
+        in_weekdays = (moment.weekday() + 1) % 7 in self.weekdays
+        if self.day_restricted and self.weekday_restricted:
+            return in_days or in_weekdays
+        return in_days and in_weekdays
+
+
+def _parse_field(
+    text: str, low: int, high: int, names: dict[str, int], label: str
+) -> frozenset[int]:
+    values: set[int] = set()
+    for part in text.lower().split(","):
+        base, _, step_text = part.partition("/")
+        step = _parse_number(step_text, {}, label) if step_text else 1
+        if step < 1:
+            raise ValueError(f"Cron {label} step must be positive: {part!r}")
+        if base == "*":
+            start, end = low, high
+        elif "-" in base:
+            start_text, end_text = base.split("-", 1)
+            start = _parse_number(start_text, names, label)
+            end = _parse_number(end_text, names, label)
+        else:
+            start = _parse_number(base, names, label)
+            end = high if step_text else start
+        if not low <= start <= end <= high:
+            raise ValueError(f"Cron {label} out of range {low}-{high}: {part!r}")
+        values.update(range(start, end + 1, step))
+    return frozenset(values)
+
+
+def _parse_number(text: str, names: dict[str, int], label: str) -> int:
+    if text in names:
+        return names[text]
+    if not text.isdigit():
+        raise ValueError(f"Invalid cron {label}: {text!r}")
+    return int(text)
+
+
+def _first_of_next_month(moment: datetime) -> datetime:
+    if moment.month == 12:
+        return datetime(moment.year + 1, 1, 1)
+    return datetime(moment.year, moment.month + 1, 1)
+
+
+def _exists(moment: datetime) -> bool:
+    """False for wall-clock times inside a daylight-saving gap."""
+    round_trip = moment.astimezone(timezone.utc).astimezone(moment.tzinfo)
+    return round_trip.replace(tzinfo=None) == moment.replace(tzinfo=None)
+
+
+__all__ = ["MACROS", "CronSchedule"]
@@ -1,5 +1,19 @@
 """Ocean report workflow orchestration."""
 
-from .report_runner import run_report
+from .daemon import ReportDaemon, serve
+from .http_service import ReportService, serve_http
+from .render_pool import RenderJob, RenderPool, RenderedReport
+from .report_runner import dispatch_pending_emails, replay_report, run_report
 
-__all__ = ["run_report"]
+__all__ = [
+    "run_report",
+    "replay_report",
+    "dispatch_pending_emails",
+    "ReportDaemon",
+    "serve",
+    "ReportService",
+    "serve_http",
+    "RenderPool",
+    "RenderJob",
+    "RenderedReport",
+]
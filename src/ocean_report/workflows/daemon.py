@@ -0,0 +1,354 @@
+"""Long-running report scheduler behind ``ocean-report serve``.
+
+A cron job pays the full start-up cost on every run: imports, config
+parsing, a new HTTP session with cold TLS connections, template parsing and
+empty in-process caches. ``ReportDaemon`` pays it once. It keeps one
+``ApplicationContext`` (and so one pooled ``ApiClient``) for its lifetime
+and runs ``run_report`` against it whenever a ``serve.schedules`` entry is
+due. Compiled templates and the LRU caches of the services stay warm
+between runs.
+
+SMTP connections are opened per run: mail servers drop idle sessions long
+before the next scheduled report, so a pooled connection would only fail
+on first use.
+
+With ``serve.render_workers`` above 1 the daemon also keeps a warm
+``RenderPool``. Schedules that are due together then run in parallel
+threads, overlapping their API calls, and each formats and renders its
+report in a pool worker process, where the GIL does not serialize them.
+"""
+
+from __future__ import annotations
+
+import os
+import signal
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Union
+from zoneinfo import ZoneInfo
+
+from ..application import ApplicationContext, create_application_context
+from ..config import clear_config_cache, load_app_config, resolve_config_path
+from ..config.schemas import AppConfig, ScheduleConfig
+from ..logger import flush_logger, logger
+from ..utils.cron import CronSchedule
+from .render_pool import RenderPool
+from .report_runner import _configure_logger_from_settings, run_report
+
+_LOCATION_OVERRIDES = ("latitude", "longitude", "beach_orientation_degrees")
+
+
+@dataclass
+class ScheduledJob:
+    """A configured schedule and the context its runs use."""
+
+    schedule: ScheduleConfig
+    cron: CronSchedule
+    zone: ZoneInfo
+    context: ApplicationContext
+    next_run: datetime
+
+    @property
+    def name(self) -> str:
+        """Schedule name from the config."""
+        return self.schedule.name
+
+
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class ReportDaemon:
+    """
+    Run scheduled reports from one warm process until stopped.
+
+    The config is loaded, and every schedule's next run time computed, when
+    the daemon is created.
+
+    Args:
+        cfg_path: Config file to load and watch. If None, uses default
+            resolution.
+        runner: Called as ``runner(context=, run_email=, test=)`` for each
+            due schedule, plus ``render_pool=`` when ``serve.render_workers``
+            is above 1. Defaults to ``run_report``.
+        clock: Returns the current aware time; injectable for tests.
+
+    Raises:
+        pydantic.ValidationError: If the config is invalid.
+        OSError: If the config file cannot be read.
+    """
+
+    def __init__(
+        self,
+        *,
+        cfg_path: Union[str, Path, None] = None,
+        runner: Callable[..., Any] = run_report,
+        clock: Callable[[], datetime] = _utc_now,
+    ) -> None:
+        self.config_path = resolve_config_path(cfg_path)
+        self._runner = runner
+        self._clock = clock
+        self._stop = threading.Event()
+        self._context: ApplicationContext | None = None
+        self._render_pool: RenderPool | None = None
+        self._config_mtime: int | None = None
+        self.jobs: list[ScheduledJob] = []
+        self.load()
+
+    @property
+    def context(self) -> ApplicationContext:
+        """The shared context of the current config."""
+        assert self._context is not None
+        return self._context
+
+    def load(self) -> None:
+        """
+        Load the config, build the shared context and schedule every job.
+        """
+        mtime = self.config_path.stat().st_mtime_ns
+        config = load_app_config(self.config_path)
+        self._apply(config)
+        self._config_mtime = mtime
+
+    def reload_if_changed(self) -> bool:
+        """
+        Reload the config if its file changed since it was last loaded.
+
+        An unreadable or invalid file is logged and the running config is
+        kept, so a half-saved edit never stops the daemon.
+
+        Returns:
+            True if a new config was applied.
+        """
+        try:
+            mtime = self.config_path.stat().st_mtime_ns
+        except OSError as exc:
+            logger.warning("  ⚠ Cannot stat config %s: %s", self.config_path, exc)
+            return False
+        if mtime == self._config_mtime:
+            return False
+        self._config_mtime = mtime
+        try:
+            config = load_app_config(self.config_path)
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            logger.error(
+                "  ⚠ Config change in %s ignored, keeping the running config: %s",
+                self.config_path,
+                exc,
+            )
+            return False
+        self._apply(config)
+        logger.info("  ✓ Reloaded config from %s", self.config_path)
+        return True
+
+    def run_due_jobs(self) -> int:
+        """
+        Run every job whose next run time has passed.
+
+        Each job is rescheduled before it runs. A run that fails is logged
+        and does not affect other jobs. Runs missed while the process was
+        suspended are run once, not once per missed slot. With a render
+        pool, jobs due together run concurrently; otherwise one by one.
+
+        Returns:
+            Number of jobs run.
+        """
+        if self._render_pool is not None:
+            return self._run_due_jobs_together()
+        ran = 0
+        for job in self.jobs:
+            if self._stop.is_set():
+                break
+            now = self._clock()
+            if job.next_run > now:
+                continue
+            job.next_run = job.cron.next_after(now, job.zone)
+            self._run_job(job)
+            ran += 1
+        return ran
+
+    def seconds_until_next(self) -> float:
+        """Seconds to sleep before the next due job or config check."""
+        wait = self.context.config.serve.config_poll_seconds
+        now = self._clock()
+        for job in self.jobs:
+            wait = min(wait, (job.next_run - now).total_seconds())
+        return max(0.0, wait)
+
+    def serve_forever(self) -> None:
+        """Run due jobs and watch the config until ``stop()`` is called."""
+        logger.info(
+            "Serving %d schedule(s) from %s", len(self.jobs), self.config_path
+        )
+        if not self.jobs:
+            logger.warning(
+                "  ⚠ serve.schedules is empty; waiting for a config change"
+            )
+        try:
+            while not self._stop.is_set():
+                self.reload_if_changed()
+                self.run_due_jobs()
+                self._stop.wait(self.seconds_until_next())
+        finally:
+            self.context.client.close()
+            if self._render_pool is not None:
+                self._render_pool.close()
+            logger.info("Report daemon stopped")
+            flush_logger()
+
+    def stop(self) -> None:
+        """Ask the loop to exit once the current run, if any, finishes."""
+        self._stop.set()
+
+    def install_signal_handlers(self) -> None:
+        """Stop gracefully on SIGTERM and SIGINT (main thread only)."""
+
+        def handle(signum: int, _frame: Any) -> None:
+            logger.info(
+                "Received %s; stopping after the current run",
+                signal.Signals(signum).name,
+            )
+            self.stop()
+
+        signal.signal(signal.SIGTERM, handle)
+        signal.signal(signal.SIGINT, handle)
+
+    def _apply(self, config: AppConfig) -> None:
+        """Swap in a new config, keeping due times of unchanged schedules."""
+        # Code that reads get_settings() must see the new file too.
+        clear_config_cache()
+        previous_context = self._context
+        context = create_application_context(config=config)
+        _configure_logger_from_settings(config)
+
+        previous = {job.name: job for job in self.jobs}
+        now = self._clock()
+        jobs = []
+        for schedule in config.serve.schedules:
+            old = previous.get(schedule.name)
+            cron = CronSchedule.parse(schedule.cron)
+            zone = ZoneInfo(schedule.timezone)
+            unchanged = (
+                old is not None
+                and old.cron == cron
+                and old.schedule.timezone == schedule.timezone
+            )
+            jobs.append(
+                ScheduledJob(
+                    schedule=schedule,
+                    cron=cron,
+                    zone=zone,
+                    context=schedule_context(context, schedule),
+                    next_run=old.next_run if unchanged else cron.next_after(now, zone),
+                )
+            )
+            logger.info(
+                "  → %s: '%s' (%s), next run %s",
+                schedule.name,
+                cron.expression,
+                schedule.timezone,
+                jobs[-1].next_run.isoformat(),
+            )
+
+        previous_pool = self._render_pool
+        self._context = context
+        self.jobs = jobs
+        self._render_pool = self._start_render_pool(config)
+        if previous_context is not None:
+            previous_context.client.close()
+        if previous_pool is not None:
+            previous_pool.close()
+
+    def _start_render_pool(self, config: AppConfig) -> RenderPool | None:
+        """Start the configured render pool; None renders in this process."""
+        workers = config.serve.render_workers
+        if workers == 1:
+            return None
+        try:
+            pool = RenderPool(workers=workers, config_path=self.config_path)
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            logger.warning(
+                "  ⚠ Render pool not started, rendering in the daemon: %s", exc
+            )
+            return None
+        logger.info("  ✓ Render pool started with %d worker(s)", workers)
+        return pool
+
+    def _run_due_jobs_together(self) -> int:
+        """Run every due job at once, one thread each."""
+        now = self._clock()
+        due = [job for job in self.jobs if job.next_run <= now]
+        if not due or self._stop.is_set():
+            return 0
+        for job in due:
+            job.next_run = job.cron.next_after(now, job.zone)
+        with ThreadPoolExecutor(
+            max_workers=len(due), thread_name_prefix="schedule"
+        ) as executor:
+            list(executor.map(self._run_job, due))
+        return len(due)
+
+    def _run_job(self, job: ScheduledJob) -> None:
+        logger.info("Running schedule %s", job.name)
+        options = {}
+        if self._render_pool is not None:
+            options["render_pool"] = self._render_pool
+        try:
+            self._runner(
+                context=job.context,
+                run_email=job.schedule.send_email,
+                test=job.schedule.test,
+                **options,
+            )
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            logger.error(
+                "  ⚠ Schedule %s failed: %s", job.name, exc, exc_info=True
+            )
+        logger.info(
+            "Schedule %s next runs at %s", job.name, job.next_run.isoformat()
+        )
+
+
+def schedule_context(
+    context: ApplicationContext, schedule: ScheduleConfig
+) -> ApplicationContext:
+    """Context for one schedule: its location overrides on the shared client."""
+    config = context.config
+    updates = {}
+    if schedule.station_id is not None:
+        updates["noaa"] = config.noaa.model_copy(
+            update={"station_id": schedule.station_id}
+        )
+    location = {
+        name: getattr(schedule, name)
+        for name in _LOCATION_OVERRIDES
+        if getattr(schedule, name) is not None
+    }
+    if location:
+        updates["location"] = config.location.model_copy(update=location)
+    if not updates:
+        return context
+    return ApplicationContext(
+        config=config.model_copy(update=updates), client=context.client
+    )
+
+
+def serve(*, cfg_path: Union[str, Path, None] = None) -> None:
+    """
+    Run the report daemon in the foreground until SIGTERM or SIGINT.
+
+    Args:
+        cfg_path: Config file to load and watch. If None, uses default
+            resolution.
+    """
+    daemon = ReportDaemon(cfg_path=cfg_path)
+    daemon.install_signal_handlers()
+    logger.info("Report daemon started (pid %d)", os.getpid())
+    daemon.serve_forever()
+
+
+__all__ = ["ReportDaemon", "ScheduledJob", "schedule_context", "serve"]
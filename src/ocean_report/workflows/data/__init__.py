@@ -1,6 +1,12 @@
 """Data operations for ocean report workflows."""
 
+from .archive import RunArchive, config_fingerprint
 from .fetcher import fetch_raw_data
 from .formatter import format_report_data
 
-__all__ = ["fetch_raw_data", "format_report_data"]
+__all__ = [
+    "RunArchive",
+    "config_fingerprint",
+    "fetch_raw_data",
+    "format_report_data",
+]
@@ -0,0 +1,247 @@
+"""Run archive: the raw inputs of every report run, kept for replay.
+
+Each run's :class:`RawReportData` is stored as one zlib-compressed JSON blob
+in a local SQLite database, next to the report date, station and a hash of
+the configuration that produced it. Any archived day can then be formatted
+and rendered again without touching the network.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import time
+import zlib
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+from ...config.schemas import AppConfig
+from ...models.noaa.tides import NoaaTidePredictionRecord
+from ..models import RawReportData
+
+ARCHIVE_FORMAT_VERSION = 1
+COMPRESSION_LEVEL = 6
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY,
+    report_date TEXT NOT NULL,
+    station_id TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    config_hash TEXT NOT NULL,
+    format_version INTEGER NOT NULL,
+    payload BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_runs_report_date ON runs (report_date, run_id);
+"""
+
+
+@dataclass(frozen=True)
+class ArchivedRun:
+    """One archived report run."""
+
+    run_id: int
+    report_date: str
+    station_id: str
+    created_at: float
+    config_hash: str
+    raw_data: RawReportData
+
+
+@dataclass(frozen=True)
+class ArchivedRunInfo:
+    """Archive row metadata, without the decoded payload."""
+
+    run_id: int
+    report_date: str
+    station_id: str
+    created_at: float
+    config_hash: str
+    payload_bytes: int
+
+
+class RunArchive:
+    """SQLite archive of raw report inputs keyed by report date.
+
+    Like the outbox, each operation opens a short-lived connection, so one
+    instance can be shared between threads.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection in autocommit mode with WAL journaling."""
+        conn = sqlite3.connect(self.path, timeout=30.0, isolation_level=None)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            yield conn
+        finally:
+            conn.close()
+
+    def save(
+        self,
+        raw_data: RawReportData,
+        *,
+        report_date: str | date,
+        station_id: str,
+        config_hash: str,
+    ) -> int:
+        """
+        Archive one run's raw inputs.
+
+        Args:
+            raw_data: Raw data returned by ``fetch_raw_data``.
+            report_date: Day the report was generated for (``YYYYMMDD`` or date).
+            station_id: NOAA station the data came from.
+            config_hash: Fingerprint of the config used (see ``config_fingerprint``).
+
+        Returns:
+            The new run's ``run_id``.
+        """
+        payload = zlib.compress(
+            json.dumps(
+                raw_report_to_dict(raw_data), separators=(",", ":")
+            ).encode("utf-8"),
+            COMPRESSION_LEVEL,
+        )
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "INSERT INTO runs (report_date, station_id, created_at, "
+                "config_hash, format_version, payload) VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    _date_key(report_date),
+                    station_id,
+                    time.time(),
+                    config_hash,
+                    ARCHIVE_FORMAT_VERSION,
+                    payload,
+                ),
+            )
+        return int(cursor.lastrowid)
+
+    def load(
+        self, report_date: str | date | None = None, *, run_id: Optional[int] = None
+    ) -> Optional[ArchivedRun]:
+        """
+        Load an archived run.
+
+        Args:
+            report_date: Report day (``YYYYMMDD`` or date); the latest run
+                archived for that day is returned.
+            run_id: Load this exact run instead.
+
+        Returns:
+            ArchivedRun, or None if nothing matches.
+
+        Raises:
+            ValueError: If neither ``report_date`` nor ``run_id`` is given.
+        """
+        if run_id is not None:
+            query, params = "WHERE run_id = ?", (run_id,)
+        elif report_date is not None:
+            query = "WHERE report_date = ? ORDER BY run_id DESC LIMIT 1"
+            params = (_date_key(report_date),)
+        else:
+            raise ValueError("Either report_date or run_id is required.")
+
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT run_id, report_date, station_id, created_at, config_hash, "
+                f"format_version, payload FROM runs {query}",
+                params,
+            ).fetchone()
+        if row is None:
+            return None
+
+        run_id, day, station_id, created_at, config_hash, version, payload = row
+        if version != ARCHIVE_FORMAT_VERSION:
+            raise ValueError(f"Unsupported archive format version {version}")
+        return ArchivedRun(
+            run_id=run_id,
+            report_date=day,
+            station_id=station_id,
+            created_at=created_at,
+            config_hash=config_hash,
+            raw_data=raw_report_from_dict(json.loads(zlib.decompress(payload))),
+        )
+
+    def list_runs(self, *, limit: Optional[int] = None) -> list[ArchivedRunInfo]:
+        """Return archived runs, newest first, without decoding payloads."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT run_id, report_date, station_id, created_at, config_hash, "
+                "length(payload) FROM runs ORDER BY run_id DESC LIMIT ?",
+                (-1 if limit is None else limit,),
+            ).fetchall()
+        return [ArchivedRunInfo(*row) for row in rows]
+
+
+def config_fingerprint(config: AppConfig) -> str:
+    """Short SHA-256 of the config, excluding credentials."""
+    dumped = config.model_dump_json(exclude={"email": {"password"}})
+    return hashlib.sha256(dumped.encode("utf-8")).hexdigest()[:16]
+
+
+def raw_report_to_dict(raw_data: RawReportData) -> dict[str, Any]:
+    """Convert RawReportData to JSON-serializable primitives."""
+    return {
+        "tides": [
+            tide.model_dump() if isinstance(tide, NoaaTidePredictionRecord) else tide
+            for tide in raw_data.tides
+        ],
+        "tide_timestamp": _iso(raw_data.tide_timestamp),
+        "water_temp": raw_data.water_temp,
+        "water_temp_timestamp": _iso(raw_data.water_temp_timestamp),
+        "water_temp_data_time": raw_data.water_temp_data_time,
+        "wind_forecast": [dict(entry) for entry in raw_data.wind_forecast],
+        "wind_timestamp": _iso(raw_data.wind_timestamp),
+    }
+
+
+def raw_report_from_dict(data: dict[str, Any]) -> RawReportData:
+    """Rebuild RawReportData from :func:`raw_report_to_dict` output."""
+    return RawReportData(
+        tides=[NoaaTidePredictionRecord.model_validate(tide) for tide in data["tides"]],
+        tide_timestamp=_from_iso(data["tide_timestamp"]),
+        water_temp=data["water_temp"],
+        water_temp_timestamp=_from_iso(data["water_temp_timestamp"]),
+        water_temp_data_time=data["water_temp_data_time"],
+        wind_forecast=list(data["wind_forecast"]),
+        wind_timestamp=_from_iso(data["wind_timestamp"]),
+    )
+
+
+def _date_key(value: str | date) -> str:
+    """Normalize a report date to ``YYYYMMDD``."""
+    if isinstance(value, date):
+        return value.strftime("%Y%m%d")
+    text = value.strip().replace("-", "")
+    datetime.strptime(text, "%Y%m%d")
+    return text
+
+
+def _iso(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value is not None else None
+
+
+def _from_iso(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value is not None else None
+
+
+__all__ = [
+    "ArchivedRun",
+    "ArchivedRunInfo",
+    "RunArchive",
+    "config_fingerprint",
+    "raw_report_from_dict",
+    "raw_report_to_dict",
+]
@@ -1,15 +1,20 @@
 """Data fetching operations for ocean report."""
 
-import time
+from typing import Any, Callable, Optional
+
 from ...application import ApplicationContext
 from ...logger import logger
+from ...tracing import span
+from ...use_cases import stale_while_revalidate as swr
 from ...use_cases import tides as tides_use_case
 from ...use_cases import water_temperature as water_temp_use_case
 from ...use_cases import wind as wind_use_case
 from ..models import FetchParams, RawReportData
 
 
-def fetch_raw_data(context: ApplicationContext, params: FetchParams) -> RawReportData:
+def fetch_raw_data(
+    context: ApplicationContext, params: FetchParams, *, serve_stale: bool = False
+) -> RawReportData:
     """Fetch raw data from all APIs without any formatting.
 
     Pure data fetching layer - no formatting, just retrieval.
@@ -17,6 +22,9 @@ def fetch_raw_data(context: ApplicationContext, params: FetchParams) -> RawRepor
     Args:
         context: Application context
         params: Fetch parameters
+        serve_stale: Fetch through the ``*_swr`` use cases, which serve
+            cached values per ``stale_while_revalidate`` and report their age
+            in ``data_age_seconds``/``stale``. For on-demand callers.
 
     Returns:
         RawReportData with all fetched information
@@ -24,62 +32,73 @@ def fetch_raw_data(context: ApplicationContext, params: FetchParams) -> RawRepor
     Raises:
         ApiClientError: If any critical API call fails
     """
+    served: Optional[list[swr.ServedValue[Any]]] = [] if serve_stale else None
+
     # Fetch tide data
     logger.info("  → Fetching tide data from NOAA...")
-    fetch_start = time.time()
-    daytime_tides, tide_timestamp = tides_use_case.get_daytime_tides_for_date(
-        context=context,
-        station_id=params.station_id,
-        date=params.date_str,
-    )
+    with span("fetch.tides", station=params.station_id, date=params.date_str) as step:
+        daytime_tides, tide_timestamp = _call(
+            served,
+            tides_use_case.get_daytime_tides_for_date,
+            swr.get_daytime_tides_for_date_swr,
+            context=context,
+            station_id=params.station_id,
+            date=params.date_str,
+        )
     logger.info(
         "  ✓ Tide data fetched in %.2f seconds (%d events)",
-        time.time() - fetch_start,
+        step.duration,
         len(daytime_tides),
     )
 
     # Fetch water temperature
     logger.info("  → Fetching water temperature from NOAA...")
-    fetch_start = time.time()
-    water_temp, water_temp_timestamp, water_temp_data_time = (
-        water_temp_use_case.get_latest_water_temp(
+    with span("fetch.water_temperature", station=params.station_id) as step:
+        water_temp, water_temp_timestamp, water_temp_data_time = _call(
+            served,
+            water_temp_use_case.get_latest_water_temp,
+            swr.get_latest_water_temp_swr,
             context=context,
             station_id=params.station_id,
         )
-    )
     logger.info(
         "  ✓ Water temperature fetched in %.2f seconds (%.1f°F)",
-        time.time() - fetch_start,
+        step.duration,
         water_temp if water_temp else 0.0,
     )
 
     # Fetch wind forecast with graceful error handling
     logger.info("  → Fetching wind forecast from Open-Meteo...")
-    fetch_start = time.time()
-    try:
-        wind_forecast, wind_timestamp = wind_use_case.get_daily_wind_forecast(
-            context=context,
-            latitude=params.latitude,
-            longitude=params.longitude,
-            beach_facing_deg=params.beach_facing_deg,
-            times_to_get=params.forecast_times,
-        )
-        logger.info(
-            "  ✓ Wind forecast fetched in %.2f seconds (%d time slots)",
-            time.time() - fetch_start,
-            len(wind_forecast),
-        )
-    except Exception as exc:  # pylint: disable=broad-exception-caught
-        logger.warning(
-            "  ⚠ Wind forecast unavailable after %.2f seconds: %s",
-            time.time() - fetch_start,
-            str(exc),
-        )
-        logger.debug("Wind API error details:", exc_info=True)
-        # Provide fallback
-        wind_forecast = []
-        wind_timestamp = None
-        logger.info("  → Continuing with report despite wind data failure")
+    with span("fetch.wind") as step:
+        try:
+            wind_forecast, wind_timestamp = _call(
+                served,
+                wind_use_case.get_daily_wind_forecast,
+                swr.get_daily_wind_forecast_swr,
+                context=context,
+                latitude=params.latitude,
+                longitude=params.longitude,
+                beach_facing_deg=params.beach_facing_deg,
+                times_to_get=params.forecast_times,
+            )
+            logger.info(
+                "  ✓ Wind forecast fetched in %.2f seconds (%d time slots)",
+                step.duration,
+                len(wind_forecast),
+            )
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            step.status = "error"
+            step.set_attribute("error", type(exc).__name__)
+            logger.warning(
+                "  ⚠ Wind forecast unavailable after %.2f seconds: %s",
+                step.duration,
+                str(exc),
+            )
+            logger.debug("Wind API error details:", exc_info=True)
+            # Provide fallback
+            wind_forecast = []
+            wind_timestamp = None
+            logger.info("  → Continuing with report despite wind data failure")
 
     return RawReportData(
         tides=daytime_tides,
@@ -89,4 +108,20 @@ def fetch_raw_data(context: ApplicationContext, params: FetchParams) -> RawRepor
         water_temp_data_time=water_temp_data_time,
         wind_forecast=wind_forecast,
         wind_timestamp=wind_timestamp,
+        data_age_seconds=max((item.age_seconds for item in served or ()), default=0.0),
+        stale=any(item.stale for item in served or ()),
     )
+
+
+def _call(
+    served: Optional[list[swr.ServedValue[Any]]],
+    use_case: Callable[..., Any],
+    swr_use_case: Callable[..., swr.ServedValue[Any]],
+    **kwargs: Any,
+) -> Any:
+    """Call ``use_case``, or its ``*_swr`` wrapper and record what it served."""
+    if served is None:
+        return use_case(**kwargs)
+    result = swr_use_case(**kwargs)
+    served.append(result)
+    return result.value
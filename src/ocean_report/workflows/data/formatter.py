@@ -1,12 +1,17 @@
 """Data formatting operations for ocean report."""
 
+from datetime import datetime
+from typing import Optional
+
 from ...config import get_settings
 from ...emailer import template_helpers
 from ...models.email import EmailTemplateData
 from ..models import RawReportData
 
 
-def format_report_data(raw_data: RawReportData) -> EmailTemplateData:
+def format_report_data(
+    raw_data: RawReportData, *, report_date: Optional[datetime] = None
+) -> EmailTemplateData:
     """Format raw data into email template data.
 
     Pure formatting layer - takes raw data, returns EmailTemplateData
@@ -14,6 +19,8 @@ def format_report_data(raw_data: RawReportData) -> EmailTemplateData:
 
     Args:
         raw_data: Raw data from APIs
+        report_date: Day shown in the report heading. Defaults to today
+            (replays pass the archived day).
 
     Returns:
         EmailTemplateData ready for template rendering
@@ -32,7 +39,7 @@ def format_report_data(raw_data: RawReportData) -> EmailTemplateData:
 
     # Build and return EmailTemplateData
     return EmailTemplateData(
-        long_date=template_helpers.format_long_date(),
+        long_date=template_helpers.format_long_date(report_date),
         water_temp=water_temp_str,
         tide_info=tide_str,
         wind_info=wind_str,
@@ -1,15 +1,21 @@
 """Email operations for ocean report workflows."""
 
+from .dispatcher import DispatchSummary, dispatch_outbox, open_outbox
 from .preview import write_email_preview
-from .recipients import get_bcc_recipients
+from .recipients import apply_suppression, get_bcc_recipients
 from .sender import send_or_preview_email
-from .validator import validate_email_credentials
+from .validator import validate_email_credentials, validate_email_password
 from .subject import format_email_subject
 
 __all__ = [
+    "DispatchSummary",
+    "dispatch_outbox",
+    "open_outbox",
     "write_email_preview",
+    "apply_suppression",
     "get_bcc_recipients",
     "send_or_preview_email",
     "validate_email_credentials",
+    "validate_email_password",
     "format_email_subject",
 ]
@@ -0,0 +1,93 @@
+"""SMTP delivery of a rendered email using the configured strategy."""
+
+import time
+from collections.abc import Callable, Sequence
+
+from ...application import ApplicationContext
+from ...emailer import sender as emailer
+from ...logger import logger
+from .validator import validate_email_credentials
+
+
+def deliver_email(  # pylint: disable=too-many-arguments
+    *,
+    context: ApplicationContext,
+    subject: str,
+    body: str,
+    sender_email: str | None,
+    email_password: str | None,
+    email_recipients: str,
+    bcc_recipients: Sequence[str],
+    before_chunk: Callable[[int], None] | None = None,
+) -> list[str]:
+    """Send email via SMTP server.
+
+    Uses ``email.delivery.mode`` to choose between a single message and
+    chunked delivery. ``before_chunk`` is passed to chunked delivery and
+    called before each envelope chunk is sent.
+
+    Returns:
+        Recipients that could not be delivered. Always empty in single mode,
+        where any failure raises instead.
+    """
+    logger.info("  → Validating email configuration...")
+    validate_email_credentials(sender_email, email_password)
+    logger.debug("  ✓ Email configuration validated")
+
+    logger.info(
+        "  → Connecting to SMTP and sending to %d recipients...",
+        len(bcc_recipients),
+    )
+    logger.debug("  → Sender: %s", sender_email)
+    send_start = time.time()
+
+    delivery = context.config.email.delivery
+    if delivery.mode == "chunked":
+        report = emailer.send_email_chunked(
+            subject=subject,
+            body=body,
+            sender_email=sender_email,
+            email_password=email_password,
+            recipients=emailer.EmailRecipients(
+                to_email=email_recipients,
+                bcc_list=list(bcc_recipients),
+            ),
+            smtp_server=context.config.email.smtp_server,
+            smtp_port=context.config.email.smtp_port,
+            chunk_size=delivery.chunk_size,
+            max_connections=delivery.max_connections,
+            max_retries=delivery.max_retries,
+            backoff_seconds=delivery.backoff_seconds,
+            before_chunk=before_chunk,
+        )
+        if report.failed:
+            logger.warning(
+                "  ⚠ %d of %d recipients could not be delivered",
+                report.failed,
+                report.delivered + report.failed,
+            )
+        logger.info(
+            "  ✓ Email delivered to %d recipients in %d chunks in %.2f seconds",
+            report.delivered,
+            len(report.chunks),
+            time.time() - send_start,
+        )
+        return report.failed_recipients
+
+    emailer.send_email(
+        subject=subject,
+        body=body,
+        sender_email=sender_email,
+        email_password=email_password,
+        recipients=emailer.EmailRecipients(
+            to_email=email_recipients,
+            bcc_list=list(bcc_recipients),
+        ),
+        smtp_server=context.config.email.smtp_server,
+        smtp_port=context.config.email.smtp_port,
+    )
+    logger.info(
+        "  ✓ Email sent successfully via SMTP in %.2f seconds",
+        time.time() - send_start,
+    )
+    return []
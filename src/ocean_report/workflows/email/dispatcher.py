@@ -0,0 +1,225 @@
+"""Outbox dispatch: drain queued messages with retries."""
+
+from __future__ import annotations
+
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from ...application import ApplicationContext
+from ...emailer.outbox import (
+    STATUS_DEAD,
+    Outbox,
+    OutboxLeaseLostError,
+    OutboxMessage,
+)
+from ...logger import logger
+from .delivery import deliver_email
+from .validator import validate_email_password
+
+
+@dataclass(frozen=True)
+class DispatchSummary:
+    """Outcome of one outbox drain."""
+
+    sent: int = 0
+    retrying: int = 0
+    dead: int = 0
+    lost: int = 0
+
+    def __add__(self, other: "DispatchSummary") -> "DispatchSummary":
+        return DispatchSummary(
+            sent=self.sent + other.sent,
+            retrying=self.retrying + other.retrying,
+            dead=self.dead + other.dead,
+            lost=self.lost + other.lost,
+        )
+
+
+def open_outbox(context: ApplicationContext) -> Outbox:
+    """Open the outbox configured in ``email.outbox``."""
+    outbox_config = context.config.email.outbox
+    return Outbox(
+        Path(outbox_config.path).expanduser(),
+        lease_seconds=outbox_config.lease_seconds,
+    )
+
+
+def dispatch_outbox(
+    *,
+    context: ApplicationContext,
+    outbox: Outbox,
+    workers: int | None = None,
+    ignore_schedule: bool = False,
+) -> DispatchSummary:
+    """Deliver every ready message in the outbox.
+
+    Messages are claimed one at a time under a lease, so several workers in
+    this process (or other processes sharing the file) never send the same
+    message twice. Chunked deliveries renew the lease before every chunk; if
+    it was lost anyway, the worker stops sending and leaves the message to
+    its new owner. Failed messages are rescheduled with exponential backoff
+    until ``email.outbox.max_attempts`` is reached.
+
+    Args:
+        context: Application context containing SMTP and outbox config.
+        outbox: Outbox to drain.
+        workers: Number of parallel dispatch workers. Defaults to config.
+        ignore_schedule: If True, try every pending message once now instead
+            of waiting for its retry time (used for manual re-sends).
+
+    Returns:
+        DispatchSummary with sent, retrying, dead and lost-lease message counts.
+
+    Raises:
+        ValueError: If the SMTP password is not configured. Nothing is
+            claimed, so every message stays pending.
+    """
+    # Checked once up front: failing inside a worker would leave the
+    # messages other workers had claimed leased until their leases expire.
+    validate_email_password(context.config.email.password)
+    workers = workers or context.config.email.outbox.workers
+    dispatch_start = time.time()
+    run_id = uuid.uuid4().hex[:8]
+    logger.info("  → Dispatching outbox %s with %d worker(s)", outbox.path, workers)
+
+    not_attempted_since = dispatch_start if ignore_schedule else None
+
+    if workers == 1:
+        summary = _drain(context, outbox, f"{run_id}-0", not_attempted_since)
+    else:
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="outbox"
+        ) as executor:
+            futures = [
+                executor.submit(
+                    _drain,
+                    context,
+                    outbox,
+                    f"{run_id}-{index}",
+                    not_attempted_since,
+                )
+                for index in range(workers)
+            ]
+            summary = sum((future.result() for future in futures), DispatchSummary())
+
+    logger.info(
+        "  ✓ Outbox dispatch finished in %.2f seconds "
+        "(%d sent, %d retrying, %d dead, %d lost lease)",
+        time.time() - dispatch_start,
+        summary.sent,
+        summary.retrying,
+        summary.dead,
+        summary.lost,
+    )
+    return summary
+
+
+def _drain(
+    context: ApplicationContext,
+    outbox: Outbox,
+    worker_id: str,
+    not_attempted_since: float | None,
+) -> DispatchSummary:
+    """Claim and deliver messages until none are ready."""
+    summary = DispatchSummary()
+    while True:
+        claimed = outbox.claim(
+            worker_id=worker_id, limit=1, not_attempted_since=not_attempted_since
+        )
+        if not claimed:
+            return summary
+        summary += _dispatch_message(context, outbox, claimed[0])
+
+
+def _dispatch_message(
+    context: ApplicationContext, outbox: Outbox, message: OutboxMessage
+) -> DispatchSummary:
+    """Deliver one claimed message, unless its lease is lost on the way."""
+    try:
+        return _deliver_message(context, outbox, message)
+    except OutboxLeaseLostError as exc:
+        logger.warning("  ⚠ Stopped outbox message %s: %s", message.message_id, exc)
+        return DispatchSummary(lost=1)
+
+
+def _deliver_message(
+    context: ApplicationContext, outbox: Outbox, message: OutboxMessage
+) -> DispatchSummary:
+    """Deliver one claimed message and record the outcome."""
+    outbox_config = context.config.email.outbox
+    logger.info(
+        "  → Sending outbox message %s (attempt %d/%d, thread %s)",
+        message.message_id,
+        message.attempts,
+        outbox_config.max_attempts,
+        threading.current_thread().name,
+    )
+
+    try:
+        failed_recipients = deliver_email(
+            context=context,
+            subject=message.subject,
+            body=message.body,
+            sender_email=message.sender_email,
+            email_password=context.config.email.password,
+            email_recipients=message.to_email,
+            bcc_recipients=message.bcc_list,
+            before_chunk=lambda _index: outbox.renew_lease(message),
+        )
+    except OutboxLeaseLostError:
+        raise
+    except ValueError as exc:
+        # The message itself is unusable (e.g. no sender): retrying cannot
+        # help, so it is marked dead now and the drain continues.
+        status = outbox.mark_failed(
+            message,
+            error=str(exc),
+            max_attempts=message.attempts,
+            retry_delay_seconds=outbox_config.retry_delay_seconds,
+        )
+        logger.error(
+            "  ✗ Outbox message %s cannot be sent: %s", message.message_id, exc
+        )
+        return _failure_summary(status)
+    except Exception as exc:  # pylint: disable=broad-exception-caught
+        status = outbox.mark_failed(
+            message,
+            error=str(exc),
+            max_attempts=outbox_config.max_attempts,
+            retry_delay_seconds=outbox_config.retry_delay_seconds,
+        )
+        logger.error(
+            "  ✗ Outbox message %s failed (%s): %s",
+            message.message_id,
+            status,
+            exc,
+        )
+        return _failure_summary(status)
+
+    if failed_recipients:
+        status = outbox.mark_failed(
+            message,
+            error=f"{len(failed_recipients)} recipients not delivered",
+            max_attempts=outbox_config.max_attempts,
+            retry_delay_seconds=outbox_config.retry_delay_seconds,
+            retry_recipients=failed_recipients,
+        )
+        return _failure_summary(status)
+
+    outbox.mark_sent(message)
+    logger.info("  ✓ Outbox message %s sent", message.message_id)
+    return DispatchSummary(sent=1)
+
+
+def _failure_summary(status: str) -> DispatchSummary:
+    """Count a failed message as retrying or dead."""
+    if status == STATUS_DEAD:
+        return DispatchSummary(dead=1)
+    return DispatchSummary(retrying=1)
+
+
+__all__ = ["DispatchSummary", "dispatch_outbox", "open_outbox"]
@@ -1,5 +1,6 @@
 """Email preview utility for ocean report workflows."""
 
+from collections.abc import Sequence
 from pathlib import Path
 from datetime import datetime
 
@@ -9,7 +10,7 @@ def write_email_preview(
     body: str,
     sender_email: str,
     email_recipients: str,
-    bcc_recipients: list[str],
+    bcc_recipients: Sequence[str],
 ) -> Path:
     """Write email preview to files for review.
 
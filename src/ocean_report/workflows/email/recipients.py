@@ -1,33 +1,83 @@
 """Email recipient management."""
 
 import time
+from pathlib import Path
+
+from ...application import ApplicationContext
+from ...emailer.address_fetcher import (
+    RecipientSet,
+    log_recipient_issues,
+    parse_recipient_lines,
+)
+from ...emailer.suppression import SuppressionList
 from ...logger import logger
-from ...use_cases.email import get_email_recipients
+from ...use_cases.email import get_email_recipient_set
 
 
 def get_bcc_recipients(
-    *, test: bool, use_url: bool, fallback_recipients: str
-) -> list[str]:
+    *,
+    test: bool,
+    use_url: bool,
+    fallback_recipients: str,
+    context: ApplicationContext | None = None,
+) -> RecipientSet:
     """Get and parse BCC recipient list from URL or config.
 
     Args:
         test: Whether to use test recipients
         use_url: If True, fetch from URL; if False, use fallback
         fallback_recipients: Comma-separated fallback recipient string
+        context: Application context. When given, its config selects the
+            recipient source and ``email.suppression`` is applied.
 
     Returns:
-        List of cleaned email addresses
+        RecipientSet of normalized, de-duplicated, valid email addresses
     """
     if use_url:
         logger.debug("  → Fetching recipients from URL (test=%s)", test)
         fetch_start = time.time()
-        recipients_str = get_email_recipients(test_recips=test)
+        recipients = get_email_recipient_set(context=context, test_recips=test)
         logger.debug(
             "  ✓ Recipients fetched from URL in %.2f seconds",
             time.time() - fetch_start,
         )
     else:
         logger.debug("  → Using fallback recipients from config")
-        recipients_str = fallback_recipients or ""
+        recipients = parse_recipient_lines([fallback_recipients or ""])
+        log_recipient_issues(recipients)
+
+    if context is None:
+        return recipients
+    return apply_suppression(context=context, recipients=recipients)
+
+
+def apply_suppression(
+    *, context: ApplicationContext, recipients: RecipientSet
+) -> RecipientSet:
+    """Drop unsubscribed and bounced addresses listed in ``email.suppression``.
+
+    Args:
+        context: Application context containing the suppression config
+        recipients: Recipients about to be sent to
 
-    return [email.strip() for email in recipients_str.split(",") if email.strip()]
+    Returns:
+        RecipientSet without suppressed addresses
+    """
+    suppression_config = context.config.email.suppression
+    if not suppression_config.enabled or not recipients:
+        return recipients
+
+    suppression_filter = SuppressionList(
+        Path(suppression_config.path).expanduser()
+    ).load_filter(false_positive_rate=suppression_config.false_positive_rate)
+    if not len(suppression_filter):
+        return recipients
+
+    result = suppression_filter.filter(recipients)
+    if result.suppressed:
+        logger.info(
+            "  → Suppressed %d of %d recipients (unsubscribed or bounced)",
+            len(result.suppressed),
+            len(recipients),
+        )
+    return result.recipients
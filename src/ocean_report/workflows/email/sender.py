@@ -1,9 +1,13 @@
 """Email sending operations."""
 
-import time
+from collections.abc import Sequence
+
 from ...application import ApplicationContext
-from ...emailer import sender as emailer
+from ...emailer.outbox import STATUS_SENT
+from ...emailer.sender import EmailDeliveryError
 from ...logger import logger
+from .delivery import deliver_email
+from .dispatcher import dispatch_outbox, open_outbox
 from .preview import write_email_preview
 from .validator import validate_email_credentials
 
@@ -14,7 +18,7 @@ def send_or_preview_email(
     run_email: bool,
     subject: str,
     body: str,
-    bcc_recipients: list[str],
+    bcc_recipients: Sequence[str],
 ) -> None:
     """Send email via SMTP or print preview to console.
 
@@ -23,14 +27,24 @@ def send_or_preview_email(
         run_email: If True, send via SMTP; if False, print to console
         subject: Email subject line
         body: Email body content
-        bcc_recipients: List of BCC recipient email addresses
+        bcc_recipients: BCC recipient email addresses (e.g. a RecipientSet)
     """
     email_recipients = context.config.email.recipients or ""
     sender_email = context.config.email.sender
     email_password = context.config.email.password
 
-    if run_email:
-        _send_via_smtp(
+    if run_email and context.config.email.outbox.enabled:
+        _queue_and_dispatch(
+            context=context,
+            subject=subject,
+            body=body,
+            sender_email=sender_email,
+            email_password=email_password,
+            email_recipients=email_recipients,
+            bcc_recipients=bcc_recipients,
+        )
+    elif run_email:
+        deliver_email(
             context=context,
             subject=subject,
             body=body,
@@ -49,7 +63,7 @@ def send_or_preview_email(
         )
 
 
-def _send_via_smtp(  # pylint: disable=too-many-arguments
+def _queue_and_dispatch(  # pylint: disable=too-many-arguments
     *,
     context: ApplicationContext,
     subject: str,
@@ -57,35 +71,32 @@ def _send_via_smtp(  # pylint: disable=too-many-arguments
     sender_email: str | None,
     email_password: str | None,
     email_recipients: str,
-    bcc_recipients: list[str],
+    bcc_recipients: Sequence[str],
 ) -> None:
-    """Send email via SMTP server."""
-    logger.info("  → Validating email configuration...")
+    """Spool the rendered message to the outbox, then drain the outbox.
+
+    If delivery fails the message stays queued, so a later
+    ``dispatch_pending_emails`` run can resend it without re-fetching data
+    or re-rendering the template.
+    """
     validate_email_credentials(sender_email, email_password)
-    logger.debug("  ✓ Email configuration validated")
 
-    logger.info(
-        "  → Connecting to SMTP and sending to %d recipients...",
-        len(bcc_recipients),
-    )
-    logger.debug("  → Sender: %s", sender_email)
-    send_start = time.time()
-    emailer.send_email(
+    outbox = open_outbox(context)
+    message = outbox.enqueue(
         subject=subject,
         body=body,
         sender_email=sender_email,
-        email_password=email_password,
-        recipients=emailer.EmailRecipients(
-            to_email=email_recipients,
-            bcc_list=bcc_recipients,
-        ),
-        smtp_server=context.config.email.smtp_server,
-        smtp_port=context.config.email.smtp_port,
-    )
-    logger.info(
-        "  ✓ Email sent successfully via SMTP in %.2f seconds",
-        time.time() - send_start,
+        to_email=email_recipients,
+        bcc_list=bcc_recipients,
     )
+    dispatch_outbox(context=context, outbox=outbox)
+
+    stored = outbox.get(message.message_id)
+    if stored is None or stored.status != STATUS_SENT:
+        raise EmailDeliveryError(
+            f"Message {message.message_id} was not delivered and remains in the "
+            f"outbox ({outbox.path}); run dispatch_pending_emails to retry."
+        )
 
 
 def _print_preview(
@@ -94,7 +105,7 @@ def _print_preview(
     body: str,
     sender_email: str | None,
     email_recipients: str,
-    bcc_recipients: list[str],
+    bcc_recipients: Sequence[str],
 ) -> None:
     """Print email preview to console and write preview files."""
     logger.info("  → Displaying email content (NOT sending):")
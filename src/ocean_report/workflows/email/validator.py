@@ -16,6 +16,18 @@ def validate_email_credentials(sender: str | None, password: str | None) -> None
             "Email sender address is not configured. "
             "Set EMAIL_SENDER environment variable or email.sender in config."
         )
+    validate_email_password(password)
+
+
+def validate_email_password(password: str | None) -> None:
+    """Validate that the SMTP password is configured.
+
+    Args:
+        password: Email password
+
+    Raises:
+        ValueError: If the password is missing
+    """
     if not password:
         raise ValueError(
             "Email password is not configured. "
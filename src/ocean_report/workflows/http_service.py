@@ -0,0 +1,414 @@
+"""Local HTTP service exposing report data (``ocean-report http``).
+
+Dashboards want the numbers the email shows without running a report per
+page view. ``ReportService`` builds a location's report once (fetch, format
+and render, exactly as ``run_report`` does) and serves it from memory until
+``http_service.cache_ttl_seconds`` have passed:
+
+- ``GET /locations``: location names. ``default`` is the top-level
+  ``noaa``/``location`` config; every ``serve.schedules`` entry adds its own.
+- ``GET /locations/<name>/raw``: ``RawReportData`` as JSON.
+- ``GET /locations/<name>/email-data``: ``EmailTemplateData`` as JSON.
+- ``GET /locations/<name>/body``: the rendered email body.
+- ``GET /metrics``: the metrics registry in text exposition format, when
+  ``metrics.enabled`` is set.
+
+Concurrent requests for a location that is not cached wait for a single
+build instead of each calling the upstream APIs. Every response carries a
+strong ``ETag``; a client that sends it back in ``If-None-Match`` gets an
+empty ``304 Not Modified``.
+
+Builds fetch through the ``*_swr`` use cases, so with
+``stale_while_revalidate.enabled`` a rebuild can reuse recent upstream data.
+Report responses give the oldest input's age in ``Age`` and whether any
+input was served stale in ``X-Data-Stale``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import signal
+import threading
+import time
+from collections.abc import Callable, Hashable
+from concurrent.futures import Future
+from dataclasses import dataclass
+from datetime import datetime
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Generic, Optional, TypeVar, Union
+from urllib.parse import unquote, urlsplit
+
+from ..application import ApplicationContext, create_application_context
+from ..emailer.template_renderer import render_email_template
+from ..logger import flush_logger, logger
+from ..metrics import registry
+from .daemon import schedule_context
+from .data import fetch_raw_data, format_report_data
+from .data.archive import raw_report_to_dict
+from .report_runner import _configure_logger_from_settings, build_fetch_params
+
+V = TypeVar("V")
+
+DEFAULT_LOCATION = "default"
+
+CACHE_LOOKUPS = registry.counter(
+    "ocean_report_http_service_cache_lookups_total",
+    "Report cache lookups of the HTTP service by result.",
+    labelnames=("result",),
+)
+
+
+class TtlCache(Generic[V]):
+    """
+    In-memory cache whose entries expire ``ttl_seconds`` after loading.
+
+    ``get_or_load`` runs at most one loader per key at a time: callers that
+    arrive while a load is in flight wait for its result. A loader that
+    raises is not cached; its waiters get the same exception.
+    """
+
+    def __init__(
+        self, *, ttl_seconds: float, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: dict[Hashable, tuple[float, V]] = {}
+        self._loading: dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], V]) -> tuple[V, float]:
+        """
+        Return the cached value for ``key``, loading it if missing or expired.
+
+        Returns:
+            ``(value, seconds until it expires)``.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > self._clock():
+                CACHE_LOOKUPS.inc(result="hit")
+                return entry[1], entry[0] - self._clock()
+            pending = self._loading.get(key)
+            if pending is None:
+                pending = self._loading[key] = Future()
+                owner = True
+            else:
+                owner = False
+
+        if not owner:
+            CACHE_LOOKUPS.inc(result="coalesced")
+            value = pending.result()
+            expires_at = self._entries.get(key, (self._clock(), None))[0]
+            return value, max(0.0, expires_at - self._clock())
+
+        CACHE_LOOKUPS.inc(result="miss")
+        try:
+            value = loader()
+        except BaseException as exc:
+            with self._lock:
+                del self._loading[key]
+            pending.set_exception(exc)
+            raise
+        now = self._clock()
+        expires_at = now + self.ttl_seconds
+        with self._lock:
+            # Keys include the date, so expired entries are never read again.
+            expired = [
+                other
+                for other, (other_expires_at, _) in self._entries.items()
+                if other_expires_at <= now
+            ]
+            for other in expired:
+                del self._entries[other]
+            self._entries[key] = (expires_at, value)
+            del self._loading[key]
+        pending.set_result(value)
+        return value, self.ttl_seconds
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        with self._lock:
+            self._entries.clear()
+
+
+@dataclass(frozen=True)
+class Representation:
+    """One encoded response body and its ETag."""
+
+    content: bytes
+    content_type: str
+    etag: str
+
+    @classmethod
+    def of(cls, content: bytes, content_type: str) -> Representation:
+        """Wrap ``content`` with a strong ETag derived from its bytes."""
+        digest = hashlib.sha256(content).hexdigest()[:32]
+        return cls(content=content, content_type=content_type, etag=f'"{digest}"')
+
+
+@dataclass(frozen=True)
+class LocationReport:
+    """Everything the service returns for one location and day."""
+
+    location: str
+    generated_at: datetime
+    raw: Representation
+    email_data: Representation
+    body: Representation
+    data_age_seconds: float = 0.0
+    stale: bool = False
+
+    def representation(self, view: str) -> Optional[Representation]:
+        """The ``raw``, ``email-data`` or ``body`` representation."""
+        return {
+            "raw": self.raw,
+            "email-data": self.email_data,
+            "body": self.body,
+        }.get(view)
+
+    def age_seconds(self) -> float:
+        """Age of the oldest upstream input now, for the ``Age`` header."""
+        built_ago = (datetime.now() - self.generated_at).total_seconds()
+        return self.data_age_seconds + max(0.0, built_ago)
+
+
+class ReportService:
+    """
+    Builds and caches reports per location on one shared context.
+
+    Args:
+        context: Context whose config and pooled client every build uses.
+        ttl_seconds: How long a built report is served from memory.
+            Defaults to ``http_service.cache_ttl_seconds``.
+        clock: Monotonic clock for the cache; injectable for tests.
+    """
+
+    def __init__(
+        self,
+        *,
+        context: ApplicationContext,
+        ttl_seconds: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        config = context.config
+        self.context = context
+        self.locations: dict[str, ApplicationContext] = {DEFAULT_LOCATION: context}
+        for schedule in config.serve.schedules:
+            self.locations[schedule.name] = schedule_context(context, schedule)
+        if ttl_seconds is None:
+            ttl_seconds = config.http_service.cache_ttl_seconds
+        self.cache: TtlCache[LocationReport] = TtlCache(
+            ttl_seconds=ttl_seconds, clock=clock
+        )
+
+    def report(self, location: str) -> tuple[LocationReport, float]:
+        """
+        Return today's report for ``location`` and its remaining cache life.
+
+        Raises:
+            KeyError: If the location is not configured.
+        """
+        location_context = self.locations[location]
+        date_str = datetime.now().strftime("%Y%m%d")
+        # The date is part of the key so reports roll over at midnight.
+        return self.cache.get_or_load(
+            (location, date_str),
+            lambda: self._build(location, location_context, date_str),
+        )
+
+    def _build(
+        self, location: str, context: ApplicationContext, date_str: str
+    ) -> LocationReport:
+        logger.info("Building report for location %s", location)
+        settings = context.config
+        raw_data = fetch_raw_data(
+            context, build_fetch_params(settings, date_str), serve_stale=True
+        )
+        email_data = format_report_data(raw_data)
+        body = render_email_template(
+            data=email_data, template_path=settings.reporting.template_path
+        )
+        return LocationReport(
+            location=location,
+            generated_at=datetime.now(),
+            raw=Representation.of(
+                _json_bytes(raw_report_to_dict(raw_data)), "application/json"
+            ),
+            email_data=Representation.of(
+                email_data.model_dump_json().encode("utf-8"), "application/json"
+            ),
+            body=Representation.of(body.encode("utf-8"), "text/plain; charset=utf-8"),
+            data_age_seconds=raw_data.data_age_seconds,
+            stale=raw_data.stale,
+        )
+
+
+class ReportRequestHandler(BaseHTTPRequestHandler):
+    """Routes GET requests to the server's ``ReportService``."""
+
+    server: ReportHTTPServer
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:  # pylint: disable=invalid-name
+        """Serve the location list or one representation of a location."""
+        parts = [unquote(part) for part in urlsplit(self.path).path.split("/") if part]
+        service = self.server.service
+        if parts == ["metrics"] and registry.enabled:
+            content = registry.to_openmetrics().encode("utf-8")
+            self._send(
+                Representation.of(content, "text/plain; version=0.0.4"), max_age=0
+            )
+            return
+        if parts == ["locations"]:
+            self._send(
+                Representation.of(
+                    _json_bytes(sorted(service.locations)), "application/json"
+                ),
+                max_age=0,
+            )
+            return
+        if len(parts) != 3 or parts[0] != "locations":
+            self._send_error(HTTPStatus.NOT_FOUND, "Unknown path")
+            return
+        location, view = parts[1], parts[2]
+        if location not in service.locations:
+            self._send_error(HTTPStatus.NOT_FOUND, f"Unknown location: {location}")
+            return
+        if view not in ("raw", "email-data", "body"):
+            self._send_error(HTTPStatus.NOT_FOUND, f"Unknown view: {view}")
+            return
+        try:
+            report, ttl = service.report(location)
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            logger.error("  ⚠ Report for %s failed: %s", location, exc, exc_info=True)
+            self._send_error(HTTPStatus.BAD_GATEWAY, str(exc))
+            return
+        self._send(
+            report.representation(view),
+            max_age=int(ttl),
+            headers={
+                "Age": str(int(report.age_seconds())),
+                "X-Data-Stale": "true" if report.stale else "false",
+            },
+        )
+
+    # pylint: disable-next=redefined-builtin
+    def log_message(self, format: str, *args: Any) -> None:
+        """Send access log lines to the package logger at DEBUG."""
+        logger.debug("http %s - %s", self.address_string(), format % args)
+
+    def _send(
+        self,
+        representation: Representation,
+        *,
+        max_age: int,
+        headers: Optional[dict[str, str]] = None,
+    ) -> None:
+        not_modified = _etag_matches(
+            self.headers.get("If-None-Match"), representation.etag
+        )
+        self.send_response(HTTPStatus.NOT_MODIFIED if not_modified else HTTPStatus.OK)
+        self.send_header("ETag", representation.etag)
+        self.send_header("Cache-Control", f"max-age={max_age}")
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        if not_modified:
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_header("Content-Type", representation.content_type)
+        self.send_header("Content-Length", str(len(representation.content)))
+        self.end_headers()
+        self.wfile.write(representation.content)
+
+    def _send_error(self, status: HTTPStatus, message: str) -> None:
+        content = _json_bytes({"error": message})
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+
+class ReportHTTPServer(ThreadingHTTPServer):
+    """Threaded HTTP server bound to one ``ReportService``."""
+
+    def __init__(self, address: tuple[str, int], service: ReportService) -> None:
+        super().__init__(address, ReportRequestHandler)
+        self.service = service
+
+
+def serve_http(
+    *,
+    cfg_path: Union[str, Path, None] = None,
+    host: Optional[str] = None,
+    port: Optional[int] = None,
+) -> None:
+    """
+    Run the HTTP service in the foreground until SIGTERM or SIGINT.
+
+    Args:
+        cfg_path: Path to configuration file. If None, uses default config.
+        host: Listen address. Defaults to ``http_service.host``.
+        port: Listen port. Defaults to ``http_service.port``.
+    """
+    context = create_application_context(config_path=cfg_path)
+    _configure_logger_from_settings(context.config)
+    registry.enabled = context.config.metrics.enabled
+    settings = context.config.http_service
+    server = ReportHTTPServer(
+        (host or settings.host, settings.port if port is None else port),
+        ReportService(context=context),
+    )
+    stopped = threading.Event()
+
+    def handle(signum: int, _frame: Any) -> None:
+        logger.info("Received %s; shutting down", signal.Signals(signum).name)
+        stopped.set()
+
+    signal.signal(signal.SIGTERM, handle)
+    signal.signal(signal.SIGINT, handle)
+
+    # serve_forever() runs in a thread so the main thread can handle signals.
+    worker = threading.Thread(target=server.serve_forever, name="http-service")
+    worker.start()
+    logger.info(
+        "Serving %d location(s) on http://%s:%d",
+        len(server.service.locations),
+        *server.server_address[:2],
+    )
+    try:
+        stopped.wait()
+    finally:
+        server.shutdown()
+        worker.join()
+        server.server_close()
+        context.client.close()
+        flush_logger()
+
+
+def _json_bytes(value: Any) -> bytes:
+    return json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+
+def _etag_matches(header: Optional[str], etag: str) -> bool:
+    """True if an ``If-None-Match`` header matches ``etag`` (weak comparison)."""
+    if not header:
+        return False
+    candidates = [item.strip() for item in header.split(",")]
+    return "*" in candidates or any(
+        item.removeprefix("W/") == etag for item in candidates
+    )
+
+
+__all__ = [
+    "LocationReport",
+    "ReportHTTPServer",
+    "ReportService",
+    "Representation",
+    "TtlCache",
+    "serve_http",
+]
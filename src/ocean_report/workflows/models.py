@@ -27,3 +27,7 @@ class RawReportData:
     water_temp_data_time: str | None
     wind_forecast: list
     wind_timestamp: datetime | None
+    # Oldest input's age and whether any input was served stale; only set by
+    # fetch_raw_data(serve_stale=True) and not archived.
+    data_age_seconds: float = 0.0
+    stale: bool = False
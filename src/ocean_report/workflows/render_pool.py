@@ -0,0 +1,183 @@
+"""Process-pool formatting and rendering for multi-location batches.
+
+Once the API calls of a batch overlap, the rest of each report is CPU-bound
+Python: rebuilding and validating the pydantic records, the
+``template_helpers`` formatting and the Jinja render. Threads cannot run
+that in parallel under the GIL, so ``RenderPool`` runs it in worker
+processes:
+
+- each job ships to a worker as the run archive's compact JSON-primitive
+  form of ``RawReportData`` (``raw_report_to_dict``), not as pickled models;
+- each worker loads the config once and compiles the template once, in its
+  initializer, then reuses both for every job it receives;
+- jobs are sent in chunks, so the per-job IPC cost stays small next to the
+  render itself.
+
+With ``workers=1`` the jobs run in the calling process, which is also the
+baseline for ``scripts/benchmarks/render_pool.py``.
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from ..config import get_settings, get_template_path
+from ..emailer.template_renderer import get_compiled_template, render_email_template
+from ..logger import configure_logger, logger
+from ..models.email import EmailTemplateData
+from .data import format_report_data
+from .data.archive import raw_report_from_dict, raw_report_to_dict
+from .models import RawReportData
+
+# Chunks per worker per batch: enough to balance uneven jobs, few enough
+# that pickling overhead stays small.
+CHUNKS_PER_WORKER = 4
+
+_Payload = tuple[dict[str, Any], Optional[str]]
+
+
+@dataclass(frozen=True)
+class RenderJob:
+    """One location's raw data to format and render."""
+
+    location: str
+    raw_data: RawReportData
+    report_date: Optional[datetime] = None
+
+
+@dataclass(frozen=True)
+class RenderedReport:
+    """Formatted template data and rendered body of one job."""
+
+    location: str
+    email_data: EmailTemplateData
+    body: str
+
+
+class RenderPool:
+    """
+    Formats and renders batches of reports in warm worker processes.
+
+    Use as a context manager, or call ``close()``; the pool is reused
+    across ``render`` calls.
+
+    Args:
+        workers: Worker processes. ``1`` renders in the calling process.
+        template_path: Template to render. Defaults to the configured one.
+        config_path: Config file the workers load. Defaults to default
+            resolution.
+        start_method: ``multiprocessing`` start method. ``spawn`` (the
+            default) is safe with the logger and HTTP pool threads that
+            may be running in the parent.
+    """
+
+    def __init__(
+        self,
+        *,
+        workers: int,
+        template_path: Union[str, Path, None] = None,
+        config_path: Union[str, Path, None] = None,
+        start_method: str = "spawn",
+    ) -> None:
+        if workers < 1:
+            raise ValueError(f"workers must be at least 1, got: {workers}")
+        self.workers = workers
+        if template_path is None:
+            template_path = get_template_path(config_path)
+        self.template_path = str(Path(template_path).resolve())
+        self._config_path = str(config_path) if config_path is not None else None
+        self._executor: Optional[ProcessPoolExecutor] = None
+        if workers > 1:
+            self._executor = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context(start_method),
+                initializer=_init_worker,
+                initargs=(self.template_path, self._config_path),
+            )
+
+    def render(self, jobs: Sequence[RenderJob]) -> list[RenderedReport]:
+        """
+        Format and render ``jobs``, returning results in job order.
+
+        Raises:
+            Exception: The first exception raised by a job.
+        """
+        payloads = [
+            (
+                raw_report_to_dict(job.raw_data),
+                job.report_date.isoformat() if job.report_date else None,
+            )
+            for job in jobs
+        ]
+        if self._executor is None:
+            results = [
+                _render_payload(payload, self.template_path) for payload in payloads
+            ]
+        else:
+            chunksize = max(1, len(payloads) // (self.workers * CHUNKS_PER_WORKER))
+            results = list(
+                self._executor.map(
+                    _render_payload,
+                    payloads,
+                    [self.template_path] * len(payloads),
+                    chunksize=chunksize,
+                )
+            )
+        logger.info(
+            "  ✓ Rendered %d report(s) with %d worker(s)", len(jobs), self.workers
+        )
+        return [
+            RenderedReport(
+                location=job.location,
+                email_data=EmailTemplateData.model_construct(**email_data),
+                body=body,
+            )
+            for job, (email_data, body) in zip(jobs, results)
+        ]
+
+    def close(self) -> None:
+        """Shut the worker processes down."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self) -> RenderPool:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+def _init_worker(template_path: str, config_path: Optional[str]) -> None:
+    """Load the config and compile the template once per worker process."""
+    if config_path is not None:
+        # format_report_data and the renderer read get_settings().
+        os.environ["OCEAN_REPORT_CONFIG"] = config_path
+    # Per-job INFO lines from many processes would interleave on stderr.
+    configure_logger(level=logging.WARNING)
+    get_settings()
+    get_compiled_template(template_path)
+
+
+def _render_payload(
+    payload: _Payload, template_path: str
+) -> tuple[dict[str, Any], str]:
+    """Worker task: rebuild the raw data, format it and render the body."""
+    raw, report_date = payload
+    email_data = format_report_data(
+        raw_report_from_dict(raw),
+        report_date=datetime.fromisoformat(report_date) if report_date else None,
+    )
+    body = render_email_template(data=email_data, template_path=template_path)
+    return email_data.model_dump(), body
+
+
+__all__ = ["RenderJob", "RenderPool", "RenderedReport"]
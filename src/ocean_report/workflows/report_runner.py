@@ -1,21 +1,58 @@
 """Main entry point for ocean report."""
 
 import logging
-import time
 from datetime import date, datetime
 from pathlib import Path
 from typing import Union
 
-from ..application import create_application_context
+from ..application import ApplicationContext, create_application_context
 from ..emailer.template_renderer import render_email_template
-from ..logger import logger, configure_logger, LogOutput
-from .data import fetch_raw_data, format_report_data
-from .email import get_bcc_recipients, send_or_preview_email, format_email_subject
-from .models import FetchParams
+from ..logger import logger, configure_logger, flush_logger, LogOutput
+from ..metrics import registry
+from ..tracing import Span, span, tracer, write_chrome_trace
+from ..emailer.address_fetcher import RecipientSet
+from .data import RunArchive, config_fingerprint, fetch_raw_data, format_report_data
+from .email import (
+    DispatchSummary,
+    dispatch_outbox,
+    format_email_subject,
+    get_bcc_recipients,
+    open_outbox,
+    send_or_preview_email,
+)
+from .models import FetchParams, RawReportData
+from .render_pool import RenderJob, RenderPool
 
+# Wind forecast hours shown in the report.
+REPORT_FORECAST_TIMES = ("08:00", "12:00", "15:00", "18:00")
 
-def run_report(  # pylint: disable=too-many-locals,too-many-statements
-    *, cfg_path: Union[str, Path] = None, run_email: bool = True, test: bool = False
+RUN_DURATION = registry.gauge(
+    "ocean_report_run_duration_seconds", "Wall time of the last report run."
+)
+RUN_SUCCESS = registry.gauge(
+    "ocean_report_run_success", "1 if the last report run succeeded, else 0."
+)
+RUN_LAST_SUCCESS = registry.gauge(
+    "ocean_report_run_last_success_timestamp_seconds",
+    "Unix time at which the last successful report run finished.",
+)
+RENDER_DURATION = registry.histogram(
+    "ocean_report_render_duration_seconds",
+    "Time to render the report email from its template.",
+)
+REPORT_RECIPIENTS = registry.gauge(
+    "ocean_report_recipients", "Recipients resolved for the last report run."
+)
+
+
+def run_report(
+    *,
+    cfg_path: Union[str, Path] = None,
+    run_email: bool = True,
+    test: bool = False,
+    replay: Union[str, date, None] = None,
+    context: ApplicationContext | None = None,
+    render_pool: RenderPool | None = None,
 ) -> None:
     """
     Fetch tide, water temperature, and wind data, format it, and send or print an email report.
@@ -24,35 +61,105 @@ def run_report(  # pylint: disable=too-many-locals,too-many-statements
         cfg_path: Path to configuration file. If None, uses default config.
         run_email: If True, send the email. If False, print the email content.
         test: If True, use test email settings.
+        replay: Report date (``YYYYMMDD`` or date) to re-render from the run
+            archive instead of fetching live data. Replays make no network
+            calls and always preview, so ``run_email`` is ignored.
+        context: Already loaded context to run with, e.g. the ``serve``
+            daemon's warm one. Mutually exclusive with ``cfg_path``. The
+            logger is left as the caller configured it.
+        render_pool: Pool to format and render the report in, instead of
+            this process. The ``serve`` daemon passes one when
+            ``serve.render_workers`` is above 1.
     """
-    workflow_start_time = time.time()
-    logger.info("=" * 80)
-    logger.info("Starting Ocean Report Email Process...")
-    logger.info("Today is %s", date.today().strftime("%A, %B %d, %Y"))
-    logger.info(
-        "Run mode: %s | Send email: %s", "TEST" if test else "PRODUCTION", run_email
-    )
-    logger.info("=" * 80)
+    if replay is not None:
+        replay_report(cfg_path=cfg_path, report_date=replay, test=test)
+        return
 
-    # Load configuration
-    logger.info("[STEP 1/5] Loading configuration...")
-    step_start = time.time()
-    context = create_application_context(config_path=cfg_path)
+    spans: list[Span] = []
+    run_span: Span | None = None
+    succeeded = False
+    try:
+        with tracer.collect() as spans, span(
+            "report.run", test=test, send_email=run_email
+        ) as run_span:
+            logger.info("=" * 80)
+            logger.info("Starting Ocean Report Email Process...")
+            logger.info("Today is %s", date.today().strftime("%A, %B %d, %Y"))
+            logger.info(
+                "Run mode: %s | Send email: %s",
+                "TEST" if test else "PRODUCTION",
+                run_email,
+            )
+            logger.info("=" * 80)
+
+            # Load configuration
+            logger.info("[STEP 1/5] Loading configuration...")
+            with span("report.load_config") as step:
+                # A supplied context (the serve daemon's) comes with logging
+                # already configured; redoing it would restart the queue
+                # listener mid-run and drop records from other threads.
+                configure_logging = context is None
+                context = create_application_context(
+                    context=context, config_path=cfg_path
+                )
+                if configure_logging:
+                    _configure_logger_from_settings(context.config)
+                registry.enabled = context.config.metrics.enabled
+            logger.info("Configuration loaded in %.2f seconds", step.duration)
+
+            _run_report_steps(
+                context=context,
+                run_email=run_email,
+                test=test,
+                render_pool=render_pool,
+            )
+        succeeded = True
+
+        total_time = run_span.duration
+        logger.info("=" * 80)
+        logger.info("Ocean Report workflow completed successfully!")
+        logger.info(
+            "Total execution time: %.2f seconds (%.1f minutes)",
+            total_time,
+            total_time / 60,
+        )
+        logger.info("=" * 80)
+    finally:
+        if context is not None:
+            _write_trace(context=context, spans=spans)
+            _write_metrics(
+                context=context,
+                duration=run_span.duration if run_span else 0.0,
+                succeeded=succeeded,
+            )
+        # Queued log records must be written before the process can exit.
+        flush_logger()
+
+
+def _run_report_steps(  # pylint: disable=too-many-locals,too-many-statements
+    *,
+    context: ApplicationContext,
+    run_email: bool,
+    test: bool,
+    render_pool: RenderPool | None = None,
+) -> None:
+    """Run report steps 2-5 (recipients, fetch, render, send), each in a span."""
     settings = context.config
-    _configure_logger_from_settings(settings)
-    logger.info("Configuration loaded in %.2f seconds", time.time() - step_start)
 
     # Get email recipients
     logger.info("[STEP 2/5] Fetching email recipients...")
-    step_start = time.time()
-    bcc_recipients = get_bcc_recipients(
-        test=test,
-        use_url=settings.email.use_recipient_url,
-        fallback_recipients=settings.email.recipients or "",
-    )
+    with span("report.recipients", test=test) as step:
+        bcc_recipients = get_bcc_recipients(
+            test=test,
+            use_url=settings.email.use_recipient_url,
+            fallback_recipients=settings.email.recipients or "",
+            context=context,
+        )
+        step.set_attribute("recipients", len(bcc_recipients))
+    REPORT_RECIPIENTS.set(len(bcc_recipients))
     logger.info(
         "Recipients fetched in %.2f seconds (found %d recipients)",
-        time.time() - step_start,
+        step.duration,
         len(bcc_recipients),
     )
 
@@ -61,39 +168,43 @@ def run_report(  # pylint: disable=too-many-locals,too-many-statements
 
     # Fetch all report data
     logger.info("[STEP 3/5] Fetching weather data from APIs...")
-    step_start = time.time()
-    try:
-        fetch_params = FetchParams(
-            station_id=station_id,
-            date_str=today_yyyymmdd,
-            latitude=settings.location.latitude,
-            longitude=settings.location.longitude,
-            beach_facing_deg=settings.location.beach_orientation_degrees,
-            forecast_times={"08:00", "12:00", "15:00", "18:00"},
-        )
-        raw_data = fetch_raw_data(context, fetch_params)
-        email_data = format_report_data(raw_data)
-        logger.info(
-            "All data fetched successfully in %.2f seconds", time.time() - step_start
-        )
-    except Exception as e:
-        logger.error(
-            "Failed to fetch report data after %.2f seconds: %s",
-            time.time() - step_start,
-            e,
-            exc_info=True,
-        )
-        raise
+    with span("report.fetch", station=station_id, date=today_yyyymmdd) as step:
+        try:
+            fetch_params = build_fetch_params(settings, today_yyyymmdd)
+            raw_data = fetch_raw_data(context, fetch_params)
+            _archive_raw_data(
+                context=context, raw_data=raw_data, fetch_params=fetch_params
+            )
+            if render_pool is None:
+                email_data = format_report_data(raw_data)
+            logger.info(
+                "All data fetched successfully in %.2f seconds", step.duration
+            )
+        except Exception as e:
+            logger.error(
+                "Failed to fetch report data after %.2f seconds: %s",
+                step.duration,
+                e,
+                exc_info=True,
+            )
+            raise
 
     # Format email using template
     logger.info("[STEP 4/5] Rendering email from template...")
-    step_start = time.time()
-    email_body = render_email_template(
-        data=email_data, template_path=settings.reporting.template_path
-    )
+    with span("report.render") as step:
+        if render_pool is None:
+            email_body = render_email_template(
+                data=email_data, template_path=settings.reporting.template_path
+            )
+        else:
+            (rendered,) = render_pool.render(
+                [RenderJob(location=station_id, raw_data=raw_data)]
+            )
+            email_body = rendered.body
+    RENDER_DURATION.observe(step.duration)
     logger.info(
         "Email rendered in %.2f seconds (body length: %d chars)",
-        time.time() - step_start,
+        step.duration,
         len(email_body),
     )
 
@@ -104,38 +215,191 @@ def run_report(  # pylint: disable=too-many-locals,too-many-statements
 
     # Send or display email
     logger.info("[STEP 5/5] %s email...", "Sending" if run_email else "Displaying")
-    step_start = time.time()
-    try:
-        send_or_preview_email(
-            context=context,
-            run_email=run_email,
-            subject=email_subject,
-            body=email_body,
-            bcc_recipients=bcc_recipients,
+    with span("report.send" if run_email else "report.preview") as step:
+        try:
+            send_or_preview_email(
+                context=context,
+                run_email=run_email,
+                subject=email_subject,
+                body=email_body,
+                bcc_recipients=bcc_recipients,
+            )
+            logger.info(
+                "%s completed in %.2f seconds",
+                "Email sent" if run_email else "Email displayed",
+                step.duration,
+            )
+        except Exception as e:
+            logger.error(
+                "Failed to %s email after %.2f seconds: %s",
+                "send" if run_email else "display",
+                step.duration,
+                e,
+                exc_info=True,
+            )
+            raise
+
+
+def build_fetch_params(settings, date_str: str) -> FetchParams:
+    """Fetch parameters of a report for ``date_str`` (``YYYYMMDD``)."""
+    return FetchParams(
+        station_id=settings.noaa.station_id,
+        date_str=date_str,
+        latitude=settings.location.latitude,
+        longitude=settings.location.longitude,
+        beach_facing_deg=settings.location.beach_orientation_degrees,
+        forecast_times=set(REPORT_FORECAST_TIMES),
+    )
+
+
+def replay_report(
+    *,
+    cfg_path: Union[str, Path] = None,
+    report_date: Union[str, date],
+    run_id: int | None = None,
+    test: bool = False,
+) -> str:
+    """
+    Re-render and preview an archived run without any network access.
+
+    Args:
+        cfg_path: Path to configuration file. If None, uses default config.
+        report_date: Report day (``YYYYMMDD`` or date); the latest run archived
+            for that day is replayed.
+        run_id: Replay this exact archived run instead of the day's latest.
+        test: If True, mark the subject as a test.
+
+    Returns:
+        The rendered email body.
+
+    Raises:
+        ValueError: If the archive has no matching run.
+    """
+    context = create_application_context(config_path=cfg_path)
+    settings = context.config
+    _configure_logger_from_settings(settings)
+
+    archive = RunArchive(Path(settings.archive.path).expanduser())
+    archived = archive.load(report_date, run_id=run_id)
+    if archived is None:
+        raise ValueError(
+            f"No archived run for {report_date} in {archive.path}"
+            if run_id is None
+            else f"No archived run with id {run_id} in {archive.path}"
         )
-        logger.info(
-            "%s completed in %.2f seconds",
-            "Email sent" if run_email else "Email displayed",
-            time.time() - step_start,
+
+    day = datetime.strptime(archived.report_date, "%Y%m%d")
+    logger.info(
+        "Replaying archived run %d for %s (station %s, archived %s)",
+        archived.run_id,
+        day.strftime("%A, %B %d, %Y"),
+        archived.station_id,
+        datetime.fromtimestamp(archived.created_at).strftime("%Y-%m-%d %H:%M"),
+    )
+    if archived.config_hash != config_fingerprint(settings):
+        logger.warning(
+            "  ⚠ Archived run used a different configuration; "
+            "rendering with the current one"
         )
-    except Exception as e:
-        logger.error(
-            "Failed to %s email after %.2f seconds: %s",
-            "send" if run_email else "display",
-            time.time() - step_start,
-            e,
-            exc_info=True,
+
+    email_data = format_report_data(archived.raw_data, report_date=day)
+    email_body = render_email_template(
+        data=email_data, template_path=settings.reporting.template_path
+    )
+    send_or_preview_email(
+        context=context,
+        run_email=False,
+        subject=format_email_subject(
+            subject_name=settings.reporting.subject, today=day.date(), test=test
+        ),
+        body=email_body,
+        bcc_recipients=RecipientSet(),
+    )
+    return email_body
+
+
+def dispatch_pending_emails(
+    *, cfg_path: Union[str, Path] = None, workers: int | None = None
+) -> DispatchSummary:
+    """
+    Deliver messages left in the outbox by earlier runs.
+
+    Only SMTP work happens here: queued messages are already rendered, so no
+    API data is fetched and no template is rendered.
+
+    Args:
+        cfg_path: Path to configuration file. If None, uses default config.
+        workers: Number of parallel dispatch workers. Defaults to config.
+
+    Returns:
+        DispatchSummary with sent, retrying, and dead message counts.
+    """
+    context = create_application_context(config_path=cfg_path)
+    _configure_logger_from_settings(context.config)
+    outbox = open_outbox(context)
+    logger.info("Outbox status before dispatch: %s", outbox.counts())
+    return dispatch_outbox(
+        context=context, outbox=outbox, workers=workers, ignore_schedule=True
+    )
+
+
+def _archive_raw_data(
+    *,
+    context: ApplicationContext,
+    raw_data: RawReportData,
+    fetch_params: FetchParams,
+) -> None:
+    """Save the run's raw inputs to the run archive; never fails the run."""
+    archive_config = context.config.archive
+    if not archive_config.enabled:
+        return
+    try:
+        run_id = RunArchive(Path(archive_config.path).expanduser()).save(
+            raw_data,
+            report_date=fetch_params.date_str,
+            station_id=fetch_params.station_id,
+            config_hash=config_fingerprint(context.config),
         )
-        raise
+    except Exception as exc:  # pylint: disable=broad-exception-caught
+        logger.warning("  ⚠ Could not archive raw report data: %s", exc)
+        return
+    logger.info("  ✓ Raw report data archived as run %d", run_id)
 
-    # Final summary
-    total_time = time.time() - workflow_start_time
-    logger.info("=" * 80)
-    logger.info("Ocean Report workflow completed successfully!")
-    logger.info(
-        "Total execution time: %.2f seconds (%.1f minutes)", total_time, total_time / 60
+
+def _write_trace(*, context: ApplicationContext, spans: list[Span]) -> None:
+    """Export the run's spans as Chrome trace JSON when tracing is enabled."""
+    tracing_config = context.config.tracing
+    if not tracing_config.enabled or not spans:
+        return
+    path = Path(tracing_config.directory).expanduser() / (
+        f"report-{datetime.now():%Y%m%d-%H%M%S}.trace.json"
     )
-    logger.info("=" * 80)
+    try:
+        write_chrome_trace(path, spans)
+    except OSError as exc:
+        logger.warning("  ⚠ Could not write trace file: %s", exc)
+        return
+    logger.info("  ✓ Trace with %d spans written to %s", len(spans), path)
+
+
+def _write_metrics(
+    *, context: ApplicationContext, duration: float, succeeded: bool
+) -> None:
+    """Record run-level metrics and write the OpenMetrics textfile when enabled."""
+    metrics_config = context.config.metrics
+    if not metrics_config.enabled:
+        return
+    RUN_DURATION.set(duration)
+    RUN_SUCCESS.set(1 if succeeded else 0)
+    if succeeded:
+        RUN_LAST_SUCCESS.set(datetime.now().timestamp())
+    path = Path(metrics_config.textfile_path).expanduser()
+    try:
+        registry.write_textfile(path)
+    except OSError as exc:
+        logger.warning("  ⚠ Could not write metrics textfile: %s", exc)
+        return
+    logger.info("  ✓ Metrics written to %s", path)
 
 
 def _configure_logger_from_settings(settings) -> None:
@@ -157,6 +421,12 @@ def _configure_logger_from_settings(settings) -> None:
 
     output = log_output_map.get(settings.logging.output.lower(), LogOutput.CONSOLE)
     level = log_level_map.get(settings.logging.level.upper(), logging.INFO)
+    handler_options = {
+        "queued": settings.logging.queued,
+        "json_output": settings.logging.json_output,
+        "max_bytes": settings.logging.max_bytes,
+        "backup_count": settings.logging.backup_count,
+    }
 
     if output in (LogOutput.FILE, LogOutput.BOTH):
         configure_logger(
@@ -164,13 +434,15 @@ def _configure_logger_from_settings(settings) -> None:
             log_file=settings.logging.file_path,
             level=level,
             log_format=settings.logging.format,
+            **handler_options,
         )
     else:
         configure_logger(
             output=output,
             level=level,
             log_format=settings.logging.format,
+            **handler_options,
         )
 
 
-__all__ = ["run_report"]
+__all__ = ["run_report", "replay_report", "dispatch_pending_emails"]
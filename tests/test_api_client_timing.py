@@ -0,0 +1,95 @@
+"""Tests for per-request HTTP phase timing in ApiClient."""
+
+import gzip
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from ocean_report.api_client.client import ApiClient
+from ocean_report.metrics import registry
+
+BODY = b'{"predictions": []}' * 200
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, so connections can be reused
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Answer after a short think-time, gzip'd when the client accepts it."""
+        time.sleep(0.05)
+        payload = BODY
+        gzipped = "gzip" in self.headers.get("Accept-Encoding", "")
+        if gzipped:
+            payload = gzip.compress(BODY)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        if gzipped:
+            self.send_header("Content-Encoding", "gzip")
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        """Keep test output quiet."""
+
+
+@pytest.fixture
+def server_url():
+    """Local keep-alive HTTP server."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/data"
+    server.shutdown()
+    server.server_close()
+
+
+def test_response_carries_phase_timing_and_byte_counts(server_url):
+    """Test phases add up and gzip'd wire bytes are smaller than decoded."""
+    with ApiClient(max_retries=0) as client:
+        response = client.get(server_url)
+
+    timing = response.timing
+    assert timing.host == "127.0.0.1"
+    assert timing.connections_opened == 1
+    assert not timing.connection_reused
+    assert timing.wait >= 0.045  # server think-time
+    assert timing.tls == 0.0  # plain HTTP
+    assert sum(timing.phases().values()) <= timing.total + 1e-3
+    assert timing.decoded_bytes == len(BODY)
+    assert 0 < timing.wire_bytes < timing.decoded_bytes
+    assert timing.attempts == 1
+
+
+def test_second_request_reuses_the_pooled_connection(server_url):
+    """Test a keep-alive request opens no connection and spends no connect time."""
+    with ApiClient(max_retries=0) as client:
+        client.get(server_url)
+        response = client.get(server_url)
+
+    assert response.timing.connection_reused
+    assert response.timing.dns == 0.0
+    assert response.timing.connect == 0.0
+
+
+def test_phase_timings_feed_metrics(server_url):
+    """Test each phase is observed per host while metrics are enabled."""
+    registry.reset()
+    registry.enabled = True
+    try:
+        with ApiClient(max_retries=0) as client:
+            client.get(server_url)
+        text = registry.to_openmetrics()
+    finally:
+        registry.enabled = False
+        registry.reset()
+
+    for phase in ("dns", "connect", "tls", "send", "wait", "download"):
+        assert (
+            "ocean_report_http_phase_duration_seconds_count"
+            f'{{host="127.0.0.1",phase="{phase}"}} 1'
+        ) in text
+    assert 'ocean_report_http_connections_opened_total{host="127.0.0.1"} 1' in text
+    assert 'ocean_report_http_wire_bytes_total{host="127.0.0.1"}' in text
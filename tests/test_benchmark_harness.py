@@ -0,0 +1,67 @@
+"""Tests for the micro-benchmark harness and its regression check."""
+
+import pytest
+
+from ocean_report.testing.benchmark import (
+    BenchmarkResult,
+    compare,
+    load_results,
+    mann_whitney_greater,
+    measure,
+    save_results,
+)
+
+# Deterministic "timings": a base level with a fixed spread pattern.
+NOISE = [0.00, 0.03, -0.02, 0.05, -0.04, 0.01, -0.01, 0.02, -0.03, 0.04] * 2
+
+
+def _result(level, name="bench"):
+    return BenchmarkResult(name=name, samples=tuple(level * (1 + n) for n in NOISE))
+
+
+def test_measure_calibrates_loops_and_records_samples():
+    """Test warmup, loop calibration and per-call sample count."""
+    calls = []
+    result = measure(
+        "append", lambda: calls.append(1), samples=7, warmup=2, min_sample_time=0.001
+    )
+
+    assert len(result.samples) == 7
+    assert result.loops > 1
+    assert len(calls) >= 2 + 7 * result.loops
+    assert result.median > 0
+    assert result.iqr >= 0
+
+
+def test_mann_whitney_detects_shifts_only():
+    """Test p-values for shifted, identical and fully tied samples."""
+    assert mann_whitney_greater(_result(1.2).samples, _result(1.0).samples) < 1e-6
+    assert mann_whitney_greater(_result(1.0).samples, _result(1.2).samples) > 0.99
+    assert mann_whitney_greater(_result(1.0).samples, _result(1.0).samples) > 0.4
+    assert mann_whitney_greater([1.0] * 5, [1.0] * 5) == 1.0
+
+
+def test_compare_requires_significance_and_threshold():
+    """Test that small or noisy slowdowns are not reported."""
+    baseline = _result(1.0)
+
+    assert compare(baseline, _result(1.25)).regressed
+    # Significant, but below the 10% threshold.
+    small = compare(baseline, _result(1.05))
+    assert small.p_value < 0.01 and not small.regressed
+    # Large median jump, but only three samples: not significant.
+    noisy = BenchmarkResult(name="bench", samples=(0.9, 1.4, 1.5))
+    assert not compare(baseline, noisy).regressed
+    assert compare(baseline, _result(0.8)).ratio == pytest.approx(0.8)
+
+
+def test_results_round_trip(tmp_path):
+    """Test saving and loading baseline JSON."""
+    path = tmp_path / "baseline.json"
+    save_results(path, [_result(1.0, "a"), _result(2.0, "b")])
+
+    loaded = load_results(path)
+
+    assert sorted(loaded) == ["a", "b"]
+    assert loaded["b"].samples == _result(2.0).samples
+    assert loaded["a"].median == pytest.approx(_result(1.0).median)
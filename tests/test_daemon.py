@@ -0,0 +1,175 @@
+"""Tests for cron schedules and the ``ocean-report serve`` daemon."""
+
+import os
+import threading
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+from zoneinfo import ZoneInfo
+
+import pytest
+from pydantic import ValidationError
+
+from ocean_report.config.schemas import AppConfig
+from ocean_report.utils.cron import CronSchedule
+from ocean_report.workflows.daemon import ReportDaemon
+
+NEW_YORK = ZoneInfo("America/New_York")
+
+CONFIG = """
+serve:
+  config_poll_seconds: 5
+  schedules:
+    - name: brigantine
+      cron: "0 6 * * *"
+      timezone: America/New_York
+      send_email: false
+    - name: cape-may
+      cron: "30 6 * * mon-fri"
+      timezone: America/New_York
+      station_id: "8536110"
+      latitude: 38.93
+"""
+
+
+class FakeClock:
+    """Settable clock for the daemon."""
+
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text(CONFIG, encoding="utf-8")
+    return path
+
+
+def test_cron_next_after_follows_wall_clock_across_dst():
+    """Test weekday ranges, skipped spring-forward times and the repeated hour."""
+    weekdays = CronSchedule.parse("0 6 * * mon-fri")
+    saturday = datetime(2026, 10, 17, 7, tzinfo=NEW_YORK)
+    assert weekdays.next_after(saturday, NEW_YORK) == datetime(
+        2026, 10, 19, 6, tzinfo=NEW_YORK
+    )
+
+    # 02:30 does not exist on 2026-03-08 in New York; that day is skipped.
+    gap = CronSchedule.parse("30 2 * * *")
+    assert gap.next_after(datetime(2026, 3, 7, 12, tzinfo=NEW_YORK), NEW_YORK) == (
+        datetime(2026, 3, 9, 2, 30, tzinfo=NEW_YORK)
+    )
+
+    # 01:30 happens twice on 2026-11-01; it runs once, at the first one.
+    repeated = CronSchedule.parse("30 1 * * *")
+    first = repeated.next_after(datetime(2026, 10, 31, 12, tzinfo=NEW_YORK), NEW_YORK)
+    assert first.utcoffset() == timedelta(hours=-4)
+    following = repeated.next_after(first, NEW_YORK)
+    assert following.date().isoformat() == "2026-11-02"
+
+
+def test_invalid_cron_and_time_zone_are_rejected():
+    """Test bad schedules fail config validation."""
+    with pytest.raises(ValueError):
+        CronSchedule.parse("0 25 * * *")
+    with pytest.raises(ValueError):
+        CronSchedule.parse("0 6 * *")
+    with pytest.raises(ValidationError):
+        AppConfig.model_validate(
+            {"serve": {"schedules": [{"name": "a", "cron": "61 * * * *"}]}}
+        )
+    with pytest.raises(ValidationError):
+        AppConfig.model_validate(
+            {"serve": {"schedules": [{"name": "a", "timezone": "Mars/Olympus"}]}}
+        )
+    daily = CronSchedule.parse("@daily")
+    assert (daily.minutes, daily.hours) == (frozenset({0}), frozenset({0}))
+
+
+def test_daemon_runs_due_jobs_with_location_overrides(config_file):
+    """Test due jobs run on the shared client and a failure does not stop others."""
+    clock = FakeClock(datetime(2026, 10, 19, 9, 0, tzinfo=timezone.utc))  # 05:00 ET
+    runner = Mock(side_effect=[RuntimeError("NOAA down"), None])
+    daemon = ReportDaemon(cfg_path=config_file, runner=runner, clock=clock)
+
+    assert daemon.run_due_jobs() == 0
+    assert daemon.seconds_until_next() == 5
+
+    clock.now += timedelta(hours=1, minutes=45)  # 06:45 ET
+    assert daemon.run_due_jobs() == 2
+
+    first, second = (call.kwargs for call in runner.call_args_list)
+    assert first["run_email"] is False
+    assert second["context"].config.noaa.station_id == "8536110"
+    assert second["context"].config.location.latitude == 38.93
+    assert second["context"].client is daemon.context.client
+    assert [job.next_run for job in daemon.jobs] == [
+        datetime(2026, 10, 20, 6, tzinfo=NEW_YORK),
+        datetime(2026, 10, 20, 6, 30, tzinfo=NEW_YORK),
+    ]
+
+
+def test_daemon_reloads_changed_config_and_keeps_it_when_invalid(config_file):
+    """Test hot reload applies new schedules and ignores a broken file."""
+    clock = FakeClock(datetime(2026, 10, 19, 9, 0, tzinfo=timezone.utc))
+    daemon = ReportDaemon(cfg_path=config_file, runner=Mock(), clock=clock)
+    original_client = daemon.context.client
+    assert daemon.reload_if_changed() is False
+
+    config_file.write_text(
+        CONFIG.replace("0 6 * * *", "15 7 * * *"), encoding="utf-8"
+    )
+    stat = config_file.stat()
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert daemon.reload_if_changed() is True
+    assert daemon.context.client is not original_client
+    assert daemon.jobs[0].next_run == datetime(2026, 10, 19, 7, 15, tzinfo=NEW_YORK)
+
+    config_file.write_text("serve:\n  bogus: 1\n", encoding="utf-8")
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2 * 10**9))
+    assert daemon.reload_if_changed() is False
+    assert [job.name for job in daemon.jobs] == ["brigantine", "cape-may"]
+
+
+def test_serve_forever_finishes_the_current_run_then_exits(config_file):
+    """Test stop() during a run lets it finish and closes the HTTP client."""
+    clock = FakeClock(datetime(2026, 10, 19, 9, 0, tzinfo=timezone.utc))
+    daemon = ReportDaemon(cfg_path=config_file, runner=Mock(), clock=clock)
+    daemon.context.client.close = Mock()
+    clock.now += timedelta(hours=1, minutes=45)
+    daemon._runner.side_effect = lambda **_: daemon.stop()
+
+    daemon.serve_forever()
+
+    assert daemon._runner.call_count == 1
+    daemon.context.client.close.assert_called_once()
+
+
+def test_render_pool_runs_jobs_due_together_concurrently(config_file, monkeypatch):
+    """Test render_workers > 1 overlaps due runs and hands them the pool."""
+    config_file.write_text(
+        CONFIG.replace("serve:\n", "serve:\n  render_workers: 4\n"),
+        encoding="utf-8",
+    )
+    pool_class = Mock()
+    monkeypatch.setattr("ocean_report.workflows.daemon.RenderPool", pool_class)
+    clock = FakeClock(datetime(2026, 10, 19, 9, 0, tzinfo=timezone.utc))
+    both_running = threading.Barrier(2, timeout=5)
+    runner = Mock(side_effect=lambda **_: both_running.wait())
+    daemon = ReportDaemon(cfg_path=config_file, runner=runner, clock=clock)
+
+    clock.now += timedelta(hours=1, minutes=45)
+    assert daemon.run_due_jobs() == 2
+    assert not both_running.broken
+    assert all(
+        call.kwargs["render_pool"] is pool_class.return_value
+        for call in runner.call_args_list
+    )
+    pool_class.assert_called_once_with(workers=4, config_path=daemon.config_path)
+
+    daemon.context.client.close = Mock()
+    daemon.stop()
+    daemon.serve_forever()
+    pool_class.return_value.close.assert_called_once()
@@ -0,0 +1,248 @@
+"""Tests for the durable email outbox and its dispatcher."""
+
+from unittest.mock import Mock, patch
+import pytest
+
+from ocean_report.application.context import ApplicationContext
+from ocean_report.config.schemas import (
+    AppConfig,
+    DeliveryConfig,
+    EmailConfig,
+    OutboxConfig,
+)
+from ocean_report.emailer.outbox import (
+    STATUS_DEAD,
+    STATUS_PENDING,
+    STATUS_SENDING,
+    STATUS_SENT,
+    Outbox,
+    OutboxLeaseLostError,
+)
+from ocean_report.emailer.sender import EmailDeliveryError
+from ocean_report.workflows.email import dispatch_outbox, send_or_preview_email
+
+
+@pytest.fixture
+def outbox(tmp_path):
+    """Create an empty outbox in a temporary directory."""
+    return Outbox(tmp_path / "outbox.sqlite3")
+
+
+@pytest.fixture
+def outbox_context(tmp_path):
+    """Create a context with the outbox enabled."""
+    config = AppConfig(
+        email=EmailConfig(
+            smtp_server="smtp.example.com",
+            smtp_port=587,
+            sender="sender@example.com",
+            password="test_password",
+            outbox=OutboxConfig(
+                enabled=True,
+                path=str(tmp_path / "outbox.sqlite3"),
+                max_attempts=3,
+                retry_delay_seconds=60,
+            ),
+        )
+    )
+    return ApplicationContext(config=config, client=Mock())
+
+
+def test_enqueue_and_claim_round_trip(outbox):
+    """Test that a queued message is claimed with its rendered content."""
+    queued = outbox.enqueue(
+        subject="Subject",
+        body="Rendered body",
+        sender_email="sender@example.com",
+        bcc_list=["a@example.com", "b@example.com"],
+    )
+
+    claimed = outbox.claim(worker_id="w1", limit=5)
+
+    assert [m.message_id for m in claimed] == [queued.message_id]
+    assert claimed[0].body == "Rendered body"
+    assert claimed[0].bcc_list == ("a@example.com", "b@example.com")
+    assert claimed[0].attempts == 1
+
+    # A leased message is not handed to another worker
+    assert outbox.claim(worker_id="w2") == []
+
+
+def test_mark_failed_reschedules_then_marks_dead(outbox):
+    """Test retry scheduling and dead-lettering after max attempts."""
+    outbox.enqueue(subject="S", body="B", sender_email="s@example.com")
+
+    first = outbox.claim(worker_id="w1")[0]
+    assert (
+        outbox.mark_failed(first, error="boom", max_attempts=2, retry_delay_seconds=0)
+        == STATUS_PENDING
+    )
+
+    second = outbox.claim(worker_id="w1")[0]
+    assert second.attempts == 2
+    assert (
+        outbox.mark_failed(second, error="boom", max_attempts=2, retry_delay_seconds=0)
+        == STATUS_DEAD
+    )
+    assert outbox.claim(worker_id="w1") == []
+    assert outbox.get(first.message_id).last_error == "boom"
+
+
+def test_mark_failed_keeps_only_retry_recipients(outbox):
+    """Test that a partial delivery only retries the failed recipients."""
+    outbox.enqueue(
+        subject="S",
+        body="B",
+        sender_email="s@example.com",
+        bcc_list=["ok@example.com", "bad@example.com"],
+    )
+    claimed = outbox.claim(worker_id="w1")[0]
+
+    outbox.mark_failed(
+        claimed,
+        error="partial",
+        max_attempts=3,
+        retry_delay_seconds=0,
+        retry_recipients=["bad@example.com"],
+    )
+
+    assert outbox.claim(worker_id="w1")[0].bcc_list == ("bad@example.com",)
+
+
+def test_expired_lease_owner_cannot_record_outcomes(tmp_path):
+    """Test a re-claimed message rejects updates from its previous worker."""
+    outbox = Outbox(tmp_path / "outbox.sqlite3", lease_seconds=-1)
+    outbox.enqueue(subject="S", body="B", sender_email="s@example.com")
+    stale = outbox.claim(worker_id="w1")[0]
+    current = outbox.claim(worker_id="w2")[0]
+
+    with pytest.raises(OutboxLeaseLostError):
+        outbox.renew_lease(stale)
+    with pytest.raises(OutboxLeaseLostError):
+        outbox.mark_sent(stale)
+    with pytest.raises(OutboxLeaseLostError):
+        outbox.mark_failed(stale, error="late", max_attempts=3, retry_delay_seconds=0)
+
+    outbox.mark_sent(current)
+    assert outbox.get(current.message_id).status == STATUS_SENT
+    with pytest.raises(OutboxLeaseLostError):
+        outbox.mark_sent(current)  # already recorded
+
+
+def test_dispatch_stops_chunked_send_when_lease_is_lost(outbox_context):
+    """Test the lease is renewed per chunk and a lost lease stops the send."""
+    context = ApplicationContext(
+        config=outbox_context.config.model_copy(
+            update={
+                "email": outbox_context.config.email.model_copy(
+                    update={
+                        "delivery": DeliveryConfig(
+                            mode="chunked", chunk_size=1, max_connections=1
+                        )
+                    }
+                )
+            }
+        ),
+        client=Mock(),
+    )
+    path = context.config.email.outbox.path
+    outbox = Outbox(path, lease_seconds=-1)  # every lease is already expired
+    queued = outbox.enqueue(
+        subject="S",
+        body="B",
+        sender_email="sender@example.com",
+        bcc_list=["a@example.com", "b@example.com", "c@example.com"],
+    )
+
+    def steal_lease(*_args, **_kwargs):
+        Outbox(path).claim(worker_id="other")
+        return {}
+
+    with patch("smtplib.SMTP") as mock_smtp:
+        mock_smtp.return_value.send_message.side_effect = steal_lease
+        summary = dispatch_outbox(context=context, outbox=outbox)
+
+    assert (summary.sent, summary.lost) == (0, 1)
+    assert mock_smtp.return_value.send_message.call_count == 1
+    message = outbox.get(queued.message_id)
+    assert (message.status, message.lease_owner) == (STATUS_SENDING, "other")
+
+
+def test_dispatch_outbox_sends_without_rendering(outbox_context, outbox):
+    """Test that dispatch delivers queued messages with stored content."""
+    outbox = Outbox(outbox_context.config.email.outbox.path)
+    queued = outbox.enqueue(
+        subject="Queued", body="Stored body", sender_email="sender@example.com"
+    )
+
+    with patch("ocean_report.workflows.email.delivery.emailer.send_email") as mock_send:
+        summary = dispatch_outbox(context=outbox_context, outbox=outbox, workers=2)
+
+    assert summary.sent == 1
+    assert mock_send.call_args.kwargs["body"] == "Stored body"
+    assert outbox.get(queued.message_id).status == STATUS_SENT
+
+
+def test_dispatch_without_password_claims_nothing(outbox_context):
+    """Test missing SMTP credentials fail the drain before any lease is taken."""
+    context = ApplicationContext(
+        config=outbox_context.config.model_copy(
+            update={
+                "email": outbox_context.config.email.model_copy(
+                    update={"password": None}
+                )
+            }
+        ),
+        client=Mock(),
+    )
+    outbox = Outbox(context.config.email.outbox.path)
+    outbox.enqueue(subject="S", body="B", sender_email="sender@example.com")
+
+    with pytest.raises(ValueError, match="password"):
+        dispatch_outbox(context=context, outbox=outbox, workers=2)
+    assert outbox.counts() == {STATUS_PENDING: 1}
+
+
+def test_unsendable_message_is_dead_and_drain_continues(outbox_context):
+    """Test a message without a sender does not stop the other workers."""
+    outbox = Outbox(outbox_context.config.email.outbox.path)
+    broken = outbox.enqueue(subject="S", body="B", sender_email="")
+    good = outbox.enqueue(subject="S", body="B", sender_email="sender@example.com")
+
+    with patch("ocean_report.workflows.email.delivery.emailer.send_email"):
+        summary = dispatch_outbox(context=outbox_context, outbox=outbox, workers=2)
+
+    assert (summary.sent, summary.dead) == (1, 1)
+    assert outbox.get(broken.message_id).status == STATUS_DEAD
+    assert outbox.get(good.message_id).status == STATUS_SENT
+    assert outbox.counts().get(STATUS_SENDING, 0) == 0
+
+
+def test_send_or_preview_email_leaves_message_queued_on_failure(outbox_context):
+    """Test that a failed send keeps the rendered message for a later dispatch."""
+
+    with patch("ocean_report.workflows.email.delivery.emailer.send_email") as mock_send:
+        mock_send.side_effect = OSError("SMTP down")
+
+        with pytest.raises(EmailDeliveryError):
+            send_or_preview_email(
+                context=outbox_context,
+                run_email=True,
+                subject="Subject",
+                body="Body",
+                bcc_recipients=["a@example.com"],
+            )
+
+    outbox = Outbox(outbox_context.config.email.outbox.path)
+    assert outbox.counts() == {STATUS_PENDING: 1}
+
+    # The retry is scheduled for later, so a regular drain leaves it alone
+    assert dispatch_outbox(context=outbox_context, outbox=outbox).sent == 0
+
+    with patch("ocean_report.workflows.email.delivery.emailer.send_email") as mock_send:
+        summary = dispatch_outbox(
+            context=outbox_context, outbox=outbox, ignore_schedule=True
+        )
+
+    assert summary.sent == 1
+    assert mock_send.call_args.kwargs["subject"] == "Subject"
@@ -3,10 +3,17 @@
 These tests demonstrate the pattern for testing the emailer module.
 """
 
+import smtplib
 from unittest.mock import Mock, patch, MagicMock
 import pytest
 
-from ocean_report.emailer.sender import EmailRecipients, send_email
+from ocean_report.emailer.sender import (
+    EmailDeliveryError,
+    EmailRecipients,
+    chunk_recipients,
+    send_email,
+    send_email_chunked,
+)
 
 
 def test_email_recipients_creation():
@@ -65,3 +72,124 @@ def test_send_email_with_valid_params():
         mock_smtp.assert_called_once_with("smtp.example.com", 587)
         mock_server.starttls.assert_called_once()
         mock_server.login.assert_called_once_with("sender@example.com", "test_password")
+
+
+def test_chunk_recipients_splits_and_drops_empty():
+    """Test that recipients are split into envelope chunks."""
+    chunks = chunk_recipients(["a@x.com", "", "b@x.com", "c@x.com"], chunk_size=2)
+
+    assert chunks == [["a@x.com", "b@x.com"], ["c@x.com"]]
+
+
+def test_chunk_recipients_rejects_invalid_size():
+    """Test that a non-positive chunk size is rejected."""
+    with pytest.raises(ValueError, match="chunk_size"):
+        chunk_recipients(["a@x.com"], chunk_size=0)
+
+
+def test_send_email_chunked_uses_envelope_without_bcc_header():
+    """Test chunked delivery sends each chunk in the envelope only."""
+    recipients = EmailRecipients(
+        to_email="", bcc_list=[f"user{i}@example.com" for i in range(5)]
+    )
+
+    with patch("smtplib.SMTP") as mock_smtp:
+        mock_server = MagicMock()
+        mock_server.send_message.return_value = {}
+        mock_smtp.return_value = mock_server
+
+        report = send_email_chunked(
+            sender_email="sender@example.com",
+            email_password="test_password",
+            recipients=recipients,
+            smtp_server="smtp.example.com",
+            smtp_port=587,
+            chunk_size=2,
+            max_connections=1,
+        )
+
+    assert report.delivered == 5
+    assert report.failed == 0
+    assert len(report.chunks) == 3
+
+    # One reused connection for a single worker
+    mock_smtp.assert_called_once_with("smtp.example.com", 587)
+    envelopes = [c.kwargs["to_addrs"] for c in mock_server.send_message.call_args_list]
+    assert envelopes == [
+        ["user0@example.com", "user1@example.com"],
+        ["user2@example.com", "user3@example.com"],
+        ["user4@example.com"],
+    ]
+    sent_msg = mock_server.send_message.call_args.args[0]
+    assert sent_msg["Bcc"] is None
+    assert sent_msg["To"] == "undisclosed-recipients:;"
+
+
+def test_send_email_chunked_reports_refused_recipients():
+    """Test that partially refused chunks are counted as failures."""
+    recipients = EmailRecipients(bcc_list=["good@example.com", "bad@example.com"])
+
+    with patch("smtplib.SMTP") as mock_smtp:
+        mock_server = MagicMock()
+        mock_server.send_message.return_value = {
+            "bad@example.com": (550, b"No such user")
+        }
+        mock_smtp.return_value = mock_server
+
+        report = send_email_chunked(
+            email_password="test_password",
+            recipients=recipients,
+            smtp_server="smtp.example.com",
+            smtp_port=587,
+        )
+
+    assert report.delivered == 1
+    assert report.failed_recipients == ["bad@example.com"]
+
+
+def test_send_email_chunked_retries_failed_chunk_independently():
+    """Test that a transient failure only retries the affected chunk."""
+    recipients = EmailRecipients(bcc_list=["a@example.com", "b@example.com"])
+
+    with patch("smtplib.SMTP") as mock_smtp, patch("time.sleep"):
+        mock_server = MagicMock()
+        mock_server.send_message.side_effect = [
+            {},
+            smtplib.SMTPServerDisconnected("dropped"),
+            {},
+        ]
+        mock_smtp.return_value = mock_server
+
+        report = send_email_chunked(
+            email_password="test_password",
+            recipients=recipients,
+            smtp_server="smtp.example.com",
+            smtp_port=587,
+            chunk_size=1,
+            max_connections=1,
+            max_retries=1,
+        )
+
+    assert report.delivered == 2
+    assert [chunk.attempts for chunk in report.chunks] == [1, 2]
+    # Initial connection plus a reconnect after the dropped session
+    assert mock_smtp.call_count == 2
+
+
+def test_send_email_chunked_raises_when_nothing_delivered():
+    """Test that total failure surfaces as EmailDeliveryError."""
+    recipients = EmailRecipients(bcc_list=["a@example.com"])
+
+    with patch("smtplib.SMTP") as mock_smtp, patch("time.sleep"):
+        mock_smtp.side_effect = OSError("connection refused")
+
+        with pytest.raises(EmailDeliveryError):
+            send_email_chunked(
+                email_password="test_password",
+                recipients=recipients,
+                smtp_server="smtp.example.com",
+                smtp_port=587,
+                max_retries=2,
+            )
+
+        assert mock_smtp.call_count == 3
@@ -10,6 +10,7 @@ from pathlib import Path
 from unittest.mock import Mock, patch
 import pytest
 
+from ocean_report.application import create_application_context
 from ocean_report.workflows.report_runner import run_report
 from ocean_report.workflows.models import RawReportData
 from ocean_report.models.email import EmailTemplateData
@@ -154,10 +155,16 @@ def test_run_report_with_default_config(mock_data_responses):
         mock_ctx.config.logging.level = "INFO"
         mock_ctx.config.logging.output = "console"
         mock_ctx.config.logging.format = "%(message)s"
+        mock_ctx.config.logging.queued = False
+        mock_ctx.config.logging.json_output = False
+        mock_ctx.config.logging.max_bytes = 0
+        mock_ctx.config.logging.backup_count = 5
         mock_ctx.config.location.latitude = 39.5
         mock_ctx.config.location.longitude = -74.2
         mock_ctx.config.location.beach_orientation_degrees = 140
         mock_ctx.config.reporting.template_path = None
+        mock_ctx.config.tracing.enabled = False
+        mock_ctx.config.metrics.enabled = False
         mock_context.return_value = mock_ctx
 
         mock_fetch.return_value = RawReportData(
@@ -239,3 +246,42 @@ def test_run_report_test_mode(temp_config_file, mock_data_responses):
         # Verify test=True was passed to get_bcc_recipients
         call_kwargs = mock_recipients.call_args.kwargs
         assert call_kwargs["test"] is True
+
+
+def test_run_report_keeps_the_logger_of_a_supplied_context(
+    temp_config_file, mock_data_responses
+):
+    """Test runs on the daemon's context do not reconfigure logging."""
+    context = create_application_context(config_path=temp_config_file)
+
+    with (
+        patch("ocean_report.workflows.report_runner.fetch_raw_data") as mock_fetch,
+        patch("ocean_report.workflows.report_runner.format_report_data"),
+        patch("ocean_report.workflows.report_runner.send_or_preview_email"),
+        patch(
+            "ocean_report.workflows.report_runner.get_bcc_recipients",
+            return_value=["test@example.com"],
+        ),
+        patch(
+            "ocean_report.workflows.report_runner.render_email_template",
+            return_value="Email body",
+        ),
+        patch(
+            "ocean_report.workflows.report_runner._configure_logger_from_settings"
+        ) as mock_configure,
+    ):
+        mock_fetch.return_value = RawReportData(
+            tides=mock_data_responses["tides"],
+            tide_timestamp=datetime.now(),
+            water_temp=72.5,
+            water_temp_timestamp=datetime.now(),
+            water_temp_data_time="14:00",
+            wind_forecast=[],
+            wind_timestamp=datetime.now(),
+        )
+
+        run_report(context=context, run_email=False, test=False)
+        mock_configure.assert_not_called()
+
+        run_report(cfg_path=temp_config_file, run_email=False, test=False)
+        mock_configure.assert_called_once()
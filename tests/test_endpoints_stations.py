@@ -1,3 +1,5 @@
+import json
+from pathlib import Path
 from unittest.mock import Mock
 
 from ocean_report.endpoints.noaa.stations import NoaaStationsEndpoint
@@ -5,26 +7,30 @@ from ocean_report.models.noaa.stations import (
     NoaaStationsParams,
     NoaaStationsResponse,
 )
+from ocean_report.storage.station_catalog import StationCatalogCache, StationIndex
+
+STATIONS_JSON = Path(__file__).parent / "fixtures" / "noaa_mdapi_stations.json"
 
 
 def test_noaa_stations_endpoint_wired_to_models() -> None:
     """Verify stations endpoint correctly consumes model layer."""
     mock_client = Mock()
     mock_client.get_json.return_value = {
+        "count": 2,
         "stations": [
             {
                 "id": "8534720",
                 "name": "Atlantic City",
-                "latitude": 39.355,
-                "longitude": -74.417,
+                "lat": 39.355,
+                "lng": -74.417,
             },
             {
                 "id": "8545530",
                 "name": "Cape May",
-                "latitude": 38.969,
-                "longitude": -74.961,
+                "lat": 38.969,
+                "lng": -74.961,
             },
-        ]
+        ],
     }
 
     endpoint = NoaaStationsEndpoint(mock_client)
@@ -39,7 +45,33 @@ def test_noaa_stations_endpoint_wired_to_models() -> None:
     assert response.stations[0].latitude == 39.355
 
     mock_client.get_json.assert_called_once_with(
-        "https://api.tidesandcurrents.noaa.gov/api/prod/stations",
+        "https://api.tidesandcurrents.noaa.gov/mdapi/prod/webapi/stations.json",
         params={"format": "json"},
         headers=None,
     )
+
+
+def test_recorded_stations_json_builds_an_index(tmp_path) -> None:
+    """Verify a recorded mdapi payload parses, caches and indexes."""
+    payload = json.loads(STATIONS_JSON.read_text(encoding="utf-8"))["stations_json"]
+    mock_client = Mock()
+    mock_client.get_json.return_value = payload
+
+    response = NoaaStationsEndpoint(mock_client).fetch(
+        NoaaStationsParams(station_type="watertemp")
+    )
+
+    assert response.count == len(response.stations) == 6
+    seattle = next(item for item in response.stations if item.station_id == "9447130")
+    assert (seattle.name, seattle.latitude, seattle.longitude) == (
+        "Seattle",
+        47.60264,
+        -122.3393,
+    )
+    assert mock_client.get_json.call_args.kwargs["params"]["type"] == "watertemp"
+
+    cache = StationCatalogCache(tmp_path)
+    cache.save("watertemp", response.stations)
+    _, stations = cache.load("watertemp")
+    (match,) = StationIndex(stations).nearest(39.5, -74.2)
+    assert match.station_id == "8534720"
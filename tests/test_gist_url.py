@@ -71,6 +71,66 @@ def test_fetch_recipients_from_gist_no_url():
         address_fetcher.fetch_recipients_from_gist(client=mock_client, url="")
 
 
+def test_parse_recipient_lines_normalizes_dedupes_and_validates():
+    lines = [
+        "A@EXAMPLE.COM, b@example.com",
+        "  a@example.com  ",
+        "",
+        "not-an-email",
+        "c@example.co.uk",
+        "not-an-email",
+    ]
+
+    result = address_fetcher.parse_recipient_lines(lines)
+
+    assert list(result) == ["a@example.com", "b@example.com", "c@example.co.uk"]
+    assert result.duplicates == 2
+    assert result.invalid_count == 1
+    assert result.invalid == ("not-an-email",)
+    assert "B@Example.com" in result
+    assert result.to_csv() == "a@example.com,b@example.com,c@example.co.uk"
+
+
+def test_parse_recipient_lines_dedupes_across_batches_and_decodes_bytes():
+    lines = [b"x@example.com", b"y@example.com", b"X@example.com", b"bad@"]
+
+    result = address_fetcher.parse_recipient_lines(lines, batch_lines=2)
+
+    assert list(result) == ["x@example.com", "y@example.com"]
+    assert result.duplicates == 1
+    assert result.invalid == ("bad@",)
+
+
+def test_stream_recipients_from_gist_reads_lines():
+    from unittest.mock import Mock
+
+    mock_response = Mock()
+    mock_response.encoding = None
+    mock_response.iter_lines.return_value = iter(
+        ["Test@example.com", "foo@bar.com", "test@example.com"]
+    )
+    mock_client = Mock()
+    mock_client.get.return_value = mock_response
+
+    result = address_fetcher.stream_recipients_from_gist(
+        client=mock_client, url="https://example.com/gist.txt"
+    )
+
+    assert list(result) == ["test@example.com", "foo@bar.com"]
+    mock_client.get.assert_called_once_with(
+        "https://example.com/gist.txt", stream=True
+    )
+    assert mock_response.encoding == "utf-8"
+    mock_response.close.assert_called_once()
+
+
+def test_stream_recipients_from_gist_no_url():
+    from unittest.mock import Mock
+
+    with pytest.raises(ValueError):
+        address_fetcher.stream_recipients_from_gist(client=Mock(), url="")
+
+
 if __name__ == "__main__":
     import pytest
 
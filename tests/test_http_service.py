@@ -0,0 +1,196 @@
+"""Tests for the local HTTP report service and its response cache."""
+
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+from datetime import datetime
+from unittest.mock import Mock, patch
+
+import pytest
+
+from ocean_report.application.context import ApplicationContext
+from ocean_report.config.schemas import AppConfig
+from ocean_report.models.email import EmailTemplateData
+from ocean_report.workflows.http_service import (
+    ReportHTTPServer,
+    ReportService,
+    TtlCache,
+)
+from ocean_report.workflows.models import RawReportData
+
+MODULE = "ocean_report.workflows.http_service"
+
+
+class FakeClock:
+    """Settable monotonic clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def raw_report():
+    return RawReportData(
+        tides=[],
+        tide_timestamp=datetime(2026, 7, 4, 6, 0),
+        water_temp=73.5,
+        water_temp_timestamp=datetime(2026, 7, 4, 6, 0),
+        water_temp_data_time="2026-07-04 05:54",
+        wind_forecast=[],
+        wind_timestamp=None,
+    )
+
+
+def email_data():
+    return EmailTemplateData(
+        long_date="Saturday, July 04, 2026",
+        water_temp="73.5 °F",
+        station_name="Atlantic City (8534720)",
+        station_city="Atlantic City",
+        date_retrieved="Jul 04 at 6:00 AM",
+    )
+
+
+@pytest.fixture
+def server():
+    """A running service on a free port with the report pipeline patched."""
+    config = AppConfig.model_validate(
+        {"serve": {"schedules": [{"name": "cape-may", "station_id": "8536110"}]}}
+    )
+    service = ReportService(context=ApplicationContext(config=config, client=Mock()))
+    httpd = ReportHTTPServer(("127.0.0.1", 0), service)
+    worker = threading.Thread(target=httpd.serve_forever, daemon=True)
+    worker.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def get(httpd, path, headers=None):
+    """GET a path; return (status, headers, body)."""
+    host, port = httpd.server_address[:2]
+    url = f"http://{host}:{port}{path}"
+    request = urllib.request.Request(url, headers=headers or {})
+    try:
+        with urllib.request.urlopen(request, timeout=5) as response:
+            return response.status, response.headers, response.read()
+    except urllib.error.HTTPError as exc:
+        return exc.code, exc.headers, exc.read()
+
+
+def test_ttl_cache_coalesces_concurrent_loads_and_expires():
+    """Test one loader runs for many concurrent callers and entries expire."""
+    clock = FakeClock()
+    cache = TtlCache(ttl_seconds=60, clock=clock)
+    release = threading.Event()
+    calls = []
+
+    def loader():
+        calls.append(1)
+        release.wait(5)
+        return "report"
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get_or_load("a", loader)))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(calls) == 1
+    assert [value for value, _ in results] == ["report"] * 8
+
+    clock.now += 59
+    assert cache.get_or_load("a", loader) == ("report", 1)
+    clock.now += 2
+    cache.get_or_load("a", loader)
+    assert len(calls) == 2
+
+
+def test_ttl_cache_does_not_cache_failures():
+    """Test a failing loader propagates and the next call retries."""
+    cache = TtlCache(ttl_seconds=60, clock=FakeClock())
+    with pytest.raises(RuntimeError):
+        cache.get_or_load("a", Mock(side_effect=RuntimeError("NOAA down")))
+    assert cache.get_or_load("a", lambda: "ok") == ("ok", 60)
+
+
+def test_ttl_cache_evicts_expired_entries_on_insert():
+    """Test entries for past days do not accumulate."""
+    clock = FakeClock()
+    cache = TtlCache(ttl_seconds=60, clock=clock)
+    cache.get_or_load(("default", "20260704"), lambda: "yesterday")
+    clock.now += 30
+    cache.get_or_load(("other", "20260705"), lambda: "other")
+    clock.now += 31
+    cache.get_or_load(("default", "20260705"), lambda: "today")
+
+    # pylint: disable-next=protected-access
+    assert set(cache._entries) == {("other", "20260705"), ("default", "20260705")}
+
+
+def test_endpoints_serve_cached_views_with_etags(server):
+    """Test the three views share one build and ETags revalidate to 304."""
+    with (
+        patch(f"{MODULE}.fetch_raw_data", return_value=raw_report()) as fetch,
+        patch(f"{MODULE}.format_report_data", return_value=email_data()),
+        patch(f"{MODULE}.render_email_template", return_value="Water: 73.5 °F"),
+    ):
+        status, _, body = get(server, "/locations")
+        assert json.loads(body) == ["cape-may", "default"]
+
+        status, headers, body = get(server, "/locations/cape-may/body")
+        assert status == 200
+        assert body.decode("utf-8") == "Water: 73.5 °F"
+        assert headers["Content-Type"].startswith("text/plain")
+        etag = headers["ETag"]
+
+        _, _, raw = get(server, "/locations/cape-may/raw")
+        _, _, data = get(server, "/locations/cape-may/email-data")
+        assert json.loads(raw)["water_temp"] == 73.5
+        assert json.loads(data)["station_city"] == "Atlantic City"
+
+        status, headers, body = get(
+            server, "/locations/cape-may/body", {"If-None-Match": etag}
+        )
+        assert (status, body, headers["ETag"]) == (304, b"", etag)
+
+    assert fetch.call_count == 1
+    assert fetch.call_args.args[1].station_id == "8536110"
+    assert get(server, "/metrics")[0] == 404  # metrics disabled
+
+
+def test_report_responses_carry_the_data_age(server):
+    """Test builds serve stale data and report its age and staleness."""
+    stale = raw_report()
+    stale.data_age_seconds, stale.stale = 120.0, True
+    with (
+        patch(f"{MODULE}.fetch_raw_data", return_value=stale) as fetch,
+        patch(f"{MODULE}.format_report_data", return_value=email_data()),
+        patch(f"{MODULE}.render_email_template", return_value="Water: 73.5 °F"),
+    ):
+        _, headers, _ = get(server, "/locations/default/body")
+
+    assert fetch.call_args.kwargs == {"serve_stale": True}
+    assert 120 <= int(headers["Age"]) < 130
+    assert headers["X-Data-Stale"] == "true"
+
+
+def test_unknown_locations_and_upstream_failures(server):
+    """Test 404 for unknown paths and 502 when the report cannot be built."""
+    assert get(server, "/locations/nowhere/body")[0] == 404
+    assert get(server, "/locations/default/html")[0] == 404
+
+    with patch(f"{MODULE}.fetch_raw_data", side_effect=RuntimeError("NOAA down")):
+        status, _, body = get(server, "/locations/default/raw")
+    assert status == 502
+    assert json.loads(body) == {"error": "NOAA down"}
@@ -0,0 +1,105 @@
+"""Tests for logger configuration (queued, JSON and rotating output)."""
+
+import json
+import logging.handlers
+import threading
+
+import pytest
+
+from ocean_report.logger import LogOutput, configure_logger, flush_logger, logger
+
+
+@pytest.fixture(autouse=True)
+def restore_console_logging():
+    """Put the default console configuration back after each test."""
+    yield
+    configure_logger()
+
+
+def test_queued_logging_flushes_all_records_in_order(tmp_path):
+    """Test queued records keep their caller's details and flush on demand."""
+    log_file = tmp_path / "queued.log"
+    configure_logger(
+        LogOutput.FILE,
+        log_file=log_file,
+        log_format="%(message)s %(threadName)s",
+        queued=True,
+    )
+
+    caller = threading.current_thread().name
+    for index in range(200):
+        logger.info("record %d", index)
+    flush_logger()
+
+    lines = log_file.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 200
+    assert lines[0] == f"record 0 {caller}"
+    assert lines[-1].startswith("record 199")
+
+    # The listener keeps running after a flush.
+    logger.info("after flush")
+    flush_logger()
+    last_line = log_file.read_text(encoding="utf-8").splitlines()[-1]
+    assert last_line.startswith("after flush")
+
+
+def test_json_output_includes_extra_fields_and_exceptions(tmp_path):
+    """Test JSON lines carry standard fields, extras and the traceback."""
+    log_file = tmp_path / "report.jsonl"
+    configure_logger(LogOutput.FILE, log_file=log_file, json_output=True, queued=True)
+
+    logger.info("fetched %s", "tides", extra={"station": "8534720"})
+    try:
+        raise ValueError("bad payload")
+    except ValueError:
+        logger.exception("parse failed")
+    flush_logger()
+
+    first, second = (
+        json.loads(line) for line in log_file.read_text(encoding="utf-8").splitlines()
+    )
+    assert first["message"] == "fetched tides"
+    assert first["level"] == "INFO"
+    assert first["logger"] == "ocean_report"
+    assert first["station"] == "8534720"
+    assert second["level"] == "ERROR"
+    assert "ValueError: bad payload" in second["exception"]
+
+
+def test_file_rotation_keeps_backup_count_files(tmp_path):
+    """Test size-based rotation caps the number of log files."""
+    log_file = tmp_path / "rotating.log"
+    configure_logger(
+        LogOutput.FILE,
+        log_file=log_file,
+        log_format="%(message)s",
+        max_bytes=200,
+        backup_count=2,
+    )
+
+    for index in range(50):
+        logger.info("line %02d %s", index, "x" * 40)
+    flush_logger()
+
+    files = sorted(path.name for path in tmp_path.iterdir())
+    assert files == ["rotating.log", "rotating.log.1", "rotating.log.2"]
+    assert all(path.stat().st_size <= 200 for path in tmp_path.iterdir())
+
+
+def test_reconfiguring_stops_previous_listener(tmp_path):
+    """Test switching modes drains the old queue and leaves one handler."""
+    log_file = tmp_path / "switch.log"
+    configure_logger(
+        LogOutput.FILE, log_file=log_file, log_format="%(message)s", queued=True
+    )
+    logger.info("queued record")
+
+    configure_logger(LogOutput.FILE, log_file=log_file, log_format="%(message)s")
+    logger.info("direct record")
+
+    assert log_file.read_text(encoding="utf-8").splitlines() == [
+        "queued record",
+        "direct record",
+    ]
+    assert len(logger.handlers) == 1
+    assert not isinstance(logger.handlers[0], logging.handlers.QueueHandler)
@@ -0,0 +1,142 @@
+"""Tests for the metrics registry and its OpenMetrics textfile export."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from ocean_report.api_client.client import ApiClient, ApiResponseError
+from ocean_report.api_client.exceptions import ApiConnectionError
+from ocean_report.metrics import MetricsRegistry, _Metric, registry
+from ocean_report.services.instrumentation import upstream_call
+
+
+@pytest.fixture
+def enabled_registry():
+    """Enable the process-wide registry for one test, starting empty."""
+    registry.reset()
+    registry.enabled = True
+    yield registry
+    registry.enabled = False
+    registry.reset()
+
+
+def test_exposition_renders_counters_gauges_and_histograms():
+    """Test the text format: HELP/TYPE, labels, cumulative buckets, EOF."""
+    metrics = MetricsRegistry(enabled=True)
+    requests_total = metrics.counter(
+        "app_requests_total", "Requests.", labelnames=("host",)
+    )
+    recipients = metrics.gauge("app_recipients", "Recipients.")
+    latency = metrics.histogram("app_latency_seconds", "Latency.", buckets=(0.1, 1.0))
+
+    requests_total.inc(host='a"b')
+    requests_total.inc(2, host='a"b')
+    recipients.set(42)
+    for value in (0.05, 0.5, 0.7, 3.0):
+        latency.observe(value)
+
+    text = metrics.to_openmetrics()
+
+    assert "# TYPE app_requests_total counter" in text
+    assert 'app_requests_total{host="a\\"b"} 3' in text
+    assert "# TYPE app_recipients gauge\napp_recipients 42\n" in text
+    assert 'app_latency_seconds_bucket{le="0.1"} 1' in text
+    assert 'app_latency_seconds_bucket{le="1.0"} 3' in text
+    assert 'app_latency_seconds_bucket{le="+Inf"} 4' in text
+    assert "app_latency_seconds_count 4" in text
+    assert "app_latency_seconds_sum 4.25" in text
+    assert text.endswith("# EOF\n")
+
+
+def test_disabled_registry_records_nothing():
+    """Test updates are no-ops until the registry is enabled."""
+    metrics = MetricsRegistry()
+    counter = metrics.counter("app_calls_total", "Calls.", labelnames=("kind",))
+
+    counter.inc(kind="x")
+    assert counter.value(kind="x") == 0
+    assert metrics.to_openmetrics() == "# EOF\n"
+
+    metrics.enabled = True
+    counter.inc(kind="x")
+    assert counter.value(kind="x") == 1
+    with pytest.raises(ValueError):
+        counter.inc(other="x")
+    assert metrics.counter("app_calls_total", "Calls.", labelnames=("kind",)) is counter
+    with pytest.raises(ValueError):
+        metrics.gauge("app_calls_total", "Calls.")
+
+
+def test_metric_types_must_implement_reset_and_samples():
+    """Test an incomplete metric type fails when instantiated."""
+
+    class Incomplete(_Metric):  # pylint: disable=abstract-method
+        metric_type = "gauge"
+
+        def _reset(self):
+            pass
+
+    with pytest.raises(TypeError, match="_samples"):
+        Incomplete(MetricsRegistry(), "app_incomplete", "Incomplete.", ())
+
+
+def test_write_textfile_replaces_file_atomically(tmp_path):
+    """Test the textfile is written whole and no temporary file is left."""
+    metrics = MetricsRegistry(enabled=True)
+    metrics.gauge("app_up", "Up.").set(1)
+    target = tmp_path / "textfile" / "ocean_report.prom"
+    target.parent.mkdir()
+    target.write_text("stale\n", encoding="utf-8")
+
+    metrics.write_textfile(target)
+
+    assert target.read_text(encoding="utf-8").startswith("# HELP app_up Up.")
+    assert [path.name for path in target.parent.iterdir()] == ["ocean_report.prom"]
+
+
+def test_api_client_records_requests_bytes_and_failures(enabled_registry):
+    """Test ApiClient counts outcomes, body bytes and request latency."""
+    ok = Mock(status_code=200, content=b"x" * 128)
+    not_found = Mock(status_code=404)
+    not_found.raise_for_status.side_effect = requests.exceptions.HTTPError("404")
+
+    with patch("requests.sessions.Session.get") as mock_get:
+        mock_get.side_effect = [
+            ok,
+            not_found,
+            requests.exceptions.ConnectionError("down"),
+        ]
+        client = ApiClient(retry_insecure_on_ssl_error=False)
+        client.get("https://api.example.com/a")
+        with pytest.raises(ApiResponseError):
+            client.get("https://api.example.com/b")
+        with pytest.raises(ApiConnectionError):
+            client.get("https://api.example.com/c")
+
+    text = enabled_registry.to_openmetrics()
+    host = 'host="api.example.com"'
+    assert f'ocean_report_http_requests_total{{{host},outcome="ok"}} 1' in text
+    assert f'ocean_report_http_requests_total{{{host},outcome="http_error"}} 1' in text
+    assert (
+        f'ocean_report_http_requests_total{{{host},outcome="connection_error"}} 1'
+        in text
+    )
+    assert f"ocean_report_http_response_bytes_total{{{host}}} 128" in text
+    assert f"ocean_report_http_request_duration_seconds_count{{{host}}} 2" in text
+
+
+def test_upstream_call_records_latency_and_errors(enabled_registry):
+    """Test the service wrapper observes every call and counts failures."""
+    with upstream_call("noaa.tides", station="8534720"):
+        pass
+    with pytest.raises(ApiConnectionError):
+        with upstream_call("noaa.tides", station="8534720"):
+            raise ApiConnectionError("down")
+
+    text = enabled_registry.to_openmetrics()
+    assert (
+        'ocean_report_upstream_request_duration_seconds_count{source="noaa.tides"} 2'
+        in text
+    )
+    assert 'ocean_report_upstream_errors_total{source="noaa.tides"} 1' in text
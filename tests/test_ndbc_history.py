@@ -0,0 +1,129 @@
+"""Tests for streaming NDBC stdmet archive ingestion."""
+
+import gzip
+import json
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+import requests
+
+from ocean_report.api_client.exceptions import ApiConnectionError, ApiResponseError
+from ocean_report.application.context import ApplicationContext
+from ocean_report.config.schemas import AppConfig
+from ocean_report.endpoints.ndbc.historical import NdbcHistoricalEndpoint
+from ocean_report.storage.timeseries import TimeSeriesStore
+from ocean_report.use_cases.buoy import STDMET_MANIFEST, ingest_buoy_history
+
+HEADER = (
+    "#YY  MM DD hh mm WDIR WSPD GST  WVHT   DPD   APD MWD   PRES  ATMP  WTMP  "
+    "DEWP  VIS  TIDE\n"
+    "#yr  mo dy hr mn degT m/s  m/s     m   sec   sec degT   hPa  degC  degC  "
+    "degC  nmi    ft\n"
+)
+
+
+def _archive(year: int, hours: int = 48) -> bytes:
+    rows = [HEADER]
+    for hour in range(hours):
+        water = "999.0" if hour == 5 else f"{10 + hour / 10:.1f}"
+        rows.append(
+            f"{year} 01 {1 + hour // 24:02d} {hour % 24:02d} 50 200  5.0  6.0 "
+            f"99.00 99.00 99.00 999 1015.0  8.0 {water}  2.0 99.0 99.00\n"
+        )
+    return gzip.compress("".join(rows).encode("ascii"))
+
+
+def _response(body: bytes, *, fail_after: int | None = None) -> Mock:
+    def iter_content(chunk_size):
+        for count, start in enumerate(range(0, len(body), 64)):
+            if fail_after is not None and count == fail_after:
+                raise requests.exceptions.ChunkedEncodingError("connection reset")
+            yield body[start : start + 64]
+
+    return Mock(iter_content=iter_content, url="https://example.test/archive")
+
+
+@pytest.fixture
+def context(tmp_path):
+    """Context whose time-series store lives in a temporary directory."""
+    config = AppConfig.model_validate(
+        {"timeseries": {"directory": str(tmp_path / "ts")}}
+    )
+    return ApplicationContext(config=config, client=Mock())
+
+
+def test_archive_is_streamed_in_bounded_chunks():
+    """Test incremental decompression and chunked parsing of one archive."""
+    client = Mock()
+    client.get.return_value = _response(_archive(2020))
+
+    frames = list(
+        NdbcHistoricalEndpoint(client).iter_frames("44091", 2020, chunk_rows=10)
+    )
+
+    assert [len(frame) for frame in frames] == [10, 10, 10, 10, 8]
+    assert client.get.call_args.args[0].endswith(
+        "data/historical/stdmet/44091h2020.txt.gz"
+    )
+    assert client.get.call_args.kwargs["stream"] is True
+    client.get.return_value.close.assert_called_once()
+
+
+def test_ingest_appends_each_variable_and_records_years(context, tmp_path):
+    """Test per-variable series, sentinel dropping and the resume manifest."""
+    archives = {"2019": _archive(2019), "2020": _archive(2020)}
+
+    def get(url, **_kwargs):
+        year = url[-11:-7]
+        if year not in archives:
+            raise ApiResponseError(f"HTTP 404 returned for GET {url}")
+        return _response(archives[year])
+
+    context.client.get.side_effect = get
+    ingested = ingest_buoy_history(context=context, years=[2021, 2020, 2019])
+
+    store = TimeSeriesStore(tmp_path / "ts")
+    water = store.open("44091", "stdmet_wtmp")
+    assert ingested == {2019: 48, 2020: 48}
+    assert len(water) == 94
+    assert np.all(np.diff(water.timestamps) > 0)
+    assert store.count("44091", "stdmet_wspd") == 96
+    assert store.count("44091", "stdmet_wvht") == 0
+
+    context.client.get.reset_mock()
+    assert ingest_buoy_history(context=context, years=[2019, 2020, 2021]) == {}
+    assert [call.args[0][-11:-7] for call in context.client.get.call_args_list] == [
+        "2021"
+    ]
+
+
+def test_interrupted_download_resumes_without_duplicates(context, tmp_path):
+    """Test that a failed stream leaves the year unfinished but consistent."""
+    body = _archive(2020, hours=240)
+    context.client.get.return_value = _response(body, fail_after=8)
+
+    with pytest.raises(ApiConnectionError):
+        ingest_buoy_history(context=context, years=[2020])
+    store = TimeSeriesStore(tmp_path / "ts")
+    assert store.count("44091", "stdmet_wspd") < 240
+
+    stored = store.count("44091", "stdmet_wspd")
+    context.client.get.return_value = _response(body)
+    assert ingest_buoy_history(context=context, years=[2020]) == {2020: 240 - stored}
+    assert store.count("44091", "stdmet_wspd") == 240
+    manifest = json.loads((tmp_path / "ts" / "44091" / STDMET_MANIFEST).read_text())
+    assert list(manifest) == ["2020"]
+
+
+def test_years_older_than_stored_data_are_not_marked_complete(context, tmp_path):
+    """Test a backfill behind newer data is reported, not silently dropped."""
+    context.client.get.return_value = _response(_archive(2024))
+    assert ingest_buoy_history(context=context, years=[2024]) == {2024: 48}
+
+    context.client.get.return_value = _response(_archive(2020))
+    assert ingest_buoy_history(context=context, years=[2020]) == {2020: 0}
+
+    manifest = json.loads((tmp_path / "ts" / "44091" / STDMET_MANIFEST).read_text())
+    assert list(manifest) == ["2024"]
+    assert TimeSeriesStore(tmp_path / "ts").count("44091", "stdmet_wspd") == 48
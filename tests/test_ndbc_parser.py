@@ -0,0 +1,117 @@
+"""Tests for the NDBC buoy file parser, endpoint and use case."""
+
+import io
+from datetime import datetime
+from unittest.mock import Mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ocean_report.application.context import ApplicationContext
+from ocean_report.config.schemas import AppConfig
+from ocean_report.endpoints.ndbc.observations import NdbcObservationsEndpoint
+from ocean_report.endpoints.ndbc.parser import (
+    iter_ndbc_frames,
+    ndbc_observations,
+    parse_ndbc_text,
+)
+from ocean_report.models.ndbc.observations import NdbcObservationsParams
+from ocean_report.use_cases.buoy import (
+    get_buoy_observations,
+    get_latest_buoy_observation,
+)
+
+REALTIME_TXT = """\
+#YY  MM DD hh mm WDIR WSPD GST  WVHT   DPD   APD MWD   PRES  ATMP  WTMP  DEWP  VIS PTDY  TIDE
+#yr  mo dy hr mn degT m/s  m/s     m   sec   sec degT   hPa  degC  degC  degC  nmi  hPa    ft
+2025 07 04 13 00   MM   MM   MM    MM    MM    MM  MM 1015.0  22.3    MM  18.1   MM -0.3    MM
+2025 07 04 12 50  210  6.0  7.5    MM    MM    MM  MM 1015.0  22.3  21.4  18.1   MM -0.3    MM
+2025 07 04 12 40  200  5.0  6.0   0.8     7   5.1 180 1015.2  22.1  21.3  18.0   MM   MM    MM
+"""
+
+HISTORICAL_TXT = """\
+YYYY MM DD hh WD   WSPD GST  WVHT  DPD   APD  MWD  BAR    ATMP  WTMP  DEWP  VIS
+1999 01 01 01 999  99.0  6.0  0.8  7.0   5.1  999 9999.0 22.1  999.0  18.0 99.0
+1999 01 01 00 200  5.0  6.0  0.8  7.0   5.1  180 1015.2 22.1  12.5  18.0 99.0
+"""
+
+
+def test_realtime_file_is_sorted_with_missing_values_as_nan():
+    """Test header, units, MM markers and newest-first row order."""
+    frame = parse_ndbc_text(REALTIME_TXT)
+
+    assert frame.index.tz is not None
+    assert frame.index[0] == pd.Timestamp("2025-07-04 12:40", tz="UTC")
+    assert frame.index.is_monotonic_increasing
+    assert frame["WTMP"].tolist()[:2] == [21.3, 21.4]
+    assert np.isnan(frame["WTMP"].iloc[-1])
+    assert frame.attrs["units"]["WSPD"] == "m/s"
+    assert "YY" not in frame and "mm" not in frame
+
+
+def test_historical_layout_is_normalized():
+    """Test single-line headers, missing minutes, old names and sentinels."""
+    frame = parse_ndbc_text(HISTORICAL_TXT)
+
+    assert list(frame.index) == [
+        pd.Timestamp("1999-01-01 00:00", tz="UTC"),
+        pd.Timestamp("1999-01-01 01:00", tz="UTC"),
+    ]
+    assert frame["WDIR"].tolist()[0] == 200
+    assert frame["PRES"].isna().tolist() == [False, True]
+    assert frame["WTMP"].isna().tolist() == [False, True]
+    assert frame["WSPD"].isna().tolist() == [False, True]
+
+
+def test_chunked_parsing_covers_every_row():
+    """Test bounded-size chunks of a stream parse to the same rows."""
+    chunks = list(iter_ndbc_frames(io.StringIO(REALTIME_TXT), chunk_rows=2))
+
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+    assert pd.concat(chunks).sort_index().equals(parse_ndbc_text(REALTIME_TXT))
+
+
+def test_observations_convert_wind_to_knots():
+    """Test frame to NdbcObservation conversion."""
+    observations = ndbc_observations(
+        parse_ndbc_text(REALTIME_TXT), station_id="44091"
+    )
+
+    assert observations[0].timestamp == "2025-07-04 12:40"
+    assert observations[0].wind_speed_knots == pytest.approx(9.72, abs=0.01)
+    assert observations[0].water_temperature_c == 21.3
+    assert observations[-1].wind_speed_knots is None
+
+
+def test_endpoint_requests_realtime_text_file():
+    """Test the realtime2 URL and text response handling."""
+    client = Mock()
+    client.get.return_value = Mock(text=REALTIME_TXT)
+
+    response = NdbcObservationsEndpoint(client).fetch(
+        NdbcObservationsParams(station_id="acyn4")
+    )
+
+    client.get.assert_called_once_with(
+        "https://www.ndbc.noaa.gov/data/realtime2/ACYN4.txt",
+        params=None,
+        headers=None,
+    )
+    assert len(response.observations) == 3
+
+
+def test_buoy_use_cases_use_configured_buoy():
+    """Test hour windows and the latest reported observation."""
+    client = Mock()
+    client.get.return_value = Mock(text=REALTIME_TXT)
+    context = ApplicationContext(config=AppConfig(), client=client)
+
+    window = get_buoy_observations(
+        context=context, hours=0.25, now=datetime(2025, 7, 4, 13, 0)
+    )
+    latest = get_latest_buoy_observation(context=context)
+
+    assert len(window) == 2
+    assert latest.timestamp == "2025-07-04 12:50"
+    assert client.get.call_args.args[0].endswith("/44091.txt")
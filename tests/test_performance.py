@@ -1,11 +1,13 @@
 """Performance tests for critical paths.
 
 Tests that verify key operations complete within acceptable time limits.
+Each check uses the median of repeated, warmed-up samples rather than one
+wall-clock reading, so a scheduler hiccup does not fail the test. Regression
+tracking against a stored baseline lives in ``scripts/benchmarks/suite.py``.
 Run with: pytest tests/test_performance.py -m performance
 """
 
 import pytest
-import time
 from datetime import datetime
 from unittest.mock import Mock, patch
 
@@ -15,6 +17,14 @@ from ocean_report.workflows.data.fetcher import fetch_raw_data
 from ocean_report.workflows.data.formatter import format_report_data
 from ocean_report.workflows.models import FetchParams, RawReportData
 from ocean_report.models.noaa.tides import NoaaTidePredictionRecord
+from ocean_report.testing.benchmark import measure
+
+
+def _median_seconds(func, *, samples=5):
+    """Median per-call time of ``func`` after a warmup call."""
+    return measure(
+        "test", func, samples=samples, warmup=1, min_sample_time=0.005
+    ).median
 
 
 @pytest.fixture
@@ -70,9 +80,9 @@ def test_fetch_raw_data_performance(mock_context, fetch_params):
         mock_temp.return_value = (73.5, datetime.now(), None)
         mock_wind.return_value = ([], datetime.now())
 
-        start_time = time.time()
-        fetch_raw_data(context=mock_context, params=fetch_params)
-        elapsed = time.time() - start_time
+        elapsed = _median_seconds(
+            lambda: fetch_raw_data(context=mock_context, params=fetch_params)
+        )
 
         # Should complete in under 100ms (mocked)
         assert elapsed < 0.1, (
@@ -105,9 +115,7 @@ def test_format_report_data_performance_large_dataset(large_tide_dataset):
         mock_temp.return_value = "Water temp text"
         mock_wind.return_value = "Wind text"
 
-        start_time = time.time()
-        format_report_data(raw_data)
-        elapsed = time.time() - start_time
+        elapsed = _median_seconds(lambda: format_report_data(raw_data))
 
         # Should handle large dataset quickly
         assert elapsed < 0.05, (
@@ -120,9 +128,8 @@ def test_tide_formatting_performance(large_tide_dataset):
     """Test tide formatting performance with many events."""
     from ocean_report.emailer.template_helpers import format_tide_info
 
-    start_time = time.time()
     result = format_tide_info(large_tide_dataset)
-    elapsed = time.time() - start_time
+    elapsed = _median_seconds(lambda: format_tide_info(large_tide_dataset))
 
     # Should format 96 tide events quickly
     assert elapsed < 0.1, f"format_tide_info took {elapsed * 1000:.2f}ms for 96 events"
@@ -138,11 +145,14 @@ def test_wind_classification_performance():
     test_angles = list(range(0, 360, 5))  # 72 test cases
     beach_facing = 140.0
 
-    start_time = time.time()
-    results = [
-        classify_wind_relative_to_beach(angle, beach_facing) for angle in test_angles
-    ]
-    elapsed = time.time() - start_time
+    def classify_all():
+        return [
+            classify_wind_relative_to_beach(angle, beach_facing)
+            for angle in test_angles
+        ]
+
+    results = classify_all()
+    elapsed = _median_seconds(classify_all)
 
     # Should classify 72 wind directions quickly
     assert elapsed < 0.01, (
@@ -174,9 +184,8 @@ def test_email_body_generation_performance():
         water_temp_measured_at_date="14:00",
     )
 
-    start_time = time.time()
     result = render_email_template(template_data)
-    elapsed = time.time() - start_time
+    elapsed = _median_seconds(lambda: render_email_template(template_data))
 
     # Should render template quickly
     assert elapsed < 0.01, f"render_email_template took {elapsed * 1000:.2f}ms"
@@ -189,9 +198,8 @@ def test_config_loading_performance():
     """Test configuration loading performance."""
     from ocean_report.config.loader import load_app_config
 
-    start_time = time.time()
     config = load_app_config()
-    elapsed = time.time() - start_time
+    elapsed = _median_seconds(load_app_config)
 
     # Config loading should be fast
     assert elapsed < 0.1, f"load_config took {elapsed * 1000:.2f}ms"
@@ -203,9 +211,8 @@ def test_application_context_creation_performance():
     """Test application context creation performance."""
     from ocean_report.application.factory import create_application_context
 
-    start_time = time.time()
     context = create_application_context()
-    elapsed = time.time() - start_time
+    elapsed = _median_seconds(create_application_context)
 
     # Context creation should be fast
     assert elapsed < 0.2, f"create_application_context took {elapsed * 1000:.2f}ms"
@@ -228,9 +235,11 @@ def test_pydantic_model_validation_performance():
         for minute in range(0, 60, 2)  # 720 records
     ]
 
-    start_time = time.time()
-    records = [NoaaTidePredictionRecord(**data) for data in tide_data[:100]]
-    elapsed = time.time() - start_time
+    def validate_records():
+        return [NoaaTidePredictionRecord(**data) for data in tide_data[:100]]
+
+    records = validate_records()
+    elapsed = _median_seconds(validate_records)
 
     # Should validate 100 records quickly
     assert elapsed < 0.05, (
@@ -271,13 +280,30 @@ def test_full_report_workflow_performance_benchmark(mock_context, fetch_params):
         mock_fmt_temp.return_value = "Temp text"
         mock_fmt_wind.return_value = "Wind text"
 
-        start_time = time.time()
-        raw_data = fetch_raw_data(context=mock_context, params=fetch_params)
-        formatted_data = format_report_data(raw_data)
-        elapsed = time.time() - start_time
+        def run_workflow():
+            raw_data = fetch_raw_data(context=mock_context, params=fetch_params)
+            return format_report_data(raw_data)
+
+        formatted_data = run_workflow()
+        elapsed = _median_seconds(run_workflow)
 
         # Full workflow should be fast
         assert elapsed < 0.15, (
             f"Full workflow took {elapsed * 1000:.2f}ms (expected <150ms)"
         )
         assert formatted_data is not None
+
+
+@pytest.mark.performance
+def test_recipient_parser_performance():
+    """Test that parsing a large recipient list stays linear and fast."""
+    from ocean_report.emailer.address_fetcher import parse_recipient_lines
+
+    lines = [f" Subscriber{i}@Example.com " for i in range(200_000)]
+
+    recipients = parse_recipient_lines(lines)
+    elapsed = _median_seconds(lambda: parse_recipient_lines(lines), samples=3)
+
+    assert len(recipients) == 200_000
+    # 1M lines target well under a second; 200k leaves headroom for slow CI
+    assert elapsed < 1.0, f"Parsing took {elapsed * 1000:.2f}ms (expected <1000ms)"
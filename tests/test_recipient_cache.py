@@ -0,0 +1,161 @@
+"""Tests for recipient list snapshots and conditional refresh."""
+
+from unittest.mock import Mock
+
+import pytest
+import requests
+
+from ocean_report.api_client.exceptions import ApiConnectionError
+from ocean_report.emailer.recipient_cache import (
+    RecipientSnapshotStore,
+    sync_recipients,
+)
+
+URL = "https://gist.example.com/recipients.txt"
+
+
+def _response(status_code=200, lines=(), headers=None):
+    response = Mock()
+    response.status_code = status_code
+    response.encoding = "utf-8"
+    response.headers = headers or {}
+    response.iter_lines.return_value = iter(lines)
+    return response
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Snapshot store in a temporary directory."""
+    return RecipientSnapshotStore(tmp_path / "recipient-cache")
+
+
+def test_first_sync_downloads_and_stores_snapshot(store):
+    """Test that a full download is parsed and cached with its validators."""
+    client = Mock()
+    client.get.return_value = _response(
+        lines=["A@example.com", "b@example.com", "a@example.com"],
+        headers={"ETag": '"v1"', "Last-Modified": "Mon, 01 Jun 2026 00:00:00 GMT"},
+    )
+
+    result = sync_recipients(client=client, url=URL, store=store)
+
+    assert list(result) == ["a@example.com", "b@example.com"]
+    client.get.assert_called_once_with(URL, headers=None, stream=True)
+    snapshot, cached = store.load(URL)
+    assert snapshot.etag == '"v1"'
+    assert snapshot.count == 2
+    assert list(cached) == ["a@example.com", "b@example.com"]
+
+
+def test_not_modified_serves_snapshot(store):
+    """Test that a 304 reply reuses the snapshot and sends validators."""
+    client = Mock()
+    client.get.return_value = _response(
+        lines=["a@example.com"],
+        headers={"ETag": '"v1"', "Last-Modified": "Mon, 01 Jun 2026 00:00:00 GMT"},
+    )
+    sync_recipients(client=client, url=URL, store=store)
+    first_snapshot, _ = store.load(URL)
+
+    client.get.return_value = _response(status_code=304)
+    result = sync_recipients(client=client, url=URL, store=store)
+
+    assert list(result) == ["a@example.com"]
+    client.get.assert_called_with(
+        URL,
+        headers={
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "Mon, 01 Jun 2026 00:00:00 GMT",
+        },
+        stream=True,
+    )
+    snapshot, _ = store.load(URL)
+    assert snapshot.downloaded_at == first_snapshot.downloaded_at
+    assert snapshot.validated_at >= first_snapshot.validated_at
+
+
+def test_changed_list_replaces_snapshot(store):
+    """Test that a 200 reply after a change overwrites the snapshot."""
+    client = Mock()
+    client.get.return_value = _response(lines=["a@example.com"], headers={})
+    sync_recipients(client=client, url=URL, store=store)
+
+    client.get.return_value = _response(
+        lines=["c@example.com"], headers={"ETag": '"v2"'}
+    )
+    result = sync_recipients(client=client, url=URL, store=store)
+
+    assert list(result) == ["c@example.com"]
+    snapshot, cached = store.load(URL)
+    assert snapshot.etag == '"v2"'
+    assert list(cached) == ["c@example.com"]
+
+
+def test_upstream_failure_falls_back_to_snapshot(store, caplog):
+    """Test that fetch errors are served from the snapshot with its age logged."""
+    client = Mock()
+    client.get.return_value = _response(lines=["a@example.com"])
+    sync_recipients(client=client, url=URL, store=store)
+
+    client.get.side_effect = ApiConnectionError("down")
+    result = sync_recipients(client=client, url=URL, store=store)
+
+    assert list(result) == ["a@example.com"]
+    assert "using local snapshot" in caplog.text
+
+
+def test_upstream_failure_without_snapshot_raises(store):
+    """Test that fetch errors propagate when nothing is cached."""
+    client = Mock()
+    client.get.side_effect = ApiConnectionError("down")
+
+    with pytest.raises(ApiConnectionError):
+        sync_recipients(client=client, url=URL, store=store)
+
+
+def test_interrupted_body_falls_back_to_snapshot(store):
+    """Test that a stream failure after a 200 reply serves the snapshot."""
+    client = Mock()
+    client.get.return_value = _response(lines=["a@example.com"], headers={})
+    sync_recipients(client=client, url=URL, store=store)
+
+    broken = _response(headers={"ETag": '"v2"'})
+    broken.iter_lines.side_effect = requests.exceptions.ChunkedEncodingError("reset")
+    client.get.return_value = broken
+    result = sync_recipients(client=client, url=URL, store=store)
+
+    assert list(result) == ["a@example.com"]
+    broken.close.assert_called_once()
+    snapshot, _ = store.load(URL)
+    assert snapshot.etag is None
+
+    store_empty = RecipientSnapshotStore(store.directory / "empty")
+    with pytest.raises(ApiConnectionError, match="Download interrupted"):
+        sync_recipients(client=client, url=URL, store=store_empty)
+
+
+def test_empty_download_does_not_replace_snapshot(store, caplog):
+    """Test that a list with no valid addresses keeps the previous snapshot."""
+    client = Mock()
+    client.get.return_value = _response(lines=["a@example.com"], headers={})
+    sync_recipients(client=client, url=URL, store=store)
+
+    client.get.return_value = _response(lines=["", "not-an-address"])
+    result = sync_recipients(client=client, url=URL, store=store)
+
+    assert list(result) == ["a@example.com"]
+    assert "has no valid addresses" in caplog.text
+    _, cached = store.load(URL)
+    assert list(cached) == ["a@example.com"]
+
+
+def test_snapshots_are_kept_per_url(store):
+    """Test that main and test lists do not overwrite each other."""
+    client = Mock()
+    client.get.return_value = _response(lines=["main@example.com"])
+    sync_recipients(client=client, url=URL, store=store)
+    client.get.return_value = _response(lines=["test@example.com"])
+    sync_recipients(client=client, url=URL + "?test", store=store)
+
+    assert list(store.load(URL)[1]) == ["main@example.com"]
+    assert list(store.load(URL + "?test")[1]) == ["test@example.com"]
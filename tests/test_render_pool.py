@@ -0,0 +1,114 @@
+"""Tests for process-pool formatting and rendering."""
+
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from ocean_report.application import create_application_context
+
+from ocean_report.emailer.template_renderer import render_email_template
+from ocean_report.models.noaa.tides import NoaaTidePredictionRecord
+from ocean_report.workflows.data import format_report_data
+from ocean_report.workflows.models import RawReportData
+from ocean_report.workflows.render_pool import RenderJob, RenderPool
+from ocean_report.workflows.report_runner import run_report
+
+
+def raw_report(water_temp: float) -> RawReportData:
+    return RawReportData(
+        tides=[
+            NoaaTidePredictionRecord(t="2025-07-04 08:12", v=4.1, type="H"),
+            NoaaTidePredictionRecord(t="2025-07-04 14:30", v=-0.2, type="L"),
+        ],
+        tide_timestamp=datetime(2025, 7, 4, 6, 0),
+        water_temp=water_temp,
+        water_temp_timestamp=datetime(2025, 7, 4, 6, 0),
+        water_temp_data_time="2025-07-04 05:54",
+        wind_forecast=[
+            {
+                "time": "8 AM",
+                "speed_mph": 7.5,
+                "direction": "ESE",
+                "wind_type": "Cross/Onshore",
+                "direction_deg": 112.0,
+            }
+        ],
+        wind_timestamp=datetime(2025, 7, 4, 6, 0),
+    )
+
+
+def jobs(count: int) -> list[RenderJob]:
+    return [
+        RenderJob(
+            location=f"beach-{index}",
+            raw_data=raw_report(60.0 + index),
+            report_date=datetime(2025, 7, 4),
+        )
+        for index in range(count)
+    ]
+
+
+def test_single_worker_matches_the_report_pipeline():
+    """Test workers=1 renders in-process exactly as run_report would."""
+    job = jobs(1)[0]
+    expected_data = format_report_data(job.raw_data, report_date=job.report_date)
+
+    with RenderPool(workers=1) as pool:
+        (result,) = pool.render([job])
+
+    assert result.location == "beach-0"
+    assert result.email_data.model_dump() == expected_data.model_dump()
+    assert result.body == render_email_template(data=expected_data)
+
+
+def test_worker_processes_return_results_in_job_order():
+    """Test a two-process pool renders every job and keeps the input order."""
+    batch = jobs(6)
+    with RenderPool(workers=1) as serial:
+        expected = serial.render(batch)
+    with RenderPool(workers=2) as pool:
+        results = pool.render(batch)
+        again = pool.render(batch[:2])
+
+    assert [item.location for item in results] == [job.location for job in batch]
+    assert [item.body for item in results] == [item.body for item in expected]
+    assert [item.body for item in again] == [item.body for item in expected[:2]]
+    assert "61" in results[1].email_data.water_temp
+
+
+def test_invalid_worker_count_is_rejected():
+    """Test a pool needs at least one worker."""
+    with pytest.raises(ValueError):
+        RenderPool(workers=0)
+
+
+def test_run_report_renders_in_a_supplied_pool():
+    """Test run_report hands format and render to the pool it is given."""
+    raw = raw_report(64.0)
+    with (
+        patch(
+            "ocean_report.workflows.report_runner.fetch_raw_data",
+            return_value=raw,
+        ),
+        patch(
+            "ocean_report.workflows.report_runner.get_bcc_recipients",
+            return_value=["test@example.com"],
+        ),
+        patch(
+            "ocean_report.workflows.report_runner.render_email_template"
+        ) as in_process_render,
+        patch(
+            "ocean_report.workflows.report_runner.send_or_preview_email"
+        ) as mock_send,
+        RenderPool(workers=1) as pool,
+    ):
+        run_report(
+            context=create_application_context(),
+            run_email=False,
+            render_pool=pool,
+        )
+        (expected,) = pool.render([RenderJob(location="default", raw_data=raw)])
+
+    in_process_render.assert_not_called()
+    assert mock_send.call_args.kwargs["body"] == expected.body
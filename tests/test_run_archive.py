@@ -0,0 +1,176 @@
+"""Tests for the run archive and replay mode."""
+
+import json
+from datetime import date, datetime
+from unittest.mock import Mock, patch
+
+import pytest
+
+from ocean_report.application.context import ApplicationContext
+from ocean_report.config.schemas import AppConfig
+from ocean_report.models.noaa.tides import NoaaTidePredictionRecord
+from ocean_report.workflows.data.archive import (
+    RunArchive,
+    config_fingerprint,
+    raw_report_to_dict,
+)
+from ocean_report.workflows.models import FetchParams, RawReportData
+from ocean_report.workflows.report_runner import _archive_raw_data, run_report
+
+
+def _raw_data(water_temp=73.5):
+    return RawReportData(
+        tides=[
+            NoaaTidePredictionRecord(
+                timestamp="2025-07-04 08:00", height_feet=4.2, event_type="H"
+            ),
+            NoaaTidePredictionRecord(
+                timestamp="2025-07-04 14:30", height_feet=0.5, event_type="L"
+            ),
+        ],
+        tide_timestamp=datetime(2025, 7, 4, 6, 0, 0),
+        water_temp=water_temp,
+        water_temp_timestamp=datetime(2025, 7, 4, 6, 0, 5),
+        water_temp_data_time="Jul 4 at 5:54 AM",
+        wind_forecast=[
+            {
+                "time": "8 AM",
+                "speed_kmh": 16.9,
+                "direction_deg": 315.0,
+                "speed_mph": 10.5,
+                "direction": "NW",
+                "wind_type": "Offshore",
+            }
+        ],
+        wind_timestamp=None,
+    )
+
+
+@pytest.fixture
+def archive(tmp_path):
+    """Run archive in a temporary directory."""
+    return RunArchive(tmp_path / "runs.sqlite3")
+
+
+def test_round_trip_preserves_raw_data(archive):
+    """Test that an archived run decodes to identical RawReportData."""
+    run_id = archive.save(
+        _raw_data(), report_date="20250704", station_id="8534720", config_hash="abc"
+    )
+
+    loaded = archive.load(run_id=run_id)
+
+    assert loaded.raw_data == _raw_data()
+    assert loaded.report_date == "20250704"
+    assert loaded.station_id == "8534720"
+    assert loaded.config_hash == "abc"
+
+
+def test_load_by_date_returns_latest_run_for_that_day(archive):
+    """Test date lookups pick the newest run and ignore other days."""
+    archive.save(
+        _raw_data(70.0), report_date="20250704", station_id="1", config_hash="a"
+    )
+    archive.save(
+        _raw_data(71.0), report_date=date(2025, 7, 4), station_id="1", config_hash="a"
+    )
+    archive.save(
+        _raw_data(72.0), report_date="2025-07-05", station_id="1", config_hash="a"
+    )
+
+    assert archive.load("2025-07-04").raw_data.water_temp == 71.0
+    assert archive.load(date(2025, 7, 5)).raw_data.water_temp == 72.0
+    assert archive.load("20250706") is None
+    assert [run.report_date for run in archive.list_runs()] == [
+        "20250705",
+        "20250704",
+        "20250704",
+    ]
+
+
+def test_payload_is_compressed(archive):
+    """Test that stored blobs are smaller than the JSON they encode."""
+    raw = _raw_data()
+    raw.wind_forecast = raw.wind_forecast * 24
+    archive.save(raw, report_date="20250704", station_id="1", config_hash="a")
+
+    (info,) = archive.list_runs()
+    assert info.payload_bytes < len(json.dumps(raw_report_to_dict(raw)))
+
+
+def test_config_fingerprint_ignores_password():
+    """Test that credentials do not change the config hash, other fields do."""
+    base = AppConfig()
+    with_password = AppConfig.model_validate({"email": {"password": "secret"}})
+    other_station = AppConfig.model_validate({"noaa": {"station_id": "8531680"}})
+
+    assert config_fingerprint(base) == config_fingerprint(with_password)
+    assert config_fingerprint(base) != config_fingerprint(other_station)
+
+
+def test_replay_renders_archived_day_without_network(tmp_path):
+    """Test that replay formats the archived data for its own date, offline."""
+    archive_path = tmp_path / "runs.sqlite3"
+    RunArchive(archive_path).save(
+        _raw_data(), report_date="20250704", station_id="8534720", config_hash="x"
+    )
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(
+        f'archive:\n  path: "{archive_path}"\n'
+        'logging:\n  output: "console"\n  level: "INFO"\n'
+    )
+
+    with (
+        patch("ocean_report.workflows.report_runner.fetch_raw_data") as mock_fetch,
+        patch(
+            "ocean_report.workflows.report_runner.get_bcc_recipients"
+        ) as mock_recipients,
+        patch(
+            "ocean_report.workflows.report_runner.send_or_preview_email"
+        ) as mock_send,
+    ):
+        run_report(cfg_path=config_path, run_email=True, replay="20250704")
+
+    mock_fetch.assert_not_called()
+    mock_recipients.assert_not_called()
+    kwargs = mock_send.call_args.kwargs
+    assert kwargs["run_email"] is False
+    assert "Jul 04, 2025" in kwargs["subject"]
+    assert "Friday, July 04, 2025" in kwargs["body"]
+    assert "73.5" in kwargs["body"]
+
+
+def test_replay_missing_day_raises(tmp_path):
+    """Test that replaying a day with no archived run is an error."""
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(f'archive:\n  path: "{tmp_path / "runs.sqlite3"}"\n')
+
+    with pytest.raises(ValueError, match="No archived run for 20250704"):
+        run_report(cfg_path=config_path, replay="20250704")
+
+
+def test_runs_are_archived_only_when_enabled(tmp_path):
+    """Test the archive is opt-in and then written to archive.path."""
+    path = tmp_path / "runs.sqlite3"
+    params = FetchParams(
+        station_id="8534720",
+        date_str="20250704",
+        latitude=39.5,
+        longitude=-74.2,
+        beach_facing_deg=140.0,
+        forecast_times={"08:00"},
+    )
+
+    for enabled in (None, True):
+        archive_config = {"path": str(path)}
+        if enabled is not None:
+            archive_config["enabled"] = enabled
+        config = AppConfig.model_validate({"archive": archive_config})
+        _archive_raw_data(
+            context=ApplicationContext(config=config, client=Mock()),
+            raw_data=_raw_data(),
+            fetch_params=params,
+        )
+        assert path.exists() is bool(enabled)
+
+    assert len(RunArchive(path).list_runs()) == 1
@@ -0,0 +1,119 @@
+"""End-to-end email tests against the in-process SMTP sink."""
+
+import smtplib
+from unittest.mock import Mock
+
+import pytest
+
+from ocean_report.application.context import ApplicationContext
+from ocean_report.config.schemas import AppConfig, DeliveryConfig, EmailConfig
+from ocean_report.emailer.sender import (
+    EmailRecipients,
+    send_email,
+    send_email_chunked,
+)
+from ocean_report.testing import SmtpSink
+from ocean_report.workflows.email import send_or_preview_email
+
+
+@pytest.fixture
+def sink():
+    """Run an authenticated SMTP sink for the duration of a test."""
+    with SmtpSink(
+        username="sender@example.com",
+        password="test_password",
+        rejected_recipients={"bounce@example.com"},
+    ) as running_sink:
+        yield running_sink
+
+
+def test_send_email_over_starttls_and_auth(sink):
+    """Test the single-message path against a real SMTP conversation."""
+    send_email(
+        subject="Sink Subject",
+        body="Sink Body",
+        sender_email="sender@example.com",
+        email_password="test_password",
+        recipients=EmailRecipients(bcc_list=["a@example.com", "b@example.com"]),
+        smtp_server=sink.host,
+        smtp_port=sink.port,
+    )
+
+    assert sink.stats.tls_upgrades == 1
+    assert sink.stats.logins == 1
+    message = sink.messages[0]
+    assert message.tls is True
+    assert message.authenticated_as == "sender@example.com"
+    assert {"a@example.com", "b@example.com"} <= set(message.rcpt_tos)
+    assert b"Sink Body" in message.data
+
+
+def test_send_email_rejects_bad_credentials(sink):
+    """Test that AUTH failures surface as SMTPAuthenticationError."""
+    with pytest.raises(smtplib.SMTPAuthenticationError):
+        send_email(
+            sender_email="sender@example.com",
+            email_password="wrong",
+            recipients=EmailRecipients(bcc_list=["a@example.com"]),
+            smtp_server=sink.host,
+            smtp_port=sink.port,
+        )
+
+
+def test_chunked_delivery_against_sink(sink):
+    """Test chunked delivery: no Bcc header, parallel sessions, refusals counted."""
+    bcc = [f"user{i}@example.com" for i in range(25)] + ["bounce@example.com"]
+
+    report = send_email_chunked(
+        sender_email="sender@example.com",
+        email_password="test_password",
+        recipients=EmailRecipients(bcc_list=bcc),
+        smtp_server=sink.host,
+        smtp_port=sink.port,
+        chunk_size=10,
+        max_connections=3,
+    )
+
+    assert report.delivered == 25
+    assert report.failed_recipients == ["bounce@example.com"]
+    assert sink.stats.messages == 3
+    assert sink.stats.connections == 3
+    assert all(b"\nBcc:" not in message.data for message in sink.messages)
+    assert all(len(message.rcpt_tos) <= 10 for message in sink.messages)
+
+
+def test_send_or_preview_email_through_sink(sink):
+    """Test the workflow sender end-to-end with chunked delivery configured."""
+    config = AppConfig(
+        email=EmailConfig(
+            smtp_server=sink.host,
+            smtp_port=sink.port,
+            sender="sender@example.com",
+            password="test_password",
+            delivery=DeliveryConfig(mode="chunked", chunk_size=2),
+        )
+    )
+    context = ApplicationContext(config=config, client=Mock())
+
+    send_or_preview_email(
+        context=context,
+        run_email=True,
+        subject="Workflow",
+        body="Workflow body",
+        bcc_recipients=["a@example.com", "b@example.com", "c@example.com"],
+    )
+
+    assert sink.stats.messages == 2
+    assert sink.stats.recipients == 3
+
+
+def test_sink_applies_command_latency():
+    """Test that per-command latency slows each SMTP round trip."""
+    with SmtpSink(command_latency_seconds=0.02) as slow_sink:
+        with smtplib.SMTP(slow_sink.host, slow_sink.port) as client:
+            client.ehlo()
+            client.noop()
+            client.noop()
+
+    # Greeting, EHLO and two NOOPs each wait at least the configured delay
+    assert slow_sink.stats.connections == 1
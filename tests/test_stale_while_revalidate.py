@@ -0,0 +1,197 @@
+"""Tests for stale-while-revalidate serving of report data."""
+
+import threading
+from datetime import datetime
+from unittest.mock import Mock, patch
+
+import pytest
+from pydantic import ValidationError
+
+from ocean_report.application.context import ApplicationContext
+from ocean_report.config.schemas import AppConfig
+from ocean_report.use_cases import stale_while_revalidate as swr
+from ocean_report.use_cases.stale_while_revalidate import (
+    ServedValue,
+    StaleWhileRevalidateCache,
+    clear_stale_while_revalidate_cache,
+    get_daytime_tides_for_date_swr,
+    get_latest_water_temp_swr,
+)
+from ocean_report.workflows.data.fetcher import fetch_raw_data
+from ocean_report.workflows.models import FetchParams
+
+BOUNDS = {"fresh_seconds": 60, "max_stale_seconds": 600}
+
+
+class FakeClock:
+    """Settable monotonic clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def wait_for_refresh(cache, key):
+    """Block until no background refresh of ``key`` is running."""
+    for _ in range(500):
+        with cache._lock:  # pylint: disable=protected-access
+            if key not in cache._refreshing:  # pylint: disable=protected-access
+                return
+        threading.Event().wait(0.01)
+    raise AssertionError("refresh did not finish")
+
+
+def test_fresh_values_are_served_without_loading():
+    """Test a value within fresh_seconds is reused and its age reported."""
+    clock = FakeClock()
+    cache = StaleWhileRevalidateCache(clock=clock)
+    loader = Mock(return_value=72.5)
+
+    first = cache.get("a", loader, **BOUNDS)
+    clock.now += 30
+    second = cache.get("a", loader, **BOUNDS)
+
+    assert (first.value, first.age_seconds, first.stale) == (72.5, 0.0, False)
+    assert (second.value, second.age_seconds, second.stale) == (72.5, 30, False)
+    assert loader.call_count == 1
+
+
+def test_stale_values_return_immediately_and_refresh_once():
+    """Test stale reads do not wait and share one background refresh."""
+    clock = FakeClock()
+    cache = StaleWhileRevalidateCache(clock=clock)
+    cache.get("a", lambda: "old", **BOUNDS)
+    clock.now += 120
+
+    release = threading.Event()
+    calls = []
+
+    def slow_loader():
+        calls.append(1)
+        release.wait(5)
+        return "new"
+
+    served = [cache.get("a", slow_loader, **BOUNDS) for _ in range(5)]
+    release.set()
+    wait_for_refresh(cache, "a")
+
+    assert [item.value for item in served] == ["old"] * 5
+    assert all(item.stale and item.refreshing for item in served)
+    assert served[0].age_seconds == 120
+    assert len(calls) == 1
+    assert cache.get("a", slow_loader, **BOUNDS).value == "new"
+
+
+def test_expired_values_load_and_failed_refreshes_keep_stale_value():
+    """Test the max-stale bound and that refresh failures are retried later."""
+    clock = FakeClock()
+    cache = StaleWhileRevalidateCache(clock=clock)
+    cache.get("a", lambda: "old", **BOUNDS)
+
+    clock.now += 120
+    failing = Mock(side_effect=RuntimeError("NOAA down"))
+    assert cache.get("a", failing, **BOUNDS).value == "old"
+    wait_for_refresh(cache, "a")
+    served = cache.get("a", failing, **BOUNDS)
+    assert (served.value, served.refreshing) == ("old", False)
+    assert failing.call_count == 1  # retry waits REFRESH_RETRY_SECONDS
+
+    clock.now += 600
+    with pytest.raises(RuntimeError):
+        cache.get("a", failing, **BOUNDS)
+    assert cache.get("a", lambda: "new", **BOUNDS).value == "new"
+
+
+def test_clear_discards_refreshes_in_flight():
+    """Test a refresh that finishes after clear() does not repopulate."""
+    clock = FakeClock()
+    cache = StaleWhileRevalidateCache(clock=clock)
+    cache.get("a", lambda: "old", **BOUNDS)
+    clock.now += 120
+
+    release = threading.Event()
+    finished = threading.Event()
+
+    def slow_loader():
+        release.wait(5)
+        finished.set()
+        return "from before clear"
+
+    cache.get("a", slow_loader, **BOUNDS)
+    cache.clear()
+    release.set()
+    finished.wait(5)
+    threading.Event().wait(0.05)
+
+    assert cache.get("a", lambda: "new", **BOUNDS).value == "new"
+
+
+def test_fetch_raw_data_serves_stale_inputs():
+    """Test serve_stale routes through the wrappers and reports the oldest age."""
+    context = ApplicationContext(config=AppConfig(), client=Mock())
+    params = FetchParams(
+        station_id="8534720",
+        date_str="20260704",
+        latitude=39.3,
+        longitude=-74.5,
+        beach_facing_deg=120.0,
+        forecast_times={"08:00"},
+    )
+    retrieved = datetime(2026, 7, 4, 6, 0)
+
+    with (
+        patch.object(swr, "get_daytime_tides_for_date_swr") as tides,
+        patch.object(swr, "get_latest_water_temp_swr") as water,
+        patch.object(swr, "get_daily_wind_forecast_swr") as wind,
+    ):
+        tides.return_value = ServedValue(([], retrieved), 10.0, False, False)
+        water.return_value = ServedValue(
+            (72.5, retrieved, "2026-07-04 05:54"), 300.0, True, True
+        )
+        wind.return_value = ServedValue(([], retrieved), 0.0, False, False)
+        raw = fetch_raw_data(context, params, serve_stale=True)
+
+    assert (raw.water_temp, raw.data_age_seconds, raw.stale) == (72.5, 300.0, True)
+    assert water.call_args.kwargs == {"context": context, "station_id": "8534720"}
+
+
+def test_use_case_wrappers_follow_the_config():
+    """Test disabled wrappers call through and enabled ones cache per key."""
+    clear_stale_while_revalidate_cache()
+    reading = (72.5, datetime(2026, 7, 4, 6, 0), "2026-07-04 05:54")
+    disabled = ApplicationContext(config=AppConfig(), client=Mock())
+    enabled = ApplicationContext(
+        config=AppConfig.model_validate({"stale_while_revalidate": {"enabled": "on"}}),
+        client=Mock(),
+    )
+
+    with (
+        patch.object(swr.water_temperature, "get_latest_water_temp") as water,
+        patch.object(swr.tides, "get_daytime_tides_for_date") as tides,
+    ):
+        water.return_value = reading
+        tides.return_value = ([], datetime(2026, 7, 4, 6, 0))
+        get_latest_water_temp_swr(context=disabled)
+        get_latest_water_temp_swr(context=disabled)
+        assert water.call_count == 2
+
+        served = get_latest_water_temp_swr(context=enabled)
+        get_latest_water_temp_swr(context=enabled)
+        get_daytime_tides_for_date_swr(context=enabled, date="20260704")
+        get_daytime_tides_for_date_swr(context=enabled, date="20260705")
+
+    assert served.value == reading
+    assert water.call_count == 3
+    assert water.call_args.kwargs["station_id"] == enabled.config.noaa.station_id
+    assert tides.call_count == 2
+    clear_stale_while_revalidate_cache()
+
+
+def test_max_stale_must_cover_fresh_seconds():
+    """Test the config rejects a max-stale bound below the fresh bound."""
+    with pytest.raises(ValidationError, match="max_stale_seconds"):
+        AppConfig.model_validate(
+            {"stale_while_revalidate": {"fresh_seconds": 300, "max_stale_seconds": 60}}
+        )
@@ -0,0 +1,143 @@
+"""Tests for the station catalog cache and nearest-station index."""
+
+import json
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pytest
+
+from ocean_report.application.context import ApplicationContext
+from ocean_report.config.schemas import AppConfig
+from ocean_report.models.noaa.stations import NoaaStation
+from ocean_report.storage.station_catalog import EARTH_RADIUS_KM, StationIndex
+from ocean_report.use_cases.stations import (
+    find_nearest_stations,
+    find_nearest_stations_bulk,
+    get_station_index,
+)
+
+STATIONS = [
+    NoaaStation(id="8534720", name="Atlantic City", latitude=39.355, longitude=-74.417),
+    NoaaStation(id="8545530", name="Cape May", latitude=38.969, longitude=-74.961),
+    NoaaStation(id="8531680", name="Sandy Hook", latitude=40.467, longitude=-74.009),
+    NoaaStation(id="9414290", name="San Francisco", latitude=37.807, longitude=-122.465),
+    NoaaStation(id="0000000", name="No coordinates"),
+]
+
+
+def _haversine_km(lat1, lon1, lat2, lon2):
+    lat1, lon1, lat2, lon2 = map(np.radians, (lat1, lon1, lat2, lon2))
+    a = (
+        np.sin((lat2 - lat1) / 2) ** 2
+        + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+
+
+@pytest.fixture
+def context(tmp_path):
+    """Context with the station catalog cached in a temporary directory."""
+    config = AppConfig.model_validate(
+        {
+            "noaa": {"station_catalog": {"directory": str(tmp_path / "stations")}},
+            "location": {"latitude": 39.5, "longitude": -74.2},
+        }
+    )
+    return ApplicationContext(config=config, client=Mock())
+
+
+def test_nearest_matches_brute_force_on_random_points():
+    """Test grid lookups against an exhaustive haversine search."""
+    rng = np.random.default_rng(7)
+    lats, lons = rng.uniform(20, 50, 500), rng.uniform(-130, -65, 500)
+    index = StationIndex(
+        [
+            NoaaStation(id=str(i), name=str(i), latitude=lat, longitude=lon)
+            for i, (lat, lon) in enumerate(zip(lats, lons))
+        ]
+    )
+
+    for lat, lon in zip(rng.uniform(-60, 70, 200), rng.uniform(-180, 180, 200)):
+        expected = np.argsort(_haversine_km(lat, lon, lats, lons))[:3]
+        matches = index.nearest(lat, lon, k=3)
+        assert [m.station_id for m in matches] == [str(i) for i in expected]
+
+
+def test_nearest_reports_distance_and_honours_max_distance():
+    """Test distances in kilometres and the max_distance_km cut-off."""
+    index = StationIndex(STATIONS)
+
+    (match,) = index.nearest(39.5, -74.2)
+    assert match.station_id == "8534720"
+    assert match.distance_km == pytest.approx(
+        _haversine_km(39.5, -74.2, 39.355, -74.417), rel=1e-6
+    )
+    assert index.nearest(0.0, -150.0, max_distance_km=500) == []
+    assert len(index) == 4
+
+
+def test_bulk_lookup_matches_single_lookups():
+    """Test vectorized bulk lookups agree with per-point lookups."""
+    index = StationIndex(STATIONS)
+    lats, lons = [39.5, 38.9, 37.7, 40.5], [-74.2, -74.9, -122.4, -74.0]
+
+    ids, distances = index.nearest_many(lats, lons)
+
+    assert ids == ["8534720", "8545530", "9414290", "8531680"]
+    for lat, lon, distance in zip(lats, lons, distances):
+        assert index.nearest(lat, lon)[0].distance_km == pytest.approx(distance)
+
+
+def test_missing_catalog_is_fetched_once_and_cached(context, tmp_path):
+    """Test the first lookup fetches and caches; later ones stay local."""
+    with patch(
+        "ocean_report.use_cases.stations.fetch_stations", return_value=STATIONS
+    ) as mock_fetch:
+        (match,) = find_nearest_stations(context=context)
+        ids, _ = find_nearest_stations_bulk(
+            context=context, latitudes=[37.8], longitudes=[-122.4]
+        )
+
+    assert match.station_id == "8534720"
+    assert ids == ["9414290"]
+    mock_fetch.assert_called_once()
+    assert mock_fetch.call_args.kwargs["params"].station_type == "tidepredictions"
+    assert (tmp_path / "stations" / "tidepredictions.json").exists()
+
+
+def test_stale_catalog_is_served_while_refreshing_in_background(context, tmp_path):
+    """Test a stale cache answers immediately and is refreshed in a thread."""
+    cache_file = tmp_path / "stations" / "watertemp.json"
+    cache_file.parent.mkdir(parents=True)
+    cache_file.write_text(
+        json.dumps(
+            {
+                "fetched_at": time.time() - 30 * 24 * 3600,
+                "stations": [STATIONS[1].model_dump()],
+            }
+        )
+    )
+    refreshed = threading.Event()
+
+    def slow_fetch(**_kwargs):
+        refreshed.wait(5)
+        return STATIONS
+
+    with patch("ocean_report.use_cases.stations.fetch_stations", side_effect=slow_fetch):
+        stale = get_station_index(context=context, product="water_temperature")
+        assert len(stale) == 1
+        refreshed.set()
+        for thread in threading.enumerate():
+            if thread.name == "station-catalog-watertemp":
+                thread.join(5)
+
+    fresh = get_station_index(context=context, product="water_temperature")
+    assert len(fresh) == 4
+
+
+def test_unknown_product_is_rejected(context):
+    """Test that only products with a station type filter are accepted."""
+    with pytest.raises(ValueError, match="Unknown product"):
+        get_station_index(context=context, product="wind")
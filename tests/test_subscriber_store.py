@@ -0,0 +1,142 @@
+"""Tests for the SQLite subscriber store."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from ocean_report.application.context import ApplicationContext
+from ocean_report.config.schemas import AppConfig
+from ocean_report.emailer.address_fetcher import RecipientSet
+from ocean_report.emailer.subscribers import SubscriberStore
+from ocean_report.use_cases.email import (
+    get_email_recipient_set,
+    import_subscribers_from_recipient_urls,
+)
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Subscriber store in a temporary directory."""
+    return SubscriberStore(tmp_path / "subscribers.sqlite3")
+
+
+@pytest.fixture
+def store_context(tmp_path):
+    """Context with the subscriber store enabled."""
+    config = AppConfig.model_validate(
+        {
+            "email": {
+                "recipient_urls": {
+                    "main": "https://example.com/main.txt",
+                    "offseason": "https://example.com/offseason.txt",
+                    "test": "",
+                },
+                "subscriber_store": {
+                    "enabled": True,
+                    "path": str(tmp_path / "subscribers.sqlite3"),
+                    "location": "lbi",
+                },
+            }
+        }
+    )
+    return ApplicationContext(config=config, client=Mock())
+
+
+def test_import_text_parses_gist_format(store):
+    """Test that Gist-format text is normalized and de-duplicated on import."""
+    count = store.import_text(
+        "A@example.com, b@example.com\na@example.com\nnot-an-email\n",
+        location="lbi",
+        season="summer",
+    )
+
+    assert count == 2
+    assert list(store.segment(location="lbi", season="summer")) == [
+        "a@example.com",
+        "b@example.com",
+    ]
+
+
+def test_segment_includes_year_round_members_only_for_its_location(store):
+    """Test that season, location and test flag select the right members."""
+    store.import_segment(["summer@example.com"], location="lbi", season="summer")
+    store.import_segment(["winter@example.com"], location="lbi", season="offseason")
+    store.import_segment(["always@example.com"], location="lbi", season="all")
+    store.import_segment(["other@example.com"], location="cape", season="summer")
+    store.import_segment(
+        ["tester@example.com"], location="lbi", season="all", is_test=True
+    )
+
+    assert list(store.segment(location="lbi", season="summer")) == [
+        "always@example.com",
+        "summer@example.com",
+    ]
+    assert list(store.segment(location="lbi", season="offseason")) == [
+        "always@example.com",
+        "winter@example.com",
+    ]
+    assert list(store.segment(location="lbi", season="summer", is_test=True)) == [
+        "tester@example.com"
+    ]
+
+
+def test_import_replaces_or_appends(store):
+    """Test that imports mirror the source list unless appending."""
+    store.import_segment(["a@example.com", "b@example.com"], location="x", season="all")
+    store.import_segment(["c@example.com"], location="x", season="all")
+    assert list(store.segment(location="x", season="all")) == ["c@example.com"]
+
+    store.import_segment(["d@example.com"], location="x", season="all", replace=False)
+    assert list(store.segment(location="x", season="all")) == [
+        "c@example.com",
+        "d@example.com",
+    ]
+
+
+def test_remove_and_counts(store):
+    """Test unsubscribing from every segment and per-segment counts."""
+    store.import_segment(["a@example.com"], location="x", season="summer")
+    store.import_segment(["a@example.com", "b@example.com"], location="x", season="all")
+
+    assert store.remove("A@example.com") == 2
+    assert store.counts() == {("x", "all", False): 1}
+
+
+def test_unknown_season_is_rejected(store):
+    """Test that typos in season names fail loudly."""
+    with pytest.raises(ValueError):
+        store.segment(location="x", season="winter")
+
+
+def test_get_email_recipient_set_reads_store_without_network(store_context):
+    """Test that an enabled store is used instead of the recipient URLs."""
+    path = store_context.config.email.subscriber_store.path
+    SubscriberStore(path).import_segment(
+        ["a@example.com"], location="lbi", season="summer"
+    )
+
+    with patch("ocean_report.use_cases.email.determine_is_summer", return_value=True):
+        result = get_email_recipient_set(context=store_context)
+
+    assert list(result) == ["a@example.com"]
+    store_context.client.get.assert_not_called()
+
+
+def test_import_subscribers_from_recipient_urls(store_context):
+    """Test that configured Gists are imported into their segments."""
+    lists = {
+        "https://example.com/main.txt": RecipientSet(["m@example.com"]),
+        "https://example.com/offseason.txt": RecipientSet(["o@example.com"]),
+    }
+
+    with patch(
+        "ocean_report.use_cases.email.stream_recipients_from_gist",
+        side_effect=lambda client, url: lists[url],
+    ):
+        counts = import_subscribers_from_recipient_urls(context=store_context)
+
+    assert counts == {"main": 1, "offseason": 1}
+    store = SubscriberStore(store_context.config.email.subscriber_store.path)
+    assert list(store.segment(location="lbi", season="offseason")) == [
+        "o@example.com"
+    ]
@@ -0,0 +1,90 @@
+"""Tests for the suppression list and bloom filter."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from ocean_report.application.context import ApplicationContext
+from ocean_report.config.schemas import AppConfig
+from ocean_report.emailer.address_fetcher import RecipientSet
+from ocean_report.emailer.suppression import SuppressionFilter, SuppressionList
+from ocean_report.workflows.email import get_bcc_recipients
+
+
+def test_filter_removes_exactly_the_suppressed_addresses():
+    """Test that bloom positives are confirmed against the exact list."""
+    suppressed = sorted(f"gone{i}@example.com" for i in range(5_000))
+    suppression_filter = SuppressionFilter(suppressed, false_positive_rate=0.05)
+    recipients = RecipientSet(
+        [f"user{i}@example.com" for i in range(5_000)]
+        + ["gone1@example.com", "gone4999@example.com"]
+    )
+
+    result = suppression_filter.filter(recipients)
+
+    assert len(result.recipients) == 5_000
+    assert result.suppressed == ("gone1@example.com", "gone4999@example.com")
+    assert "gone1@example.com" not in result.recipients
+
+
+def test_bloom_false_positive_rate_is_near_target():
+    """Test that the bloom filter rejects most non-members on its own."""
+    suppression_filter = SuppressionFilter(
+        sorted(f"gone{i}@example.com" for i in range(20_000)),
+        false_positive_rate=0.01,
+    )
+    probes = [f"user{i}@example.com" for i in range(20_000)]
+
+    rate = suppression_filter.might_contain_many(probes).mean()
+
+    assert rate < 0.03
+    assert "user1@example.com" not in suppression_filter
+    assert "gone1@example.com" in suppression_filter
+
+
+def test_empty_filter_keeps_everyone():
+    """Test that an empty suppression list suppresses nothing."""
+    recipients = RecipientSet(["a@example.com"])
+
+    result = SuppressionFilter([]).filter(recipients)
+
+    assert result.recipients is recipients
+    assert result.suppressed == ()
+
+
+def test_suppression_list_add_and_remove(tmp_path):
+    """Test that the on-disk list stays normalized, unique and sorted."""
+    suppression_list = SuppressionList(tmp_path / "suppression.txt")
+
+    assert suppression_list.add(["B@example.com", "a@example.com", "bad"]) == 2
+    assert suppression_list.add(["a@example.com"]) == 0
+    assert suppression_list.read() == ["a@example.com", "b@example.com"]
+
+    assert suppression_list.remove(["A@example.com"]) == 1
+    assert suppression_list.read() == ["b@example.com"]
+
+
+def test_get_bcc_recipients_applies_suppression(tmp_path):
+    """Test that suppressed addresses are dropped before sending."""
+    suppression_path = tmp_path / "suppression.txt"
+    SuppressionList(suppression_path).add(["bounced@example.com"])
+    config = AppConfig.model_validate(
+        {"email": {"suppression": {"path": str(suppression_path)}}}
+    )
+    context = ApplicationContext(config=config, client=Mock())
+
+    result = get_bcc_recipients(
+        test=False,
+        use_url=False,
+        fallback_recipients="ok@example.com,bounced@example.com",
+        context=context,
+    )
+
+    assert list(result) == ["ok@example.com"]
+
+
+@pytest.mark.parametrize("rate", [0, 1, 1.5])
+def test_invalid_false_positive_rate_is_rejected(rate):
+    """Test that impossible bloom filter targets fail loudly."""
+    with pytest.raises(ValueError):
+        SuppressionFilter(["a@example.com"], false_positive_rate=rate)
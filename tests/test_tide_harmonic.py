@@ -0,0 +1,232 @@
+"""Tests for harmonic tide prediction from NOAA constituents."""
+
+import json
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pytest
+
+from ocean_report.api_client.exceptions import ApiConnectionError
+from ocean_report.application.context import ApplicationContext
+from ocean_report.config.schemas import AppConfig
+from ocean_report.models.noaa.harmonics import (
+    NoaaDatumsResponse,
+    NoaaHarmonicConstituent,
+    NoaaHarmonicConstituentsResponse,
+)
+from ocean_report.models.noaa.tides import NoaaTidePredictionRecord
+from ocean_report.tides.harmonic import (
+    CONSTITUENTS,
+    HarmonicModel,
+    astronomical_arguments,
+    node_factors,
+    predict_hilo,
+)
+from ocean_report.use_cases.tides import get_daytime_tides_for_date
+
+# Seattle constituents, datums and NOAA's own hi/lo predictions, as recorded.
+SEATTLE = Path(__file__).parent / "fixtures" / "noaa_9447130_hilo_20150101.json"
+
+# Speeds (degrees/hour) as listed in NOAA harcon responses.
+NOAA_SPEEDS = {
+    "M2": 28.984104,
+    "S2": 30.0,
+    "N2": 28.43973,
+    "K1": 15.041069,
+    "O1": 13.943035,
+    "M4": 57.96821,
+    "MK3": 44.025173,
+    "2MK3": 42.92714,
+    "L2": 29.528479,
+    "MSF": 1.015896,
+    "SA": 0.041069,
+}
+
+HARCON = {
+    "units": "feet",
+    "HarmonicConstituents": [
+        {"number": 1, "name": "M2", "amplitude": 2.01, "phase_GMT": 5.0, "speed": 28.984104},
+        {"number": 2, "name": "S2", "amplitude": 0.39, "phase_GMT": 32.0, "speed": 30.0},
+        {"number": 3, "name": "N2", "amplitude": 0.46, "phase_GMT": -12.0, "speed": 28.43973},
+        {"number": 4, "name": "K1", "amplitude": 0.32, "phase_GMT": 104.0, "speed": 15.041069},
+        {"number": 6, "name": "O1", "amplitude": 0.26, "phase_GMT": 96.0, "speed": 13.943035},
+        {"number": 5, "name": "M4", "amplitude": 0.0, "phase_GMT": 0.0, "speed": 57.96821},
+    ],
+}
+DATUMS = {
+    "datums": [
+        {"name": "MLLW", "value": 2.10},
+        {"name": "MSL", "value": 4.66},
+        {"name": "MHHW", "value": 6.33},
+    ],
+    "epoch": "1983-2001",
+}
+
+
+def _model(**kwargs):
+    constituents = NoaaHarmonicConstituentsResponse.model_validate(HARCON).constituents
+    return HarmonicModel.from_constituents("8534720", constituents, **kwargs)
+
+
+def test_constituent_speeds_match_noaa():
+    """Test that equilibrium argument coefficients reproduce NOAA speeds."""
+    model = HarmonicModel.from_constituents(
+        "x",
+        [
+            NoaaHarmonicConstituent(name=name, amplitude=1.0, phase_GMT=0.0, speed=0.0)
+            for name in NOAA_SPEEDS
+        ],
+    )
+
+    assert model.speeds == pytest.approx(list(NOAA_SPEEDS.values()), abs=2e-6)
+    assert len(CONSTITUENTS) == 37
+
+
+def test_node_factors_match_schureman_extremes():
+    """Test f/u at the lunar node extremes (N = 0 and 180 degrees)."""
+    f, u = node_factors(["M2", "K1", "O1", "K2"], np.array([0.0, 180.0]), np.zeros(2))
+
+    assert f[:, 0] == pytest.approx([0.963, 1.113, 1.183, 1.316], abs=2e-3)
+    assert f[:, 1] == pytest.approx([1.038, 0.882, 0.806, 0.746], abs=2e-3)
+    assert np.abs(u).max() < 1e-9
+
+
+def test_equilibrium_arguments_follow_the_mean_sun():
+    """Test solar terms: S2 peaks at 00:00 UTC and T, h at J2000."""
+    model = HarmonicModel.from_constituents(
+        "x", [NoaaHarmonicConstituent(name="S2", amplitude=1.0, phase_GMT=0.0, speed=30)]
+    )
+    times = np.array(["2025-07-04T00:00", "2025-07-04T03:00"], dtype="datetime64[m]")
+    astro = astronomical_arguments(np.array(["2000-01-01T12:00"], dtype="datetime64[m]"))
+
+    assert model.heights(times) == pytest.approx([1.0, 0.0], abs=1e-9)
+    assert astro["T"][0] == pytest.approx(0.0)
+    assert astro["h"][0] == pytest.approx(280.46646)
+
+
+def test_diurnal_solar_tide_peaks_at_noon_at_the_june_solstice():
+    """Test K1 (T + h - 90) and P1 (T - h + 90) add up at local noon."""
+    model = HarmonicModel.from_constituents(
+        "x",
+        [
+            NoaaHarmonicConstituent(name=name, amplitude=1.0, phase_GMT=0.0, speed=15)
+            for name in ("K1", "P1")
+        ],
+    )
+    times = np.array(["2025-06-21T00:00", "2025-06-21T12:00"], dtype="datetime64[m]")
+
+    midnight, noon = model.heights(times)
+    assert noon > 1.9
+    assert midnight < -1.9
+
+
+def test_hilo_matches_recorded_noaa_predictions():
+    """Test times and heights against NOAA's published Seattle hi/lo tides."""
+    fixture = json.loads(SEATTLE.read_text(encoding="utf-8"))
+    datums = NoaaDatumsResponse.model_validate(fixture["datums"])
+    model = HarmonicModel.from_constituents(
+        fixture["station"],
+        NoaaHarmonicConstituentsResponse.model_validate(fixture["harcon"]).constituents,
+        datum_offset=datums.value("MSL") - datums.value("MLLW"),
+    )
+    expected = [
+        NoaaTidePredictionRecord.model_validate(record)
+        for record in fixture["hilo"]["predictions"]
+    ]
+
+    records = predict_hilo(model, start="2015-01-01", end="2015-01-03", time_zone="UTC")
+
+    assert [r.event_type for r in records] == [r.event_type for r in expected]
+    minutes = np.array(
+        [r.timestamp for r in records], dtype="datetime64[m]"
+    ) - np.array([r.timestamp for r in expected], dtype="datetime64[m]")
+    heights = np.array([r.height_feet for r in records]) - np.array(
+        [r.height_feet for r in expected]
+    )
+    # NOAA's 2015 tables predate the current (2000-2024) constituent set.
+    assert np.abs(minutes.astype(int)).max() <= 6
+    assert np.abs(heights).max() < 0.08
+
+
+def test_extrema_match_dense_sampling():
+    """Test hi/lo events against a 1-minute brute-force search."""
+    model = _model(datum_offset=2.56)
+    times, heights, is_high = model.extrema("2025-07-01", "2025-07-08")
+
+    dense = np.arange(
+        np.datetime64("2025-06-30T22:00"), np.datetime64("2025-07-08T02:00")
+    ).astype("datetime64[m]")
+    curve = model.heights(dense)
+    slope = np.sign(np.diff(curve))
+    turning = np.flatnonzero(slope[1:] != slope[:-1]) + 1
+    minute = np.timedelta64(1, "m")
+    keep = (dense[turning] >= times[0] - minute) & (dense[turning] <= times[-1] + minute)
+    expected = dense[turning][keep]
+    rising = slope[turning - 1][keep] > 0
+
+    assert len(times) == len(expected) >= 26
+    assert np.abs((times - expected).astype(int)).max() <= 1
+    assert is_high.tolist() == rising.tolist()
+    assert heights == pytest.approx(curve[turning][keep], abs=1e-3)
+
+
+def test_hilo_records_are_local_time():
+    """Test record shape and conversion to local wall-clock time."""
+    records = predict_hilo(
+        _model(datum_offset=2.56),
+        start="2025-07-04",
+        end="2025-07-05",
+        time_zone="America/New_York",
+    )
+
+    assert all(isinstance(record, NoaaTidePredictionRecord) for record in records)
+    assert all(record.timestamp.startswith("2025-07-04") for record in records)
+    assert {record.event_type for record in records} == {"H", "L"}
+    assert len(records) in (3, 4)
+
+
+def test_daytime_tides_use_cached_constituents(tmp_path):
+    """Test local prediction, the constituent cache and API fallback."""
+    config = AppConfig.model_validate(
+        {
+            "noaa": {
+                "tide_prediction": {
+                    "enabled": True,
+                    "directory": str(tmp_path / "harmonics"),
+                }
+            }
+        }
+    )
+    context = ApplicationContext(config=config, client=Mock())
+    responses = (
+        NoaaHarmonicConstituentsResponse.model_validate(HARCON),
+        NoaaDatumsResponse.model_validate(DATUMS),
+    )
+
+    with (
+        patch(
+            "ocean_report.use_cases.tides.fetch_station_harmonics",
+            return_value=responses,
+        ) as mock_harmonics,
+        patch("ocean_report.use_cases.tides.fetch_tide_data") as mock_fetch,
+    ):
+        first, _ = get_daytime_tides_for_date(context=context, date="20250704")
+        second, _ = get_daytime_tides_for_date(context=context, date="20250705")
+
+    mock_harmonics.assert_called_once()
+    mock_fetch.assert_not_called()
+    assert first and second
+    assert (tmp_path / "harmonics" / "8534720.json").exists()
+
+    with (
+        patch(
+            "ocean_report.use_cases.tides.fetch_station_harmonics",
+            side_effect=ApiConnectionError("offline"),
+        ),
+        patch(
+            "ocean_report.use_cases.tides.fetch_tide_data", return_value=[]
+        ) as mock_fetch,
+    ):
+        get_daytime_tides_for_date(context=context, station_id="8518750", date="20250704")
+    mock_fetch.assert_called_once()
@@ -0,0 +1,114 @@
+"""Tests for tide curves interpolated from high/low predictions."""
+
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pytest
+
+from ocean_report.application.context import ApplicationContext
+from ocean_report.config.schemas import AppConfig
+from ocean_report.models.noaa.tides import NoaaTidePredictionRecord
+from ocean_report.tides.interpolation import (
+    TideEvents,
+    interpolate_heights,
+    interpolation_error,
+    tide_curve,
+)
+from ocean_report.use_cases import tides as tide_use_cases
+
+# Approximate Atlantic City constituents: speed (deg/hour), amplitude (ft), phase.
+CONSTITUENTS = [
+    (28.9841042, 2.0, 0.0),
+    (30.0, 0.38, 40.0),
+    (28.4397295, 0.46, -20.0),
+    (15.0410686, 0.32, 100.0),
+    (13.9430356, 0.26, 90.0),
+    (57.9682084, 0.05, 10.0),
+]
+
+
+def _records(*events):
+    return [
+        NoaaTidePredictionRecord(t=stamp, v=height, type=kind)
+        for stamp, height, kind in events
+    ]
+
+
+EVENTS = _records(
+    ("2025-07-04 02:00", 4.0, "H"),
+    ("2025-07-04 08:00", 0.0, "L"),
+    ("2025-07-04 14:00", 5.0, "H"),
+)
+
+
+def test_curve_passes_through_events_and_midpoints():
+    """Test exact heights at extrema and the cosine midpoint."""
+    events = TideEvents.from_records(EVENTS)
+    times = np.array(
+        ["2025-07-04 02:00", "2025-07-04 05:00", "2025-07-04 08:00", "2025-07-04 14:00"],
+        dtype="datetime64[m]",
+    )
+
+    assert interpolate_heights(events, times) == pytest.approx([4.0, 2.0, 0.0, 5.0])
+
+
+def test_times_outside_events_are_nan():
+    """Test that the curve is not extrapolated past the first/last event."""
+    events = TideEvents.from_records(EVENTS)
+
+    times, heights = tide_curve(
+        events, start="2025-07-04 00:00", end="2025-07-04 16:00", step_minutes=60
+    )
+
+    assert len(times) == 16
+    assert np.isnan(heights[:2]).all() and np.isnan(heights[-1])
+    assert not np.isnan(heights[2:15]).any()
+
+
+def test_error_against_harmonic_six_minute_series_is_bounded():
+    """Test reconstruction error on a month of mixed semidiurnal tide."""
+    times = np.datetime64("2025-07-01T00:00") + np.arange(30 * 240) * np.timedelta64(
+        6, "m"
+    )
+    hours = np.arange(len(times)) / 10
+    truth = 2.5 + sum(
+        amplitude * np.cos(np.radians(speed * hours - phase))
+        for speed, amplitude, phase in CONSTITUENTS
+    )
+    slope = np.sign(np.diff(truth))
+    turning = np.flatnonzero(slope[1:] != slope[:-1]) + 1
+    events = TideEvents(times=times[turning], heights=truth[turning])
+
+    error = interpolation_error(events, times, truth)
+
+    assert error["count"] > 0.95 * len(times)
+    assert error["rms"] < 0.08
+    assert error["max_abs"] < 0.2
+
+
+def test_hourly_heights_reuse_cached_hilo_events():
+    """Test the use case fetches hi/lo once and returns 24 hourly heights."""
+    context = ApplicationContext(config=AppConfig(), client=Mock())
+    tide_use_cases._events_cache.clear()
+    events = _records(
+        ("2025-07-03 20:00", 4.0, "H"),
+        ("2025-07-04 02:10", 0.2, "L"),
+        ("2025-07-04 08:20", 4.4, "H"),
+        ("2025-07-04 14:30", 0.1, "L"),
+        ("2025-07-04 20:40", 4.6, "H"),
+        ("2025-07-05 02:50", 0.3, "L"),
+    )
+
+    with patch(
+        "ocean_report.use_cases.tides.fetch_tide_data", return_value=events
+    ) as mock_fetch:
+        times, heights = tide_use_cases.get_tide_heights(
+            context=context, date="20250704"
+        )
+        tide_use_cases.get_tide_heights(context=context, date="20250704", step_minutes=6)
+
+    mock_fetch.assert_called_once()
+    params = mock_fetch.call_args.kwargs["params"]
+    assert (params.begin_date, params.end_date) == ("20250703", "20250705")
+    assert len(times) == 24 and times[0] == np.datetime64("2025-07-04T00:00")
+    assert np.all((heights > 0.1) & (heights < 4.6))
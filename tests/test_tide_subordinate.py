@@ -0,0 +1,180 @@
+"""Tests for subordinate-station tide predictions."""
+
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pytest
+
+from ocean_report.application.context import ApplicationContext
+from ocean_report.config.schemas import AppConfig
+from ocean_report.models.noaa.harmonics import NoaaTidePredictionOffsets
+from ocean_report.models.noaa.tides import NoaaTidePredictionRecord
+from ocean_report.tides.interpolation import TideEvents
+from ocean_report.tides.subordinate import SubordinateOffsets, apply_offsets
+from ocean_report.use_cases.tides import (
+    _events_cache,
+    get_daytime_tides_for_date,
+    get_subordinate_tide_events,
+)
+
+REFERENCE = "8534720"
+
+
+def _records(day):
+    return [
+        NoaaTidePredictionRecord(t=f"{day} 00:30", v=-0.2, type="L"),
+        NoaaTidePredictionRecord(t=f"{day} 06:45", v=4.1, type="H"),
+        NoaaTidePredictionRecord(t=f"{day} 12:50", v=0.1, type="L"),
+        NoaaTidePredictionRecord(t=f"{day} 19:05", v=4.5, type="H"),
+    ]
+
+
+def _context(subordinates):
+    config = AppConfig.model_validate({"noaa": {"subordinate_stations": subordinates}})
+    return ApplicationContext(config=config, client=Mock())
+
+
+@pytest.fixture(autouse=True)
+def clear_event_cache():
+    """Reset the per-process hi/lo cache between tests."""
+    _events_cache.clear()
+    yield
+    _events_cache.clear()
+
+
+def test_apply_offsets_shifts_times_and_scales_heights():
+    """Test high/low offsets with ratio and additive height adjustments."""
+    events = TideEvents.from_records(_records("2025-07-04"))
+    ratio, additive = apply_offsets(
+        events,
+        [
+            SubordinateOffsets(
+                station_id="8534139",
+                reference_station_id=REFERENCE,
+                time_offset_high_minutes=-26,
+                time_offset_low_minutes=-17,
+                height_offset_high=0.9,
+                height_offset_low=0.5,
+            ),
+            SubordinateOffsets(
+                station_id="8533615",
+                reference_station_id=REFERENCE,
+                time_offset_high_minutes=95,
+                time_offset_low_minutes=120,
+                height_offset_high=-0.4,
+                height_offset_low=0.2,
+                height_adjustment="add",
+            ),
+        ],
+    )
+
+    assert ratio.times[:2].tolist() == np.array(
+        ["2025-07-04T00:13", "2025-07-04T06:19"], dtype="datetime64[m]"
+    ).tolist()
+    assert ratio.heights == pytest.approx([-0.1, 3.69, 0.05, 4.05])
+    assert additive.times[0] == np.datetime64("2025-07-04T02:30")
+    assert additive.heights == pytest.approx([0.0, 3.7, 0.3, 4.1])
+    assert additive.is_high.tolist() == [False, True, False, True]
+
+
+def test_offsets_that_cross_reorder_events():
+    """Test that events stay in time order when offsets differ by type."""
+    events = TideEvents(
+        times=np.array(["2025-07-04T06:00", "2025-07-04T06:30"], dtype="datetime64[m]"),
+        heights=np.array([3.0, 2.5]),
+        is_high=np.array([True, False]),
+    )
+    (derived,) = apply_offsets(
+        events,
+        [SubordinateOffsets("x", REFERENCE, time_offset_high_minutes=60)],
+    )
+
+    assert derived.is_high.tolist() == [False, True]
+    assert derived.heights.tolist() == [2.5, 3.0]
+
+
+def test_subordinates_share_one_reference_request():
+    """Test that many subordinate stations cost one reference fetch."""
+    context = _context(
+        {
+            8534139: {
+                "reference_station_id": REFERENCE,
+                "time_offset_high_minutes": -26,
+                "height_offset_high": 0.98,
+            },
+            "8533615": {"reference_station_id": REFERENCE, "height_adjustment": "add"},
+        }
+    )
+    records = _records("2025-07-03") + _records("2025-07-04") + _records("2025-07-05")
+
+    with patch(
+        "ocean_report.use_cases.tides.fetch_tide_data", return_value=records
+    ) as mock_fetch:
+        derived = get_subordinate_tide_events(
+            context=context,
+            station_ids=["8534139", "8533615"],
+            begin_date="20250704",
+            end_date="20250704",
+        )
+        daytime, _ = get_daytime_tides_for_date(
+            context=context, station_id="8534139", date="20250704"
+        )
+
+    mock_fetch.assert_called_once()
+    assert mock_fetch.call_args.kwargs["params"].station == REFERENCE
+    assert len(derived["8534139"]) == len(derived["8533615"]) == 4
+    assert derived["8534139"].times[0] == np.datetime64("2025-07-04T00:30")
+    assert [record.timestamp for record in daytime] == [
+        "2025-07-04 06:19",
+        "2025-07-04 12:50",
+        "2025-07-04 18:39",
+    ]
+    assert daytime[0].height_feet == pytest.approx(4.018)
+
+
+def test_published_offsets_are_fetched_for_empty_definitions():
+    """Test that an empty config entry uses NOAA's published offsets."""
+    context = _context({"8534139": None})
+    published = NoaaTidePredictionOffsets.model_validate(
+        {
+            "refStationId": REFERENCE,
+            "type": "S",
+            "heightOffsetHighTide": 1.02,
+            "heightOffsetLowTide": 0.96,
+            "timeOffsetHighTide": 12,
+            "timeOffsetLowTide": 7,
+            "heightAdjustedType": "R",
+            "self": "https://example.invalid",
+        }
+    )
+
+    with (
+        patch(
+            "ocean_report.use_cases.tides.fetch_subordinate_offsets",
+            return_value=published,
+        ),
+        patch(
+            "ocean_report.use_cases.tides.fetch_tide_data",
+            return_value=_records("2025-07-04"),
+        ),
+    ):
+        events = get_subordinate_tide_events(
+            context=context,
+            station_ids=["8534139"],
+            begin_date="20250704",
+            end_date="20250704",
+        )["8534139"]
+
+    assert events.times[1] == np.datetime64("2025-07-04T06:57")
+    assert events.heights[1] == pytest.approx(4.182)
+
+
+def test_subordinate_chains_are_rejected():
+    """Test that a reference station cannot itself be subordinate."""
+    with pytest.raises(ValueError):
+        _context(
+            {
+                "8534139": {"reference_station_id": "8533615"},
+                "8533615": {"reference_station_id": REFERENCE},
+            }
+        )
@@ -0,0 +1,149 @@
+"""Tests for the memory-mapped columnar time-series store."""
+
+from datetime import datetime
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pytest
+
+from ocean_report.application.context import ApplicationContext
+from ocean_report.config.schemas import AppConfig
+from ocean_report.models.noaa.water_temperature import NoaaWaterTemperatureRecord
+from ocean_report.storage.timeseries import TimeSeriesStore, noaa_columns
+from ocean_report.use_cases.water_temperature import (
+    get_water_temp_series,
+    open_water_temp_history,
+    sync_water_temp_history,
+)
+
+STATION = "8534720"
+
+
+def _stamps(*values):
+    return np.array(values, dtype="datetime64[m]")
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Time-series store in a temporary directory."""
+    return TimeSeriesStore(tmp_path / "timeseries")
+
+
+def test_append_and_slice_by_time(store):
+    """Test that appended rows are memory-mapped and sliced by time range."""
+    stamps = np.arange(
+        np.datetime64("2025-07-04T00:00"),
+        np.datetime64("2025-07-05T00:00"),
+        np.timedelta64(6, "m"),
+    )
+    values = np.linspace(70, 74, len(stamps))
+    assert store.append(STATION, "water_temperature", stamps, values) == 240
+
+    series = store.open(STATION, "water_temperature")
+    assert isinstance(series.values, np.memmap)
+
+    morning = series.slice(datetime(2025, 7, 4, 6), datetime(2025, 7, 4, 12))
+    assert len(morning) == 60
+    assert morning.times[0] == np.datetime64("2025-07-04T06:00")
+    assert np.shares_memory(morning.values, series.values)
+    assert series.latest() == (datetime(2025, 7, 4, 23, 54), pytest.approx(74.0))
+
+
+
+def test_missing_flags_timestamps_without_rows(store):
+    """Test lookups of stored timestamps, including ones the store refused."""
+    query = _stamps("2025-07-04T00:00", "2025-07-04T00:06", "2025-07-04T00:12")
+    assert store.missing(STATION, "water_temperature", query).tolist() == [True] * 3
+
+    store.append(STATION, "water_temperature", query[1:], np.array([70.0, 70.1]))
+    store.append(STATION, "water_temperature", query[:1], np.array([69.9]))
+
+    assert store.missing(STATION, "water_temperature", query).tolist() == [
+        True,
+        False,
+        False,
+    ]
+
+def test_overlapping_appends_keep_series_sorted_and_unique(store):
+    """Test that rows at or before the last stored timestamp are skipped."""
+    store.append(
+        STATION, "wtmp", _stamps("2025-07-04T00:06", "2025-07-04T00:00"), [2.0, 1.0]
+    )
+    added = store.append(
+        STATION,
+        "wtmp",
+        _stamps("2025-07-04T00:06", "2025-07-04T00:12", "2025-07-04T00:12"),
+        [9.0, 3.0, 3.5],
+    )
+
+    series = store.open(STATION, "wtmp")
+    assert added == 1
+    assert series.values.tolist() == [1.0, 2.0, 3.5]
+    assert store.series() == [(STATION, "wtmp")]
+
+
+def test_uncommitted_bytes_are_ignored_and_overwritten(store, tmp_path):
+    """Test that a torn append is invisible and replaced by the next one."""
+    store.append(STATION, "wtmp", _stamps("2025-07-04T00:00"), [1.0])
+    values_file = tmp_path / "timeseries" / STATION / "wtmp" / "values.f4"
+    with open(values_file, "ab") as handle:
+        handle.write(np.float32(99.0).tobytes())
+
+    assert store.open(STATION, "wtmp").values.tolist() == [1.0]
+
+    store.append(STATION, "wtmp", _stamps("2025-07-04T00:06"), [2.0])
+    assert store.open(STATION, "wtmp").values.tolist() == [1.0, 2.0]
+
+
+def test_noaa_columns_and_stats():
+    """Test conversion of NOAA records without per-row pydantic access later."""
+    records = [
+        NoaaWaterTemperatureRecord(timestamp="2025-07-04 11:54", temperature=72.0),
+        NoaaWaterTemperatureRecord(
+            timestamp="2025-07-04 12:00", temperature=73.0, f="1,0,1"
+        ),
+    ]
+
+    stamps, values, flags = noaa_columns(records, value_field="temperature")
+
+    assert stamps.view("datetime64[s]")[1] == np.datetime64("2025-07-04T12:00")
+    assert values.dtype == np.float32
+    assert flags.tolist() == [0, 0b101]
+
+
+def test_invalid_series_names_are_rejected(store):
+    """Test that station/product names cannot escape the store directory."""
+    with pytest.raises(ValueError):
+        store.open("../etc", "water_temperature")
+
+
+def test_history_sync_mirrors_samples_into_timeseries(tmp_path):
+    """Test that delta-fetched samples are appended to the columnar store."""
+    config = AppConfig.model_validate(
+        {
+            "noaa": {
+                "water_temp_history": {
+                    "enabled": True,
+                    "path": str(tmp_path / "history.sqlite3"),
+                }
+            },
+            "timeseries": {"enabled": True, "directory": str(tmp_path / "ts")},
+        }
+    )
+    context = ApplicationContext(config=config, client=Mock())
+    now = datetime(2025, 7, 4, 12, 0)
+
+    with patch(
+        "ocean_report.use_cases.water_temperature.fetch_water_temp_series",
+        return_value=[
+            NoaaWaterTemperatureRecord(timestamp="2025-07-04 11:54", temperature=72.0),
+            NoaaWaterTemperatureRecord(timestamp="2025-07-04 12:00", temperature=72.4),
+        ],
+    ):
+        sync_water_temp_history(
+            context=context, history=open_water_temp_history(context), now=now
+        )
+
+    series = get_water_temp_series(context=context, hours=24, now=now)
+    assert series.stats()["count"] == 2
+    assert series.stats()["max"] == pytest.approx(72.4)
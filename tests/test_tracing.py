@@ -0,0 +1,168 @@
+"""Tests for span-based tracing and Chrome trace export."""
+
+import asyncio
+import json
+import threading
+from datetime import datetime
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+from ocean_report.api_client.exceptions import ApiClientError
+from ocean_report.application.context import ApplicationContext
+from ocean_report.config.schemas import AppConfig
+from ocean_report.emailer.sender import EmailRecipients, send_email_chunked
+from ocean_report.tracing import Tracer, aggregate, to_chrome_trace
+from ocean_report.tracing import tracer as global_tracer
+from ocean_report.workflows.data.fetcher import fetch_raw_data
+from ocean_report.workflows.models import FetchParams
+
+
+def test_spans_nest_and_are_only_kept_while_collecting():
+    """Test child spans record their parent and collection is scoped."""
+    tracer = Tracer()
+    with tracer.span("outside"):
+        pass
+
+    with tracer.collect() as spans:
+        with tracer.span("parent", station="8534720") as parent:
+            with tracer.span("child") as child:
+                assert tracer.current_span() is child
+            assert tracer.current_span() is parent
+        assert tracer.current_span() is None
+
+    assert [item.name for item in spans] == ["child", "parent"]
+    assert child.parent_id == parent.span_id
+    assert parent.parent_id is None
+    assert parent.attributes == {"station": "8534720"}
+    assert parent.duration >= child.duration >= 0
+
+
+def test_span_records_errors_and_reraises():
+    """Test an exception marks the span as failed without swallowing it."""
+    tracer = Tracer()
+    with tracer.collect() as spans:
+        with pytest.raises(ValueError):
+            with tracer.span("broken"):
+                raise ValueError("boom")
+
+    (failed,) = spans
+    assert failed.status == "error"
+    assert failed.attributes["error"] == "ValueError"
+    assert failed.end_ns is not None
+
+
+def test_concurrent_collections_keep_only_their_own_spans():
+    """Test two threads collecting at once do not see each other's spans."""
+    tracer = Tracer()
+    both_open = threading.Barrier(2)
+    results = {}
+
+    def run(name):
+        with tracer.collect() as spans:
+            both_open.wait(5)
+            with tracer.span(f"{name}.work"):
+                both_open.wait(5)
+        results[name] = [item.name for item in spans]
+
+    threads = [threading.Thread(target=run, args=(name,)) for name in ("a", "b")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+    assert results == {"a": ["a.work"], "b": ["b.work"]}
+
+
+def test_chunk_workers_report_spans_to_the_callers_collection():
+    """Test chunked SMTP worker spans nest under the caller's span."""
+    recipients = EmailRecipients(bcc_list=[f"u{i}@example.com" for i in range(4)])
+    with (
+        patch("smtplib.SMTP") as mock_smtp,
+        global_tracer.collect() as spans,
+        global_tracer.span("report.send") as send,
+    ):
+        mock_smtp.return_value = MagicMock(**{"send_message.return_value": {}})
+        send_email_chunked(
+            sender_email="sender@example.com",
+            email_password="test_password",
+            recipients=recipients,
+            smtp_server="smtp.example.com",
+            smtp_port=587,
+            chunk_size=1,
+            max_connections=2,
+        )
+
+    chunks = [item for item in spans if item.name == "smtp.chunk"]
+    assert len(chunks) == 4
+    assert {item.thread_name.split("_")[0] for item in chunks} == {"smtp-chunk"}
+    assert {item.parent_id for item in chunks} == {send.span_id}
+
+
+def test_chrome_trace_gives_each_asyncio_task_its_own_track():
+    """Test concurrent tasks on one thread export to separate tids."""
+    tracer = Tracer()
+
+    async def fetch(name):
+        with tracer.span(f"fetch.{name}"):
+            await asyncio.sleep(0.01)
+
+    async def main():
+        with tracer.span("report.fetch"):
+            await asyncio.gather(
+                asyncio.create_task(fetch("tides"), name="tides"),
+                asyncio.create_task(fetch("wind"), name="wind"),
+            )
+
+    with tracer.collect() as spans:
+        asyncio.run(main())
+
+    trace = to_chrome_trace(spans)
+    complete = {e["name"]: e for e in trace["traceEvents"] if e["ph"] == "X"}
+    lanes = [e["args"]["name"] for e in trace["traceEvents"] if e["ph"] == "M"]
+
+    assert set(complete) == {"report.fetch", "fetch.tides", "fetch.wind"}
+    assert complete["fetch.tides"]["tid"] != complete["fetch.wind"]["tid"]
+    assert complete["fetch.tides"]["args"]["parent_id"] == (
+        complete["report.fetch"]["args"]["span_id"]
+    )
+    assert complete["report.fetch"]["ts"] == 0
+    assert complete["fetch.wind"]["dur"] >= 10_000  # microseconds
+    assert any(label.endswith("/ tides") for label in lanes)
+    json.dumps(trace)
+
+
+def test_fetch_raw_data_emits_step_spans():
+    """Test the fetcher traces each source and marks swallowed failures."""
+    context = ApplicationContext(config=AppConfig(), client=Mock())
+    params = FetchParams(
+        station_id="8534720",
+        date_str="20250704",
+        latitude=39.5,
+        longitude=-74.2,
+        beach_facing_deg=140.0,
+        forecast_times={"08:00"},
+    )
+
+    with (
+        patch(
+            "ocean_report.workflows.data.fetcher.tides_use_case.get_daytime_tides_for_date",
+            return_value=([], datetime.now()),
+        ),
+        patch(
+            "ocean_report.workflows.data.fetcher.water_temp_use_case.get_latest_water_temp",
+            return_value=(73.5, datetime.now(), None),
+        ),
+        patch(
+            "ocean_report.workflows.data.fetcher.wind_use_case.get_daily_wind_forecast",
+            side_effect=ApiClientError("Open-Meteo down"),
+        ),
+        global_tracer.collect() as spans,
+    ):
+        fetch_raw_data(context=context, params=params)
+
+    summary = aggregate(spans)
+    assert set(summary) == {"fetch.tides", "fetch.water_temperature", "fetch.wind"}
+    wind = next(item for item in spans if item.name == "fetch.wind")
+    assert wind.status == "error"
+    assert wind.attributes["error"] == "ApiClientError"
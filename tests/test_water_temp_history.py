@@ -0,0 +1,186 @@
+"""Tests for water temperature history and delta fetching."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock, patch
+
+import pytest
+from pydantic import ValidationError
+
+from ocean_report.api_client.exceptions import ApiConnectionError
+from ocean_report.application.context import ApplicationContext
+from ocean_report.config.schemas import AppConfig
+from ocean_report.models.noaa.water_temperature import (
+    NoaaWaterTemperatureParams,
+    NoaaWaterTemperatureRecord,
+)
+from ocean_report.storage.water_temp_history import WaterTempHistory
+from ocean_report.use_cases.water_temperature import (
+    get_latest_water_temp,
+    station_now,
+    summarize_water_temp_history,
+    sync_water_temp_history,
+)
+
+STATION = "8534720"
+NOW = datetime(2025, 7, 4, 12, 0)
+
+
+def _record(timestamp, temperature):
+    return NoaaWaterTemperatureRecord(
+        timestamp=timestamp, temperature=temperature, f="0,0,0"
+    )
+
+
+@pytest.fixture
+def context(tmp_path):
+    """Application context with history enabled in a temporary directory."""
+    config = AppConfig.model_validate(
+        {
+            "noaa": {
+                "station_id": STATION,
+                "water_temp_history": {
+                    "enabled": True,
+                    "path": str(tmp_path / "water-temperature.sqlite3"),
+                    "backfill_hours": 24,
+                    "retention_days": 2,
+                },
+            }
+        }
+    )
+    return ApplicationContext(config=config, client=Mock())
+
+
+@pytest.fixture
+def history(tmp_path):
+    """History store shared with the context fixture."""
+    return WaterTempHistory(tmp_path / "water-temperature.sqlite3")
+
+
+def test_range_params_replace_latest_date():
+    """Test that a begin/end range is sent instead of date=latest."""
+    params = NoaaWaterTemperatureParams(
+        station=STATION, begin_date="20250704 06:00", end_date="20250704 12:00"
+    )
+
+    query = params.to_query_params()
+    assert "date" not in query
+    assert query["begin_date"] == "20250704 06:00"
+
+    with pytest.raises(ValidationError):
+        NoaaWaterTemperatureParams(station=STATION, begin_date="20250704 06:00")
+
+
+def test_append_ignores_samples_already_stored(history):
+    """Test that overlapping fetches do not duplicate samples."""
+    assert history.append(STATION, [_record("2025-07-04 11:00", 72.0)]) == 1
+    added = history.append(
+        STATION,
+        [_record("2025-07-04 11:00", 72.0), _record("2025-07-04 11:06", 72.1)],
+    )
+
+    assert added == 1
+    assert history.latest(STATION).timestamp == "2025-07-04 11:06"
+    assert history.latest("0000000") is None
+
+
+def test_first_sync_backfills_then_fetches_only_newer_samples(context, history):
+    """Test that the second sync starts just after the newest stored sample."""
+    with patch(
+        "ocean_report.use_cases.water_temperature.fetch_water_temp_series"
+    ) as mock_fetch:
+        mock_fetch.return_value = [
+            _record("2025-07-04 11:48", 72.0),
+            _record("2025-07-04 11:54", 72.2),
+        ]
+        assert (
+            sync_water_temp_history(context=context, history=history, now=NOW) == 2
+        )
+        first_params = mock_fetch.call_args.kwargs["params"]
+
+        mock_fetch.return_value = [_record("2025-07-04 12:00", 72.3)]
+        assert (
+            sync_water_temp_history(context=context, history=history, now=NOW) == 1
+        )
+        second_params = mock_fetch.call_args.kwargs["params"]
+
+    assert first_params.begin_date == "20250703 12:00"
+    assert second_params.begin_date == "20250704 11:55"
+    assert second_params.date is None
+
+
+def test_sync_prunes_samples_past_retention(context, history):
+    """Test that samples older than retention_days are deleted."""
+    history.append(STATION, [_record("2025-07-01 12:00", 70.0)])
+
+    with patch(
+        "ocean_report.use_cases.water_temperature.fetch_water_temp_series",
+        return_value=[_record("2025-07-04 12:00", 72.0)],
+    ):
+        sync_water_temp_history(context=context, history=history, now=NOW)
+
+    kept = history.window(STATION, start=datetime(2025, 1, 1))
+    assert [sample.timestamp for sample in kept] == ["2025-07-04 12:00"]
+
+
+def test_latest_water_temp_uses_history_when_enabled(context):
+    """Test that get_latest_water_temp returns the newest stored sample."""
+    measured = datetime.now().strftime("%Y-%m-%d %H:%M")
+    with (
+        patch(
+            "ocean_report.use_cases.water_temperature.fetch_water_temp_series",
+            return_value=[_record(measured, 72.5)],
+        ),
+        patch("ocean_report.use_cases.water_temperature.fetch_water_temp") as latest,
+    ):
+        temp, _, data_time = get_latest_water_temp(context=context)
+
+    latest.assert_not_called()
+    assert temp == 72.5
+    assert data_time == measured
+
+
+def test_latest_water_temp_serves_history_when_noaa_fails(context, history):
+    """Test an upstream error falls back to the newest stored sample."""
+    history.append(STATION, [_record("2025-07-04 11:54", 73.0)])
+
+    with patch(
+        "ocean_report.use_cases.water_temperature.fetch_water_temp_series",
+        side_effect=ApiConnectionError("NOAA down"),
+    ):
+        temp, _, data_time = get_latest_water_temp(context=context)
+
+    assert (temp, data_time) == (73.0, "2025-07-04 11:54")
+
+
+def test_station_now_uses_the_station_zone():
+    """Test ranges are computed in the station's zone, not the host's."""
+    config = AppConfig.model_validate(
+        {"noaa": {"water_temp_history": {"time_zone": "Pacific/Honolulu"}}}
+    )
+    context = ApplicationContext(config=config, client=Mock())
+    honolulu = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(hours=10)
+
+    assert abs(station_now(context) - honolulu) < timedelta(minutes=1)
+    with pytest.raises(ValidationError):
+        AppConfig.model_validate(
+            {"noaa": {"water_temp_history": {"time_zone": "Mars/Olympus"}}}
+        )
+
+
+def test_summary_covers_requested_window(context, history):
+    """Test 24h summaries from local samples."""
+    history.append(
+        STATION,
+        [
+            _record("2025-07-03 06:00", 68.0),
+            _record("2025-07-03 18:00", 70.0),
+            _record("2025-07-04 06:00", 71.0),
+            _record("2025-07-04 11:54", 73.0),
+        ],
+    )
+
+    summary = summarize_water_temp_history(context=context, hours=24, now=NOW)
+
+    assert summary.count == 3
+    assert (summary.minimum, summary.maximum) == (70.0, 73.0)
+    assert summary.change == pytest.approx(3.0)
@@ -4,7 +4,9 @@ from unittest.mock import Mock, patch, MagicMock
 import pytest
 
 from ocean_report.application.context import ApplicationContext
-from ocean_report.config.schemas import AppConfig, EmailConfig
+from ocean_report.config.schemas import AppConfig, DeliveryConfig, EmailConfig
+from ocean_report.emailer.address_fetcher import RecipientSet
+from ocean_report.emailer.sender import DeliveryReport
 from ocean_report.workflows.email import get_bcc_recipients, send_or_preview_email
 
 
@@ -30,9 +32,11 @@ def test_get_bcc_recipients_fetches_from_url_when_enabled():
     """Test that recipients are fetched from URL when use_url=True."""
 
     with patch(
-        "ocean_report.workflows.email.recipients.get_email_recipients"
+        "ocean_report.workflows.email.recipients.get_email_recipient_set"
     ) as mock_get:
-        mock_get.return_value = "user1@example.com,user2@example.com,user3@example.com"
+        mock_get.return_value = RecipientSet(
+            ["user1@example.com", "user2@example.com", "user3@example.com"]
+        )
 
         result = get_bcc_recipients(
             test=False, use_url=True, fallback_recipients="fallback@example.com"
@@ -44,14 +48,14 @@ def test_get_bcc_recipients_fetches_from_url_when_enabled():
         assert "user3@example.com" in result
 
         # Verify URL fetch was called
-        mock_get.assert_called_once_with(test_recips=False)
+        mock_get.assert_called_once_with(context=None, test_recips=False)
 
 
 def test_get_bcc_recipients_uses_fallback_when_url_disabled():
     """Test that fallback recipients are used when use_url=False."""
 
     with patch(
-        "ocean_report.workflows.email.recipients.get_email_recipients"
+        "ocean_report.workflows.email.recipients.get_email_recipient_set"
     ) as mock_get:
         result = get_bcc_recipients(
             test=False,
@@ -71,45 +75,61 @@ def test_get_bcc_recipients_uses_test_mode_when_flag_set():
     """Test that test=True is passed to recipient fetcher."""
 
     with patch(
-        "ocean_report.workflows.email.recipients.get_email_recipients"
+        "ocean_report.workflows.email.recipients.get_email_recipient_set"
     ) as mock_get:
-        mock_get.return_value = "test@example.com"
+        mock_get.return_value = RecipientSet(["test@example.com"])
 
         result = get_bcc_recipients(test=True, use_url=True, fallback_recipients="")
 
-        assert result == ["test@example.com"]
-        mock_get.assert_called_once_with(test_recips=True)
+        assert list(result) == ["test@example.com"]
+        mock_get.assert_called_once_with(context=None, test_recips=True)
 
 
 def test_get_bcc_recipients_strips_whitespace():
     """Test that email addresses are stripped of whitespace."""
 
-    with patch(
-        "ocean_report.workflows.email.recipients.get_email_recipients"
-    ) as mock_get:
-        mock_get.return_value = (
+    result = get_bcc_recipients(
+        test=False,
+        use_url=False,
+        fallback_recipients=(
             "  user1@example.com  , user2@example.com ,  user3@example.com  "
-        )
-
-        result = get_bcc_recipients(test=False, use_url=True, fallback_recipients="")
+        ),
+    )
 
-        # All emails should be stripped
-        assert result == ["user1@example.com", "user2@example.com", "user3@example.com"]
+    # All emails should be stripped
+    assert list(result) == [
+        "user1@example.com",
+        "user2@example.com",
+        "user3@example.com",
+    ]
 
 
 def test_get_bcc_recipients_filters_empty_strings():
     """Test that empty strings are filtered out."""
 
-    with patch(
-        "ocean_report.workflows.email.recipients.get_email_recipients"
-    ) as mock_get:
-        mock_get.return_value = "user1@example.com,,,user2@example.com,"
+    result = get_bcc_recipients(
+        test=False,
+        use_url=False,
+        fallback_recipients="user1@example.com,,,user2@example.com,",
+    )
 
-        result = get_bcc_recipients(test=False, use_url=True, fallback_recipients="")
+    # Only valid emails should remain
+    assert len(result) == 2
+    assert list(result) == ["user1@example.com", "user2@example.com"]
 
-        # Only valid emails should remain
-        assert len(result) == 2
-        assert result == ["user1@example.com", "user2@example.com"]
+
+def test_get_bcc_recipients_dedupes_and_drops_invalid_fallback():
+    """Test that fallback recipients are de-duplicated and validated."""
+
+    result = get_bcc_recipients(
+        test=False,
+        use_url=False,
+        fallback_recipients="Admin@Example.com,admin@example.com,not-an-email",
+    )
+
+    assert list(result) == ["admin@example.com"]
+    assert result.duplicates == 1
+    assert result.invalid == ("not-an-email",)
 
 
 def test_get_bcc_recipients_handles_empty_fallback():
@@ -117,7 +137,7 @@ def test_get_bcc_recipients_handles_empty_fallback():
 
     result = get_bcc_recipients(test=False, use_url=False, fallback_recipients="")
 
-    assert result == []
+    assert len(result) == 0
 
 
 # Tests for send_or_preview_email
@@ -146,7 +166,7 @@ def test_send_or_preview_email_prints_preview_when_run_email_false(
 def test_send_or_preview_email_sends_via_smtp_when_run_email_true(mock_context):
     """Test that email is sent via SMTP when run_email=True."""
 
-    with patch("ocean_report.workflows.email.sender.emailer.send_email") as mock_send:
+    with patch("ocean_report.workflows.email.delivery.emailer.send_email") as mock_send:
         send_or_preview_email(
             context=mock_context,
             run_email=True,
@@ -167,7 +187,7 @@ def test_send_or_preview_email_sends_via_smtp_when_run_email_true(mock_context):
 def test_send_or_preview_email_uses_context_config(mock_context):
     """Test that email config is taken from context."""
 
-    with patch("ocean_report.workflows.email.sender.emailer.send_email") as mock_send:
+    with patch("ocean_report.workflows.email.delivery.emailer.send_email") as mock_send:
         send_or_preview_email(
             context=mock_context,
             run_email=True,
@@ -188,7 +208,7 @@ def test_send_or_preview_email_passes_bcc_list(mock_context):
 
     bcc_list = ["bcc1@example.com", "bcc2@example.com", "bcc3@example.com"]
 
-    with patch("ocean_report.workflows.email.sender.emailer.send_email") as mock_send:
+    with patch("ocean_report.workflows.email.delivery.emailer.send_email") as mock_send:
         send_or_preview_email(
             context=mock_context,
             run_email=True,
@@ -200,3 +220,42 @@ def test_send_or_preview_email_passes_bcc_list(mock_context):
         # Verify BCC list was passed
         call_kwargs = mock_send.call_args.kwargs
         assert "bcc_list" in call_kwargs or "recipients" in call_kwargs
+
+
+def test_send_or_preview_email_uses_chunked_delivery_when_configured(mock_context):
+    """Test that chunked delivery mode routes to send_email_chunked."""
+
+    context = ApplicationContext(
+        config=mock_context.config.model_copy(
+            update={
+                "email": mock_context.config.email.model_copy(
+                    update={
+                        "delivery": DeliveryConfig(
+                            mode="chunked", chunk_size=10, max_connections=2
+                        )
+                    }
+                )
+            }
+        ),
+        client=Mock(),
+    )
+
+    with (
+        patch("ocean_report.workflows.email.delivery.emailer.send_email") as mock_send,
+        patch(
+            "ocean_report.workflows.email.delivery.emailer.send_email_chunked"
+        ) as mock_chunked,
+    ):
+        mock_chunked.return_value = DeliveryReport()
+        send_or_preview_email(
+            context=context,
+            run_email=True,
+            subject="Test",
+            body="Body",
+            bcc_recipients=["bcc1@example.com"],
+        )
+
+    mock_send.assert_not_called()
+    call_kwargs = mock_chunked.call_args.kwargs
+    assert call_kwargs["chunk_size"] == 10
+    assert call_kwargs["max_connections"] == 2